@@ -0,0 +1,149 @@
+"""
+Compare the requests/sec of the Flask (WSGI) and the Starlette (ASGI) web
+adapters at high concurrency.
+
+Each server runs in its own process against a freshly seeded SQLite
+database, and is hammered with GET /character/get/<id> requests by an
+asynchronous HTTP client.
+
+Usage:
+    python benchmarks/asgi_vs_wsgi.py --requests 5000 --concurrency 200
+"""
+import argparse
+import asyncio
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+
+SRC_PATH = Path(__file__).resolve().parent.parent / "src"
+
+SERVERS = {
+    "wsgi": (
+        "import logging; logging.disable(logging.CRITICAL);"
+        "from infra.web.flask.app import CharacterCRUDApp;"
+        "CharacterCRUDApp('benchmark').run(threaded=True)"
+    ),
+    "asgi": (
+        "from infra.web.starlette.app import CharacterCRUDASGIApp;"
+        "CharacterCRUDASGIApp().run(log_level='warning', access_log=False)"
+    ),
+}
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(kind: str, database_url: str, port: int) -> subprocess.Popen:
+    env = os.environ | {
+        "PYTHONPATH": str(SRC_PATH),
+        "DB_CONNECTION_STRING": database_url,
+        "WEB_SERVER_HOST": "127.0.0.1",
+        "WEB_SERVER_PORT": str(port),
+        "DEBUG_MODE": "False",
+        "DB_CREATE_SCHEMA_ON_STARTUP": "True",
+    }
+    return subprocess.Popen(
+        [sys.executable, "-c", SERVERS[kind]],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+
+async def wait_until_ready(base_url: str, timeout: float = 20):
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient(base_url=base_url) as client:
+        while time.monotonic() < deadline:
+            try:
+                await client.get("/")
+                return
+            except httpx.TransportError:
+                await asyncio.sleep(0.1)
+    raise TimeoutError(f"{base_url} did not start")
+
+
+async def seed(base_url: str, count: int) -> list:
+    characters = [
+        {
+            "name": f"Character {i}",
+            "height": 170,
+            "mass": 70,
+            "hair_color": "blond",
+            "skin_color": "fair",
+            "eye_color": random.choice(["blue", "brown", "green"]),
+            "birth_year": i,
+        }
+        for i in range(count)
+    ]
+    async with httpx.AsyncClient(base_url=base_url, timeout=60) as client:
+        response = await client.post("/character/bulk", json=characters)
+        response.raise_for_status()
+        return [character["id"] for character in response.json()["created"]]
+
+
+async def hammer(
+    base_url: str, ids: list, requests: int, concurrency: int
+) -> float:
+    limits = httpx.Limits(max_connections=concurrency)
+    remaining = iter(range(requests))
+
+    async def worker(client: httpx.AsyncClient):
+        for _ in remaining:
+            response = await client.get(
+                f"/character/get/{random.choice(ids)}"
+            )
+            response.raise_for_status()
+
+    async with httpx.AsyncClient(
+        base_url=base_url, limits=limits, timeout=60
+    ) as client:
+        started = time.perf_counter()
+        await asyncio.gather(*(worker(client) for _ in range(concurrency)))
+        return requests / (time.perf_counter() - started)
+
+
+async def benchmark(kind: str, args: argparse.Namespace) -> float:
+    with tempfile.TemporaryDirectory() as directory:
+        port = free_port()
+        base_url = f"http://127.0.0.1:{port}"
+        server = start_server(
+            kind, f"sqlite:///{directory}/characters.db", port
+        )
+        try:
+            await wait_until_ready(base_url)
+            ids = await seed(base_url, args.characters)
+            return await hammer(
+                base_url, ids, args.requests, args.concurrency
+            )
+        finally:
+            server.terminate()
+            server.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--characters", type=int, default=1000)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=200)
+    args = parser.parse_args()
+
+    for kind in SERVERS:
+        rate = asyncio.run(benchmark(kind, args))
+        print(
+            f"{kind}: {rate:.0f} requests/sec "
+            f"({args.requests} requests, concurrency {args.concurrency})"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Measure the per row cost of turning SQL rows into a JSON listing, the
+former way (rows validated one by one into models, dumped to dictionaries
+and encoded by Flask's default JSON provider) and the current one (the page
+validated in a single TypeAdapter call and serialised straight to bytes by
+PydanticJSONProvider).
+
+Rows are read once from a seeded SQLite database, so only the conversion
+to JSON is timed.
+
+Usage:
+    python benchmarks/json_serialization.py --characters 10000 --rounds 5
+"""
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from flask import Flask  # noqa: E402
+from flask.json.provider import DefaultJSONProvider  # noqa: E402
+from sqlalchemy import select  # noqa: E402
+
+from domain.entities.schemas import (  # noqa: E402
+    CharacterPartialSchema,
+    CharacterSchema,
+)
+from infra.repositories.sql.base import EngineRegistry  # noqa: E402
+from infra.repositories.sql.character_repository import (  # noqa: E402
+    CHARACTER_LIST_ADAPTER,
+    CharacterRepository,
+)
+from infra.repositories.sql.queries import projected_columns  # noqa: E402
+from infra.web.flask.json_provider import PydanticJSONProvider  # noqa: E402
+
+APP = Flask("benchmark")
+DEFAULT_PROVIDER = DefaultJSONProvider(APP)
+PYDANTIC_PROVIDER = PydanticJSONProvider(APP)
+
+
+def before(rows: list) -> bytes:
+    characters = [CharacterPartialSchema.model_validate(row) for row in rows]
+    return DEFAULT_PROVIDER.dumps(
+        [c.model_dump(exclude_unset=True) for c in characters]
+    ).encode()
+
+
+def after(rows: list) -> bytes:
+    fields = rows[0]._fields
+    characters = CHARACTER_LIST_ADAPTER.validate_python(
+        [dict(zip(fields, row)) for row in rows]
+    )
+    return PYDANTIC_PROVIDER.dumpb(characters, exclude_unset=True)
+
+
+SCENARIOS = {
+    "validate + model_dump + json.dumps (before)": before,
+    "TypeAdapter validate + dump_json (after)": after,
+}
+
+
+def load_rows(directory: str, count: int) -> list:
+    initializer = EngineRegistry.get(
+        f"sqlite:///{directory}/characters.db", create_schema=True
+    )
+    CharacterRepository(initializer).create_characters(
+        [
+            CharacterSchema(
+                name=f"Character {i}",
+                height=170,
+                mass=70,
+                hair_color="blond",
+                skin_color="fair",
+                eye_color="blue",
+                birth_year=i,
+            )
+            for i in range(count)
+        ]
+    )
+    session = initializer.get_session()
+    try:
+        return session.execute(
+            select(
+                *projected_columns(list(CharacterPartialSchema.model_fields))
+            )
+        ).all()
+    finally:
+        session.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--characters", type=int, default=10000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        rows = load_rows(directory, args.characters)
+        EngineRegistry.dispose_all()
+    with APP.app_context():
+        for name, serialize in SCENARIOS.items():
+            best = float("inf")
+            for _ in range(args.rounds):
+                started = time.perf_counter()
+                serialize(rows)
+                best = min(best, time.perf_counter() - started)
+            per_row = best / len(rows) * 1e6
+            print(f"{name}: {per_row:.2f} µs/row ({len(rows)} rows)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Measure the requests/sec of the Flask app with SQL echo written
+synchronously (the former echo=True), with SQL echo through the queued
+handler, and with SQL echo off.
+
+Requests go through the Flask test client against a seeded SQLite
+database, and records are written to a temporary file.
+
+Usage:
+    python benchmarks/logging_overhead.py --requests 5000
+"""
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from infra.log.config import configure_logging  # noqa: E402
+from infra.repositories.sql.base import EngineRegistry  # noqa: E402
+from infra.repositories.sql.character_repository import (  # noqa: E402
+    CharacterRepository,
+)
+from infra.web.flask.app import CharacterCRUDApp  # noqa: E402
+
+SCENARIOS = {
+    "sql echo, synchronous": {"sql_echo": True, "asynchronous": False},
+    "sql echo, queued": {"sql_echo": True, "asynchronous": True},
+    "sql echo off": {"sql_echo": False, "asynchronous": True},
+}
+
+
+def seed(client, count: int) -> list:
+    characters = [
+        {
+            "name": f"Character {i}",
+            "height": 170,
+            "mass": 70,
+            "hair_color": "blond",
+            "skin_color": "fair",
+            "eye_color": "blue",
+            "birth_year": i,
+        }
+        for i in range(count)
+    ]
+    response = client.post("/character/bulk", json=characters)
+    return [character["id"] for character in response.get_json()["created"]]
+
+
+def benchmark(options: dict, args: argparse.Namespace) -> float:
+    with tempfile.TemporaryDirectory() as directory:
+        repository = CharacterRepository(
+            EngineRegistry.get(
+                f"sqlite:///{directory}/characters.db", create_schema=True
+            )
+        )
+        client = CharacterCRUDApp(
+            "benchmark", character_repository=repository
+        ).test_client()
+        ids = seed(client, args.characters)
+        with open(Path(directory) / "log.txt", "w") as stream:
+            configure_logging(stream=stream, **options)
+            started = time.perf_counter()
+            for _ in range(args.requests):
+                client.get(f"/character/get/{random.choice(ids)}")
+            rate = args.requests / (time.perf_counter() - started)
+            configure_logging(sql_echo=False, asynchronous=False)
+        EngineRegistry.dispose_all()
+        return rate
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--characters", type=int, default=1000)
+    parser.add_argument("--requests", type=int, default=5000)
+    args = parser.parse_args()
+
+    for name, options in SCENARIOS.items():
+        rate = benchmark(options, args)
+        print(f"{name}: {rate:.0f} requests/sec ({args.requests} requests)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,334 @@
+"""
+Run the performance suite: CharacterRepository operations, HTTP latency and
+throughput through the Flask test client and a real local server, and CLI
+startup time, against a database seeded with Faker-generated characters.
+
+Results are written as JSON. Given the results of a previous run with
+--baseline, the suite fails when a benchmark got slower than --threshold:
+throughput lower, or p99 latency higher, by more than that fraction.
+
+Usage:
+    python benchmarks/suite.py --characters 1000 --output results.json
+    python benchmarks/suite.py --baseline results.json --threshold 0.2
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List
+
+import httpx
+from faker import Faker
+
+from asgi_vs_wsgi import (
+    SRC_PATH,
+    free_port,
+    hammer,
+    start_server,
+    wait_until_ready,
+)
+
+sys.path.insert(0, str(SRC_PATH))
+
+from domain.entities.schemas import (  # noqa: E402
+    CharacterQuerySchema,
+    CharacterSchema,
+)
+from infra.repositories.sql.base import EngineRegistry  # noqa: E402
+from infra.repositories.sql.character_repository import (  # noqa: E402
+    CharacterRepository,
+)
+from infra.web.flask.app import CharacterCRUDApp  # noqa: E402
+
+GROUPS = ("repository", "http", "server", "cli")
+LIST_PAGE_SIZE = 100
+BULK_SIZE = 100
+
+fake = Faker()
+
+
+def fake_characters(count: int) -> List[CharacterSchema]:
+    return [
+        CharacterSchema(
+            name=fake.name(),
+            height=fake.random_int(50, 250),
+            mass=fake.random_int(20, 200),
+            hair_color=fake.color_name(),
+            skin_color=fake.color_name(),
+            eye_color=random.choice(["blue", "brown", "green"]),
+            birth_year=fake.random_int(0, 1000),
+        )
+        for _ in range(count)
+    ]
+
+
+def measure(operation: Callable[[], object], iterations: int) -> Dict:
+    """
+    Time an operation, one call at a time.
+
+    Args:
+        operation (Callable[[], object]): The operation.
+        iterations (int): The number of calls.
+
+    Returns:
+        Dict: The throughput and the p50 and p99 latencies.
+    """
+    latencies = []
+    started = time.perf_counter()
+    for _ in range(iterations):
+        call_started = time.perf_counter()
+        operation()
+        latencies.append(time.perf_counter() - call_started)
+    return summarize(latencies, time.perf_counter() - started)
+
+
+def summarize(latencies: List[float], elapsed: float) -> Dict:
+    latencies = sorted(latencies)
+    return {
+        "ops_per_sec": round(len(latencies) / elapsed, 2),
+        "p50_ms": round(latencies[len(latencies) // 2] * 1000, 4),
+        "p99_ms": round(
+            latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+            * 1000,
+            4,
+        ),
+        "samples": len(latencies),
+    }
+
+
+def repository_benchmarks(
+    repository: CharacterRepository, ids: List[int], iterations: int
+) -> Dict[str, Dict]:
+    page = CharacterQuerySchema(limit=LIST_PAGE_SIZE)
+    created = []
+
+    def create():
+        created.append(repository.create_character(fake_characters(1)[0]).id)
+
+    def delete():
+        repository.delete_character(created.pop())
+
+    results = {
+        "repository.get_character": measure(
+            lambda: repository.get_character(random.choice(ids)), iterations
+        ),
+        "repository.get_characters": measure(
+            lambda: repository.get_characters(page), iterations
+        ),
+        "repository.create_character": measure(create, iterations),
+        "repository.delete_character": measure(delete, iterations),
+    }
+    bulk = fake_characters(BULK_SIZE)
+    results["repository.create_characters"] = measure(
+        lambda: repository.create_characters(bulk), max(1, iterations // 10)
+    )
+    return results
+
+
+def http_benchmarks(
+    repository: CharacterRepository, ids: List[int], iterations: int
+) -> Dict[str, Dict]:
+    client = CharacterCRUDApp(
+        "benchmark", character_repository=repository
+    ).test_client()
+    return {
+        "http.get_character": measure(
+            lambda: client.get(f"/character/get/{random.choice(ids)}"),
+            iterations,
+        ),
+        "http.get_characters": measure(
+            lambda: client.get(f"/character/getAll?limit={LIST_PAGE_SIZE}"),
+            iterations,
+        ),
+    }
+
+
+def server_benchmarks(
+    database_url: str, ids: List[int], iterations: int, concurrency: int
+) -> Dict[str, Dict]:
+    port = free_port()
+    base_url = f"http://127.0.0.1:{port}"
+    server = start_server("wsgi", database_url, port)
+    try:
+        asyncio.run(wait_until_ready(base_url))
+        with httpx.Client(base_url=base_url) as client:
+            latency = measure(
+                lambda: client.get(
+                    f"/character/get/{random.choice(ids)}"
+                ).raise_for_status(),
+                iterations,
+            )
+        rate = asyncio.run(hammer(base_url, ids, iterations, concurrency))
+    finally:
+        server.terminate()
+        server.wait()
+    return {
+        "server.get_character": latency,
+        "server.get_character_concurrent": {
+            "ops_per_sec": round(rate, 2),
+            "samples": iterations,
+            "concurrency": concurrency,
+        },
+    }
+
+
+def cli_benchmarks(database_url: str, ids: List[int], runs: int) -> Dict:
+    env = os.environ | {
+        "PYTHONPATH": str(SRC_PATH),
+        "DB_CONNECTION_STRING": database_url,
+    }
+    commands = {
+        "cli.get_character": ["get-character", str(ids[0])],
+        "cli.list_characters": [
+            "list-characters", "--limit", str(LIST_PAGE_SIZE)
+        ],
+    }
+    return {
+        name: measure(
+            lambda: subprocess.run(
+                [sys.executable, str(SRC_PATH / "cli.py"), *arguments],
+                env=env,
+                stdout=subprocess.DEVNULL,
+                check=True,
+            ),
+            runs,
+        )
+        for name, arguments in commands.items()
+    }
+
+
+def compare(results: Dict, baseline: Dict, threshold: float) -> List[str]:
+    """
+    Find the benchmarks that regressed past the threshold.
+
+    Args:
+        results (Dict): The benchmarks of this run.
+        baseline (Dict): The benchmarks of the previous run.
+        threshold (float): The tolerated slowdown, as a fraction.
+
+    Returns:
+        List[str]: A description of each regression.
+    """
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            continue
+        if current["ops_per_sec"] < previous["ops_per_sec"] * (1 - threshold):
+            regressions.append(
+                f"{name}: {current['ops_per_sec']} ops/sec, "
+                f"was {previous['ops_per_sec']}"
+            )
+        if "p99_ms" in current and "p99_ms" in previous:
+            if current["p99_ms"] > previous["p99_ms"] * (1 + threshold):
+                regressions.append(
+                    f"{name}: p99 {current['p99_ms']} ms, "
+                    f"was {previous['p99_ms']}"
+                )
+    return regressions
+
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=SRC_PATH.parent,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--characters", type=int, default=1000)
+    parser.add_argument("--iterations", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--cli-runs", type=int, default=5)
+    parser.add_argument(
+        "--only", nargs="+", choices=GROUPS, default=list(GROUPS)
+    )
+    parser.add_argument("--output", type=Path, default=Path("results.json"))
+    parser.add_argument("--baseline", type=Path)
+    parser.add_argument("--threshold", type=float, default=0.2)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    Faker.seed(args.seed)
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        database_url = f"sqlite:///{directory}/characters.db"
+        repository = CharacterRepository(
+            EngineRegistry.get(database_url, create_schema=True)
+        )
+        ids = [
+            character.id
+            for character in repository.create_characters(
+                fake_characters(args.characters)
+            ).created
+        ]
+        if "repository" in args.only:
+            results.update(
+                repository_benchmarks(repository, ids, args.iterations)
+            )
+        if "http" in args.only:
+            results.update(http_benchmarks(repository, ids, args.iterations))
+        if "server" in args.only:
+            results.update(
+                server_benchmarks(
+                    database_url, ids, args.iterations, args.concurrency
+                )
+            )
+        if "cli" in args.only:
+            results.update(cli_benchmarks(database_url, ids, args.cli_runs))
+        EngineRegistry.dispose_all()
+
+    for name, result in results.items():
+        latency = (
+            f", p50 {result['p50_ms']} ms, p99 {result['p99_ms']} ms"
+            if "p50_ms" in result
+            else ""
+        )
+        print(f"{name}: {result['ops_per_sec']} ops/sec{latency}")
+    args.output.write_text(
+        json.dumps(
+            {
+                "commit": git_commit(),
+                "created_at": datetime.now(timezone.utc).isoformat(),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "parameters": {
+                    "characters": args.characters,
+                    "iterations": args.iterations,
+                    "concurrency": args.concurrency,
+                    "cli_runs": args.cli_runs,
+                },
+                "benchmarks": results,
+            },
+            indent=2,
+        )
+    )
+    print(f"Results written to {args.output}")
+
+    if args.baseline is not None:
+        baseline = json.loads(args.baseline.read_text())["benchmarks"]
+        regressions = compare(results, baseline, args.threshold)
+        for regression in regressions:
+            print(f"Regression: {regression}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,4 @@
+from infra.log.config import configure_logging
 from infra.web.flask.app import CharacterCRUDApp
 
 
@@ -5,6 +6,7 @@ def main():
     """
     The main function
     """
+    configure_logging()
     app = CharacterCRUDApp(__name__)
     app.run()
 
@@ -1,21 +1,38 @@
-from domain.entities.schemas import CharacterSchema
+from typing import Any, List, Tuple
+
+from pydantic import TypeAdapter
+
+from domain.entities.schemas import (
+    BulkCreateErrorSchema,
+    BulkCreateResultSchema,
+    CharacterSchema,
+)
 from domain.repositories.character_repository import (
+    AsyncCharacterRepositoryInterface,
     CharacterRepositoryInterface,
 )
 
+CHARACTER_LIST_ADAPTER = TypeAdapter(List[CharacterSchema])
+
 
 class CharacterCreator:
     """
     A class to create a new character.
     """
 
-    def __init__(self, character_repository: CharacterRepositoryInterface):
+    def __init__(
+        self,
+        character_repository: CharacterRepositoryInterface
+        | AsyncCharacterRepositoryInterface,
+    ):
         """
-        Constructor method.
+        Constructor method. Methods prefixed with "a" are the coroutines to
+        use with an asynchronous repository.
 
         Args:
-            character_repository (CharacterRepositoryInterface): An instance of
-                a character repository.
+            character_repository (CharacterRepositoryInterface |
+                AsyncCharacterRepositoryInterface): An instance of a
+                character repository.
         """
         self._character_repository = character_repository
 
@@ -30,3 +47,149 @@ class CharacterCreator:
             CharacterSchema: The created character.
         """
         return self._character_repository.create_character(character)
+
+    def create_characters(
+        self,
+        data: List[Any],
+        chunk_size: int | None = None,
+        atomic: bool = True,
+    ) -> BulkCreateResultSchema:
+        """
+        Validate and create many characters.
+
+        The whole payload is validated at once. In atomic mode any invalid
+        character aborts the creation, otherwise invalid characters are
+        reported by index and the valid ones are created.
+
+        Args:
+            data (List[Any]): The characters to create, as dictionaries or
+                CharacterSchema instances.
+            chunk_size (int | None): The number of characters inserted per
+                statement.
+            atomic (bool): Whether to create all the characters or none.
+
+        Returns:
+            BulkCreateResultSchema: The created characters and the errors,
+                indexed on data.
+        """
+        characters, indexes, errors = self._validate(data, atomic)
+        result = self._character_repository.create_characters(
+            characters, chunk_size=chunk_size, atomic=atomic
+        )
+        return self._merge_errors(result, indexes, errors)
+
+    async def acreate_character(
+        self, character: CharacterSchema
+    ) -> CharacterSchema:
+        """
+        Create a new character with an asynchronous repository.
+
+        Args:
+            character (CharacterSchema): The character to create.
+
+        Returns:
+            CharacterSchema: The created character.
+        """
+        return await self._character_repository.create_character(character)
+
+    async def acreate_characters(
+        self,
+        data: List[Any],
+        chunk_size: int | None = None,
+        atomic: bool = True,
+    ) -> BulkCreateResultSchema:
+        """
+        Validate and create many characters with an asynchronous repository.
+
+        Args:
+            data (List[Any]): The characters to create, as dictionaries or
+                CharacterSchema instances.
+            chunk_size (int | None): The number of characters inserted per
+                statement.
+            atomic (bool): Whether to create all the characters or none.
+
+        Returns:
+            BulkCreateResultSchema: The created characters and the errors,
+                indexed on data.
+        """
+        characters, indexes, errors = self._validate(data, atomic)
+        result = await self._character_repository.create_characters(
+            characters, chunk_size=chunk_size, atomic=atomic
+        )
+        return self._merge_errors(result, indexes, errors)
+
+    def _validate(
+        self, data: List[Any], atomic: bool
+    ) -> Tuple[List[CharacterSchema], List[int], List[BulkCreateErrorSchema]]:
+        """
+        Validate the whole payload at once, falling back to validating the
+        characters one by one to report the invalid ones when not atomic.
+
+        Args:
+            data (List[Any]): The characters to validate.
+            atomic (bool): Whether any invalid character aborts the creation.
+
+        Returns:
+            Tuple[List[CharacterSchema], List[int], List[BulkCreateErrorSchema]]:
+                The valid characters, their indexes on data and the
+                errors of the invalid ones.
+        """
+        try:
+            characters = CHARACTER_LIST_ADAPTER.validate_python(data)
+            return characters, list(range(len(characters))), []
+        except Exception:
+            if atomic:
+                raise
+            return self._validate_rows(data)
+
+    @staticmethod
+    def _merge_errors(
+        result: BulkCreateResultSchema,
+        indexes: List[int],
+        errors: List[BulkCreateErrorSchema],
+    ) -> BulkCreateResultSchema:
+        """
+        Merge the validation errors with the repository ones, indexing them
+        on the original payload.
+
+        Args:
+            result (BulkCreateResultSchema): The repository result.
+            indexes (List[int]): The payload index of each validated
+                character.
+            errors (List[BulkCreateErrorSchema]): The validation errors.
+
+        Returns:
+            BulkCreateResultSchema: The merged result.
+        """
+        errors = errors + [
+            BulkCreateErrorSchema(index=indexes[error.index], message=error.message)
+            for error in result.errors
+        ]
+        return BulkCreateResultSchema(
+            created=result.created,
+            errors=sorted(errors, key=lambda error: error.index),
+        )
+
+    @staticmethod
+    def _validate_rows(
+        data: List[Any],
+    ) -> Tuple[List[CharacterSchema], List[int], List[BulkCreateErrorSchema]]:
+        """
+        Validate characters one by one to find the invalid ones.
+
+        Args:
+            data (List[Any]): The characters to validate.
+
+        Returns:
+            Tuple[List[CharacterSchema], List[int], List[BulkCreateErrorSchema]]:
+                The valid characters, their indexes on data and the
+                errors of the invalid ones.
+        """
+        characters, indexes, errors = [], [], []
+        for index, item in enumerate(data):
+            try:
+                characters.append(CharacterSchema.model_validate(item))
+                indexes.append(index)
+            except Exception as e:
+                errors.append(BulkCreateErrorSchema(index=index, message=str(e)))
+        return characters, indexes, errors
@@ -1,8 +1,18 @@
-from typing import List
+from typing import AsyncIterator, Iterator, List
 
 from domain.entities.exceptions import CharacterNotFoundError
-from domain.entities.schemas import CharacterSchema
+from domain.entities.schemas import (
+    CharacterLookupResultSchema,
+    CharacterPartialSchema,
+    CharacterQuerySchema,
+    CharacterSchema,
+    CharacterSearchSchema,
+    CharacterStatsQuerySchema,
+    CharacterStatsSchema,
+    ResourceVersionSchema,
+)
 from domain.repositories.character_repository import (
+    AsyncCharacterRepositoryInterface,
     CharacterRepositoryInterface,
 )
 
@@ -12,24 +22,51 @@ class CharacterInspector:
     A class to list characters.
     """
 
-    def __init__(self, character_repository: CharacterRepositoryInterface):
+    def __init__(
+        self,
+        character_repository: CharacterRepositoryInterface
+        | AsyncCharacterRepositoryInterface,
+    ):
         """
-        Constructor method.
+        Constructor method. Methods prefixed with "a" are the coroutines to
+        use with an asynchronous repository.
 
         Args:
-            character_repository (CharacterRepositoryInterface): An instance of
-                a character repository.
+            character_repository (CharacterRepositoryInterface |
+                AsyncCharacterRepositoryInterface): An instance of a
+                character repository.
         """
         self._character_repository = character_repository
 
-    def list_characters(self) -> List[CharacterSchema]:
+    def list_characters(
+        self, query: CharacterQuerySchema | None = None
+    ) -> List[CharacterPartialSchema]:
         """
-        List all characters.
+        List characters.
+
+        Args:
+            query (CharacterQuerySchema | None): Pagination, projection and
+                filtering options. Defaults to the first page.
 
         Returns:
-            List[CharacterSchema]: A list of characters.
+            List[CharacterPartialSchema]: A list of characters.
         """
-        return self._character_repository.get_characters()
+        return self._character_repository.get_characters(query)
+
+    def iter_characters(
+        self, query: CharacterQuerySchema | None = None
+    ) -> Iterator[CharacterSchema]:
+        """
+        Stream characters one at a time.
+
+        Args:
+            query (CharacterQuerySchema | None): Pagination, projection and
+                filtering options. Defaults to every character.
+
+        Returns:
+            Iterator[CharacterSchema]: The characters.
+        """
+        return self._character_repository.iter_characters(query)
 
     def get_character(self, character_id: int) -> CharacterSchema:
         """
@@ -48,3 +85,194 @@ class CharacterInspector:
         if char is None:
             raise CharacterNotFoundError(character_id)
         return char
+
+    def get_characters_by_ids(
+        self, character_ids: List[int]
+    ) -> CharacterLookupResultSchema:
+        """
+        Get many characters by their IDs at once.
+
+        Args:
+            character_ids (List[int]): The IDs of the characters.
+
+        Returns:
+            CharacterLookupResultSchema: The characters found, in the order
+                of their IDs, and the IDs not found.
+        """
+        characters = self._character_repository.get_characters_by_ids(
+            character_ids
+        )
+        return self._lookup_result(character_ids, characters)
+
+    def search_characters(
+        self, search: CharacterSearchSchema
+    ) -> List[CharacterSchema]:
+        """
+        Search characters by name, tolerating typos for fuzzy searches.
+
+        Args:
+            search (CharacterSearchSchema): The search options.
+
+        Returns:
+            List[CharacterSchema]: The page of characters, best match first.
+        """
+        return self._character_repository.search_characters(search)
+
+    def get_character_stats(
+        self, query: CharacterStatsQuerySchema | None = None
+    ) -> CharacterStatsSchema:
+        """
+        Get the statistics of the characters.
+
+        Args:
+            query (CharacterStatsQuerySchema | None): The statistics
+                options. Defaults to the default ones.
+
+        Returns:
+            CharacterStatsSchema: The statistics.
+        """
+        return self._character_repository.get_character_stats(query)
+
+    def get_character_version(
+        self, character_id: int
+    ) -> ResourceVersionSchema | None:
+        """
+        Get the validators of a character, to answer a conditional request.
+
+        Args:
+            character_id (int): The ID of the character.
+
+        Returns:
+            ResourceVersionSchema | None: The validators if the character
+                is found, None otherwise.
+        """
+        return self._character_repository.get_character_version(character_id)
+
+    def get_characters_version(self) -> ResourceVersionSchema | None:
+        """
+        Get the validators of the character collection, to answer a
+        conditional request on a listing.
+
+        Returns:
+            ResourceVersionSchema | None: The validators, None if the
+                collection is not versioned.
+        """
+        return self._character_repository.get_characters_version()
+
+    async def alist_characters(
+        self, query: CharacterQuerySchema | None = None
+    ) -> List[CharacterPartialSchema]:
+        """
+        List characters with an asynchronous repository.
+
+        Args:
+            query (CharacterQuerySchema | None): Pagination, projection and
+                filtering options. Defaults to the first page.
+
+        Returns:
+            List[CharacterPartialSchema]: A list of characters.
+        """
+        return await self._character_repository.get_characters(query)
+
+    def aiter_characters(
+        self, query: CharacterQuerySchema | None = None
+    ) -> AsyncIterator[CharacterSchema]:
+        """
+        Stream characters one at a time with an asynchronous repository.
+
+        Args:
+            query (CharacterQuerySchema | None): Pagination, projection and
+                filtering options. Defaults to every character.
+
+        Returns:
+            AsyncIterator[CharacterSchema]: The characters.
+        """
+        return self._character_repository.iter_characters(query)
+
+    async def aget_character(self, character_id: int) -> CharacterSchema:
+        """
+        Get a character by its ID with an asynchronous repository.
+
+        Args:
+            character_id (int): The ID of the character.
+
+        Returns:
+            CharacterSchema: The character.
+
+        Raises:
+            CharacterNotFoundError: If the character is not found.
+        """
+        char = await self._character_repository.get_character(character_id)
+        if char is None:
+            raise CharacterNotFoundError(character_id)
+        return char
+
+    async def aget_characters_by_ids(
+        self, character_ids: List[int]
+    ) -> CharacterLookupResultSchema:
+        """
+        Get many characters by their IDs at once with an asynchronous
+        repository.
+
+        Args:
+            character_ids (List[int]): The IDs of the characters.
+
+        Returns:
+            CharacterLookupResultSchema: The characters found, in the order
+                of their IDs, and the IDs not found.
+        """
+        characters = await self._character_repository.get_characters_by_ids(
+            character_ids
+        )
+        return self._lookup_result(character_ids, characters)
+
+    async def asearch_characters(
+        self, search: CharacterSearchSchema
+    ) -> List[CharacterSchema]:
+        """
+        Search characters by name with an asynchronous repository.
+
+        Args:
+            search (CharacterSearchSchema): The search options.
+
+        Returns:
+            List[CharacterSchema]: The page of characters, best match first.
+        """
+        return await self._character_repository.search_characters(search)
+
+    async def aget_character_stats(
+        self, query: CharacterStatsQuerySchema | None = None
+    ) -> CharacterStatsSchema:
+        """
+        Get the statistics of the characters with an asynchronous repository.
+
+        Args:
+            query (CharacterStatsQuerySchema | None): The statistics
+                options. Defaults to the default ones.
+
+        Returns:
+            CharacterStatsSchema: The statistics.
+        """
+        return await self._character_repository.get_character_stats(query)
+
+    @staticmethod
+    def _lookup_result(
+        character_ids: List[int], characters: List[CharacterSchema]
+    ) -> CharacterLookupResultSchema:
+        """
+        Report the IDs a lookup did not find.
+
+        Args:
+            character_ids (List[int]): The IDs looked up.
+            characters (List[CharacterSchema]): The characters found.
+
+        Returns:
+            CharacterLookupResultSchema: The lookup result.
+        """
+        found = {character.id for character in characters}
+        return CharacterLookupResultSchema(
+            characters=characters,
+            not_found=[
+                id_ for id_ in dict.fromkeys(character_ids) if id_ not in found
+            ],
+        )
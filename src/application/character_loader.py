@@ -0,0 +1,141 @@
+from typing import Dict, List
+
+from domain.entities.schemas import CharacterSchema
+from domain.repositories.character_repository import (
+    CharacterRepositoryInterface,
+)
+
+
+class PendingCharacter:
+    """
+    A character requested from a CharacterLoader. It is fetched together
+    with every other pending character when it is first read.
+    """
+
+    def __init__(self, loader: "CharacterLoader", character_id: int):
+        """
+        Constructor method.
+
+        Args:
+            loader (CharacterLoader): The loader it was requested from.
+            character_id (int): The ID of the character.
+        """
+        self._loader = loader
+        self.character_id = character_id
+
+    def get(self) -> CharacterSchema | None:
+        """
+        Get the character, fetching the pending ones first if needed.
+
+        Returns:
+            CharacterSchema | None: The character if found, None otherwise.
+        """
+        return self._loader.resolve(self.character_id)
+
+
+class CharacterLoader:
+    """
+    A class to coalesce the character lookups of a unit of work, such as a
+    request, into a single get_characters_by_ids call.
+
+    Lookups are deferred until a requested character is read, and results
+    are remembered for the life of the loader, so a loader must not
+    outlive its unit of work.
+    """
+
+    def __init__(self, character_repository: CharacterRepositoryInterface):
+        """
+        Constructor method.
+
+        Args:
+            character_repository (CharacterRepositoryInterface): An instance
+                of a character repository.
+        """
+        self._character_repository = character_repository
+        # Insertion ordered, to fetch characters in the order requested.
+        self._pending: Dict[int, None] = {}
+        self._loaded: Dict[int, CharacterSchema | None] = {}
+
+    def load(self, character_id: int) -> PendingCharacter:
+        """
+        Request a character without fetching it yet.
+
+        Args:
+            character_id (int): The ID of the character.
+
+        Returns:
+            PendingCharacter: The requested character.
+        """
+        if character_id not in self._loaded:
+            self._pending[character_id] = None
+        return PendingCharacter(self, character_id)
+
+    def load_many(self, character_ids: List[int]) -> List[PendingCharacter]:
+        """
+        Request many characters without fetching them yet.
+
+        Args:
+            character_ids (List[int]): The IDs of the characters.
+
+        Returns:
+            List[PendingCharacter]: The requested characters.
+        """
+        return [self.load(character_id) for character_id in character_ids]
+
+    def get(self, character_id: int) -> CharacterSchema | None:
+        """
+        Get a character, fetching it with every pending one.
+
+        Args:
+            character_id (int): The ID of the character.
+
+        Returns:
+            CharacterSchema | None: The character if found, None otherwise.
+        """
+        return self.resolve(character_id)
+
+    def dispatch(self):
+        """
+        Fetch every pending character in a single repository call.
+        """
+        if not self._pending:
+            return
+        character_ids = list(self._pending)
+        self._pending.clear()
+        found = {
+            character.id: character
+            for character in self._character_repository.get_characters_by_ids(
+                character_ids
+            )
+        }
+        for character_id in character_ids:
+            self._loaded[character_id] = found.get(character_id)
+
+    def clear(self, character_id: int | None = None):
+        """
+        Forget a loaded character, or every one, after a write.
+
+        Args:
+            character_id (int | None): The ID of the character. Defaults to
+                every character.
+        """
+        if character_id is None:
+            self._loaded.clear()
+        else:
+            self._loaded.pop(character_id, None)
+
+    def resolve(self, character_id: int) -> CharacterSchema | None:
+        """
+        Get a requested character, fetching the pending ones if it is not
+        loaded yet.
+
+        Args:
+            character_id (int): The ID of the character.
+
+        Returns:
+            CharacterSchema | None: The character if found, None otherwise.
+        """
+        if character_id not in self._loaded:
+            self._pending[character_id] = None
+            self.dispatch()
+        return self._loaded[character_id]
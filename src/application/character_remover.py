@@ -1,5 +1,8 @@
-from domain.entities.schemas import CharacterSchema
+from typing import List
+
+from domain.entities.schemas import BulkDeleteResultSchema
 from domain.repositories.character_repository import (
+    AsyncCharacterRepositoryInterface,
     CharacterRepositoryInterface,
 )
 
@@ -9,13 +12,19 @@ class CharacterRemover:
     A class to remove a character.
     """
 
-    def __init__(self, character_repository: CharacterRepositoryInterface):
+    def __init__(
+        self,
+        character_repository: CharacterRepositoryInterface
+        | AsyncCharacterRepositoryInterface,
+    ):
         """
-        Constructor method.
+        Constructor method. Methods prefixed with "a" are the coroutines to
+        use with an asynchronous repository.
 
         Args:
-            character_repository (CharacterRepositoryInterface): An instance of
-                a character repository.
+            character_repository (CharacterRepositoryInterface |
+                AsyncCharacterRepositoryInterface): An instance of a
+                character repository.
         """
         self._character_repository = character_repository
 
@@ -30,3 +39,69 @@ class CharacterRemover:
             bool: True if the character was removed, False otherwise.
         """
         return self._character_repository.delete_character(character_id)
+
+    def remove_characters(
+        self, character_ids: List[int]
+    ) -> BulkDeleteResultSchema:
+        """
+        Remove many characters by their IDs.
+
+        Args:
+            character_ids (List[int]): The IDs of the characters.
+
+        Returns:
+            BulkDeleteResultSchema: The deleted and the not found IDs.
+        """
+        character_ids = list(dict.fromkeys(character_ids))
+        deleted = self._character_repository.delete_characters(character_ids)
+        return self._bulk_result(character_ids, deleted)
+
+    async def aremove_character(self, character_id: int) -> bool:
+        """
+        Remove a character by its ID with an asynchronous repository.
+
+        Args:
+            character_id (int): The ID of the character.
+
+        Returns:
+            bool: True if the character was removed, False otherwise.
+        """
+        return await self._character_repository.delete_character(character_id)
+
+    async def aremove_characters(
+        self, character_ids: List[int]
+    ) -> BulkDeleteResultSchema:
+        """
+        Remove many characters by their IDs with an asynchronous repository.
+
+        Args:
+            character_ids (List[int]): The IDs of the characters.
+
+        Returns:
+            BulkDeleteResultSchema: The deleted and the not found IDs.
+        """
+        character_ids = list(dict.fromkeys(character_ids))
+        deleted = await self._character_repository.delete_characters(
+            character_ids
+        )
+        return self._bulk_result(character_ids, deleted)
+
+    @staticmethod
+    def _bulk_result(
+        character_ids: List[int], deleted_ids: List[int]
+    ) -> BulkDeleteResultSchema:
+        """
+        Split the requested IDs between deleted and not found.
+
+        Args:
+            character_ids (List[int]): The requested IDs, without duplicates.
+            deleted_ids (List[int]): The deleted IDs.
+
+        Returns:
+            BulkDeleteResultSchema: The deleted and the not found IDs.
+        """
+        deleted = set(deleted_ids)
+        return BulkDeleteResultSchema(
+            deleted=[id_ for id_ in character_ids if id_ in deleted],
+            not_found=[id_ for id_ in character_ids if id_ not in deleted],
+        )
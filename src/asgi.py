@@ -0,0 +1,9 @@
+from infra.log.config import configure_logging
+from infra.web.starlette.app import CharacterCRUDASGIApp
+
+configure_logging()
+app = CharacterCRUDASGIApp()
+
+
+if __name__ == "__main__":
+    app.run()
@@ -14,3 +14,23 @@ class CharacterNotFoundError(Exception):
     def __init__(self, char_id: int):
         message = f"Character with ID {char_id} not found"
         super().__init__(message)
+
+
+class UnknownFieldError(Exception):
+    def __init__(self, fields: list):
+        message = f"Unknown fields: {', '.join(fields)}"
+        super().__init__(message)
+
+
+class BulkCreateError(Exception):
+    def __init__(self, start: int, reason: str):
+        message = (
+            f"Characters from index {start} could not be created: {reason}"
+        )
+        super().__init__(message)
+
+
+class CharacterAlreadyExistsError(Exception):
+    def __init__(self, char_id: int):
+        message = f"Character with ID {char_id} already exists"
+        super().__init__(message)
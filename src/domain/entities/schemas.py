@@ -1,10 +1,24 @@
-from pydantic import BaseModel, ConfigDict, field_validator
+import hashlib
+from datetime import datetime
+from typing import Dict, List, Sequence
+
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from domain.entities.exceptions import (
     NegativeNumberError,
+    UnknownFieldError,
     ZeroOrNegativeNumberError,
 )
 
+MAX_PAGE_SIZE = 1000
+DEFAULT_PAGE_SIZE = 100
+MIN_SEARCH_LENGTH = 2
+MAX_SEARCH_LENGTH = 100
+MAX_SEARCH_OFFSET = 10000
+MAX_HISTOGRAM_BUCKET_SIZE = 1000
+# Past this many rows a multi-row INSERT hits SQLite's parameter limit.
+MAX_BULK_CHUNK_SIZE = 1000
+
 
 class CharacterSchema(BaseModel):
     model_config = ConfigDict(from_attributes=True)
@@ -32,6 +46,18 @@ class CharacterSchema(BaseModel):
             raise NegativeNumberError()
         return value
 
+    def content_hash(self) -> str:
+        """
+        Hash the content of the character, its ID aside, to tag its
+        representations.
+
+        Returns:
+            str: The hexadecimal hash.
+        """
+        return hashlib.blake2b(
+            self.model_dump_json(exclude={"id"}).encode(), digest_size=16
+        ).hexdigest()
+
 
 class CharacterPartialSchema(BaseModel):
     model_config = ConfigDict(from_attributes=True)
@@ -42,3 +68,198 @@ class CharacterPartialSchema(BaseModel):
     mass: float
     eye_color: str
     birth_year: int
+
+
+class CharacterQuerySchema(BaseModel):
+    """
+    Pagination, projection and filtering options for character listings.
+    Listings are paginated by DEFAULT_PAGE_SIZE unless a limit is given,
+    None reads every character and is meant for streams.
+    """
+
+    limit: int | None = Field(
+        default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE
+    )
+    after_id: int | None = None
+    fields: List[str] | None = None
+    name: str | None = None
+    eye_color: str | None = None
+    birth_year_min: int | None = None
+    birth_year_max: int | None = None
+
+    @field_validator("fields", mode="before")
+    @classmethod
+    def split_fields(cls, value):
+        if isinstance(value, str):
+            value = [field.strip() for field in value.split(",") if field.strip()]
+        return value
+
+    @field_validator("fields")
+    @classmethod
+    def validate_fields(cls, value):
+        if value is None:
+            return value
+        unknown = [
+            field
+            for field in value
+            if field not in CharacterPartialSchema.model_fields
+        ]
+        if unknown:
+            raise UnknownFieldError(unknown)
+        return value
+
+    def next_after_id(
+        self, characters: Sequence[CharacterPartialSchema]
+    ) -> int | None:
+        """
+        Get the cursor of the page following the given one.
+
+        Args:
+            characters (Sequence[CharacterPartialSchema]): The current page.
+
+        Returns:
+            int | None: The after_id of the next page, None if it is the last.
+        """
+        if self.limit is not None and len(characters) == self.limit:
+            return characters[-1].id
+        return None
+
+
+class CharacterSearchSchema(BaseModel):
+    """
+    Options of a search of characters by name.
+    """
+
+    q: str = Field(min_length=MIN_SEARCH_LENGTH, max_length=MAX_SEARCH_LENGTH)
+    limit: int = Field(default=20, ge=1, le=MAX_PAGE_SIZE)
+    offset: int = Field(default=0, ge=0, le=MAX_SEARCH_OFFSET)
+    fuzzy: bool = True
+
+    @field_validator("q", mode="before")
+    @classmethod
+    def collapse_whitespace(cls, value):
+        if isinstance(value, str):
+            value = " ".join(value.split())
+        return value
+
+    def next_offset(self, characters: Sequence[CharacterSchema]) -> int | None:
+        """
+        Get the offset of the page following the given one.
+
+        Args:
+            characters (Sequence[CharacterSchema]): The current page.
+
+        Returns:
+            int | None: The offset of the next page, None if it is the last
+                or past MAX_SEARCH_OFFSET.
+        """
+        next_offset = self.offset + self.limit
+        if len(characters) == self.limit and next_offset <= MAX_SEARCH_OFFSET:
+            return next_offset
+        return None
+
+
+class CharacterStatsQuerySchema(BaseModel):
+    """
+    Options of the statistics of the characters.
+    """
+
+    bucket_size: int = Field(default=10, ge=1, le=MAX_HISTOGRAM_BUCKET_SIZE)
+
+
+class NumericStatsSchema(BaseModel):
+    """
+    The statistics of a numeric field of the characters. Percentiles are
+    interpolated linearly between the closest values.
+    """
+
+    count: int = 0
+    mean: float | None = None
+    min: float | None = None
+    max: float | None = None
+    percentiles: Dict[str, float] = Field(default_factory=dict)
+
+
+class HistogramBucketSchema(BaseModel):
+    """
+    The number of characters with a value in [start, end).
+    """
+
+    start: int
+    end: int
+    count: int
+
+
+class CharacterStatsSchema(BaseModel):
+    """
+    The statistics of the characters: the counts per color, most common
+    first, the statistics of the numeric fields, and the non-empty buckets
+    of the birth years.
+    """
+
+    count: int = 0
+    eye_color: Dict[str, int] = Field(default_factory=dict)
+    hair_color: Dict[str, int] = Field(default_factory=dict)
+    skin_color: Dict[str, int] = Field(default_factory=dict)
+    height: NumericStatsSchema = Field(default_factory=NumericStatsSchema)
+    mass: NumericStatsSchema = Field(default_factory=NumericStatsSchema)
+    birth_year: NumericStatsSchema = Field(default_factory=NumericStatsSchema)
+    birth_year_histogram: List[HistogramBucketSchema] = Field(
+        default_factory=list
+    )
+
+
+class BulkCreateQuerySchema(BaseModel):
+    """
+    Options of a bulk creation of characters.
+    """
+
+    chunk_size: int | None = Field(
+        default=None, ge=1, le=MAX_BULK_CHUNK_SIZE
+    )
+
+
+class BulkCreateErrorSchema(BaseModel):
+    """
+    A character of a bulk creation that could not be created.
+    """
+
+    index: int
+    message: str
+
+
+class BulkCreateResultSchema(BaseModel):
+    """
+    The outcome of a bulk creation.
+    """
+
+    created: List[CharacterSchema] = Field(default_factory=list)
+    errors: List[BulkCreateErrorSchema] = Field(default_factory=list)
+
+
+class BulkDeleteResultSchema(BaseModel):
+    """
+    The outcome of a bulk deletion.
+    """
+
+    deleted: List[int] = Field(default_factory=list)
+    not_found: List[int] = Field(default_factory=list)
+
+
+class CharacterLookupResultSchema(BaseModel):
+    """
+    The outcome of a lookup of many characters by ID.
+    """
+
+    characters: List[CharacterSchema] = Field(default_factory=list)
+    not_found: List[int] = Field(default_factory=list)
+
+
+class ResourceVersionSchema(BaseModel):
+    """
+    The validators of a character or of the character collection, to
+    answer conditional requests without loading them.
+    """
+
+    tag: str
+    modified_at: datetime
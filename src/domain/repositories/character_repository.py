@@ -1,17 +1,50 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import AsyncIterator, Iterator, List
 
-from domain.entities.schemas import CharacterPartialSchema, CharacterSchema
+from domain.entities.schemas import (
+    BulkCreateResultSchema,
+    CharacterPartialSchema,
+    CharacterQuerySchema,
+    CharacterSchema,
+    CharacterSearchSchema,
+    CharacterStatsQuerySchema,
+    CharacterStatsSchema,
+    ResourceVersionSchema,
+)
 
 
 class CharacterRepositoryInterface(ABC):
     @abstractmethod
-    def get_characters(self) -> List[CharacterPartialSchema]:
+    def get_characters(
+        self, query: CharacterQuerySchema | None = None
+    ) -> List[CharacterPartialSchema]:
         """
-        Get all characters from the database.
+        Get characters from the database, ordered by ID.
+
+        Args:
+            query (CharacterQuerySchema | None): Pagination, projection and
+                filtering options. Defaults to the first page.
+
+        Returns:
+            List[CharacterPartialSchema]: A list of characters. When fields
+                are projected only those (and the ID) are set.
+        """
+
+    @abstractmethod
+    def iter_characters(
+        self, query: CharacterQuerySchema | None = None
+    ) -> Iterator[CharacterSchema]:
+        """
+        Stream characters from the database, ordered by ID, without holding
+        them all in memory.
+
+        Args:
+            query (CharacterQuerySchema | None): Pagination, projection and
+                filtering options. Defaults to every character.
 
         Returns:
-            List[CharacterSchema]: A list of characters.
+            Iterator[CharacterSchema]: The characters. When fields are
+                projected only those (and the ID) are set.
         """
 
     @abstractmethod
@@ -26,6 +59,81 @@ class CharacterRepositoryInterface(ABC):
             CharacterSchema | None: The character if found, None otherwise.
         """
 
+    @abstractmethod
+    def get_characters_by_ids(
+        self, character_ids: List[int]
+    ) -> List[CharacterSchema]:
+        """
+        Get many characters by their IDs at once.
+
+        Args:
+            character_ids (List[int]): The IDs of the characters.
+
+        Returns:
+            List[CharacterSchema]: The characters found, in the order of
+                their first ID in character_ids.
+        """
+
+    @abstractmethod
+    def search_characters(
+        self, search: CharacterSearchSchema
+    ) -> List[CharacterSchema]:
+        """
+        Search characters by name: names starting with the query first,
+        then names with a word starting with it, then names containing it
+        and, for fuzzy searches, names matching it with a few typos.
+
+        Args:
+            search (CharacterSearchSchema): The search options.
+
+        Returns:
+            List[CharacterSchema]: The page of characters, best match first.
+        """
+
+    @abstractmethod
+    def get_character_stats(
+        self, query: CharacterStatsQuerySchema | None = None
+    ) -> CharacterStatsSchema:
+        """
+        Get the statistics of the characters: the counts per color, the
+        mean and percentiles of the numeric fields and a histogram of the
+        birth years.
+
+        Args:
+            query (CharacterStatsQuerySchema | None): The statistics
+                options. Defaults to the default ones.
+
+        Returns:
+            CharacterStatsSchema: The statistics.
+        """
+
+    @abstractmethod
+    def get_character_version(
+        self, character_id: int
+    ) -> ResourceVersionSchema | None:
+        """
+        Get the validators of a character without loading it. Its tag is
+        the content hash of the character.
+
+        Args:
+            character_id (int): The ID of the character.
+
+        Returns:
+            ResourceVersionSchema | None: The validators if the character
+                is found, None otherwise.
+        """
+
+    @abstractmethod
+    def get_characters_version(self) -> ResourceVersionSchema | None:
+        """
+        Get the validators of the character collection, which change with
+        every write.
+
+        Returns:
+            ResourceVersionSchema | None: The validators, None if the
+                collection is not versioned.
+        """
+
     @abstractmethod
     def create_character(self, character: CharacterSchema) -> CharacterSchema:
         """
@@ -38,6 +146,32 @@ class CharacterRepositoryInterface(ABC):
             CharacterSchema: The created character.
         """
 
+    @abstractmethod
+    def create_characters(
+        self,
+        characters: List[CharacterSchema],
+        chunk_size: int | None = None,
+        atomic: bool = True,
+    ) -> BulkCreateResultSchema:
+        """
+        Create many characters, inserting them in chunks.
+
+        Args:
+            characters (List[CharacterSchema]): The characters to create.
+            chunk_size (int | None): The number of characters inserted per
+                statement. Defaults to the repository's own.
+            atomic (bool): If True every character is created in a single
+                transaction and any failure creates none of them. If False
+                a failing chunk does not undo the others: each chunk runs
+                in its own savepoint of a single transaction, or is
+                committed on its own where the repository cannot use
+                savepoints, and failing characters are reported by index.
+
+        Returns:
+            BulkCreateResultSchema: The created characters, in input order,
+                and the errors.
+        """
+
     @abstractmethod
     def delete_character(self, character_id: int) -> bool:
         """
@@ -49,3 +183,169 @@ class CharacterRepositoryInterface(ABC):
         Returns:
             bool: True if the character was deleted, False otherwise
         """
+
+    @abstractmethod
+    def delete_characters(self, character_ids: List[int]) -> List[int]:
+        """
+        Delete many characters by their IDs in a single transaction.
+
+        Args:
+            character_ids (List[int]): The IDs of the characters.
+
+        Returns:
+            List[int]: The IDs of the deleted characters.
+        """
+
+
+class AsyncCharacterRepositoryInterface(ABC):
+    """
+    The asynchronous counterpart of CharacterRepositoryInterface.
+    """
+
+    @abstractmethod
+    async def get_characters(
+        self, query: CharacterQuerySchema | None = None
+    ) -> List[CharacterPartialSchema]:
+        """
+        Get characters from the database, ordered by ID.
+
+        Args:
+            query (CharacterQuerySchema | None): Pagination, projection and
+                filtering options. Defaults to the first page.
+
+        Returns:
+            List[CharacterPartialSchema]: A list of characters.
+        """
+
+    @abstractmethod
+    def iter_characters(
+        self, query: CharacterQuerySchema | None = None
+    ) -> AsyncIterator[CharacterSchema]:
+        """
+        Stream characters from the database, ordered by ID.
+
+        Args:
+            query (CharacterQuerySchema | None): Pagination, projection and
+                filtering options. Defaults to every character.
+
+        Returns:
+            AsyncIterator[CharacterSchema]: The characters.
+        """
+
+    @abstractmethod
+    async def get_character(self, character_id: int) -> CharacterSchema | None:
+        """
+        Get a character by its ID.
+
+        Args:
+            character_id (int): The ID of the character.
+
+        Returns:
+            CharacterSchema | None: The character if found, None otherwise.
+        """
+
+    @abstractmethod
+    async def get_characters_by_ids(
+        self, character_ids: List[int]
+    ) -> List[CharacterSchema]:
+        """
+        Get many characters by their IDs at once.
+
+        Args:
+            character_ids (List[int]): The IDs of the characters.
+
+        Returns:
+            List[CharacterSchema]: The characters found, in the order of
+                their first ID in character_ids.
+        """
+
+    @abstractmethod
+    async def search_characters(
+        self, search: CharacterSearchSchema
+    ) -> List[CharacterSchema]:
+        """
+        Search characters by name: names starting with the query first,
+        then names with a word starting with it, then names containing it
+        and, for fuzzy searches, names matching it with a few typos.
+
+        Args:
+            search (CharacterSearchSchema): The search options.
+
+        Returns:
+            List[CharacterSchema]: The page of characters, best match first.
+        """
+
+    @abstractmethod
+    async def get_character_stats(
+        self, query: CharacterStatsQuerySchema | None = None
+    ) -> CharacterStatsSchema:
+        """
+        Get the statistics of the characters: the counts per color, the
+        mean and percentiles of the numeric fields and a histogram of the
+        birth years.
+
+        Args:
+            query (CharacterStatsQuerySchema | None): The statistics
+                options. Defaults to the default ones.
+
+        Returns:
+            CharacterStatsSchema: The statistics.
+        """
+
+    @abstractmethod
+    async def create_character(
+        self, character: CharacterSchema
+    ) -> CharacterSchema:
+        """
+        Create a new character.
+
+        Args:
+            character (CharacterSchema): The character to create.
+
+        Returns:
+            CharacterSchema: The created character.
+        """
+
+    @abstractmethod
+    async def create_characters(
+        self,
+        characters: List[CharacterSchema],
+        chunk_size: int | None = None,
+        atomic: bool = True,
+    ) -> BulkCreateResultSchema:
+        """
+        Create many characters, inserting them in chunks.
+
+        Args:
+            characters (List[CharacterSchema]): The characters to create.
+            chunk_size (int | None): The number of characters inserted per
+                statement. Defaults to the repository's own.
+            atomic (bool): Whether to create all the characters or none.
+
+        Returns:
+            BulkCreateResultSchema: The created characters and the errors.
+        """
+
+    @abstractmethod
+    async def delete_character(self, character_id: int) -> bool:
+        """
+        Delete a character by its ID.
+
+        Args:
+            character_id (int): The ID of the character.
+
+        Returns:
+            bool: True if the character was deleted, False otherwise
+        """
+
+    @abstractmethod
+    async def delete_characters(self, character_ids: List[int]) -> List[int]:
+        """
+        Delete many characters by their IDs in a single transaction.
+
+        Args:
+            character_ids (List[int]): The IDs of the characters.
+
+        Returns:
+            List[int]: The IDs of the deleted characters.
+        """
@@ -1,10 +1,15 @@
+import json
+import time
+from pathlib import Path
+from typing import List, Optional
+
 import typer
 
-from application.character_creator import CharacterCreator
-from application.character_inspector import CharacterInspector
-from application.character_remover import CharacterRemover
-from domain.entities.schemas import CharacterSchema
-from infra.repositories.sql.character_repository import CharacterRepository
+from infra.cli.enums import FileFormats
+from settings import DatabaseSettings
+
+# Commands import the application and database layers when they run, so
+# that starting the CLI, or asking for --help, stays cheap.
 
 app = typer.Typer(
     help="""
@@ -14,27 +19,138 @@ This console interface allows you to manage characters with the following functi
 \n
 - 📜 **list-characters**: Lists all stored characters.\n
 - 🔍 **get-character**: Retrieves a specific character by its ID.\n
+- 🔎 **search-characters**: Searches characters by name, tolerating typos.\n
 - ➕ **add-character**: Creates a new character by providing the necessary data.\n
-- 🗑️ **delete-character**: Deletes an existing character by its ID.\n\n
+- 🗑️ **delete-character**: Deletes existing characters by their IDs.\n
+- 📥 **import-characters**: Imports characters from a JSONL or CSV file.\n
+- 📤 **export-characters**: Exports every character to a JSONL or CSV file.\n
+- 💾 **snapshot-characters**: Writes every character to an in-memory repository snapshot.\n
+- 🛠️ **migrate**: Applies the pending database migrations.\n
+- 📝 **dump-openapi**: Writes the OpenAPI document to a file.\n\n
 
 Example usage:\n\n
 
     python app.py list-characters\n
+    python app.py list-characters --stream > characters.ndjson\n
+    python app.py list-characters --limit 50 --after-id 100 --fields name,eye_color --eye-color blue\n
     python app.py get-character 1\n
+    python app.py search-characters "luke sky" --limit 10\n
     python app.py add-character --name "Luke" --height 172 --mass 77 --hair-color "blond" --skin-color "fair" --eye-color "blue" --birth-year 19\n
     python app.py delete-character 1\n
+    python app.py delete-character 1 2 3\n
+    python app.py import-characters characters.csv --chunk-size 1000\n
+    python app.py export-characters characters.jsonl\n
+    python app.py snapshot-characters characters.snapshot\n
+    python app.py migrate\n
+    python app.py migrate --status\n
+    python app.py dump-openapi swagger.json\n
 """
 )
 
 
+@app.callback()
+def main():
+    """
+    Configure logging before a command runs.
+    """
+    from infra.log.config import configure_logging
+
+    configure_logging()
+
+
+def character_repository(read_only: bool = False):
+    """
+    Build the SQL repository on the process-wide engines, cached per
+    database URL.
+
+    Args:
+        read_only (bool): Whether the command only reads, in which case
+            pending migrations are never applied.
+
+    Returns:
+        CharacterRepository: The repository.
+    """
+    from infra.repositories.sql.base import EngineRegistry
+    from infra.repositories.sql.character_repository import (
+        CharacterRepository,
+    )
+
+    create_schema = DatabaseSettings.CREATE_SCHEMA_ON_STARTUP and not read_only
+    return CharacterRepository(
+        EngineRegistry.get(
+            CharacterRepository.DATABASE_URL, create_schema=create_schema
+        ),
+        replicas=[
+            EngineRegistry.get(url, create_schema=False)
+            for url in CharacterRepository.REPLICA_URLS
+        ],
+    )
+
+
 @app.command(help="📜 Lists all registered characters.")
-def list_characters():
-    """List all characters."""
-    character_inspector = CharacterInspector(CharacterRepository())
+def list_characters(
+    limit: Optional[int] = typer.Option(
+        None, help="Maximum number of characters to list."
+    ),
+    after_id: Optional[int] = typer.Option(
+        None, help="List characters with an ID greater than this cursor."
+    ),
+    fields: Optional[str] = typer.Option(
+        None, help="Comma separated fields to show, e.g. name,eye_color."
+    ),
+    name: Optional[str] = typer.Option(None, help="Filter by exact name."),
+    eye_color: Optional[str] = typer.Option(
+        None, help="Filter by exact eye color."
+    ),
+    birth_year_min: Optional[int] = typer.Option(
+        None, help="Filter by minimum year of birth."
+    ),
+    birth_year_max: Optional[int] = typer.Option(
+        None, help="Filter by maximum year of birth."
+    ),
+    stream: bool = typer.Option(
+        False, help="Stream characters as NDJSON, one per line."
+    ),
+):
+    """
+    List characters.
+
+    Args:
+        limit (int | None): Maximum number of characters to list.
+        after_id (int | None): Pagination cursor.
+        fields (str | None): Comma separated fields to show.
+        name (str | None): Name filter.
+        eye_color (str | None): Eye color filter.
+        birth_year_min (int | None): Minimum year of birth filter.
+        birth_year_max (int | None): Maximum year of birth filter.
+        stream (bool): Whether to stream NDJSON lines.
+    """
+    from application.character_inspector import CharacterInspector
+    from domain.entities.schemas import CharacterQuerySchema
+
+    character_inspector = CharacterInspector(
+        character_repository(read_only=True)
+    )
     try:
-        characters = character_inspector.list_characters()
+        query = CharacterQuerySchema(
+            limit=limit,
+            after_id=after_id,
+            fields=fields,
+            name=name,
+            eye_color=eye_color,
+            birth_year_min=birth_year_min,
+            birth_year_max=birth_year_max,
+        )
+        if stream:
+            for character in character_inspector.iter_characters(query):
+                typer.echo(character.model_dump_json(exclude_unset=True))
+            return
+        characters = character_inspector.list_characters(query)
         for character in characters:
-            typer.echo(character.model_dump_json(indent=2))
+            typer.echo(character.model_dump_json(indent=2, exclude_unset=True))
+        next_after_id = query.next_after_id(characters)
+        if next_after_id is not None:
+            typer.echo(f"➡️ Next page: --after-id {next_after_id}")
     except Exception as e:
         typer.echo(f"❌ Error: {str(e)}")
 
@@ -51,7 +167,11 @@ def get_character(
     Args:
         character_id (int): The ID of the character.
     """
-    character_inspector = CharacterInspector(CharacterRepository())
+    from application.character_inspector import CharacterInspector
+
+    character_inspector = CharacterInspector(
+        character_repository(read_only=True)
+    )
     try:
         character = character_inspector.get_character(character_id)
         if character:
@@ -62,6 +182,44 @@ def get_character(
         typer.echo(f"❌ Error: {str(e)}")
 
 
+@app.command(help="🔎 Searches characters by name, tolerating typos.")
+def search_characters(
+    q: str = typer.Argument(..., help="The name, or part of it."),
+    limit: int = typer.Option(20, help="Maximum number of characters."),
+    offset: int = typer.Option(0, help="Number of best matches to skip."),
+    fuzzy: bool = typer.Option(
+        True, help="Also match names with a few typos."
+    ),
+):
+    """
+    Search characters by name, best match first.
+
+    Args:
+        q (str): The name, or part of it.
+        limit (int): Maximum number of characters.
+        offset (int): Number of best matches to skip.
+        fuzzy (bool): Whether to match names with a few typos.
+    """
+    from application.character_inspector import CharacterInspector
+    from domain.entities.schemas import CharacterSearchSchema
+
+    character_inspector = CharacterInspector(
+        character_repository(read_only=True)
+    )
+    try:
+        search = CharacterSearchSchema(
+            q=q, limit=limit, offset=offset, fuzzy=fuzzy
+        )
+        characters = character_inspector.search_characters(search)
+        for character in characters:
+            typer.echo(character.model_dump_json(indent=2))
+        next_offset = search.next_offset(characters)
+        if next_offset is not None:
+            typer.echo(f"➡️ Next page: --offset {next_offset}")
+    except Exception as e:
+        typer.echo(f"❌ Error: {str(e)}")
+
+
 @app.command(
     help="➕ Creates a new character by providing the necessary data."
 )
@@ -86,7 +244,10 @@ def add_character(
         eye_color (str): Character's eye color.
         birth_year (int): Character's year of birth.
     """
-    character_creator = CharacterCreator(CharacterRepository())
+    from application.character_creator import CharacterCreator
+    from domain.entities.schemas import CharacterSchema
+
+    character_creator = CharacterCreator(character_repository())
     try:
         input_data = CharacterSchema(
             id=None,
@@ -105,24 +266,215 @@ def add_character(
         typer.echo(f"❌ Error: {str(e)}")
 
 
-@app.command(help="🗑️ Deletes a character by its ID.")
+@app.command(help="🗑️ Deletes characters by their IDs.")
 def delete_character(
-    character_id: int = typer.Argument(
-        ..., help="ID of the character to delete."
+    character_ids: List[int] = typer.Argument(
+        ..., help="IDs of the characters to delete."
     )
 ):
     """
-    Delete a character by ID.
+    Delete characters by ID.
 
     Args:
-        character_id (int): The ID of the character.
+        character_ids (List[int]): The IDs of the characters.
     """
-    character_remover = CharacterRemover(CharacterRepository())
+    from application.character_remover import CharacterRemover
+
+    character_remover = CharacterRemover(character_repository())
     try:
-        removed = character_remover.remove_character(character_id)
-        if removed:
-            typer.echo("✅ Character deleted successfully.")
-        else:
-            typer.echo("⚠️ Character not found.")
+        if len(character_ids) == 1:
+            removed = character_remover.remove_character(character_ids[0])
+            if removed:
+                typer.echo("✅ Character deleted successfully.")
+            else:
+                typer.echo("⚠️ Character not found.")
+            return
+        result = character_remover.remove_characters(character_ids)
+        typer.echo(f"✅ {len(result.deleted)} characters deleted successfully.")
+        if result.not_found:
+            not_found = ", ".join(str(id_) for id_ in result.not_found)
+            typer.echo(f"⚠️ Characters not found: {not_found}")
+    except Exception as e:
+        typer.echo(f"❌ Error: {str(e)}")
+
+
+@app.command(help="📥 Imports characters from a JSONL or CSV file.")
+def import_characters(
+    path: Path = typer.Argument(
+        ..., exists=True, dir_okay=False, help="File to import."
+    ),
+    file_format: Optional[FileFormats] = typer.Option(
+        None, "--format", help="File format, detected from the extension."
+    ),
+    chunk_size: int = typer.Option(
+        DatabaseSettings.BULK_CHUNK_SIZE,
+        min=1,
+        help="Number of characters inserted per batch.",
+    ),
+):
+    """
+    Import characters from a file, streaming it in batches. Malformed,
+    invalid or conflicting rows are reported and skipped.
+
+    Args:
+        path (Path): The file to import.
+        file_format (FileFormats | None): The format of the file.
+        chunk_size (int): The number of characters inserted per batch.
+    """
+    from application.character_creator import CharacterCreator
+    from infra.cli.files import chunked, detect_format, read_characters
+
+    character_creator = CharacterCreator(character_repository())
+    try:
+        file_format = file_format or detect_format(path)
+        started = time.perf_counter()
+        created = failed = processed = 0
+        malformed: List[int] = []
+
+        def report_malformed(line_number: int, message: str):
+            malformed.append(line_number)
+            typer.echo(f"⚠️ Line {line_number}: invalid JSON, {message}")
+
+        position = "Record" if file_format == FileFormats.CSV else "Line"
+        with path.open(newline="") as file:
+            rows = read_characters(file, file_format, on_error=report_malformed)
+            for chunk in chunked(rows, chunk_size):
+                numbers = [number for number, _ in chunk]
+                result = character_creator.create_characters(
+                    [row for _, row in chunk],
+                    chunk_size=chunk_size,
+                    atomic=False,
+                )
+                for error in result.errors:
+                    typer.echo(
+                        f"⚠️ {position} {numbers[error.index]}: "
+                        f"{error.message}"
+                    )
+                created += len(result.created)
+                failed += len(result.errors)
+                processed += len(chunk)
+                typer.echo(f"⏳ {processed} rows processed")
+        failed += len(malformed)
+        elapsed = time.perf_counter() - started
+        typer.echo(
+            f"✅ Imported {created} characters ({failed} failed) in "
+            f"{elapsed:.2f}s, {processed / elapsed:.0f} rows/sec"
+        )
+    except Exception as e:
+        typer.echo(f"❌ Error: {str(e)}")
+
+
+@app.command(help="📤 Exports every character to a JSONL or CSV file.")
+def export_characters(
+    path: Path = typer.Argument(..., dir_okay=False, help="File to write."),
+    file_format: Optional[FileFormats] = typer.Option(
+        None, "--format", help="File format, detected from the extension."
+    ),
+):
+    """
+    Export every character to a file, streaming them from the database.
+
+    Args:
+        path (Path): The file to write.
+        file_format (FileFormats | None): The format of the file.
+    """
+    from application.character_inspector import CharacterInspector
+    from infra.cli.files import detect_format, write_characters
+
+    character_inspector = CharacterInspector(
+        character_repository(read_only=True)
+    )
+    try:
+        file_format = file_format or detect_format(path)
+        started = time.perf_counter()
+        with path.open("w", newline="") as file:
+            exported = write_characters(
+                file, file_format, character_inspector.iter_characters()
+            )
+        elapsed = time.perf_counter() - started
+        typer.echo(
+            f"✅ Exported {exported} characters in {elapsed:.2f}s, "
+            f"{exported / elapsed:.0f} rows/sec"
+        )
+    except Exception as e:
+        typer.echo(f"❌ Error: {str(e)}")
+
+
+@app.command(help="💾 Writes every character to an in-memory repository snapshot.")
+def snapshot_characters(
+    path: Path = typer.Argument(..., dir_okay=False, help="File to write."),
+):
+    """
+    Load every character into an in-memory repository, streaming them from
+    the database, and write its snapshot, to warm start from.
+
+    Args:
+        path (Path): The file to write.
+    """
+    from infra.repositories.memory.character_repository import (
+        InMemoryCharacterRepository,
+    )
+
+    try:
+        started = time.perf_counter()
+        repository = InMemoryCharacterRepository()
+        repository.load(character_repository(read_only=True).iter_characters())
+        written = repository.snapshot(str(path))
+        elapsed = time.perf_counter() - started
+        typer.echo(
+            f"✅ Wrote {written} characters to {path} in {elapsed:.2f}s"
+        )
+    except Exception as e:
+        typer.echo(f"❌ Error: {str(e)}")
+
+
+@app.command(help="🛠️ Applies the pending database migrations.")
+def migrate(
+    status: bool = typer.Option(
+        False, help="Only list the pending migrations."
+    ),
+):
+    """
+    Apply the pending database migrations.
+
+    Args:
+        status (bool): Whether to only list the pending migrations.
+    """
+    from infra.repositories.sql.base import EngineRegistry
+    from infra.repositories.sql.migrations.migrator import Migrator
+
+    try:
+        initializer = EngineRegistry.get(
+            DatabaseSettings.CONNECTION_STRING, create_schema=False
+        )
+        if status:
+            with initializer.write_engine.begin() as connection:
+                pending = Migrator(connection).pending()
+            for revision in pending:
+                typer.echo(f"⏳ {revision.version:04d} {revision.description}")
+            typer.echo(f"✅ {len(pending)} pending migrations.")
+            return
+        for revision in initializer.create_schema():
+            typer.echo(f"✅ Applied {revision.version:04d} {revision.description}")
+        typer.echo("✅ Database schema is up to date.")
+    except Exception as e:
+        typer.echo(f"❌ Error: {str(e)}")
+
+
+@app.command(help="📝 Writes the OpenAPI document to a file.")
+def dump_openapi(
+    path: Path = typer.Argument(..., dir_okay=False, help="File to write."),
+):
+    """
+    Write the OpenAPI document to a file.
+
+    Args:
+        path (Path): The file to write.
+    """
+    from infra.web.flask.openapi_spec import build_openapi_spec
+
+    try:
+        path.write_text(json.dumps(build_openapi_spec(), indent=2))
+        typer.echo(f"✅ OpenAPI document written to {path}")
     except Exception as e:
         typer.echo(f"❌ Error: {str(e)}")
@@ -0,0 +1,10 @@
+from enum import Enum
+
+
+class FileFormats(str, Enum):
+    """
+    Character file formats
+    """
+
+    JSONL = "jsonl"
+    CSV = "csv"
@@ -0,0 +1,136 @@
+import csv
+import json
+from itertools import islice
+from pathlib import Path
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Tuple,
+)
+
+from domain.entities.schemas import CharacterSchema
+from infra.cli.enums import FileFormats
+
+FILE_EXTENSIONS = {
+    ".jsonl": FileFormats.JSONL,
+    ".ndjson": FileFormats.JSONL,
+    ".csv": FileFormats.CSV,
+}
+CSV_FIELDS = list(CharacterSchema.model_fields)
+
+
+def detect_format(path: Path) -> FileFormats:
+    """
+    Detect the format of a characters file from its extension.
+
+    Args:
+        path (Path): The path of the file.
+
+    Returns:
+        FileFormats: The format of the file.
+
+    Raises:
+        ValueError: If the extension is unknown.
+    """
+    try:
+        return FILE_EXTENSIONS[path.suffix.lower()]
+    except KeyError:
+        raise ValueError(
+            f"Unknown file extension {path.suffix!r}, use --format"
+        ) from None
+
+
+def read_characters(
+    file: IO[str],
+    file_format: FileFormats,
+    on_error: Callable[[int, str], None] | None = None,
+) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """
+    Read characters from a file one row at a time, with their position in
+    the file: the line number for JSONL and the record number, header
+    excluded, for CSV.
+
+    Args:
+        file (IO[str]): The file to read.
+        file_format (FileFormats): The format of the file.
+        on_error (Callable[[int, str], None] | None): Called with the line
+            number and the error of each malformed JSONL line, which is
+            then skipped. If None the error is raised.
+
+    Yields:
+        Tuple[int, Dict[str, Any]]: The positions and the unvalidated
+            characters.
+
+    Raises:
+        json.JSONDecodeError: If a JSONL line is malformed and there is no
+            on_error callback.
+    """
+    if file_format == FileFormats.CSV:
+        for record_number, row in enumerate(csv.DictReader(file), start=1):
+            yield record_number, {
+                key: value for key, value in row.items() if value != ""
+            }
+        return
+    for line_number, line in enumerate(file, start=1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except json.JSONDecodeError as e:
+            if on_error is None:
+                raise
+            on_error(line_number, str(e))
+            continue
+        yield line_number, row
+
+
+def write_characters(
+    file: IO[str],
+    file_format: FileFormats,
+    characters: Iterable[CharacterSchema],
+) -> int:
+    """
+    Write characters to a file one row at a time.
+
+    Args:
+        file (IO[str]): The file to write.
+        file_format (FileFormats): The format of the file.
+        characters (Iterable[CharacterSchema]): The characters to write.
+
+    Returns:
+        int: The number of characters written.
+    """
+    count = 0
+    if file_format == FileFormats.CSV:
+        writer = csv.DictWriter(file, fieldnames=CSV_FIELDS)
+        writer.writeheader()
+        for character in characters:
+            writer.writerow(character.model_dump())
+            count += 1
+        return count
+    for character in characters:
+        file.write(character.model_dump_json())
+        file.write("\n")
+        count += 1
+    return count
+
+
+def chunked(rows: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """
+    Split rows in lists of at most size rows.
+
+    Args:
+        rows (Iterable[Any]): The rows to split.
+        size (int): The size of the chunks.
+
+    Yields:
+        List[Any]: The chunks.
+    """
+    iterator = iter(rows)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
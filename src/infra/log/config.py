@@ -0,0 +1,114 @@
+import atexit
+import logging
+import os
+import queue
+import sys
+from logging.handlers import QueueListener
+from typing import TextIO
+
+from infra.log import constants as cts
+from infra.log.formatters import JsonFormatter
+from infra.log.handlers import DroppingQueueHandler
+from infra.log.sql import (
+    install_slow_query_logging,
+    uninstall_slow_query_logging,
+)
+from settings import LoggingSettings
+
+_state = {"handler": None, "listener": None}
+
+
+def configure_logging(
+    level: str = LoggingSettings.LEVEL,
+    log_format: str = LoggingSettings.FORMAT,
+    asynchronous: bool = LoggingSettings.ASYNC,
+    queue_size: int = LoggingSettings.QUEUE_SIZE,
+    sql_echo: bool = LoggingSettings.SQL_ECHO,
+    slow_query_ms: float = LoggingSettings.SLOW_QUERY_MS,
+    slow_query_sample_rate: float = LoggingSettings.SLOW_QUERY_SAMPLE_RATE,
+    stream: TextIO | None = None,
+):
+    """
+    Configure the root logger.
+
+    When asynchronous, records are put on a bounded queue by the logging
+    thread and written by a background listener thread, so log I/O never
+    blocks a request. Calling it again replaces the previous
+    configuration, which is how a forked worker gets its own listener.
+
+    Args:
+        level (str): The level of the root logger.
+        log_format (str): "json" for one JSON object per line, or "text".
+        asynchronous (bool): Whether to write the records from a background
+            thread.
+        queue_size (int): The maximum number of records waiting to be
+            written, above which records are dropped.
+        sql_echo (bool): Whether to log every SQL statement.
+        slow_query_ms (float): The duration above which SQL statements are
+            logged, 0 to disable.
+        slow_query_sample_rate (float): The fraction of the slow SQL
+            statements logged.
+        stream (TextIO | None): Where records are written. Defaults to
+            stderr.
+    """
+    root = logging.getLogger()
+    _reset()
+
+    output_handler = logging.StreamHandler(stream or sys.stderr)
+    if log_format == cts.LogFormats.JSON:
+        output_handler.setFormatter(JsonFormatter())
+    else:
+        output_handler.setFormatter(logging.Formatter(cts.TEXT_FORMAT))
+
+    handler = output_handler
+    if asynchronous:
+        records = queue.Queue(maxsize=queue_size)
+        handler = DroppingQueueHandler(records)
+        listener = QueueListener(
+            records, output_handler, respect_handler_level=True
+        )
+        listener.start()
+        _state["listener"] = listener
+    root.addHandler(handler)
+    root.setLevel(level)
+    _state["handler"] = handler
+
+    logging.getLogger(cts.SQL_LOGGER_NAME).setLevel(
+        logging.INFO if sql_echo else logging.WARNING
+    )
+    if slow_query_ms > 0:
+        install_slow_query_logging(slow_query_ms, slow_query_sample_rate)
+    else:
+        uninstall_slow_query_logging()
+
+
+def _reset():
+    """
+    Remove the handler installed by configure_logging and flush its
+    listener.
+    """
+    handler = _state["handler"]
+    if handler is not None:
+        logging.getLogger().removeHandler(handler)
+        _state["handler"] = None
+    listener = _state["listener"]
+    if listener is not None:
+        listener.stop()
+        _state["listener"] = None
+
+
+def _forget_after_fork():
+    """
+    Remove the handler installed by configure_logging in a forked child,
+    whose copy of the listener thread does not run. configure_logging has
+    to be called again in the child.
+    """
+    handler = _state["handler"]
+    if handler is not None:
+        logging.getLogger().removeHandler(handler)
+    _state["handler"] = None
+    _state["listener"] = None
+
+
+atexit.register(_reset)
+os.register_at_fork(after_in_child=_forget_after_fork)
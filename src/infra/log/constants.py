@@ -0,0 +1,8 @@
+TEXT_FORMAT: str = "%(asctime)s %(levelname)s %(name)s: %(message)s"
+SQL_LOGGER_NAME: str = "sqlalchemy.engine"
+SLOW_QUERY_LOGGER_NAME: str = "sql.slow_query"
+
+
+class LogFormats:
+    JSON: str = "json"
+    TEXT: str = "text"
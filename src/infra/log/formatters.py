@@ -0,0 +1,42 @@
+import json
+import logging
+from datetime import datetime, timezone
+
+# The attributes every LogRecord has, anything else came from extra=.
+RECORD_ATTRIBUTES = frozenset(
+    logging.LogRecord("", 0, "", 0, "", (), None).__dict__
+) | {"message", "asctime"}
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    Format records as one JSON object per line, with the fields given in
+    extra= as top-level keys.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        """
+        Format a record.
+
+        Args:
+            record (logging.LogRecord): The record.
+
+        Returns:
+            str: The JSON line.
+        """
+        data = {
+            "timestamp": datetime.fromtimestamp(
+                record.created, timezone.utc
+            ).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in RECORD_ATTRIBUTES:
+                data[key] = value
+        if record.exc_info:
+            data["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            data["exception"] = record.exc_text
+        return json.dumps(data, default=str)
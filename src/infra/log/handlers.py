@@ -0,0 +1,46 @@
+import copy
+import logging
+import queue
+from logging.handlers import QueueHandler
+
+from infra.metrics.metrics import LOG_RECORDS_DROPPED
+
+
+class DroppingQueueHandler(QueueHandler):
+    """
+    A QueueHandler that never blocks: when the queue is full the record is
+    dropped and counted instead.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Merge the message arguments and render the exception of a record,
+        so that it can be formatted later on the listener thread.
+
+        Args:
+            record (logging.LogRecord): The record.
+
+        Returns:
+            logging.LogRecord: A copy of the record, safe to enqueue.
+        """
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(
+                record.exc_info
+            )
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        """
+        Enqueue a record, dropping it if the queue is full.
+
+        Args:
+            record (logging.LogRecord): The record.
+        """
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            LOG_RECORDS_DROPPED.inc()
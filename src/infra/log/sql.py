@@ -0,0 +1,73 @@
+import logging
+import random
+from time import perf_counter
+
+from sqlalchemy import Engine, event
+
+from infra.log import constants as cts
+from infra.metrics.metrics import REPOSITORY_METHOD
+
+STATEMENT_START_TIME_KEY = "log_statement_start_time"
+
+logger = logging.getLogger(cts.SLOW_QUERY_LOGGER_NAME)
+
+_options = {"threshold": 0.0, "sample_rate": 1.0}
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    """
+    Remember when a statement started.
+    """
+    conn.info[STATEMENT_START_TIME_KEY] = perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    """
+    Log a sample of the statements slower than the threshold.
+    """
+    started = conn.info.pop(STATEMENT_START_TIME_KEY, None)
+    if started is None:
+        # Logging was installed while the statement was running.
+        return
+    duration = perf_counter() - started
+    if duration < _options["threshold"]:
+        return
+    if random.random() >= _options["sample_rate"]:
+        return
+    logger.warning(
+        "Slow query (%.1f ms): %s",
+        duration * 1000,
+        statement,
+        extra={
+            "duration_ms": round(duration * 1000, 3),
+            "statement": statement,
+            "repository_method": REPOSITORY_METHOD.get(),
+        },
+    )
+
+
+def install_slow_query_logging(threshold_ms: float, sample_rate: float = 1.0):
+    """
+    Log the SQL statements of every engine that run longer than a
+    threshold. Calling it again only updates the options.
+
+    Args:
+        threshold_ms (float): The duration, in milliseconds, above which a
+            statement is logged.
+        sample_rate (float): The fraction of the slow statements logged,
+            between 0 and 1.
+    """
+    _options["threshold"] = threshold_ms / 1000
+    _options["sample_rate"] = sample_rate
+    if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def uninstall_slow_query_logging():
+    """
+    Stop logging slow SQL statements.
+    """
+    if event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.remove(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.remove(Engine, "after_cursor_execute", _after_cursor_execute)
@@ -0,0 +1,19 @@
+DEFAULT_BUCKETS: tuple = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+CONTENT_TYPE: str = "text/plain; version=0.0.4; charset=utf-8"
+UNMATCHED_ROUTE: str = "unmatched"
+NO_REPOSITORY_METHOD: str = "none"
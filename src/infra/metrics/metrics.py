@@ -0,0 +1,62 @@
+from contextvars import ContextVar
+
+from infra.metrics import constants as cts
+from infra.metrics.registry import REGISTRY
+
+HTTP_REQUESTS = REGISTRY.counter(
+    "http_requests_total",
+    "HTTP requests by route, method and status code.",
+    ("route", "method", "status"),
+)
+HTTP_REQUEST_DURATION = REGISTRY.histogram(
+    "http_request_duration_seconds",
+    "Time until the response headers are sent, by route and method.",
+    ("route", "method"),
+)
+REPOSITORY_CALL_DURATION = REGISTRY.histogram(
+    "repository_call_duration_seconds",
+    "Duration of the character repository calls, by method.",
+    ("method",),
+)
+REPOSITORY_CALL_ERRORS = REGISTRY.counter(
+    "repository_call_errors_total",
+    "Character repository calls that raised, by method.",
+    ("method",),
+)
+SQL_STATEMENTS = REGISTRY.counter(
+    "sql_statements_total",
+    "SQL statements executed, by repository method.",
+    ("method",),
+)
+SQL_STATEMENT_DURATION = REGISTRY.histogram(
+    "sql_statement_duration_seconds",
+    "Duration of the SQL statements, by repository method.",
+    ("method",),
+)
+DB_POOL_CHECKOUT_WAIT = REGISTRY.histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time waited for a pooled database connection, by repository method.",
+    ("method",),
+)
+SQL_WRITE_BATCH_SIZE = REGISTRY.histogram(
+    "sql_write_batch_size",
+    "Writes committed together by the SQLite writer thread.",
+    buckets=(1, 2, 4, 8, 16, 32, 64, 128),
+)
+SINGLE_FLIGHT_CALLS = REGISTRY.counter(
+    "repository_single_flight_calls_total",
+    "Repository reads by method and role: leader (ran the query), "
+    "coalesced (shared the result of the leader) or timed_out (waited "
+    "too long and ran its own query).",
+    ("method", "role"),
+)
+LOG_RECORDS_DROPPED = REGISTRY.counter(
+    "log_records_dropped_total",
+    "Log records dropped because the logging queue was full.",
+)
+
+# The repository method running in the current context, used to attribute
+# SQL statements and pool checkouts.
+REPOSITORY_METHOD: ContextVar[str] = ContextVar(
+    "repository_method", default=cts.NO_REPOSITORY_METHOD
+)
@@ -0,0 +1,406 @@
+import threading
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from typing import Callable, Dict, Iterator, List, Tuple
+
+from infra.metrics import constants as cts
+
+Labels = Tuple[str, ...]
+Shard = Dict[Labels, List[float]]
+
+
+def _accumulate(
+    totals: Dict[Labels, List[float]], values: Dict[Labels, List[float]]
+):
+    """
+    Add values to totals, index by index.
+
+    Args:
+        totals (Dict[Labels, List[float]]): The totals, by labels, updated
+            in place.
+        values (Dict[Labels, List[float]]): The values to add, by labels.
+    """
+    for labels, added in values.items():
+        total = totals.get(labels)
+        if total is None:
+            totals[labels] = list(added)
+        else:
+            for index, value in enumerate(added):
+                total[index] += value
+
+
+class _ThreadShards:
+    """
+    One value store per thread, so that recording never takes a lock.
+    Stores are registered once, on the first record of each thread. Once
+    their thread ends they are folded into a base store, when a thread
+    registers or the values are read, so that no count is lost and the
+    stores do not pile up with threads started per request.
+    """
+
+    def __init__(self):
+        """
+        Constructor method.
+        """
+        self._local = threading.local()
+        self._shards: List[Tuple[threading.Thread, Shard]] = []
+        self._base: Dict[Labels, List[float]] = {}
+        self._lock = threading.Lock()
+
+    def get(self) -> Dict[Labels, List[float]]:
+        """
+        Get the store of the current thread.
+
+        Returns:
+            Dict[Labels, List[float]]: The values of the thread, by labels.
+        """
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard = self._local.shard = {}
+            with self._lock:
+                self._sweep()
+                self._shards.append((threading.current_thread(), shard))
+            return shard
+
+    def snapshot(self) -> Iterator[Dict[Labels, List[float]]]:
+        """
+        Copy the base store and the store of every live thread.
+
+        Yields:
+            Dict[Labels, List[float]]: The values of a store, by labels.
+        """
+        with self._lock:
+            self._sweep()
+            shards = [shard for _, shard in self._shards]
+            base = {
+                labels: list(values) for labels, values in self._base.items()
+            }
+        yield base
+        for shard in shards:
+            yield shard.copy()
+
+    def __len__(self) -> int:
+        return len(self._shards)
+
+    def _sweep(self):
+        """
+        Fold the stores of the threads that ended into the base store,
+        holding the lock. They are no longer written to.
+        """
+        alive = []
+        for thread, shard in self._shards:
+            if thread.is_alive():
+                alive.append((thread, shard))
+            else:
+                _accumulate(self._base, shard)
+        self._shards = alive
+
+
+class Metric(ABC):
+    """
+    Base class of the metrics, identified by a name and a tuple of label
+    names whose values are given positionally when recording.
+    """
+
+    TYPE: str = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Labels = ()):
+        """
+        Constructor method.
+
+        Args:
+            name (str): The name of the metric.
+            documentation (str): The help text of the metric.
+            labelnames (Labels): The names of the labels.
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self._shards = _ThreadShards()
+
+    def _merge(self) -> Dict[Labels, List[float]]:
+        """
+        Sum the values of every thread.
+
+        Returns:
+            Dict[Labels, List[float]]: The values, by labels.
+        """
+        merged: Dict[Labels, List[float]] = {}
+        for shard in self._shards.snapshot():
+            _accumulate(merged, shard)
+        return merged
+
+    def _format_labels(self, labels: Labels, **extra: str) -> str:
+        """
+        Format label values in the Prometheus text format.
+
+        Args:
+            labels (Labels): The values of the labels.
+            **extra (str): Additional labels.
+
+        Returns:
+            str: The labels between braces, or "" without labels.
+        """
+        pairs = list(zip(self.labelnames, labels)) + list(extra.items())
+        if not pairs:
+            return ""
+        return "{" + ",".join(
+            f'{name}="{_escape(str(value))}"' for name, value in pairs
+        ) + "}"
+
+    def render(self) -> List[str]:
+        """
+        Render the metric in the Prometheus text format.
+
+        Returns:
+            List[str]: The lines of the metric.
+        """
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.TYPE}",
+        ]
+        for labels, values in sorted(self._merge().items()):
+            lines.extend(self._render_values(labels, values))
+        return lines
+
+    @abstractmethod
+    def _render_values(self, labels: Labels, values: List[float]) -> List[str]:
+        """
+        Render the merged values of one set of labels.
+
+        Args:
+            labels (Labels): The values of the labels.
+            values (List[float]): The merged values.
+
+        Returns:
+            List[str]: The sample lines.
+        """
+
+
+class Counter(Metric):
+    """
+    A monotonically increasing count.
+    """
+
+    TYPE: str = "counter"
+
+    def inc(self, *labels: str, amount: float = 1):
+        """
+        Increase the count.
+
+        Args:
+            *labels (str): The values of the labels.
+            amount (float): The amount to add.
+        """
+        shard = self._shards.get()
+        values = shard.get(labels)
+        if values is None:
+            shard[labels] = [amount]
+        else:
+            values[0] += amount
+
+    def value(self, *labels: str) -> float:
+        """
+        Get the count.
+
+        Args:
+            *labels (str): The values of the labels.
+
+        Returns:
+            float: The count, summed over every thread.
+        """
+        return self._merge().get(labels, [0])[0]
+
+    def _render_values(self, labels: Labels, values: List[float]) -> List[str]:
+        return [f"{self.name}{self._format_labels(labels)} {_number(values[0])}"]
+
+
+class Histogram(Metric):
+    """
+    A distribution of observations in fixed buckets.
+
+    Each thread keeps, per labels, a preallocated list of one count per
+    bucket (plus the +Inf one) followed by the sum of the observations.
+    Counts are cumulated only when rendering.
+    """
+
+    TYPE: str = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Labels = (),
+        buckets: Tuple[float, ...] = cts.DEFAULT_BUCKETS,
+    ):
+        """
+        Constructor method.
+
+        Args:
+            name (str): The name of the metric.
+            documentation (str): The help text of the metric.
+            labelnames (Labels): The names of the labels.
+            buckets (Tuple[float, ...]): The sorted upper bounds of the
+                buckets, +Inf excluded.
+        """
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(buckets)
+        self._size = len(self.buckets) + 2
+
+    def observe(self, value: float, *labels: str):
+        """
+        Record an observation.
+
+        Args:
+            value (float): The observed value.
+            *labels (str): The values of the labels.
+        """
+        shard = self._shards.get()
+        values = shard.get(labels)
+        if values is None:
+            values = shard[labels] = [0] * self._size
+        values[bisect_left(self.buckets, value)] += 1
+        values[-1] += value
+
+    def count(self, *labels: str) -> int:
+        """
+        Get the number of observations.
+
+        Args:
+            *labels (str): The values of the labels.
+
+        Returns:
+            int: The number of observations, summed over every thread.
+        """
+        values = self._merge().get(labels)
+        return int(sum(values[:-1])) if values else 0
+
+    def _render_values(self, labels: Labels, values: List[float]) -> List[str]:
+        lines = []
+        cumulative = 0
+        bounds = [_number(bound) for bound in self.buckets] + ["+Inf"]
+        for bound, count in zip(bounds, values[:-1]):
+            cumulative += count
+            lines.append(
+                f"{self.name}_bucket{self._format_labels(labels, le=bound)} "
+                f"{_number(cumulative)}"
+            )
+        label_text = self._format_labels(labels)
+        lines.append(f"{self.name}_sum{label_text} {_number(values[-1])}")
+        lines.append(f"{self.name}_count{label_text} {_number(cumulative)}")
+        return lines
+
+
+class MetricsRegistry:
+    """
+    A collection of metrics rendered together.
+    """
+
+    def __init__(self):
+        """
+        Constructor method.
+        """
+        self._metrics: Dict[str, Metric] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, name: str, factory: Callable[[], Metric]) -> Metric:
+        """
+        Get a metric by its name, creating it on first use.
+
+        Args:
+            name (str): The name of the metric.
+            factory (Callable[[], Metric]): Builds the metric.
+
+        Returns:
+            Metric: The metric.
+        """
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = factory()
+            return metric
+
+    def counter(
+        self, name: str, documentation: str, labelnames: Labels = ()
+    ) -> Counter:
+        """
+        Get or create a counter.
+
+        Args:
+            name (str): The name of the metric.
+            documentation (str): The help text of the metric.
+            labelnames (Labels): The names of the labels.
+
+        Returns:
+            Counter: The counter.
+        """
+        return self._register(
+            name, lambda: Counter(name, documentation, labelnames)
+        )
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Labels = (),
+        buckets: Tuple[float, ...] = cts.DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """
+        Get or create a histogram.
+
+        Args:
+            name (str): The name of the metric.
+            documentation (str): The help text of the metric.
+            labelnames (Labels): The names of the labels.
+            buckets (Tuple[float, ...]): The upper bounds of the buckets.
+
+        Returns:
+            Histogram: The histogram.
+        """
+        return self._register(
+            name, lambda: Histogram(name, documentation, labelnames, buckets)
+        )
+
+    def render(self) -> str:
+        """
+        Render every metric in the Prometheus text format.
+
+        Returns:
+            str: The exposition.
+        """
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    """
+    Escape a label value.
+
+    Args:
+        value (str): The label value.
+
+    Returns:
+        str: The escaped value.
+    """
+    return value.replace("\\", r"\\").replace('"', r"\"").replace("\n", r"\n")
+
+
+def _number(value: float) -> str:
+    """
+    Format a number without a useless fractional part.
+
+    Args:
+        value (float): The number.
+
+    Returns:
+        str: The formatted number.
+    """
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+REGISTRY = MetricsRegistry()
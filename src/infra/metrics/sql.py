@@ -0,0 +1,62 @@
+from time import perf_counter
+from typing import Any
+
+from sqlalchemy import Engine, event
+from sqlalchemy.pool import QueuePool
+
+from infra.metrics.metrics import (
+    DB_POOL_CHECKOUT_WAIT,
+    REPOSITORY_METHOD,
+    SQL_STATEMENT_DURATION,
+    SQL_STATEMENTS,
+)
+
+STATEMENT_START_TIME_KEY = "metrics_statement_start_time"
+
+
+class TimedQueuePool(QueuePool):
+    """
+    A QueuePool recording how long each checkout waited for a connection.
+    """
+
+    def _do_get(self) -> Any:
+        """
+        Check a connection out of the pool, timing the wait.
+
+        Returns:
+            Any: The pooled connection record.
+        """
+        start = perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            DB_POOL_CHECKOUT_WAIT.observe(
+                perf_counter() - start, REPOSITORY_METHOD.get()
+            )
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    """
+    Remember when a statement started.
+    """
+    conn.info[STATEMENT_START_TIME_KEY] = perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    """
+    Count a statement and record its duration.
+    """
+    start = conn.info.pop(STATEMENT_START_TIME_KEY)
+    method = REPOSITORY_METHOD.get()
+    SQL_STATEMENTS.inc(method)
+    SQL_STATEMENT_DURATION.observe(perf_counter() - start, method)
+
+
+def install_sql_instrumentation():
+    """
+    Count and time the SQL statements of every engine. Calling it again
+    has no effect.
+    """
+    if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
@@ -0,0 +1,137 @@
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Dict, Tuple
+
+
+class CacheBackendInterface(ABC):
+    @abstractmethod
+    def get(self, key: str) -> Any | None:
+        """
+        Get a value from the cache.
+
+        Args:
+            key (str): The key of the value.
+
+        Returns:
+            Any | None: The value if cached and not expired, None otherwise.
+        """
+
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl: float):
+        """
+        Store a value in the cache.
+
+        Args:
+            key (str): The key of the value.
+            value (Any): The value to store.
+            ttl (float): Seconds the value stays valid.
+        """
+
+    @abstractmethod
+    def delete(self, key: str):
+        """
+        Remove a value from the cache.
+
+        Args:
+            key (str): The key of the value.
+        """
+
+    @abstractmethod
+    def delete_prefix(self, prefix: str):
+        """
+        Remove every value whose key starts with a prefix.
+
+        Args:
+            prefix (str): The prefix of the keys.
+        """
+
+
+class LRUCacheBackend(CacheBackendInterface):
+    """
+    A bounded, thread-safe, in-process LRU cache with a TTL per entry.
+    """
+
+    def __init__(self, max_size: int):
+        """
+        Constructor method.
+
+        Args:
+            max_size (int): The maximum number of entries kept.
+        """
+        self._max_size = max_size
+        self._entries: OrderedDict[str, Tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.evictions = 0
+
+    def get(self, key: str) -> Any | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                self.evictions += 1
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl: float):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key: str):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def delete_prefix(self, prefix: str):
+        with self._lock:
+            for key in [k for k in self._entries if k.startswith(prefix)]:
+                del self._entries[key]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class InMemorySharedCacheBackend(CacheBackendInterface):
+    """
+    A local stand-in for a cache shared between processes (e.g. Redis).
+    Like a real shared cache it is meant to store serialised bytes.
+    """
+
+    def __init__(self):
+        """
+        Constructor method.
+        """
+        self._entries: Dict[str, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            return value
+
+    def set(self, key: str, value: Any, ttl: float):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+
+    def delete(self, key: str):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def delete_prefix(self, prefix: str):
+        with self._lock:
+            for key in [k for k in self._entries if k.startswith(prefix)]:
+                del self._entries[key]
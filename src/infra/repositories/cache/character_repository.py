@@ -0,0 +1,391 @@
+import json
+import threading
+from typing import Dict, Iterable, Iterator, List
+
+from pydantic import TypeAdapter
+
+from domain.entities.schemas import (
+    BulkCreateResultSchema,
+    CharacterPartialSchema,
+    CharacterQuerySchema,
+    CharacterSchema,
+    CharacterSearchSchema,
+    CharacterStatsQuerySchema,
+    CharacterStatsSchema,
+    ResourceVersionSchema,
+)
+from domain.repositories.character_repository import (
+    CharacterRepositoryInterface,
+)
+from infra.repositories.cache import constants as cts
+from infra.repositories.cache.backends import (
+    CacheBackendInterface,
+    LRUCacheBackend,
+)
+from settings import CacheSettings
+
+CHARACTER_LIST_ADAPTER = TypeAdapter(List[CharacterPartialSchema])
+
+
+class CachedCharacterRepository(CharacterRepositoryInterface):
+    """
+    A read-through caching decorator around a character repository.
+
+    Lookups are served from a bounded in-process LRU first, then from an
+    optional shared backend, and finally from the wrapped repository.
+    Writes invalidate the affected character and every cached list page.
+    Cached models are shared between callers and must not be mutated.
+    """
+
+    def __init__(
+        self,
+        repository: CharacterRepositoryInterface,
+        local_cache: LRUCacheBackend | None = None,
+        shared_cache: CacheBackendInterface | None = None,
+        ttl: float = CacheSettings.TTL_SECONDS,
+    ):
+        """
+        Constructor method.
+
+        Args:
+            repository (CharacterRepositoryInterface): The wrapped repository.
+            local_cache (LRUCacheBackend | None): The in-process cache.
+                Defaults to one of CacheSettings.MAX_SIZE entries.
+            shared_cache (CacheBackendInterface | None): An optional cache
+                shared between processes, storing JSON bytes.
+            ttl (float): Seconds an entry stays valid.
+        """
+        self._repository = repository
+        self._local_cache = local_cache or LRUCacheBackend(
+            CacheSettings.MAX_SIZE
+        )
+        self._shared_cache = shared_cache
+        self._ttl = ttl
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """
+        The cache counters.
+
+        Returns:
+            Dict[str, int]: The hits, misses and evictions of the cache.
+        """
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._local_cache.evictions,
+        }
+
+    def _count(self, hit: bool):
+        """
+        Count a cache lookup.
+
+        Args:
+            hit (bool): Whether the lookup was a hit.
+        """
+        with self._lock:
+            if hit:
+                self._hits += 1
+            else:
+                self._misses += 1
+
+    def _count_many(self, hits: int, misses: int):
+        """
+        Count the lookups of a multi-get.
+
+        Args:
+            hits (int): The number of hits.
+            misses (int): The number of misses.
+        """
+        with self._lock:
+            self._hits += hits
+            self._misses += misses
+
+    def get_characters(
+        self, query: CharacterQuerySchema | None = None
+    ) -> List[CharacterPartialSchema]:
+        """
+        Get a page of characters from the in-process cache, then from the
+        shared one, then from the wrapped repository, caching it in both.
+
+        Args:
+            query (CharacterQuerySchema | None): Pagination, projection and
+                filtering options. Defaults to the first page.
+
+        Returns:
+            List[CharacterPartialSchema]: A list of characters.
+        """
+        query = query or CharacterQuerySchema()
+        key = cts.CHARACTER_LIST_KEY_PREFIX + query.model_dump_json()
+        characters = self._local_cache.get(key)
+        if characters is None and self._shared_cache is not None:
+            raw = self._shared_cache.get(key)
+            if raw is not None:
+                characters = [
+                    CharacterPartialSchema.model_construct(
+                        _fields_set=set(data), **data
+                    )
+                    for data in json.loads(raw)
+                ]
+                self._local_cache.set(key, characters, self._ttl)
+        if characters is not None:
+            self._count(hit=True)
+            return characters
+
+        self._count(hit=False)
+        characters = self._repository.get_characters(query)
+        self._local_cache.set(key, characters, self._ttl)
+        if self._shared_cache is not None:
+            self._shared_cache.set(
+                key,
+                CHARACTER_LIST_ADAPTER.dump_json(characters, exclude_unset=True),
+                self._ttl,
+            )
+        return characters
+
+    def iter_characters(
+        self, query: CharacterQuerySchema | None = None
+    ) -> Iterator[CharacterSchema]:
+        """
+        Stream characters from the wrapped repository. Streams are never
+        cached.
+
+        Args:
+            query (CharacterQuerySchema | None): Pagination, projection and
+                filtering options. Defaults to every character.
+
+        Returns:
+            Iterator[CharacterSchema]: The characters.
+        """
+        return self._repository.iter_characters(query)
+
+    def get_character(self, character_id: int) -> CharacterSchema | None:
+        """
+        Get a character from the caches, falling back to the wrapped
+        repository and caching what it finds.
+
+        Args:
+            character_id (int): The ID of the character.
+
+        Returns:
+            CharacterSchema | None: The character if found, None otherwise.
+        """
+        character = self._cached_character(character_id)
+        if character is not None:
+            self._count(hit=True)
+            return character
+
+        self._count(hit=False)
+        character = self._repository.get_character(character_id)
+        if character is not None:
+            self._cache_character(character)
+        return character
+
+    def get_characters_by_ids(
+        self, character_ids: List[int]
+    ) -> List[CharacterSchema]:
+        """
+        Get many characters by their IDs, fetching only the ones missing
+        from the in-process and shared caches from the wrapped repository,
+        in one call.
+
+        Args:
+            character_ids (List[int]): The IDs of the characters.
+
+        Returns:
+            List[CharacterSchema]: The characters found, in the order of
+                their first ID in character_ids.
+        """
+        unique_ids = list(dict.fromkeys(character_ids))
+        found = {}
+        for id_ in unique_ids:
+            character = self._cached_character(id_)
+            if character is not None:
+                found[id_] = character
+        missing = [id_ for id_ in unique_ids if id_ not in found]
+        self._count_many(hits=len(found), misses=len(missing))
+        if missing:
+            for character in self._repository.get_characters_by_ids(missing):
+                found[character.id] = character
+                self._cache_character(character)
+        return [found[id_] for id_ in unique_ids if id_ in found]
+
+    def _cached_character(self, character_id: int) -> CharacterSchema | None:
+        """
+        Get a character from the in-process cache, then from the shared
+        one, keeping it in the in-process cache.
+
+        Args:
+            character_id (int): The ID of the character.
+
+        Returns:
+            CharacterSchema | None: The character if cached, None otherwise.
+        """
+        key = f"{cts.CHARACTER_KEY_PREFIX}{character_id}"
+        character = self._local_cache.get(key)
+        if character is None and self._shared_cache is not None:
+            raw = self._shared_cache.get(key)
+            if raw is not None:
+                character = CharacterSchema.model_validate_json(raw)
+                self._local_cache.set(key, character, self._ttl)
+        return character
+
+    def _cache_character(self, character: CharacterSchema):
+        """
+        Keep a character in the in-process and shared caches.
+
+        Args:
+            character (CharacterSchema): The character.
+        """
+        key = f"{cts.CHARACTER_KEY_PREFIX}{character.id}"
+        self._local_cache.set(key, character, self._ttl)
+        if self._shared_cache is not None:
+            self._shared_cache.set(key, character.model_dump_json(), self._ttl)
+
+    def search_characters(
+        self, search: CharacterSearchSchema
+    ) -> List[CharacterSchema]:
+        """
+        Search characters through the wrapped repository. Searches are never
+        cached, since their results rarely repeat.
+
+        Args:
+            search (CharacterSearchSchema): The search options.
+
+        Returns:
+            List[CharacterSchema]: The page of characters, best match first.
+        """
+        return self._repository.search_characters(search)
+
+    def get_character_stats(
+        self, query: CharacterStatsQuerySchema | None = None
+    ) -> CharacterStatsSchema:
+        """
+        Get the statistics of the characters from the wrapped repository.
+        Statistics are never cached, since they are read from counts.
+
+        Args:
+            query (CharacterStatsQuerySchema | None): The statistics
+                options. Defaults to the default ones.
+
+        Returns:
+            CharacterStatsSchema: The statistics.
+        """
+        return self._repository.get_character_stats(query)
+
+    def get_character_version(
+        self, character_id: int
+    ) -> ResourceVersionSchema | None:
+        """
+        Get the validators of a character from the wrapped repository.
+        Validators are never cached, since they are what revalidates.
+
+        Args:
+            character_id (int): The ID of the character.
+
+        Returns:
+            ResourceVersionSchema | None: The validators if the character
+                is found, None otherwise.
+        """
+        return self._repository.get_character_version(character_id)
+
+    def get_characters_version(self) -> ResourceVersionSchema | None:
+        """
+        Get the validators of the character collection from the wrapped
+        repository. Validators are never cached.
+
+        Returns:
+            ResourceVersionSchema | None: The validators, None if the
+                collection is not versioned.
+        """
+        return self._repository.get_characters_version()
+
+    def create_character(self, character: CharacterSchema) -> CharacterSchema:
+        """
+        Create a character through the wrapped repository and invalidate
+        it and every cached list page.
+
+        Args:
+            character (CharacterSchema): The character to create.
+
+        Returns:
+            CharacterSchema: The created character.
+        """
+        created = self._repository.create_character(character)
+        self._invalidate([created.id])
+        return created
+
+    def create_characters(
+        self,
+        characters: List[CharacterSchema],
+        chunk_size: int | None = None,
+        atomic: bool = True,
+    ) -> BulkCreateResultSchema:
+        """
+        Create many characters through the wrapped repository and
+        invalidate the created ones and every cached list page.
+
+        Args:
+            characters (List[CharacterSchema]): The characters to create.
+            chunk_size (int | None): The number of characters inserted per
+                statement. Defaults to the wrapped repository's own.
+            atomic (bool): Whether any failure creates none of them.
+
+        Returns:
+            BulkCreateResultSchema: The created characters and the errors of
+                the failing ones.
+        """
+        result = self._repository.create_characters(
+            characters, chunk_size=chunk_size, atomic=atomic
+        )
+        self._invalidate(character.id for character in result.created)
+        return result
+
+    def delete_character(self, character_id: int) -> bool:
+        """
+        Delete a character through the wrapped repository and invalidate
+        it and every cached list page.
+
+        Args:
+            character_id (int): The ID of the character.
+
+        Returns:
+            bool: True if the character was deleted, False if not found.
+        """
+        deleted = self._repository.delete_character(character_id)
+        self._invalidate([character_id])
+        return deleted
+
+    def delete_characters(self, character_ids: List[int]) -> List[int]:
+        """
+        Delete many characters through the wrapped repository and
+        invalidate the deleted ones and every cached list page.
+
+        Args:
+            character_ids (List[int]): The IDs of the characters.
+
+        Returns:
+            List[int]: The IDs of the deleted characters.
+        """
+        deleted = self._repository.delete_characters(character_ids)
+        self._invalidate(deleted)
+        return deleted
+
+    def _invalidate(self, character_ids: Iterable[int]):
+        """
+        Drop characters and every list page from the caches.
+
+        Args:
+            character_ids (Iterable[int]): The IDs of the written characters.
+        """
+        caches = [self._local_cache]
+        if self._shared_cache is not None:
+            caches.append(self._shared_cache)
+        keys = [f"{cts.CHARACTER_KEY_PREFIX}{id_}" for id_ in character_ids]
+        for cache in caches:
+            for key in keys:
+                cache.delete(key)
+            cache.delete_prefix(cts.CHARACTER_LIST_KEY_PREFIX)
@@ -0,0 +1,2 @@
+CHARACTER_KEY_PREFIX = "character:"
+CHARACTER_LIST_KEY_PREFIX = "characters:"
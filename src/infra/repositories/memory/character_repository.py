@@ -0,0 +1,895 @@
+import bisect
+import json
+import mmap
+import os
+import struct
+import sys
+import threading
+import time
+from array import array
+from datetime import datetime, timezone
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List
+
+from domain.entities.exceptions import (
+    BulkCreateError,
+    CharacterAlreadyExistsError,
+)
+from domain.entities.schemas import (
+    BulkCreateErrorSchema,
+    BulkCreateResultSchema,
+    CharacterPartialSchema,
+    CharacterQuerySchema,
+    CharacterSchema,
+    CharacterSearchSchema,
+    CharacterStatsQuerySchema,
+    CharacterStatsSchema,
+    ResourceVersionSchema,
+)
+from domain.repositories.character_repository import (
+    CharacterRepositoryInterface,
+)
+from infra.repositories.memory import constants as cts
+from infra.repositories.search.name_index import NameIndex
+from infra.repositories.stats import constants as stats_cts
+from infra.repositories.stats.value_counter import ValueCounter
+from settings import DatabaseSettings
+
+HEADER_LENGTH = struct.Struct("<Q")
+
+
+def aligned(offset: int) -> int:
+    """
+    Round an offset of a snapshot up to the next buffer boundary.
+
+    Args:
+        offset (int): The offset, in bytes.
+
+    Returns:
+        int: The aligned offset.
+    """
+    return -(-offset // cts.SNAPSHOT_ALIGNMENT) * cts.SNAPSHOT_ALIGNMENT
+
+
+def splice(column: array, positions: List[int], values: List[Any]) -> array:
+    """
+    Insert values into a column in one pass, copying the rows between them
+    as raw memory.
+
+    Args:
+        column (array): The column.
+        positions (List[int]): The rows to insert each value before, in
+            increasing order.
+        values (List[Any]): The values.
+
+    Returns:
+        array: The new column.
+    """
+    spliced = array(column.typecode)
+    size = column.itemsize
+    with memoryview(column) as view, view.cast("B") as raw:
+        previous = 0
+        for position, value in zip(positions, values):
+            spliced.frombytes(raw[previous * size : position * size])
+            spliced.append(value)
+            previous = position
+        spliced.frombytes(raw[previous * size :])
+    return spliced
+
+
+def to_datetime(timestamp: float) -> datetime:
+    """
+    Convert a timestamp to a naive UTC datetime, as the SQL repository
+    returns them.
+
+    Args:
+        timestamp (float): The POSIX timestamp.
+
+    Returns:
+        datetime: The datetime.
+    """
+    return datetime.fromtimestamp(timestamp, timezone.utc).replace(tzinfo=None)
+
+
+class StringDictionary:
+    """
+    The distinct values of a dictionary-encoded string column, each stored
+    once and referred to by its code.
+    """
+
+    def __init__(self, values: List[str] | None = None):
+        """
+        Constructor method.
+
+        Args:
+            values (List[str] | None): The values, by code. Defaults to
+                none.
+        """
+        self.values: List[str] = list(values or [])
+        self._codes = {value: code for code, value in enumerate(self.values)}
+
+    def encode(self, value: str) -> int:
+        """
+        Get the code of a value, adding it if new.
+
+        Args:
+            value (str): The value.
+
+        Returns:
+            int: The code.
+        """
+        code = self._codes.get(value)
+        if code is None:
+            code = self._codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def code(self, value: str) -> int | None:
+        """
+        Get the code of a value.
+
+        Args:
+            value (str): The value.
+
+        Returns:
+            int | None: The code, None if the value is unknown.
+        """
+        return self._codes.get(value)
+
+
+class InMemoryCharacterRepository(CharacterRepositoryInterface):
+    """
+    A concrete class to CRUD characters in memory, for tests and for
+    read-heavy deployments.
+
+    Characters are stored column-wise, in typed arrays sorted by ID: the
+    ID index is a binary search on the ID column, the colors are
+    dictionary-encoded and the names share one UTF-8 buffer, so a
+    character takes a few dozen bytes instead of two objects per field.
+    Deletes only mark rows dead, and the dead rows are compacted away once
+    they make up COMPACTION_RATIO of the rows. The columns can be written
+    to a snapshot file and read back through a memory map, to warm start
+    without the database.
+    """
+
+    STREAM_BATCH_SIZE: int = DatabaseSettings.STREAM_BATCH_SIZE
+
+    def __init__(self):
+        """
+        Constructor method.
+        """
+        self._lock = threading.RLock()
+        self._columns: Dict[str, array] = {
+            name: array(typecode)
+            for name, typecode in cts.COLUMN_TYPECODES.items()
+        }
+        self._dictionaries = {
+            field: StringDictionary() for field in stats_cts.COLOR_FIELDS
+        }
+        self._names = bytearray()
+        self._alive = array("B")
+        self._dead = 0
+        self._counter = ValueCounter()
+        self._name_index: NameIndex | None = None
+        self._version = 1
+        self._updated_at = time.time()
+
+    def __len__(self) -> int:
+        return len(self._alive) - self._dead
+
+    @classmethod
+    def from_snapshot(cls, path: str) -> "InMemoryCharacterRepository":
+        """
+        Restore a repository from a snapshot file. The file is memory
+        mapped and each column is copied from it in a single call, without
+        building any object per character.
+
+        Args:
+            path (str): The path of the snapshot.
+
+        Returns:
+            InMemoryCharacterRepository: The repository.
+
+        Raises:
+            ValueError: If the file is not a snapshot of this format.
+        """
+        repository = cls()
+        with open(path, "rb") as file, mmap.mmap(
+            file.fileno(), 0, access=mmap.ACCESS_READ
+        ) as mapped, memoryview(mapped) as view:
+            if view[: len(cts.SNAPSHOT_MAGIC)] != cts.SNAPSHOT_MAGIC:
+                raise ValueError(f"{path} is not a character snapshot")
+            (header_length,) = HEADER_LENGTH.unpack_from(
+                view, len(cts.SNAPSHOT_MAGIC)
+            )
+            header_start = len(cts.SNAPSHOT_MAGIC) + HEADER_LENGTH.size
+            header = json.loads(
+                bytes(view[header_start : header_start + header_length])
+            )
+            if set(header["columns"]) != set(cts.COLUMN_TYPECODES):
+                raise ValueError(f"{path} is not a character snapshot")
+            data_start = aligned(header_start + header_length)
+            for name, (typecode, offset, size) in header["columns"].items():
+                column = array(typecode)
+                column.frombytes(
+                    view[data_start + offset : data_start + offset + size]
+                )
+                if header["byteorder"] != sys.byteorder:
+                    column.byteswap()
+                repository._columns[name] = column
+            offset, size = header["names"]
+            repository._names = bytearray(
+                view[data_start + offset : data_start + offset + size]
+            )
+        repository._alive = array("B", b"\x01" * header["rows"])
+        repository._dictionaries = {
+            field: StringDictionary(values)
+            for field, values in header["dictionaries"].items()
+        }
+        repository._counter = ValueCounter.from_rows(header["counts"])
+        repository._version = header["version"]
+        repository._updated_at = header["updated_at"]
+        return repository
+
+    @classmethod
+    def warm_start(
+        cls,
+        source: CharacterRepositoryInterface,
+        snapshot_path: str | None = None,
+    ) -> "InMemoryCharacterRepository":
+        """
+        Restore a repository from its snapshot if there is one, otherwise
+        load it from another repository and write the snapshot for the next
+        start. Delete the snapshot to load the characters again.
+
+        Args:
+            source (CharacterRepositoryInterface): The repository to load
+                the characters from.
+            snapshot_path (str | None): The path of the snapshot. Defaults
+                to none, to always load from the source.
+
+        Returns:
+            InMemoryCharacterRepository: The repository.
+        """
+        if snapshot_path and os.path.exists(snapshot_path):
+            return cls.from_snapshot(snapshot_path)
+        repository = cls()
+        repository.load(source.iter_characters())
+        if snapshot_path:
+            repository.snapshot(snapshot_path)
+        return repository
+
+    def load(self, characters: Iterable[CharacterSchema]) -> int:
+        """
+        Create characters STREAM_BATCH_SIZE at a time, e.g. streamed from
+        another repository, so that they are never all held as objects.
+
+        Args:
+            characters (Iterable[CharacterSchema]): The characters.
+
+        Returns:
+            int: The number of characters created.
+
+        Raises:
+            BulkCreateError: If the ID of a character is taken, in which
+                case the batches before its own are kept.
+        """
+        characters = iter(characters)
+        loaded = 0
+        while batch := list(islice(characters, self.STREAM_BATCH_SIZE)):
+            loaded += len(self.create_characters(batch).created)
+        return loaded
+
+    def snapshot(self, path: str) -> int:
+        """
+        Write the characters to a snapshot file: a JSON header, with the
+        dictionaries, the value counts and the layout of the columns,
+        followed by the raw, aligned buffers of the columns. Dead rows are
+        compacted first, and the file is replaced atomically.
+
+        Args:
+            path (str): The path of the snapshot.
+
+        Returns:
+            int: The number of characters written.
+        """
+        with self._lock:
+            self._compact()
+            buffers = list(self._columns.items()) + [("names", self._names)]
+            layout: Dict[str, List[Any]] = {}
+            offset = 0
+            for name, buffer in buffers:
+                offset = aligned(offset)
+                size = memoryview(buffer).nbytes
+                layout[name] = [offset, size]
+                offset += size
+            header = json.dumps(
+                {
+                    "byteorder": sys.byteorder,
+                    "rows": len(self),
+                    "version": self._version,
+                    "updated_at": self._updated_at,
+                    "dictionaries": {
+                        field: dictionary.values
+                        for field, dictionary in self._dictionaries.items()
+                    },
+                    "counts": [
+                        (stats_cts.TOTAL_FIELD, None, self._counter.total)
+                    ]
+                    + [
+                        (field, value, count)
+                        for field, counts in self._counter.counts.items()
+                        for value, count in counts.items()
+                    ],
+                    "columns": {
+                        name: [column.typecode] + layout[name]
+                        for name, column in self._columns.items()
+                    },
+                    "names": layout["names"],
+                }
+            ).encode()
+            data_start = aligned(
+                len(cts.SNAPSHOT_MAGIC) + HEADER_LENGTH.size + len(header)
+            )
+            temporary = f"{path}.tmp"
+            with open(temporary, "wb") as file:
+                file.write(cts.SNAPSHOT_MAGIC)
+                file.write(HEADER_LENGTH.pack(len(header)))
+                file.write(header)
+                for name, buffer in buffers:
+                    file.seek(data_start + layout[name][0])
+                    file.write(buffer)
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(temporary, path)
+            return len(self)
+
+    def get_characters(
+        self, query: CharacterQuerySchema | None = None
+    ) -> List[CharacterPartialSchema]:
+        """
+        Get characters, ordered by ID. The scan starts at the after_id
+        cursor and only decodes the requested fields of the matching rows.
+        Values were validated when written, so they are not again.
+
+        Args:
+            query (CharacterQuerySchema | None): Pagination, projection and
+                filtering options. Defaults to the first page.
+
+        Returns:
+            List[CharacterPartialSchema]: A list of characters.
+        """
+        query = query or CharacterQuerySchema()
+        fields = query.fields or list(CharacterPartialSchema.model_fields)
+        with self._lock:
+            rows = self._scan(query, fields, query.after_id, query.limit)
+        return [
+            CharacterPartialSchema.model_construct(
+                _fields_set=set(values), **values
+            )
+            for values in rows
+        ]
+
+    def iter_characters(
+        self, query: CharacterQuerySchema | None = None
+    ) -> Iterator[CharacterSchema]:
+        """
+        Stream characters, ordered by ID, STREAM_BATCH_SIZE at a time. The
+        lock is only held while a batch is read, so writes made meanwhile
+        are seen by the following batches.
+
+        Args:
+            query (CharacterQuerySchema | None): Pagination, projection and
+                filtering options. Defaults to every character.
+
+        Yields:
+            CharacterSchema: The characters.
+        """
+        query = query or CharacterQuerySchema(limit=None)
+        fields = query.fields or list(CharacterSchema.model_fields)
+        after_id, remaining = query.after_id, query.limit
+        while remaining is None or remaining > 0:
+            batch_size = self.STREAM_BATCH_SIZE
+            if remaining is not None:
+                batch_size = min(batch_size, remaining)
+                remaining -= batch_size
+            with self._lock:
+                rows = self._scan(query, fields, after_id, batch_size)
+            for values in rows:
+                yield CharacterSchema.model_construct(
+                    _fields_set=set(values), **values
+                )
+            if len(rows) < batch_size:
+                return
+            after_id = rows[-1]["id"]
+
+    def get_character(self, character_id: int) -> CharacterSchema | None:
+        """
+        Get a character by its ID.
+
+        Args:
+            character_id (int): The ID of the character.
+
+        Returns:
+            CharacterSchema | None: The character if found, None otherwise.
+        """
+        with self._lock:
+            row = self._live_row(character_id)
+            return None if row is None else self._character(row)
+
+    def get_characters_by_ids(
+        self, character_ids: List[int]
+    ) -> List[CharacterSchema]:
+        """
+        Get many characters by their IDs.
+
+        Args:
+            character_ids (List[int]): The IDs of the characters.
+
+        Returns:
+            List[CharacterSchema]: The characters found, in the order of
+                their first ID in character_ids.
+        """
+        with self._lock:
+            rows = [
+                self._live_row(character_id)
+                for character_id in dict.fromkeys(character_ids)
+            ]
+            return [self._character(row) for row in rows if row is not None]
+
+    def search_characters(
+        self, search: CharacterSearchSchema
+    ) -> List[CharacterSchema]:
+        """
+        Search characters by name in a name index, built on the first
+        search and kept up to date by the writes.
+
+        Args:
+            search (CharacterSearchSchema): The search options.
+
+        Returns:
+            List[CharacterSchema]: The page of characters, best match first.
+        """
+        with self._lock:
+            if self._name_index is None:
+                index = NameIndex()
+                index.add_many(
+                    (self._columns["id"][row], self._value(row, "name"))
+                    for row in range(len(self._alive))
+                    if self._alive[row]
+                )
+                self._name_index = index
+            index = self._name_index
+        return self.get_characters_by_ids(index.search(search))
+
+    def get_character_stats(
+        self, query: CharacterStatsQuerySchema | None = None
+    ) -> CharacterStatsSchema:
+        """
+        Get the statistics of the characters from the number of characters
+        per value of each field, kept up to date by the writes.
+
+        Args:
+            query (CharacterStatsQuerySchema | None): The statistics
+                options. Defaults to the default ones.
+
+        Returns:
+            CharacterStatsSchema: The statistics.
+        """
+        with self._lock:
+            return self._counter.stats(query)
+
+    def get_character_version(
+        self, character_id: int
+    ) -> ResourceVersionSchema | None:
+        """
+        Get the validators of a character.
+
+        Args:
+            character_id (int): The ID of the character.
+
+        Returns:
+            ResourceVersionSchema | None: The validators if the character
+                is found, None otherwise.
+        """
+        with self._lock:
+            row = self._live_row(character_id)
+            if row is None:
+                return None
+            return ResourceVersionSchema(
+                tag=self._character(row).content_hash(),
+                modified_at=to_datetime(self._columns["updated_at"][row]),
+            )
+
+    def get_characters_version(self) -> ResourceVersionSchema | None:
+        """
+        Get the validators of the character collection, whose version is
+        bumped by every write.
+
+        Returns:
+            ResourceVersionSchema | None: The validators.
+        """
+        with self._lock:
+            return ResourceVersionSchema(
+                tag=str(self._version),
+                modified_at=to_datetime(self._updated_at),
+            )
+
+    def create_character(self, character: CharacterSchema) -> CharacterSchema:
+        """
+        Create a new character.
+
+        Args:
+            character (CharacterSchema): The character to create.
+
+        Returns:
+            CharacterSchema: The created character.
+
+        Raises:
+            CharacterAlreadyExistsError: If its ID is taken.
+        """
+        with self._lock:
+            if (
+                character.id is not None
+                and self._live_row(character.id) is not None
+            ):
+                raise CharacterAlreadyExistsError(character.id)
+            return self._insert([character])[0]
+
+    def create_characters(
+        self,
+        characters: List[CharacterSchema],
+        chunk_size: int | None = None,
+        atomic: bool = True,
+    ) -> BulkCreateResultSchema:
+        """
+        Create many characters at once, merging them into the columns in
+        one pass.
+
+        Args:
+            characters (List[CharacterSchema]): The characters to create.
+            chunk_size (int | None): Unused, every character is inserted at
+                once.
+            atomic (bool): If True a character with a taken ID creates no
+                character at all. If False it is reported and the others
+                are created.
+
+        Returns:
+            BulkCreateResultSchema: The created characters and the errors.
+
+        Raises:
+            BulkCreateError: If the ID of a character is taken in atomic
+                mode.
+        """
+        result = BulkCreateResultSchema()
+        with self._lock:
+            accepted: List[CharacterSchema] = []
+            taken = set()
+            for index, character in enumerate(characters):
+                if character.id is not None and (
+                    character.id in taken
+                    or self._live_row(character.id) is not None
+                ):
+                    error = CharacterAlreadyExistsError(character.id)
+                    if atomic:
+                        raise BulkCreateError(index, str(error))
+                    result.errors.append(
+                        BulkCreateErrorSchema(index=index, message=str(error))
+                    )
+                    continue
+                taken.add(character.id)
+                accepted.append(character)
+            if accepted:
+                result.created = self._insert(accepted)
+        return result
+
+    def delete_character(self, character_id: int) -> bool:
+        """
+        Delete a character by its ID.
+
+        Args:
+            character_id (int): The ID of the character.
+
+        Returns:
+            bool: True if the character was deleted, False otherwise.
+        """
+        return bool(self.delete_characters([character_id]))
+
+    def delete_characters(self, character_ids: List[int]) -> List[int]:
+        """
+        Delete many characters by marking their rows dead, then compact the
+        columns if the dead rows make up COMPACTION_RATIO of them.
+
+        Args:
+            character_ids (List[int]): The IDs of the characters.
+
+        Returns:
+            List[int]: The IDs of the deleted characters.
+        """
+        with self._lock:
+            deleted: List[int] = []
+            for character_id in dict.fromkeys(character_ids):
+                row = self._live_row(character_id)
+                if row is None:
+                    continue
+                self._counter.remove(self._character(row))
+                if self._name_index is not None:
+                    self._name_index.remove(character_id)
+                self._alive[row] = 0
+                self._dead += 1
+                deleted.append(character_id)
+            if deleted:
+                self._bump()
+                if self._dead > len(self._alive) * cts.COMPACTION_RATIO:
+                    self._compact()
+            return deleted
+
+    def _row(self, character_id: int) -> int | None:
+        """
+        Find the row of an ID, live or dead.
+
+        Args:
+            character_id (int): The ID of the character.
+
+        Returns:
+            int | None: The row, None if the ID was never stored.
+        """
+        ids = self._columns["id"]
+        row = bisect.bisect_left(ids, character_id)
+        if row < len(ids) and ids[row] == character_id:
+            return row
+        return None
+
+    def _live_row(self, character_id: int) -> int | None:
+        """
+        Find the row of a character.
+
+        Args:
+            character_id (int): The ID of the character.
+
+        Returns:
+            int | None: The row, None if the character is not found.
+        """
+        row = self._row(character_id)
+        if row is None or not self._alive[row]:
+            return None
+        return row
+
+    def _value(self, row: int, field: str) -> Any:
+        """
+        Decode a field of a row.
+
+        Args:
+            row (int): The row.
+            field (str): The field.
+
+        Returns:
+            Any: The value.
+        """
+        if field == "name":
+            start = self._columns["name_start"][row]
+            end = start + self._columns["name_length"][row]
+            return self._names[start:end].decode()
+        value = self._columns[field][row]
+        if field in self._dictionaries:
+            return self._dictionaries[field].values[value]
+        return value
+
+    def _character(self, row: int) -> CharacterSchema:
+        """
+        Decode every field of a row.
+
+        Args:
+            row (int): The row.
+
+        Returns:
+            CharacterSchema: The character.
+        """
+        return CharacterSchema.model_construct(
+            **{
+                field: self._value(row, field)
+                for field in CharacterSchema.model_fields
+            }
+        )
+
+    def _scan(
+        self,
+        query: CharacterQuerySchema,
+        fields: List[str],
+        after_id: int | None,
+        limit: int | None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Decode the requested fields of the live rows matching the filters
+        of a query, in ID order. The ID is always decoded since it is the
+        pagination cursor.
+
+        Args:
+            query (CharacterQuerySchema): The filters.
+            fields (List[str]): The requested fields.
+            after_id (int | None): The ID to start after.
+            limit (int | None): The maximum number of rows.
+
+        Returns:
+            List[Dict[str, Any]]: The values of the rows.
+        """
+        eye_color = None
+        if query.eye_color is not None:
+            eye_color = self._dictionaries["eye_color"].code(query.eye_color)
+            if eye_color is None:
+                return []
+        name = None if query.name is None else query.name.encode()
+        fields = ["id"] + [field for field in fields if field != "id"]
+        ids = self._columns["id"]
+        eye_colors = self._columns["eye_color"]
+        birth_years = self._columns["birth_year"]
+        name_starts = self._columns["name_start"]
+        name_lengths = self._columns["name_length"]
+        row = 0 if after_id is None else bisect.bisect_right(ids, after_id)
+        rows: List[Dict[str, Any]] = []
+        while row < len(ids) and (limit is None or len(rows) < limit):
+            if (
+                self._alive[row]
+                and (eye_color is None or eye_colors[row] == eye_color)
+                and (
+                    query.birth_year_min is None
+                    or birth_years[row] >= query.birth_year_min
+                )
+                and (
+                    query.birth_year_max is None
+                    or birth_years[row] <= query.birth_year_max
+                )
+                and (
+                    name is None
+                    or name_lengths[row] == len(name)
+                    and self._names[
+                        name_starts[row] : name_starts[row] + len(name)
+                    ]
+                    == name
+                )
+            ):
+                rows.append({field: self._value(row, field) for field in fields})
+            row += 1
+        return rows
+
+    def _insert(
+        self, characters: List[CharacterSchema]
+    ) -> List[CharacterSchema]:
+        """
+        Insert characters whose IDs are free, assigning the missing ones
+        after the highest ID, as SQLite does. A character reusing the ID of
+        a dead row takes the row over; the others are appended when their
+        IDs are the highest, as usual, or merged into the columns in one
+        pass otherwise.
+
+        Args:
+            characters (List[CharacterSchema]): The characters to insert.
+
+        Returns:
+            List[CharacterSchema]: The inserted characters, in input order.
+        """
+        ids = self._columns["id"]
+        next_id = (
+            max(
+                [ids[-1] if ids else 0]
+                + [c.id for c in characters if c.id is not None]
+            )
+            + 1
+        )
+        created: List[CharacterSchema] = []
+        for character in characters:
+            update = {}
+            if character.id is None:
+                update["id"] = next_id
+                next_id += 1
+            created.append(character.model_copy(update=update))
+        now = time.time()
+        merged: List[Dict[str, Any]] = []
+        for character in sorted(created, key=lambda c: c.id):
+            values = self._encode(character, now)
+            row = self._row(character.id)
+            if row is None:
+                merged.append(values)
+            else:
+                for name, column in self._columns.items():
+                    column[row] = values[name]
+                self._alive[row] = 1
+                self._dead -= 1
+            self._counter.add(character)
+        if merged:
+            self._merge(merged)
+        if self._name_index is not None:
+            self._name_index.add_many((c.id, c.name) for c in created)
+        self._bump()
+        return created
+
+    def _encode(self, character: CharacterSchema, now: float) -> Dict[str, Any]:
+        """
+        Encode a character into the values of its row, appending its name
+        to the name buffer.
+
+        Args:
+            character (CharacterSchema): The character, with its ID.
+            now (float): The timestamp of the write.
+
+        Returns:
+            Dict[str, Any]: The value of each column.
+        """
+        name = character.name.encode()
+        values = {
+            field: self._dictionaries[field].encode(getattr(character, field))
+            for field in stats_cts.COLOR_FIELDS
+        }
+        values.update(
+            id=character.id,
+            height=character.height,
+            mass=character.mass,
+            birth_year=character.birth_year,
+            name_start=len(self._names),
+            name_length=len(name),
+            updated_at=now,
+        )
+        self._names += name
+        return values
+
+    def _merge(self, rows: List[Dict[str, Any]]):
+        """
+        Add rows with new IDs to the columns, keeping them sorted.
+
+        Args:
+            rows (List[Dict[str, Any]]): The values of the rows, in ID
+                order.
+        """
+        ids = self._columns["id"]
+        if not ids or rows[0]["id"] > ids[-1]:
+            for name, column in self._columns.items():
+                column.extend(values[name] for values in rows)
+            self._alive.frombytes(b"\x01" * len(rows))
+            return
+        positions = [bisect.bisect_left(ids, values["id"]) for values in rows]
+        self._columns = {
+            name: splice(column, positions, [values[name] for values in rows])
+            for name, column in self._columns.items()
+        }
+        self._alive = splice(self._alive, positions, [1] * len(rows))
+
+    def _compact(self):
+        """
+        Drop the dead rows, copying the runs of live rows between them as
+        raw memory, and the names they held.
+        """
+        if not self._dead:
+            return
+        flags = self._alive.tobytes()
+        runs = []
+        start = flags.find(1)
+        while start != -1:
+            end = flags.find(0, start)
+            end = len(flags) if end == -1 else end
+            runs.append((start, end))
+            start = flags.find(1, end)
+        columns: Dict[str, array] = {}
+        for name, column in self._columns.items():
+            compacted = array(column.typecode)
+            size = column.itemsize
+            with memoryview(column) as view, view.cast("B") as raw:
+                for start, end in runs:
+                    compacted.frombytes(raw[start * size : end * size])
+            columns[name] = compacted
+        names = bytearray()
+        starts, lengths = columns["name_start"], columns["name_length"]
+        with memoryview(self._names) as view:
+            for row, (start, length) in enumerate(zip(starts, lengths)):
+                starts[row] = len(names)
+                names += view[start : start + length]
+        self._columns = columns
+        self._names = names
+        self._alive = array("B", b"\x01" * len(columns["id"]))
+        self._dead = 0
+
+    def _bump(self):
+        """
+        Bump the version of the character collection.
+        """
+        self._version += 1
+        self._updated_at = time.time()
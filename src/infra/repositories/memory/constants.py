@@ -0,0 +1,18 @@
+SNAPSHOT_MAGIC = b"CHARSNP1"
+# Snapshot buffers start on multiples of this many bytes.
+SNAPSHOT_ALIGNMENT = 8
+# Deleted rows are compacted away once they make up this share of rows.
+COMPACTION_RATIO = 0.25
+# The typecodes of the array columns, colors holding dictionary codes.
+COLUMN_TYPECODES = {
+    "id": "q",
+    "height": "d",
+    "mass": "d",
+    "birth_year": "q",
+    "eye_color": "I",
+    "hair_color": "I",
+    "skin_color": "I",
+    "name_start": "q",
+    "name_length": "I",
+    "updated_at": "d",
+}
@@ -0,0 +1,167 @@
+from time import perf_counter
+from typing import Any, Callable, Iterator, List
+
+from domain.entities.schemas import (
+    BulkCreateResultSchema,
+    CharacterPartialSchema,
+    CharacterQuerySchema,
+    CharacterSchema,
+    CharacterSearchSchema,
+    CharacterStatsQuerySchema,
+    CharacterStatsSchema,
+    ResourceVersionSchema,
+)
+from domain.repositories.character_repository import (
+    CharacterRepositoryInterface,
+)
+from infra.metrics.metrics import (
+    REPOSITORY_CALL_DURATION,
+    REPOSITORY_CALL_ERRORS,
+    REPOSITORY_METHOD,
+)
+
+
+class InstrumentedCharacterRepository(CharacterRepositoryInterface):
+    """
+    A decorator timing every call of a character repository.
+
+    While a call runs its method name is set in REPOSITORY_METHOD, so the
+    SQL statements and pool checkouts it triggers are attributed to it.
+    """
+
+    def __init__(self, repository: CharacterRepositoryInterface):
+        """
+        Constructor method.
+
+        Args:
+            repository (CharacterRepositoryInterface): The wrapped repository.
+        """
+        self._repository = repository
+
+    def __getattr__(self, name: str) -> Any:
+        """
+        Expose the other attributes of the wrapped repository, such as the
+        cache stats.
+        """
+        return getattr(self._repository, name)
+
+    def _call(self, method: str, function: Callable, *args, **kwargs) -> Any:
+        """
+        Call a method of the wrapped repository, timing it.
+
+        Args:
+            method (str): The name of the method.
+            function (Callable): The bound method to call.
+
+        Returns:
+            Any: The result of the call.
+        """
+        token = REPOSITORY_METHOD.set(method)
+        start = perf_counter()
+        try:
+            return function(*args, **kwargs)
+        except Exception:
+            REPOSITORY_CALL_ERRORS.inc(method)
+            raise
+        finally:
+            REPOSITORY_CALL_DURATION.observe(perf_counter() - start, method)
+            REPOSITORY_METHOD.reset(token)
+
+    def get_characters(
+        self, query: CharacterQuerySchema | None = None
+    ) -> List[CharacterPartialSchema]:
+        return self._call(
+            "get_characters", self._repository.get_characters, query
+        )
+
+    def iter_characters(
+        self, query: CharacterQuerySchema | None = None
+    ) -> Iterator[CharacterSchema]:
+        """
+        Stream characters from the wrapped repository, timing the whole
+        stream. Its statements are not attributed, since the caller runs
+        between the characters.
+        """
+        start = perf_counter()
+        try:
+            yield from self._repository.iter_characters(query)
+        except Exception:
+            REPOSITORY_CALL_ERRORS.inc("iter_characters")
+            raise
+        finally:
+            REPOSITORY_CALL_DURATION.observe(
+                perf_counter() - start, "iter_characters"
+            )
+
+    def get_character(self, character_id: int) -> CharacterSchema | None:
+        return self._call(
+            "get_character", self._repository.get_character, character_id
+        )
+
+    def get_characters_by_ids(
+        self, character_ids: List[int]
+    ) -> List[CharacterSchema]:
+        return self._call(
+            "get_characters_by_ids",
+            self._repository.get_characters_by_ids,
+            character_ids,
+        )
+
+    def search_characters(
+        self, search: CharacterSearchSchema
+    ) -> List[CharacterSchema]:
+        return self._call(
+            "search_characters", self._repository.search_characters, search
+        )
+
+    def get_character_stats(
+        self, query: CharacterStatsQuerySchema | None = None
+    ) -> CharacterStatsSchema:
+        return self._call(
+            "get_character_stats", self._repository.get_character_stats, query
+        )
+
+    def get_character_version(
+        self, character_id: int
+    ) -> ResourceVersionSchema | None:
+        return self._call(
+            "get_character_version",
+            self._repository.get_character_version,
+            character_id,
+        )
+
+    def get_characters_version(self) -> ResourceVersionSchema | None:
+        return self._call(
+            "get_characters_version", self._repository.get_characters_version
+        )
+
+    def create_character(self, character: CharacterSchema) -> CharacterSchema:
+        return self._call(
+            "create_character", self._repository.create_character, character
+        )
+
+    def create_characters(
+        self,
+        characters: List[CharacterSchema],
+        chunk_size: int | None = None,
+        atomic: bool = True,
+    ) -> BulkCreateResultSchema:
+        return self._call(
+            "create_characters",
+            self._repository.create_characters,
+            characters,
+            chunk_size=chunk_size,
+            atomic=atomic,
+        )
+
+    def delete_character(self, character_id: int) -> bool:
+        return self._call(
+            "delete_character", self._repository.delete_character, character_id
+        )
+
+    def delete_characters(self, character_ids: List[int]) -> List[int]:
+        return self._call(
+            "delete_characters",
+            self._repository.delete_characters,
+            character_ids,
+        )
@@ -0,0 +1,166 @@
+import threading
+from typing import Iterator, List, Set
+
+from domain.entities.schemas import (
+    BulkCreateResultSchema,
+    CharacterPartialSchema,
+    CharacterQuerySchema,
+    CharacterSchema,
+    CharacterSearchSchema,
+    CharacterStatsQuerySchema,
+    CharacterStatsSchema,
+    ResourceVersionSchema,
+)
+from domain.repositories.character_repository import (
+    CharacterRepositoryInterface,
+)
+from infra.repositories.search.name_index import NameIndex
+
+
+class IndexedCharacterRepository(CharacterRepositoryInterface):
+    """
+    A decorator searching the characters of a repository in an in-process
+    name index, for databases without full-text search or when searches
+    must not reach the database.
+
+    The index is loaded from the wrapped repository on the first search,
+    then kept up to date by the writes made through this decorator. Writes
+    made by other processes are not seen until the process restarts.
+    """
+
+    def __init__(
+        self,
+        repository: CharacterRepositoryInterface,
+        index: NameIndex | None = None,
+    ):
+        """
+        Constructor method.
+
+        Args:
+            repository (CharacterRepositoryInterface): The wrapped repository.
+            index (NameIndex | None): The name index. Defaults to an empty
+                one.
+        """
+        self._repository = repository
+        self._index = index or NameIndex()
+        self._load_lock = threading.Lock()
+        self._deletes_lock = threading.Lock()
+        self._loaded = False
+        self._loading = False
+        # Characters deleted while the index loads, which it may have read.
+        self._deleted_while_loading: Set[int] = set()
+
+    def get_characters(
+        self, query: CharacterQuerySchema | None = None
+    ) -> List[CharacterPartialSchema]:
+        return self._repository.get_characters(query)
+
+    def iter_characters(
+        self, query: CharacterQuerySchema | None = None
+    ) -> Iterator[CharacterSchema]:
+        return self._repository.iter_characters(query)
+
+    def get_character(self, character_id: int) -> CharacterSchema | None:
+        return self._repository.get_character(character_id)
+
+    def get_characters_by_ids(
+        self, character_ids: List[int]
+    ) -> List[CharacterSchema]:
+        return self._repository.get_characters_by_ids(character_ids)
+
+    def search_characters(
+        self, search: CharacterSearchSchema
+    ) -> List[CharacterSchema]:
+        """
+        Search characters in the name index, then get the page of
+        characters from the wrapped repository in one call.
+        """
+        self._ensure_loaded()
+        return self._repository.get_characters_by_ids(self._index.search(search))
+
+    def get_character_stats(
+        self, query: CharacterStatsQuerySchema | None = None
+    ) -> CharacterStatsSchema:
+        return self._repository.get_character_stats(query)
+
+    def get_character_version(
+        self, character_id: int
+    ) -> ResourceVersionSchema | None:
+        return self._repository.get_character_version(character_id)
+
+    def get_characters_version(self) -> ResourceVersionSchema | None:
+        return self._repository.get_characters_version()
+
+    def create_character(self, character: CharacterSchema) -> CharacterSchema:
+        created = self._repository.create_character(character)
+        self._index.add(created.id, created.name)
+        return created
+
+    def create_characters(
+        self,
+        characters: List[CharacterSchema],
+        chunk_size: int | None = None,
+        atomic: bool = True,
+    ) -> BulkCreateResultSchema:
+        result = self._repository.create_characters(
+            characters, chunk_size=chunk_size, atomic=atomic
+        )
+        self._index.add_many(
+            (character.id, character.name) for character in result.created
+        )
+        return result
+
+    def delete_character(self, character_id: int) -> bool:
+        deleted = self._repository.delete_character(character_id)
+        if deleted:
+            self._forget([character_id])
+        return deleted
+
+    def delete_characters(self, character_ids: List[int]) -> List[int]:
+        deleted = self._repository.delete_characters(character_ids)
+        self._forget(deleted)
+        return deleted
+
+    def _ensure_loaded(self):
+        """
+        Load the names of every character into the index, once. Concurrent
+        searches wait for the load.
+        """
+        if self._loaded:
+            return
+        with self._load_lock:
+            if self._loaded:
+                return
+            with self._deletes_lock:
+                self._loading = True
+            try:
+                # Read outside the index lock, so writes are not held up.
+                names = [
+                    (character.id, character.name)
+                    for character in self._repository.iter_characters(
+                        CharacterQuerySchema(fields=["name"], limit=None)
+                    )
+                ]
+                self._index.add_many(names)
+            finally:
+                with self._deletes_lock:
+                    self._loading = False
+                    deleted = self._deleted_while_loading
+                    self._deleted_while_loading = set()
+            for character_id in deleted:
+                self._index.remove(character_id)
+            self._loaded = True
+
+    def _forget(self, character_ids: List[int]):
+        """
+        Remove deleted characters from the index, and from the load in
+        progress, if any.
+
+        Args:
+            character_ids (List[int]): The IDs of the deleted characters.
+        """
+        with self._deletes_lock:
+            if self._loading:
+                self._deleted_while_loading.update(character_ids)
+        for character_id in character_ids:
+            self._index.remove(character_id)
@@ -0,0 +1,8 @@
+GRAM_SIZE = 3
+# Edits tolerated per query word by fuzzy searches, by minimum word length.
+FUZZY_EDITS = ((8, 2), (4, 1))
+# Corrections kept per query word, and corrected queries tried per search.
+FUZZY_WORD_CORRECTIONS = 3
+FUZZY_QUERIES = 8
+# Above every character, to bound the range of the names with a prefix.
+MAX_CHAR = "\U0010ffff"
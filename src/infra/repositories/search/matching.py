@@ -0,0 +1,294 @@
+import re
+from abc import ABC, abstractmethod
+from typing import Dict, List, Set, Tuple
+
+from domain.entities.schemas import CharacterSearchSchema
+from infra.repositories.search import constants as cts
+
+WORD = re.compile(r"[^\W_]+")
+
+
+def normalize(text: str) -> str:
+    """
+    Fold the case and collapse the whitespace of a text, as names are
+    compared by searches.
+
+    Args:
+        text (str): The text.
+
+    Returns:
+        str: The normalized text.
+    """
+    return " ".join(text.split()).casefold()
+
+
+def grams(text: str) -> Set[str]:
+    """
+    Get the trigrams of a text.
+
+    Args:
+        text (str): The text.
+
+    Returns:
+        Set[str]: The trigrams.
+    """
+    return {
+        text[start : start + cts.GRAM_SIZE]
+        for start in range(len(text) - cts.GRAM_SIZE + 1)
+    }
+
+
+def words(text: str) -> List[str]:
+    """
+    Get the words of a text, the runs of letters and digits, as the
+    vocabularies of the indexes split them.
+
+    Args:
+        text (str): The normalized text.
+
+    Returns:
+        List[str]: The words.
+    """
+    return WORD.findall(text)
+
+
+def edit_distance(source: str, target: str, limit: int) -> int | None:
+    """
+    Get the number of insertions, deletions, substitutions and swaps of
+    adjacent characters turning a text into another, giving up as soon as
+    it exceeds a limit.
+
+    Args:
+        source (str): The first text.
+        target (str): The second text.
+        limit (int): The greatest distance of interest.
+
+    Returns:
+        int | None: The distance, None if it exceeds the limit.
+    """
+    if abs(len(source) - len(target)) > limit:
+        return None
+    before: List[int] = []
+    previous = list(range(len(target) + 1))
+    for row, source_char in enumerate(source, 1):
+        current = [row]
+        for column, target_char in enumerate(target, 1):
+            distance = min(
+                previous[column] + 1,
+                current[column - 1] + 1,
+                previous[column - 1] + (source_char != target_char),
+            )
+            if (
+                row > 1
+                and column > 1
+                and source_char == target[column - 2]
+                and source[row - 2] == target_char
+            ):
+                distance = min(distance, before[column - 2] + 1)
+            current.append(distance)
+        if min(current) > limit:
+            return None
+        before, previous = previous, current
+    return previous[-1] if previous[-1] <= limit else None
+
+
+class NameSourceInterface(ABC):
+    """
+    The lookups of an index of normalized character names that searches
+    are run with.
+    """
+
+    @abstractmethod
+    def prefixed(self, query: str, limit: int) -> List[int]:
+        """
+        Get the characters whose name starts with a query.
+
+        Args:
+            query (str): The normalized query.
+            limit (int): The maximum number of characters.
+
+        Returns:
+            List[int]: The IDs of the characters, ordered by name, then
+                by ID.
+        """
+
+    @abstractmethod
+    def word_prefixed(self, query: str, limit: int) -> List[int]:
+        """
+        Get the characters with a word of their name, past the first one,
+        starting with a query.
+
+        Args:
+            query (str): The normalized query.
+            limit (int): The maximum number of characters.
+
+        Returns:
+            List[int]: The IDs of the characters, ordered by ID.
+        """
+
+    @abstractmethod
+    def containing(self, query: str, limit: int) -> List[int]:
+        """
+        Get the characters whose name contains a query of at least
+        GRAM_SIZE characters.
+
+        Args:
+            query (str): The normalized query.
+            limit (int): The maximum number of characters.
+
+        Returns:
+            List[int]: The IDs of the characters, ordered by ID.
+        """
+
+    @abstractmethod
+    def words(self, initial: str) -> List[str]:
+        """
+        Get the distinct words of the names starting with a character.
+
+        Args:
+            initial (str): The character.
+
+        Returns:
+            List[str]: The words, empty if the index has no vocabulary.
+        """
+
+
+def match(source: NameSourceInterface, query: str, limit: int) -> List[int]:
+    """
+    Rank the names matching a query as typed: the names starting with it,
+    in name order, then the names with a word starting with it and, for
+    queries of a trigram or more, the names containing it, in ID order.
+
+    Args:
+        source (NameSourceInterface): The index to search.
+        query (str): The normalized query.
+        limit (int): The maximum number of characters.
+
+    Returns:
+        List[int]: The IDs of the characters, best match first.
+    """
+    lookups = [source.prefixed, source.word_prefixed]
+    if len(query) >= cts.GRAM_SIZE:
+        lookups.append(source.containing)
+    matched: Dict[int, None] = {}
+    for lookup in lookups:
+        # A name may match a lookup and a better one before it.
+        for character_id in lookup(query, limit + len(matched)):
+            matched.setdefault(character_id)
+            if len(matched) == limit:
+                return list(matched)
+    return list(matched)
+
+
+def allowed_edits(word: str) -> int:
+    """
+    Get the typos tolerated in a query word: none below four characters,
+    since nearly every short word is a typo away from another.
+
+    Args:
+        word (str): The word.
+
+    Returns:
+        int: The number of edits.
+    """
+    for min_length, edits in cts.FUZZY_EDITS:
+        if len(word) >= min_length:
+            return edits
+    return 0
+
+
+def word_corrections(
+    source: NameSourceInterface, word: str, last: bool
+) -> List[Tuple[int, str]]:
+    """
+    Get the words of the vocabulary a few typos away from a query word.
+    Like most spelling correctors, the first character is assumed right,
+    which keeps the vocabulary lookup small.
+
+    Args:
+        source (NameSourceInterface): The index to search.
+        word (str): The query word.
+        last (bool): Whether the word ends the query, in which case it
+            may be the start of a word still being typed.
+
+    Returns:
+        List[Tuple[int, str]]: The edits and corrections, fewest edits
+            first, at most FUZZY_WORD_CORRECTIONS of them.
+    """
+    limit = allowed_edits(word)
+    if not limit:
+        return []
+    corrections: Dict[str, int] = {}
+    for candidate in source.words(word[0]):
+        options = [candidate]
+        if last and len(candidate) > len(word):
+            options.append(candidate[: len(word)])
+        for option in options:
+            if option == word:
+                continue
+            edits = edit_distance(word, option, limit)
+            if edits is not None and edits < corrections.get(option, limit + 1):
+                corrections[option] = edits
+    return sorted(
+        (edits, option) for option, edits in corrections.items()
+    )[: cts.FUZZY_WORD_CORRECTIONS]
+
+
+def corrections(source: NameSourceInterface, query: str) -> List[str]:
+    """
+    Get the queries a few typos away from a query, by correcting its
+    words against the vocabulary of the names.
+
+    Args:
+        source (NameSourceInterface): The index to search.
+        query (str): The normalized query.
+
+    Returns:
+        List[str]: The corrected queries, fewest edits first, at most
+            FUZZY_QUERIES of them.
+    """
+    spans = list(WORD.finditer(query))
+    # Partial queries, kept to the fewest edits, with the end of their text.
+    beam: List[Tuple[int, str, int]] = [(0, "", 0)]
+    for position, span in enumerate(spans):
+        last = position == len(spans) - 1 and span.end() == len(query)
+        options = [(0, span.group())] + word_corrections(
+            source, span.group(), last
+        )
+        beam = sorted(
+            (edits + more, text + query[end : span.start()] + option, span.end())
+            for edits, text, end in beam
+            for more, option in options
+        )[: cts.FUZZY_QUERIES + 1]
+    return [text + query[end:] for edits, text, end in beam if edits]
+
+
+def search_names(
+    source: NameSourceInterface, search: CharacterSearchSchema
+) -> List[int]:
+    """
+    Search the names of an index. Matches of the query as typed come
+    first, then, for fuzzy searches, the matches of its corrections,
+    fewest typos first. Corrections are only looked for when the matches
+    of the query do not fill the page.
+
+    Args:
+        source (NameSourceInterface): The index to search.
+        search (CharacterSearchSchema): The search options.
+
+    Returns:
+        List[int]: The IDs of the page of characters, best match first.
+    """
+    query = normalize(search.q)
+    end = search.offset + search.limit
+    matched = match(source, query, end)
+    if len(matched) < end and search.fuzzy:
+        seen = set(matched)
+        for corrected in corrections(source, query):
+            for character_id in match(source, corrected, end):
+                if character_id not in seen:
+                    seen.add(character_id)
+                    matched.append(character_id)
+            if len(matched) >= end:
+                break
+    return matched[search.offset : end]
@@ -0,0 +1,239 @@
+import bisect
+import threading
+from array import array
+from typing import Callable, Dict, Iterable, List, Set, Tuple
+
+from domain.entities.schemas import CharacterSearchSchema
+from infra.repositories.search.matching import (
+    NameSourceInterface,
+    grams,
+    normalize,
+    search_names,
+    words,
+)
+
+
+class NameIndex(NameSourceInterface):
+    """
+    A thread-safe, in-process index of the character names, for searches
+    on any database.
+
+    Names are kept sorted, for prefixes, and in trigram posting arrays of
+    IDs, for the words and substrings they contain, with a vocabulary of
+    their words for typo tolerance. Writes only append: the entries of
+    removed or renamed characters stay behind until they outnumber the
+    live ones, and are skipped meanwhile.
+    """
+
+    def __init__(self):
+        """
+        Constructor method.
+        """
+        self._lock = threading.RLock()
+        self._names: Dict[int, str] = {}
+        self._sorted: List[Tuple[str, int]] = []
+        self._unsorted: List[Tuple[str, int]] = []
+        self._postings: Dict[str, array] = {}
+        self._unsorted_grams: Set[str] = set()
+        self._words: Dict[str, Dict[str, int]] = {}
+        self._stale = 0
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def add(self, character_id: int, name: str):
+        """
+        Index the name of a character, replacing its previous one.
+
+        Args:
+            character_id (int): The ID of the character.
+            name (str): The name.
+        """
+        with self._lock:
+            self._remove(character_id)
+            name = normalize(name)
+            self._names[character_id] = name
+            self._unsorted.append((name, character_id))
+            for gram in grams(name):
+                postings = self._postings.get(gram)
+                if postings is None:
+                    postings = self._postings[gram] = array("q")
+                elif postings[-1] > character_id:
+                    self._unsorted_grams.add(gram)
+                postings.append(character_id)
+            self._add_words(name)
+            if self._stale > len(self._names):
+                self._compact()
+
+    def add_many(self, names: Iterable[Tuple[int, str]]):
+        """
+        Index the names of many characters at once, much faster than one
+        by one.
+
+        Args:
+            names (Iterable[Tuple[int, str]]): The IDs and names.
+        """
+        with self._lock:
+            added: List[Tuple[str, int]] = []
+            for character_id, name in names:
+                self._remove(character_id)
+                name = normalize(name)
+                self._names[character_id] = name
+                added.append((name, character_id))
+            postings: Dict[str, List[int]] = {}
+            for name, character_id in added:
+                for gram in grams(name):
+                    postings.setdefault(gram, []).append(character_id)
+                self._add_words(name)
+            ordered = all(
+                previous[1] < following[1]
+                for previous, following in zip(added, added[1:])
+            )
+            for gram, ids in postings.items():
+                existing = self._postings.setdefault(gram, array("q"))
+                if not ordered or (existing and existing[-1] > ids[0]):
+                    self._unsorted_grams.add(gram)
+                existing.extend(ids)
+            self._unsorted += added
+            if self._stale > len(self._names):
+                self._compact()
+
+    def remove(self, character_id: int):
+        """
+        Remove the name of a character, if indexed.
+
+        Args:
+            character_id (int): The ID of the character.
+        """
+        with self._lock:
+            self._remove(character_id)
+            if self._stale > len(self._names):
+                self._compact()
+
+    def search(self, search: CharacterSearchSchema) -> List[int]:
+        """
+        Search the names.
+
+        Args:
+            search (CharacterSearchSchema): The search options.
+
+        Returns:
+            List[int]: The IDs of the page of characters, best match first.
+        """
+        with self._lock:
+            return search_names(self, search)
+
+    def prefixed(self, query: str, limit: int) -> List[int]:
+        with self._lock:
+            if self._unsorted:
+                # Sorted runs are merged in linear time.
+                self._unsorted.sort()
+                self._sorted += self._unsorted
+                self._sorted.sort()
+                self._unsorted = []
+            found: List[int] = []
+            position = bisect.bisect_left(self._sorted, (query,))
+            while position < len(self._sorted) and len(found) < limit:
+                name, character_id = self._sorted[position]
+                position += 1
+                if not name.startswith(query):
+                    break
+                if self._names.get(character_id) == name and (
+                    not found or found[-1] != character_id
+                ):
+                    found.append(character_id)
+            return found
+
+    def word_prefixed(self, query: str, limit: int) -> List[int]:
+        word_start = f" {query}"
+        return self._scan(
+            grams(word_start), lambda name: word_start in name, limit
+        )
+
+    def containing(self, query: str, limit: int) -> List[int]:
+        return self._scan(grams(query), lambda name: query in name, limit)
+
+    def words(self, initial: str) -> List[str]:
+        with self._lock:
+            return list(self._words.get(initial, ()))
+
+    def _scan(
+        self, query_grams: Set[str], matches: Callable[[str], bool], limit: int
+    ) -> List[int]:
+        """
+        Get the characters whose name matches, in ID order, scanning the
+        shortest posting array of the trigrams they must all have.
+
+        Args:
+            query_grams (Set[str]): The trigrams.
+            matches (Callable[[str], bool]): Checks a normalized name.
+            limit (int): The maximum number of characters.
+
+        Returns:
+            List[int]: The IDs of the characters.
+        """
+        with self._lock:
+            if any(gram not in self._postings for gram in query_grams):
+                return []
+            gram = min(query_grams, key=lambda gram: len(self._postings[gram]))
+            if gram in self._unsorted_grams:
+                self._postings[gram] = array("q", sorted(self._postings[gram]))
+                self._unsorted_grams.discard(gram)
+            found: List[int] = []
+            for character_id in self._postings[gram]:
+                if len(found) == limit:
+                    break
+                if found and found[-1] == character_id:
+                    continue
+                name = self._names.get(character_id)
+                if name is not None and matches(name):
+                    found.append(character_id)
+            return found
+
+    def _add_words(self, name: str):
+        """
+        Count the words of a name in the vocabulary, holding the lock.
+
+        Args:
+            name (str): The normalized name.
+        """
+        for word in words(name):
+            vocabulary = self._words.setdefault(word[0], {})
+            vocabulary[word] = vocabulary.get(word, 0) + 1
+
+    def _remove(self, character_id: int):
+        """
+        Remove the name of a character, holding the lock. Its sorted and
+        posting entries become stale.
+
+        Args:
+            character_id (int): The ID of the character.
+        """
+        name = self._names.pop(character_id, None)
+        if name is None:
+            return
+        self._stale += 1
+        for word in words(name):
+            vocabulary = self._words[word[0]]
+            vocabulary[word] -= 1
+            if not vocabulary[word]:
+                del vocabulary[word]
+
+    def _compact(self):
+        """
+        Rebuild the sorted names and the posting arrays from the live
+        names, holding the lock.
+        """
+        self._sorted = sorted(
+            (name, character_id) for character_id, name in self._names.items()
+        )
+        self._unsorted = []
+        postings: Dict[str, List[int]] = {}
+        for character_id, name in self._names.items():
+            for gram in grams(name):
+                postings.setdefault(gram, []).append(character_id)
+        self._postings = {
+            gram: array("q", sorted(ids)) for gram, ids in postings.items()
+        }
+        self._unsorted_grams = set()
+        self._stale = 0
@@ -0,0 +1,377 @@
+from typing import AsyncIterator, List
+
+from sqlalchemy import delete, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from domain.entities.exceptions import BulkCreateError
+from domain.entities.schemas import (
+    BulkCreateErrorSchema,
+    BulkCreateResultSchema,
+    CharacterPartialSchema,
+    CharacterQuerySchema,
+    CharacterSchema,
+    CharacterSearchSchema,
+    CharacterStatsQuerySchema,
+    CharacterStatsSchema,
+)
+from domain.repositories.character_repository import (
+    AsyncCharacterRepositoryInterface,
+)
+from infra.repositories.search.matching import search_names
+from infra.repositories.sql.base import AsyncDatabaseInitializer
+from infra.repositories.sql.models import Character
+from infra.repositories.sql.queries import (
+    apply_query,
+    bump_collection_version,
+    insert_groups,
+    insert_statement,
+    projected_columns,
+)
+from infra.repositories.sql.search import SQLNameSource
+from infra.repositories.sql.stats import count_values
+from settings import DatabaseSettings
+
+
+class AsyncCharacterRepository(AsyncCharacterRepositoryInterface):
+    """
+    A Concrete class to CRUD characters in a SQL database with asyncio.
+    """
+
+    STREAM_BATCH_SIZE: int = DatabaseSettings.STREAM_BATCH_SIZE
+    BULK_CHUNK_SIZE: int = DatabaseSettings.BULK_CHUNK_SIZE
+
+    def __init__(self, db_initializer: AsyncDatabaseInitializer):
+        """
+        Constructor method.
+
+        Args:
+            db_initializer (AsyncDatabaseInitializer): The database
+                initializer to use.
+        """
+        self._db_initializer = db_initializer
+
+    async def get_characters(
+        self, query: CharacterQuerySchema | None = None
+    ) -> List[CharacterPartialSchema]:
+        """
+        Get characters from the database, ordered by ID.
+
+        Args:
+            query (CharacterQuerySchema | None): Pagination, projection and
+                filtering options. Defaults to the first page.
+
+        Returns:
+            List[CharacterPartialSchema]: A list of characters.
+        """
+        query = query or CharacterQuerySchema()
+        columns = projected_columns(
+            query.fields or list(CharacterPartialSchema.model_fields)
+        )
+        async with self._db_initializer.get_session() as session:
+            result = await session.execute(
+                apply_query(select(*columns), query)
+            )
+            rows = result.all()
+        if query.fields is None:
+            return [CharacterPartialSchema.model_validate(row) for row in rows]
+        return [
+            CharacterPartialSchema.model_construct(
+                _fields_set=set(row._fields), **row._asdict()
+            )
+            for row in rows
+        ]
+
+    async def iter_characters(
+        self, query: CharacterQuerySchema | None = None
+    ) -> AsyncIterator[CharacterSchema]:
+        """
+        Stream characters from the database, ordered by ID, from a
+        server-side cursor fetching STREAM_BATCH_SIZE rows at a time.
+
+        Args:
+            query (CharacterQuerySchema | None): Pagination, projection and
+                filtering options. Defaults to every character.
+
+        Yields:
+            CharacterSchema: The characters.
+        """
+        query = query or CharacterQuerySchema(limit=None)
+        columns = projected_columns(
+            query.fields or list(CharacterSchema.model_fields)
+        )
+        async with self._db_initializer.get_session() as session:
+            result = await session.stream(
+                apply_query(select(*columns), query).execution_options(
+                    yield_per=self.STREAM_BATCH_SIZE
+                )
+            )
+            async for row in result:
+                yield CharacterSchema.model_construct(
+                    _fields_set=set(row._fields), **row._asdict()
+                )
+
+    async def get_character(self, character_id: int) -> CharacterSchema | None:
+        """
+        Get a character by its ID.
+
+        Args:
+            character_id (int): The ID of the character.
+
+        Returns:
+            CharacterSchema | None: The character if found, None otherwise.
+        """
+        async with self._db_initializer.get_session() as session:
+            character = await session.get(Character, character_id)
+            if character:
+                return CharacterSchema.model_validate(character)
+            return None
+
+    async def get_characters_by_ids(
+        self, character_ids: List[int]
+    ) -> List[CharacterSchema]:
+        """
+        Get many characters by their IDs with one SELECT ... WHERE id IN
+        statement per chunk of BULK_CHUNK_SIZE distinct IDs.
+
+        Args:
+            character_ids (List[int]): The IDs of the characters.
+
+        Returns:
+            List[CharacterSchema]: The characters found, in the order of
+                their first ID in character_ids.
+        """
+        unique_ids = list(dict.fromkeys(character_ids))
+        found = {}
+        async with self._db_initializer.get_session() as session:
+            for start in range(0, len(unique_ids), self.BULK_CHUNK_SIZE):
+                chunk = unique_ids[start : start + self.BULK_CHUNK_SIZE]
+                for character in await session.scalars(
+                    select(Character).where(Character.id.in_(chunk))
+                ):
+                    found[character.id] = CharacterSchema.model_validate(
+                        character
+                    )
+        return [found[id_] for id_ in unique_ids if id_ in found]
+
+    async def search_characters(
+        self, search: CharacterSearchSchema
+    ) -> List[CharacterSchema]:
+        """
+        Search characters by name. The lookups, a few small statements, run
+        through the synchronous facade of the session, then the page of
+        characters is loaded by ID.
+
+        Args:
+            search (CharacterSearchSchema): The search options.
+
+        Returns:
+            List[CharacterSchema]: The page of characters, best match first.
+        """
+        async with self._db_initializer.get_session() as session:
+            character_ids = await session.run_sync(
+                lambda sync_session: search_names(
+                    SQLNameSource(sync_session), search
+                )
+            )
+        return await self.get_characters_by_ids(character_ids)
+
+    async def get_character_stats(
+        self, query: CharacterStatsQuerySchema | None = None
+    ) -> CharacterStatsSchema:
+        """
+        Get the statistics of the characters from the number of characters
+        per value of each field, maintained by triggers on SQLite and
+        computed with GROUP BY queries elsewhere.
+
+        Args:
+            query (CharacterStatsQuerySchema | None): The statistics
+                options. Defaults to the default ones.
+
+        Returns:
+            CharacterStatsSchema: The statistics.
+        """
+        async with self._db_initializer.get_session() as session:
+            counter = await session.run_sync(count_values)
+        return counter.stats(query)
+
+    async def create_character(
+        self, character: CharacterSchema
+    ) -> CharacterSchema:
+        """
+        Create a new character.
+
+        Args:
+            character (CharacterSchema): The character to create.
+
+        Returns:
+            CharacterSchema: The created character.
+        """
+        async with self._db_initializer.get_session() as session:
+            created = await self._insert_chunk(session, [character])
+            await self._commit(session)
+            return created[0]
+
+    async def create_characters(
+        self,
+        characters: List[CharacterSchema],
+        chunk_size: int | None = None,
+        atomic: bool = True,
+    ) -> BulkCreateResultSchema:
+        """
+        Create many characters with one multi-row INSERT ... RETURNING per
+        chunk.
+
+        Args:
+            characters (List[CharacterSchema]): The characters to create.
+            chunk_size (int | None): The number of characters inserted per
+                statement. Defaults to BULK_CHUNK_SIZE.
+            atomic (bool): If True a single transaction covers every chunk.
+                If False each chunk is committed on its own and, when one
+                fails, its characters are retried one by one to report the
+                failing ones. Unlike the synchronous repository it does not
+                use savepoints, which aiosqlite does not run reliably.
+
+        Returns:
+            BulkCreateResultSchema: The created characters and the errors.
+
+        Raises:
+            ValueError: If chunk_size is less than 1.
+            BulkCreateError: If a chunk fails in atomic mode.
+        """
+        chunk_size = chunk_size or self.BULK_CHUNK_SIZE
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        result = BulkCreateResultSchema()
+        async with self._db_initializer.get_session() as session:
+            for start in range(0, len(characters), chunk_size):
+                chunk = characters[start : start + chunk_size]
+                if atomic:
+                    try:
+                        created = await self._insert_chunk(session, chunk)
+                    except SQLAlchemyError as e:
+                        await session.rollback()
+                        raise BulkCreateError(
+                            start, str(getattr(e, "orig", None) or e)
+                        ) from e
+                    result.created.extend(created)
+                    continue
+                try:
+                    created = await self._insert_chunk(session, chunk)
+                    await self._commit(session)
+                    result.created.extend(created)
+                except SQLAlchemyError:
+                    await session.rollback()
+                    await self._insert_rows(session, chunk, start, result)
+            # Partial chunks are already committed.
+            await self._commit(session, changed=atomic and bool(result.created))
+        return result
+
+    @staticmethod
+    async def _commit(session: AsyncSession, changed: bool = True):
+        """
+        Bump the version of the character collection, if the transaction
+        changed any row, and commit.
+
+        Args:
+            session (AsyncSession): The session to commit.
+            changed (bool): Whether the transaction changed any row.
+        """
+        if changed:
+            await session.execute(bump_collection_version())
+        await session.commit()
+
+    async def _insert_chunk(
+        self, session: AsyncSession, chunk: List[CharacterSchema]
+    ) -> List[CharacterSchema]:
+        """
+        Insert a chunk of characters, without committing.
+
+        Args:
+            session (AsyncSession): The session to insert with.
+            chunk (List[CharacterSchema]): The characters to insert.
+
+        Returns:
+            List[CharacterSchema]: The inserted characters, in chunk order.
+        """
+        created: List[CharacterSchema | None] = [None] * len(chunk)
+        for positions, rows in insert_groups(chunk):
+            result = await session.execute(insert_statement(), rows)
+            for position, row in zip(positions, result):
+                created[position] = CharacterSchema.model_validate(row)
+        return created
+
+    async def _insert_rows(
+        self,
+        session: AsyncSession,
+        chunk: List[CharacterSchema],
+        start: int,
+        result: BulkCreateResultSchema,
+    ):
+        """
+        Insert the characters of a failed chunk one by one, each in its own
+        transaction, recording the failing ones.
+
+        Args:
+            session (AsyncSession): The session to insert with.
+            chunk (List[CharacterSchema]): The characters to insert.
+            start (int): The index of the chunk's first character.
+            result (BulkCreateResultSchema): The result to fill.
+        """
+        for offset, character in enumerate(chunk):
+            try:
+                created = await self._insert_chunk(session, [character])
+                await self._commit(session)
+                result.created.extend(created)
+            except SQLAlchemyError as e:
+                await session.rollback()
+                result.errors.append(
+                    BulkCreateErrorSchema(
+                        index=start + offset,
+                        message=str(getattr(e, "orig", None) or e),
+                    )
+                )
+
+    async def delete_character(self, character_id: int) -> bool:
+        """
+        Delete a character by its ID with a single DELETE statement.
+
+        Args:
+            character_id (int): The ID of the character.
+
+        Returns:
+            bool: True if the character was deleted, False otherwise
+        """
+        async with self._db_initializer.get_session() as session:
+            result = await session.execute(
+                delete(Character)
+                .where(Character.id == character_id)
+                .execution_options(synchronize_session=False)
+            )
+            await self._commit(session, changed=result.rowcount > 0)
+            return result.rowcount > 0
+
+    async def delete_characters(self, character_ids: List[int]) -> List[int]:
+        """
+        Delete many characters with one DELETE ... RETURNING statement per
+        chunk of BULK_CHUNK_SIZE IDs, in a single transaction.
+
+        Args:
+            character_ids (List[int]): The IDs of the characters.
+
+        Returns:
+            List[int]: The IDs of the deleted characters.
+        """
+        deleted: List[int] = []
+        async with self._db_initializer.get_session() as session:
+            for start in range(0, len(character_ids), self.BULK_CHUNK_SIZE):
+                chunk = character_ids[start : start + self.BULK_CHUNK_SIZE]
+                result = await session.scalars(
+                    delete(Character)
+                    .where(Character.id.in_(chunk))
+                    .returning(Character.id)
+                    .execution_options(synchronize_session=False)
+                )
+                deleted.extend(result)
+            await self._commit(session, changed=bool(deleted))
+        return deleted
@@ -1,44 +1,210 @@
 import os
+import threading
+from typing import Any, Callable, Dict, List, TypeVar
 
-from sqlalchemy import create_engine
+from sqlalchemy import Engine, create_engine, make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import Session, declarative_base, sessionmaker
 
+from infra.metrics.sql import TimedQueuePool
+from infra.repositories.sql import constants as cts
+from infra.repositories.sql.migrations.migrator import Migrator
+from infra.repositories.sql.migrations.revisions import Revision
+from infra.repositories.sql.sqlite import apply_pragmas, read_only_url
+from infra.repositories.sql.writer import WriteQueue
+from settings import DatabaseSettings, SQLiteSettings
+
 Base = declarative_base()
 
+T = TypeVar("T")
+
 
 class DatabaseInitializer:
     """
     Handles database initialization logic such as file creation (for SQLite) and table setup.
     """
 
-    def __init__(self, database_url: str):
+    def __init__(
+        self,
+        database_url: str,
+        pool_size: int = DatabaseSettings.POOL_SIZE,
+        max_overflow: int = DatabaseSettings.MAX_OVERFLOW,
+        pool_recycle: int = DatabaseSettings.POOL_RECYCLE,
+        pool_pre_ping: bool = DatabaseSettings.POOL_PRE_PING,
+    ):
         """
         Constructor method.
 
         Args:
             database_url (str): The URL of the database
+            pool_size (int): The number of connections kept in the pool.
+            max_overflow (int): The number of connections allowed above
+                pool_size.
+            pool_recycle (int): Seconds after which a connection is recycled,
+                -1 to disable.
+            pool_pre_ping (bool): Whether to test connections on checkout.
         """
         self._database_url = database_url
+        self._pool_size = pool_size
+        self._max_overflow = max_overflow
+        self._pool_recycle = pool_recycle
+        self._pool_pre_ping = pool_pre_ping
         self._engine = None
         self._SessionLocal = None
+        self._write_engine = None
+        self._WriteSessionLocal = None
+        self._write_queue = None
         self._initialize_database()
 
-    def _initialize_database(self):
+    @property
+    def engine(self) -> Engine:
+        """
+        The SQLAlchemy engine bound to the database, read-only for SQLite
+        files.
+
+        Returns:
+            Engine: The engine.
+        """
+        return self._engine
+
+    @property
+    def write_engine(self) -> Engine:
         """
-        Initialize the database engine, create files if needed
-            (SQLite), and create tables.
+        The SQLAlchemy engine used for writes and migrations.
+
+        Returns:
+            Engine: The engine.
         """
-        if self._database_url.startswith("sqlite"):
-            db_path = self._database_url.replace("sqlite:///", "")
+        return self._write_engine
+
+    def _is_sqlite_memory(self) -> bool:
+        """
+        Check whether the database is an in-memory SQLite database.
+
+        Returns:
+            bool: True if the database lives in memory, False otherwise.
+        """
+        url = make_url(self._database_url)
+        return url.get_backend_name() == "sqlite" and url.database in (
+            None,
+            "",
+            ":memory:",
+        )
+
+    def _is_sqlite_file(self) -> bool:
+        """
+        Check whether the database is a SQLite database file.
+
+        Returns:
+            bool: True if the database is a SQLite file, False otherwise.
+        """
+        return (
+            make_url(self._database_url).get_backend_name() == "sqlite"
+            and not self._is_sqlite_memory()
+        )
+
+    def _pool_options(self) -> Dict[str, Any]:
+        """
+        Build the connection pool options for create_engine.
+
+        In-memory SQLite databases use a per-thread singleton pool that does
+        not accept sizing options.
+
+        Returns:
+            Dict[str, Any]: The keyword arguments for create_engine.
+        """
+        options = {
+            "pool_recycle": self._pool_recycle,
+            "pool_pre_ping": self._pool_pre_ping,
+        }
+        if not self._is_sqlite_memory():
+            options["pool_size"] = self._pool_size
+            options["max_overflow"] = self._max_overflow
+        return options
+
+    def _create_sqlite_file(self):
+        """
+        Create the database file and its directory if needed (SQLite).
+        """
+        if self._is_sqlite_file():
+            db_path = make_url(self._database_url).database
             if not os.path.exists(db_path):
-                os.makedirs(os.path.dirname(db_path), exist_ok=True)
+                db_dir = os.path.dirname(db_path)
+                if db_dir:
+                    os.makedirs(db_dir, exist_ok=True)
                 open(db_path, "a").close()
 
-        self._engine = create_engine(self._database_url, echo=True)
-        Base.metadata.create_all(self._engine)
+    def _initialize_database(self):
+        """
+        Initialize the database engines and the session factories, creating
+            the database file if needed (SQLite). Pooled engines time their
+            connection checkouts.
+
+        SQLite files get a dedicated profile: a single writer connection in
+        WAL mode, fed by a WriteQueue that group-commits concurrent writes,
+        and a pool of read-only connections for the reads.
+        """
+        self._create_sqlite_file()
+        pool_options = self._pool_options()
+        if not self._is_sqlite_memory():
+            pool_options["poolclass"] = TimedQueuePool
+        if not self._is_sqlite_file():
+            self._engine = create_engine(self._database_url, **pool_options)
+            self._write_engine = self._engine
+        else:
+            self._write_engine = create_engine(
+                self._database_url,
+                **(pool_options | {"pool_size": 1, "max_overflow": 0}),
+            )
+            apply_pragmas(self._write_engine, begin_immediate=True)
+            # The writer sets the journal mode before readers open the file.
+            self._write_engine.connect().close()
+            self._engine = create_engine(
+                read_only_url(self._database_url), **pool_options
+            )
+            apply_pragmas(self._engine, read_only=True)
         self._SessionLocal = sessionmaker(
             autocommit=False, autoflush=False, bind=self._engine
         )
+        self._WriteSessionLocal = sessionmaker(
+            autocommit=False, autoflush=False, bind=self._write_engine
+        )
+        if self._is_sqlite_file() and SQLiteSettings.WRITE_QUEUE:
+            self._write_queue = WriteQueue(
+                self._WriteSessionLocal, SQLiteSettings.WRITE_BATCH_SIZE
+            )
+
+    def create_schema(self) -> List[Revision]:
+        """
+        Apply the pending schema migrations, in a single transaction.
+
+        Returns:
+            List[Revision]: The applied revisions.
+        """
+        with self._write_engine.begin() as connection:
+            return Migrator(connection).upgrade()
+
+    def reset_after_fork(self):
+        """
+        Give the engines fresh connection pools in a forked child process.
+        """
+        self._engine.dispose(close=False)
+        if self._write_engine is not self._engine:
+            self._write_engine.dispose(close=False)
+
+    def dispose(self):
+        """
+        Stop the writer and close every pooled connection of the engines.
+        """
+        if self._write_queue is not None:
+            self._write_queue.close()
+        self._engine.dispose()
+        if self._write_engine is not self._engine:
+            self._write_engine.dispose()
 
     def get_session(self) -> Session:
         """
@@ -48,3 +214,163 @@ class DatabaseInitializer:
             Session: A new session object.
         """
         return self._SessionLocal()
+
+    def write(self, work: Callable[[Session], T]) -> T:
+        """
+        Run a write in a transaction and commit it.
+
+        Through the write queue, when there is one, the write shares its
+        transaction with the writes queued at the same time and runs in a
+        savepoint that alone is rolled back if it raises. Otherwise it runs
+        in a transaction of its own, rolled back as a whole if it raises.
+
+        Args:
+            work (Callable[[Session], T]): The write. It must not commit.
+
+        Returns:
+            T: The result of the write, once committed.
+        """
+        if self._write_queue is not None:
+            return self._write_queue.submit(work)
+        session = self._WriteSessionLocal()
+        try:
+            result = work(session)
+            session.commit()
+            return result
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+
+class AsyncDatabaseInitializer(DatabaseInitializer):
+    """
+    The asyncio counterpart of DatabaseInitializer. The database URL is
+    switched to the asynchronous driver of its dialect.
+    """
+
+    def _initialize_database(self):
+        """
+        Initialize the asynchronous database engine and the session
+            factory, creating the database file if needed (SQLite) and
+            setting its pragmas.
+        """
+        self._create_sqlite_file()
+        self._engine = create_async_engine(
+            self.async_url(self._database_url), **self._pool_options()
+        )
+        self._write_engine = self._engine
+        if self._is_sqlite_file():
+            apply_pragmas(self._engine.sync_engine)
+        self._SessionLocal = async_sessionmaker(
+            autoflush=False, expire_on_commit=False, bind=self._engine
+        )
+
+    @staticmethod
+    def async_url(database_url: str) -> str:
+        """
+        Get the URL of a database with the asynchronous driver of its
+        dialect, unless a driver is already given.
+
+        Args:
+            database_url (str): The URL of the database.
+
+        Returns:
+            str: The URL with an asynchronous driver.
+        """
+        url = make_url(database_url)
+        driver = cts.ASYNC_DRIVERS.get(url.drivername)
+        if driver is None:
+            return database_url
+        return url.set(drivername=f"{url.drivername}+{driver}").render_as_string(
+            hide_password=False
+        )
+
+    async def create_schema(self) -> List[Revision]:
+        """
+        Apply the pending schema migrations, in a single transaction.
+
+        Returns:
+            List[Revision]: The applied revisions.
+        """
+        async with self._engine.begin() as connection:
+            return await connection.run_sync(
+                lambda sync_connection: Migrator(sync_connection).upgrade()
+            )
+
+    async def dispose(self):
+        """
+        Close every pooled connection of the engine.
+        """
+        await self._engine.dispose()
+
+    def get_session(self) -> AsyncSession:
+        """
+        Provides a new asynchronous SQLAlchemy session.
+
+        Returns:
+            AsyncSession: A new session object.
+        """
+        return self._SessionLocal()
+
+
+class EngineRegistry:
+    """
+    Process-wide registry that keeps a single DatabaseInitializer (engine,
+    connection pool and session factory) per database URL.
+    """
+
+    _initializers: Dict[str, DatabaseInitializer] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def get(
+        cls,
+        database_url: str,
+        create_schema: bool = DatabaseSettings.CREATE_SCHEMA_ON_STARTUP,
+    ) -> DatabaseInitializer:
+        """
+        Get the shared DatabaseInitializer of a database, creating it on
+        first use.
+
+        Args:
+            database_url (str): The URL of the database.
+            create_schema (bool): Whether to apply the pending migrations
+                when the initializer is first built.
+
+        Returns:
+            DatabaseInitializer: The shared initializer.
+        """
+        initializer = cls._initializers.get(database_url)
+        if initializer is not None:
+            return initializer
+        with cls._lock:
+            initializer = cls._initializers.get(database_url)
+            if initializer is None:
+                initializer = DatabaseInitializer(database_url)
+                if create_schema:
+                    initializer.create_schema()
+                cls._initializers[database_url] = initializer
+        return initializer
+
+    @classmethod
+    def reset_after_fork(cls):
+        """
+        Give every registered engine a fresh connection pool in a forked
+        child process, leaving the connections inherited from the parent
+        for the parent to use and close.
+        """
+        with cls._lock:
+            for initializer in cls._initializers.values():
+                initializer.reset_after_fork()
+
+    @classmethod
+    def dispose_all(cls):
+        """
+        Dispose every registered engine and forget them.
+        """
+        with cls._lock:
+            for initializer in cls._initializers.values():
+                initializer.dispose()
+            cls._initializers.clear()
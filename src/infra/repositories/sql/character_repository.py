@@ -1,13 +1,46 @@
-from typing import List
+from typing import Callable, Hashable, Iterator, List, TypeVar
 
-from domain.entities.schemas import CharacterPartialSchema, CharacterSchema
+from pydantic import TypeAdapter
+from sqlalchemy import delete, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from domain.entities.exceptions import BulkCreateError
+from domain.entities.schemas import (
+    BulkCreateErrorSchema,
+    BulkCreateResultSchema,
+    CharacterPartialSchema,
+    CharacterQuerySchema,
+    CharacterSchema,
+    CharacterSearchSchema,
+    CharacterStatsQuerySchema,
+    CharacterStatsSchema,
+    ResourceVersionSchema,
+)
 from domain.repositories.character_repository import (
     CharacterRepositoryInterface,
 )
-from infra.repositories.sql.base import DatabaseInitializer
-from infra.repositories.sql.models import Character
+from infra.repositories.search.matching import search_names
+from infra.repositories.sql.base import DatabaseInitializer, EngineRegistry
+from infra.repositories.sql import constants as cts
+from infra.repositories.sql.models import Character, CollectionVersion
+from infra.repositories.sql.queries import (
+    apply_query,
+    bump_collection_version,
+    insert_groups,
+    insert_statement,
+    projected_columns,
+)
+from infra.repositories.sql.replicas import ReplicaRouter
+from infra.repositories.sql.search import SQLNameSource
+from infra.repositories.sql.singleflight import SingleFlight
+from infra.repositories.sql.stats import count_values
 from settings import DatabaseSettings
 
+T = TypeVar("T")
+
+CHARACTER_LIST_ADAPTER = TypeAdapter(List[CharacterPartialSchema])
+
 
 class CharacterRepository(CharacterRepositoryInterface):
     """
@@ -15,27 +48,125 @@ class CharacterRepository(CharacterRepositoryInterface):
     """
 
     DATABASE_URL: str = DatabaseSettings.CONNECTION_STRING
+    REPLICA_URLS: List[str] = DatabaseSettings.REPLICA_CONNECTION_STRINGS
+    STREAM_BATCH_SIZE: int = DatabaseSettings.STREAM_BATCH_SIZE
+    BULK_CHUNK_SIZE: int = DatabaseSettings.BULK_CHUNK_SIZE
+    SINGLE_FLIGHT: bool = DatabaseSettings.SINGLE_FLIGHT
+    SINGLE_FLIGHT_TIMEOUT: float = DatabaseSettings.SINGLE_FLIGHT_TIMEOUT_SECONDS
 
-    def __init__(self):
+    def __init__(
+        self,
+        db_initializer: DatabaseInitializer | None = None,
+        replicas: List[DatabaseInitializer] | None = None,
+        replica_selection: str = DatabaseSettings.REPLICA_SELECTION,
+    ):
         """
         Constructor method.
+
+        Reads are routed to the replicas, if any, and writes to the
+        primary. A client reads from the primary for a while after it
+        writes, to see its own writes. With SINGLE_FLIGHT, concurrent
+        identical reads share a single query.
+
+        Args:
+            db_initializer (DatabaseInitializer | None): The primary
+                database initializer. Defaults to the process-wide one of
+                DATABASE_URL.
+            replicas (List[DatabaseInitializer] | None): The replica
+                database initializers. Default to the process-wide ones of
+                REPLICA_URLS when db_initializer is not given, to none
+                otherwise.
+            replica_selection (str): How a read picks its replica, one of
+                the ReplicaSelections.
         """
-        self._db_initializer = DatabaseInitializer(self.DATABASE_URL)
+        if db_initializer is None and replicas is None:
+            replicas = [EngineRegistry.get(url) for url in self.REPLICA_URLS]
+        self._db_initializer = db_initializer or EngineRegistry.get(
+            self.DATABASE_URL
+        )
+        self._router = ReplicaRouter(
+            self._db_initializer, replicas, selection=replica_selection
+        )
+        self._flights = (
+            SingleFlight(self.SINGLE_FLIGHT_TIMEOUT)
+            if self.SINGLE_FLIGHT
+            else None
+        )
 
-    def get_characters(self) -> List[CharacterPartialSchema]:
+    def get_characters(
+        self, query: CharacterQuerySchema | None = None
+    ) -> List[CharacterPartialSchema]:
         """
-        Get all characters from the database.
+        Get characters from the database, ordered by ID.
+
+        Only the requested columns are selected, and the filters and the
+        after_id cursor are applied in SQL. Full pages are validated in a
+        single call rather than row by row.
+
+        Args:
+            query (CharacterQuerySchema | None): Pagination, projection and
+                filtering options. Defaults to the first page.
 
         Returns:
             List[CharacterPartialSchema]: A list of characters.
         """
-        session = self._db_initializer.get_session()
+        query = query or CharacterQuerySchema()
+
+        def fetch() -> List[CharacterPartialSchema]:
+            columns = projected_columns(
+                query.fields or list(CharacterPartialSchema.model_fields)
+            )
+            session = self._router.reader().get_session()
+            try:
+                result = session.execute(apply_query(select(*columns), query))
+                fields = list(result.keys())
+                if query.fields is None:
+                    return CHARACTER_LIST_ADAPTER.validate_python(
+                        [dict(zip(fields, row)) for row in result]
+                    )
+                return [
+                    CharacterPartialSchema.model_construct(
+                        _fields_set=set(fields), **dict(zip(fields, row))
+                    )
+                    for row in result
+                ]
+            finally:
+                session.close()
+
+        return self._read("get_characters", query.model_dump_json(), fetch)
+
+    def iter_characters(
+        self, query: CharacterQuerySchema | None = None
+    ) -> Iterator[CharacterSchema]:
+        """
+        Stream characters from the database, ordered by ID.
+
+        Rows are fetched STREAM_BATCH_SIZE at a time from a server-side
+        cursor and built without validation, so memory stays constant
+        whatever the number of rows.
+
+        Args:
+            query (CharacterQuerySchema | None): Pagination, projection and
+                filtering options. Defaults to every character.
+
+        Yields:
+            CharacterSchema: The characters.
+        """
+        query = query or CharacterQuerySchema(limit=None)
+        columns = projected_columns(
+            query.fields or list(CharacterSchema.model_fields)
+        )
+        session = self._router.reader().get_session()
         try:
-            characters = session.query(Character).all()
-            return [
-                CharacterPartialSchema.model_validate(character)
-                for character in characters
-            ]
+            result = session.execute(
+                apply_query(select(*columns), query).execution_options(
+                    yield_per=self.STREAM_BATCH_SIZE
+                )
+            )
+            for row in result:
+                yield CharacterSchema.model_construct(
+                    _fields_set=set(row._fields), **row._asdict()
+                )
         finally:
             session.close()
 
@@ -49,18 +180,185 @@ class CharacterRepository(CharacterRepositoryInterface):
         Returns:
             CharacterSchema | None: The character if found, None otherwise.
         """
-        session = self._db_initializer.get_session()
-        try:
-            character = (
-                session.query(Character)
-                .filter(Character.id == character_id)
-                .first()
-            )
-            if character:
-                return CharacterSchema.model_validate(character)
-            return None
-        finally:
-            session.close()
+
+        def fetch() -> CharacterSchema | None:
+            session = self._router.reader().get_session()
+            try:
+                character = (
+                    session.query(Character)
+                    .filter(Character.id == character_id)
+                    .first()
+                )
+                if character:
+                    return CharacterSchema.model_validate(character)
+                return None
+            finally:
+                session.close()
+
+        return self._read("get_character", character_id, fetch)
+
+    def get_characters_by_ids(
+        self, character_ids: List[int]
+    ) -> List[CharacterSchema]:
+        """
+        Get many characters by their IDs with one SELECT ... WHERE id IN
+        statement per chunk of BULK_CHUNK_SIZE distinct IDs.
+
+        Args:
+            character_ids (List[int]): The IDs of the characters.
+
+        Returns:
+            List[CharacterSchema]: The characters found, in the order of
+                their first ID in character_ids.
+        """
+
+        def fetch() -> List[CharacterSchema]:
+            session = self._router.reader().get_session()
+            try:
+                return self._load_characters(session, character_ids)
+            finally:
+                session.close()
+
+        return self._read("get_characters_by_ids", tuple(character_ids), fetch)
+
+    def search_characters(
+        self, search: CharacterSearchSchema
+    ) -> List[CharacterSchema]:
+        """
+        Search characters by name. Prefixes are matched with the index on
+        the normalized names and, on SQLite, words, substrings and typos
+        with the full-text tables of the migrations, then the page of
+        characters is loaded by ID.
+
+        Args:
+            search (CharacterSearchSchema): The search options.
+
+        Returns:
+            List[CharacterSchema]: The page of characters, best match first.
+        """
+
+        def fetch() -> List[CharacterSchema]:
+            session = self._router.reader().get_session()
+            try:
+                character_ids = search_names(SQLNameSource(session), search)
+                return self._load_characters(session, character_ids)
+            finally:
+                session.close()
+
+        return self._read("search_characters", search.model_dump_json(), fetch)
+
+    def get_character_stats(
+        self, query: CharacterStatsQuerySchema | None = None
+    ) -> CharacterStatsSchema:
+        """
+        Get the statistics of the characters from the number of characters
+        per value of each field, maintained by triggers on SQLite and
+        computed with GROUP BY queries elsewhere, so that their cost only
+        depends on the number of distinct values.
+
+        Args:
+            query (CharacterStatsQuerySchema | None): The statistics
+                options. Defaults to the default ones.
+
+        Returns:
+            CharacterStatsSchema: The statistics.
+        """
+        query = query or CharacterStatsQuerySchema()
+
+        def fetch() -> CharacterStatsSchema:
+            session = self._router.reader().get_session()
+            try:
+                return count_values(session).stats(query)
+            finally:
+                session.close()
+
+        return self._read("get_character_stats", query.model_dump_json(), fetch)
+
+    def _load_characters(
+        self, session: Session, character_ids: List[int]
+    ) -> List[CharacterSchema]:
+        """
+        Load characters by their IDs, one SELECT per chunk of
+        BULK_CHUNK_SIZE distinct IDs.
+
+        Args:
+            session (Session): The session to read with.
+            character_ids (List[int]): The IDs of the characters.
+
+        Returns:
+            List[CharacterSchema]: The characters found, in the order of
+                their first ID in character_ids.
+        """
+        unique_ids = list(dict.fromkeys(character_ids))
+        found = {}
+        for start in range(0, len(unique_ids), self.BULK_CHUNK_SIZE):
+            chunk = unique_ids[start : start + self.BULK_CHUNK_SIZE]
+            for character in session.scalars(
+                select(Character).where(Character.id.in_(chunk))
+            ):
+                found[character.id] = CharacterSchema.model_validate(character)
+        return [found[id_] for id_ in unique_ids if id_ in found]
+
+    def get_character_version(
+        self, character_id: int
+    ) -> ResourceVersionSchema | None:
+        """
+        Get the validators of a character by its primary key, without
+        loading the other columns.
+
+        Args:
+            character_id (int): The ID of the character.
+
+        Returns:
+            ResourceVersionSchema | None: The validators if the character
+                is found, None otherwise.
+        """
+
+        def fetch() -> ResourceVersionSchema | None:
+            session = self._router.reader().get_session()
+            try:
+                row = session.execute(
+                    select(
+                        Character.content_hash, Character.updated_at
+                    ).where(Character.id == character_id)
+                ).first()
+                if row is None or row.content_hash is None:
+                    return None
+                return ResourceVersionSchema(
+                    tag=row.content_hash, modified_at=row.updated_at
+                )
+            finally:
+                session.close()
+
+        return self._read("get_character_version", character_id, fetch)
+
+    def get_characters_version(self) -> ResourceVersionSchema | None:
+        """
+        Get the validators of the character collection from its row in the
+        collection_versions table.
+
+        Returns:
+            ResourceVersionSchema | None: The validators, None if the
+                collection is not versioned.
+        """
+
+        def fetch() -> ResourceVersionSchema | None:
+            session = self._router.reader().get_session()
+            try:
+                row = session.execute(
+                    select(
+                        CollectionVersion.version, CollectionVersion.updated_at
+                    ).where(CollectionVersion.name == cts.CHARACTER_TABLE_NAME)
+                ).first()
+                if row is None:
+                    return None
+                return ResourceVersionSchema(
+                    tag=str(row.version), modified_at=row.updated_at
+                )
+            finally:
+                session.close()
+
+        return self._read("get_characters_version", None, fetch)
 
     def create_character(self, character: CharacterSchema) -> CharacterSchema:
         """
@@ -72,19 +370,168 @@ class CharacterRepository(CharacterRepositoryInterface):
         Returns:
             CharacterSchema: The created character.
         """
-        session = self._db_initializer.get_session()
-        try:
-            new_character = Character(**character.model_dump())
-            session.add(new_character)
-            session.commit()
-            session.refresh(new_character)
-            return CharacterSchema.model_validate(new_character)
-        finally:
-            session.close()
+        return self._write(
+            lambda session: self._insert_chunk(session, [character])[0]
+        )
+
+    def create_characters(
+        self,
+        characters: List[CharacterSchema],
+        chunk_size: int | None = None,
+        atomic: bool = True,
+    ) -> BulkCreateResultSchema:
+        """
+        Create many characters with one multi-row INSERT ... RETURNING per
+        chunk, in a single transaction.
+
+        Args:
+            characters (List[CharacterSchema]): The characters to create.
+            chunk_size (int | None): The number of characters inserted per
+                statement. Defaults to BULK_CHUNK_SIZE.
+            atomic (bool): If True any failing chunk creates no character
+                at all. If False each chunk runs in its own savepoint and,
+                when one fails, its characters are retried one by one to
+                report the failing ones.
+
+        Returns:
+            BulkCreateResultSchema: The created characters and the errors.
+
+        Raises:
+            ValueError: If chunk_size is less than 1.
+            BulkCreateError: If a chunk fails in atomic mode.
+        """
+        chunk_size = chunk_size or self.BULK_CHUNK_SIZE
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+
+        def create(session: Session) -> BulkCreateResultSchema:
+            result = BulkCreateResultSchema()
+            for start in range(0, len(characters), chunk_size):
+                chunk = characters[start : start + chunk_size]
+                if atomic:
+                    try:
+                        created = self._insert_chunk(session, chunk)
+                    except SQLAlchemyError as e:
+                        raise BulkCreateError(
+                            start, str(getattr(e, "orig", None) or e)
+                        ) from e
+                    result.created.extend(created)
+                    continue
+                try:
+                    with session.begin_nested():
+                        created = self._insert_chunk(session, chunk)
+                    result.created.extend(created)
+                except SQLAlchemyError:
+                    self._insert_rows(session, chunk, start, result)
+            return result
+
+        return self._write(create, changed=lambda result: bool(result.created))
+
+    def _read(self, method: str, key: Hashable, fetch: Callable[[], T]) -> T:
+        """
+        Run a read, sharing it with the identical reads in flight when
+        SINGLE_FLIGHT is set. Reads pinned to the primary never share the
+        result of a read routed to a replica.
+
+        Args:
+            method (str): The name of the read method.
+            key (Hashable): The arguments of the read.
+            fetch (Callable[[], T]): The read.
+
+        Returns:
+            T: The result of the read.
+        """
+        if self._flights is None:
+            return fetch()
+        return self._flights.do(
+            (method, key, self._router.pinned_to_primary()), fetch, method
+        )
+
+    def _write(
+        self,
+        work: Callable[[Session], T],
+        changed: Callable[[T], bool] = bool,
+    ) -> T:
+        """
+        Run a write on the primary database, bumping the version of the
+        character collection if it changed any row, and pin the reads of
+        the client to the primary.
+
+        Args:
+            work (Callable[[Session], T]): The write. It must not commit.
+            changed (Callable[[T], bool]): Whether the result of the write
+                reports changed rows. Defaults to its truth value.
+
+        Returns:
+            T: The result of the write, once committed.
+        """
+
+        def versioned_work(session: Session) -> T:
+            result = work(session)
+            if changed(result):
+                session.execute(bump_collection_version())
+            return result
+
+        result = self._db_initializer.write(versioned_work)
+        self._router.record_write()
+        if self._flights is not None:
+            # Reads started before the commit must not serve later callers.
+            self._flights.forget()
+        return result
+
+    def _insert_chunk(
+        self, session: Session, chunk: List[CharacterSchema]
+    ) -> List[CharacterSchema]:
+        """
+        Insert a chunk of characters, without committing.
+
+        Args:
+            session (Session): The session to insert with.
+            chunk (List[CharacterSchema]): The characters to insert.
+
+        Returns:
+            List[CharacterSchema]: The inserted characters, in chunk order.
+        """
+        created: List[CharacterSchema | None] = [None] * len(chunk)
+        for positions, rows in insert_groups(chunk):
+            result = session.execute(insert_statement(), rows)
+            for position, row in zip(positions, result):
+                created[position] = CharacterSchema.model_validate(row)
+        return created
+
+    def _insert_rows(
+        self,
+        session: Session,
+        chunk: List[CharacterSchema],
+        start: int,
+        result: BulkCreateResultSchema,
+    ):
+        """
+        Insert the characters of a failed chunk one by one, each in its own
+        savepoint, recording the failing ones.
+
+        Args:
+            session (Session): The session to insert with.
+            chunk (List[CharacterSchema]): The characters to insert.
+            start (int): The index of the chunk's first character.
+            result (BulkCreateResultSchema): The result to fill.
+        """
+        for offset, character in enumerate(chunk):
+            try:
+                with session.begin_nested():
+                    created = self._insert_chunk(session, [character])
+                result.created.extend(created)
+            except SQLAlchemyError as e:
+                result.errors.append(
+                    BulkCreateErrorSchema(
+                        index=start + offset,
+                        message=str(getattr(e, "orig", None) or e),
+                    )
+                )
 
     def delete_character(self, character_id: int) -> bool:
         """
-        Delete a character by its ID.
+        Delete a character by its ID with a single DELETE statement.
 
         Args:
             character_id (int): The ID of the character.
@@ -92,17 +539,41 @@ class CharacterRepository(CharacterRepositoryInterface):
         Returns:
             bool: True if the character was deleted, False otherwise
         """
-        session = self._db_initializer.get_session()
-        try:
-            character = (
-                session.query(Character)
-                .filter(Character.id == character_id)
-                .first()
+
+        def delete_one(session: Session) -> bool:
+            result = session.execute(
+                delete(Character)
+                .where(Character.id == character_id)
+                .execution_options(synchronize_session=False)
             )
-            if character:
-                session.delete(character)
-                session.commit()
-                return True
-            return False
-        finally:
-            session.close()
+            return result.rowcount > 0
+
+        return self._write(delete_one)
+
+    def delete_characters(self, character_ids: List[int]) -> List[int]:
+        """
+        Delete many characters with one DELETE ... RETURNING statement per
+        chunk of BULK_CHUNK_SIZE IDs, in a single transaction.
+
+        Args:
+            character_ids (List[int]): The IDs of the characters.
+
+        Returns:
+            List[int]: The IDs of the deleted characters.
+        """
+
+        def delete_all(session: Session) -> List[int]:
+            deleted: List[int] = []
+            for start in range(0, len(character_ids), self.BULK_CHUNK_SIZE):
+                chunk = character_ids[start : start + self.BULK_CHUNK_SIZE]
+                deleted.extend(
+                    session.scalars(
+                        delete(Character)
+                        .where(Character.id.in_(chunk))
+                        .returning(Character.id)
+                        .execution_options(synchronize_session=False)
+                    )
+                )
+            return deleted
+
+        return self._write(delete_all)
@@ -1 +1,19 @@
 CHARACTER_TABLE_NAME = "characters"
+NAME_INDEX_NAME = "ix_characters_name"
+BIRTH_YEAR_INDEX_NAME = "ix_characters_birth_year"
+EYE_COLOR_BIRTH_YEAR_INDEX_NAME = "ix_characters_eye_color_birth_year"
+UNIQUE_NAME_INDEX_NAME = "uq_characters_name"
+SCHEMA_VERSION_TABLE_NAME = "schema_version"
+COLLECTION_VERSION_TABLE_NAME = "collection_versions"
+ASYNC_DRIVERS = {
+    "sqlite": "aiosqlite",
+    "postgresql": "asyncpg",
+    "mysql": "aiomysql",
+}
+SEARCH_NAME_INDEX_NAME = "ix_characters_search_name"
+NAME_GRAMS_TABLE_NAME = "character_name_grams"
+NAME_WORDS_TABLE_NAME = "character_name_words"
+NAME_VOCABULARY_TABLE_NAME = "character_name_vocabulary"
+# The first SQLite release with the trigram tokenizer of FTS5.
+SQLITE_TRIGRAM_VERSION = (3, 34, 0)
+VALUE_COUNTS_TABLE_NAME = "character_value_counts"
@@ -0,0 +1,20 @@
+from enum import Enum
+
+
+class ReplicaSelections(str, Enum):
+    """
+    Strategies to pick the replica serving a read
+    """
+
+    ROUND_ROBIN = "round_robin"
+    LEAST_BUSY = "least_busy"
+
+
+class FlightRoles(str, Enum):
+    """
+    How a call took part in a single-flight group
+    """
+
+    LEADER = "leader"
+    COALESCED = "coalesced"
+    TIMED_OUT = "timed_out"
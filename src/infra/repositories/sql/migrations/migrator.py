@@ -0,0 +1,96 @@
+from datetime import datetime, timezone
+from typing import List, Set
+
+from sqlalchemy import (
+    Column,
+    Connection,
+    DateTime,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    insert,
+    select,
+)
+
+from infra.repositories.sql import constants as cts
+from infra.repositories.sql.migrations.revisions import REVISIONS, Revision
+
+schema_version = Table(
+    cts.SCHEMA_VERSION_TABLE_NAME,
+    MetaData(),
+    Column("version", Integer, primary_key=True),
+    Column("description", String),
+    Column("applied_at", DateTime),
+)
+
+
+class Migrator:
+    """
+    Applies the pending revisions of the schema, recording each applied
+    one in the schema_version table.
+    """
+
+    def __init__(
+        self, connection: Connection, revisions: List[Revision] | None = None
+    ):
+        """
+        Constructor method.
+
+        Args:
+            connection (Connection): The connection to migrate with. The
+                caller owns its transaction.
+            revisions (List[Revision] | None): The revisions. Defaults to
+                REVISIONS.
+        """
+        self._connection = connection
+        self._revisions = sorted(
+            revisions if revisions is not None else REVISIONS,
+            key=lambda revision: revision.version,
+        )
+
+    def applied_versions(self) -> Set[int]:
+        """
+        Get the versions of the applied revisions.
+
+        Returns:
+            Set[int]: The versions, empty if the database was never
+                migrated.
+        """
+        schema_version.create(self._connection, checkfirst=True)
+        return set(
+            self._connection.scalars(select(schema_version.c.version))
+        )
+
+    def pending(self) -> List[Revision]:
+        """
+        Get the enabled revisions that are not applied yet.
+
+        Returns:
+            List[Revision]: The revisions, in version order.
+        """
+        applied = self.applied_versions()
+        return [
+            revision
+            for revision in self._revisions
+            if revision.version not in applied and revision.enabled()
+        ]
+
+    def upgrade(self) -> List[Revision]:
+        """
+        Apply the pending revisions in version order.
+
+        Returns:
+            List[Revision]: The applied revisions.
+        """
+        pending = self.pending()
+        for revision in pending:
+            revision.upgrade(self._connection)
+            self._connection.execute(
+                insert(schema_version).values(
+                    version=revision.version,
+                    description=revision.description,
+                    applied_at=datetime.now(timezone.utc),
+                )
+            )
+        return pending
@@ -0,0 +1,392 @@
+from datetime import datetime, timezone
+from typing import Callable, List
+
+from sqlalchemy import (
+    Column,
+    Connection,
+    DateTime,
+    Float,
+    Index,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    inspect,
+    insert,
+    select,
+    text,
+    update,
+)
+
+from domain.entities.schemas import CharacterSchema
+from infra.repositories.search.matching import normalize
+from infra.repositories.sql import constants as cts
+from infra.repositories.stats import constants as stats_cts
+from settings import DatabaseSettings
+
+
+class Revision:
+    """
+    A versioned change of the database schema.
+    """
+
+    def __init__(
+        self,
+        version: int,
+        description: str,
+        upgrade: Callable[[Connection], None],
+        enabled: Callable[[], bool] = lambda: True,
+    ):
+        """
+        Constructor method.
+
+        Args:
+            version (int): The version of the revision, unique and
+                increasing.
+            description (str): What the revision changes.
+            upgrade (Callable[[Connection], None]): Applies the revision.
+                It must tolerate objects that already exist, since
+                databases created before migrations have them.
+            enabled (Callable[[], bool]): Whether the revision applies. A
+                disabled revision stays pending until it is enabled.
+        """
+        self.version = version
+        self.description = description
+        self.upgrade = upgrade
+        self.enabled = enabled
+
+
+def _characters_table() -> Table:
+    """
+    Build the characters table as created by the first revision, in its
+    own metadata so that revisions never see the current model.
+
+    Returns:
+        Table: The table.
+    """
+    return Table(
+        cts.CHARACTER_TABLE_NAME,
+        MetaData(),
+        Column("id", Integer, primary_key=True),
+        Column("name", String),
+        Column("height", Float),
+        Column("mass", Float),
+        Column("hair_color", String),
+        Column("skin_color", String),
+        Column("eye_color", String),
+        Column("birth_year", Integer),
+    )
+
+
+def create_characters_table(connection: Connection):
+    """
+    Create the characters table.
+
+    Args:
+        connection (Connection): The connection to migrate with.
+    """
+    _characters_table().create(connection, checkfirst=True)
+
+
+def add_lookup_indexes(connection: Connection):
+    """
+    Add the indexes used by the name, eye_color and birth_year filters.
+
+    Args:
+        connection (Connection): The connection to migrate with.
+    """
+    characters = _characters_table()
+    indexes = [
+        Index(cts.NAME_INDEX_NAME, characters.c.name),
+        Index(cts.BIRTH_YEAR_INDEX_NAME, characters.c.birth_year),
+        Index(
+            cts.EYE_COLOR_BIRTH_YEAR_INDEX_NAME,
+            characters.c.eye_color,
+            characters.c.birth_year,
+        ),
+    ]
+    for index in indexes:
+        index.create(connection, checkfirst=True)
+
+
+def add_unique_name_index(connection: Connection):
+    """
+    Add a unique index on the character names. It fails if duplicate
+    names already exist.
+
+    Args:
+        connection (Connection): The connection to migrate with.
+    """
+    characters = _characters_table()
+    Index(cts.UNIQUE_NAME_INDEX_NAME, characters.c.name, unique=True).create(
+        connection, checkfirst=True
+    )
+
+
+def add_versions(connection: Connection):
+    """
+    Add the content_hash and updated_at columns of the characters, filled
+    in for the existing ones, and the collection_versions table holding
+    the version of the character collection.
+
+    Args:
+        connection (Connection): The connection to migrate with.
+    """
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    existing = {
+        column["name"]
+        for column in inspect(connection).get_columns(cts.CHARACTER_TABLE_NAME)
+    }
+    new_columns = [
+        Column("content_hash", String),
+        Column("updated_at", DateTime),
+    ]
+    for column in new_columns:
+        if column.name not in existing:
+            column_type = column.type.compile(dialect=connection.dialect)
+            connection.execute(
+                text(
+                    f"ALTER TABLE {cts.CHARACTER_TABLE_NAME} "
+                    f"ADD COLUMN {column.name} {column_type}"
+                )
+            )
+    characters = _characters_table()
+    for column in new_columns:
+        characters.append_column(column)
+    rows = connection.execute(
+        select(characters).where(characters.c.content_hash.is_(None))
+    ).all()
+    for row in rows:
+        connection.execute(
+            update(characters)
+            .where(characters.c.id == row.id)
+            .values(
+                content_hash=CharacterSchema.model_validate(
+                    row._asdict()
+                ).content_hash(),
+                updated_at=row.updated_at or now,
+            )
+        )
+
+    collection_versions = Table(
+        cts.COLLECTION_VERSION_TABLE_NAME,
+        MetaData(),
+        Column("name", String, primary_key=True),
+        Column("version", Integer, nullable=False),
+        Column("updated_at", DateTime, nullable=False),
+    )
+    collection_versions.create(connection, checkfirst=True)
+    if connection.execute(
+        select(collection_versions.c.name).where(
+            collection_versions.c.name == cts.CHARACTER_TABLE_NAME
+        )
+    ).first() is None:
+        connection.execute(
+            insert(collection_versions).values(
+                name=cts.CHARACTER_TABLE_NAME, version=1, updated_at=now
+            )
+        )
+
+
+def _has_fts5_trigrams(connection: Connection) -> bool:
+    """
+    Check whether the database is SQLite with FTS5 and its trigram
+    tokenizer.
+
+    Args:
+        connection (Connection): The connection to migrate with.
+
+    Returns:
+        bool: True if the full-text search tables can be created.
+    """
+    if connection.dialect.name != "sqlite":
+        return False
+    version = connection.exec_driver_sql("SELECT sqlite_version()").scalar()
+    options = connection.exec_driver_sql("PRAGMA compile_options").scalars()
+    return (
+        tuple(int(part) for part in version.split("."))
+        >= cts.SQLITE_TRIGRAM_VERSION
+        and "ENABLE_FTS5" in set(options)
+    )
+
+
+def add_search_indexes(connection: Connection):
+    """
+    Add the search_name column of the characters, their normalized name,
+    filled in for the existing ones, and its index, for name prefixes.
+
+    On SQLite with FTS5 also add two contentless full-text tables of the
+    normalized names, kept in sync by triggers: one tokenized in trigrams,
+    for the words and substrings the names contain, and one in words,
+    whose vocabulary corrects the typos of the searches.
+
+    Args:
+        connection (Connection): The connection to migrate with.
+    """
+    existing = {
+        column["name"]
+        for column in inspect(connection).get_columns(cts.CHARACTER_TABLE_NAME)
+    }
+    if "search_name" not in existing:
+        connection.execute(
+            text(
+                f"ALTER TABLE {cts.CHARACTER_TABLE_NAME} "
+                "ADD COLUMN search_name VARCHAR"
+            )
+        )
+    characters = _characters_table()
+    characters.append_column(Column("search_name", String))
+    rows = connection.execute(
+        select(characters.c.id, characters.c.name).where(
+            characters.c.search_name.is_(None)
+        )
+    ).all()
+    for row in rows:
+        connection.execute(
+            update(characters)
+            .where(characters.c.id == row.id)
+            .values(search_name=normalize(row.name or ""))
+        )
+    Index(
+        cts.SEARCH_NAME_INDEX_NAME,
+        characters.c.search_name,
+        characters.c.id,
+    ).create(connection, checkfirst=True)
+
+    if not _has_fts5_trigrams(connection):
+        return
+    table = cts.CHARACTER_TABLE_NAME
+    grams = cts.NAME_GRAMS_TABLE_NAME
+    words = cts.NAME_WORDS_TABLE_NAME
+    created = inspect(connection).has_table(grams)
+    statements = [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {grams} USING fts5("
+        "search_name, content='', tokenize='trigram')",
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {words} USING fts5("
+        "search_name, content='', detail='none', "
+        "tokenize='unicode61 remove_diacritics 0')",
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS "
+        f"{cts.NAME_VOCABULARY_TABLE_NAME} USING fts5vocab({words}, 'row')",
+        f"CREATE TRIGGER IF NOT EXISTS {table}_search_insert "
+        f"AFTER INSERT ON {table} BEGIN "
+        f"INSERT INTO {grams}(rowid, search_name) "
+        "VALUES (new.id, new.search_name); "
+        f"INSERT INTO {words}(rowid, search_name) "
+        "VALUES (new.id, new.search_name); END",
+        f"CREATE TRIGGER IF NOT EXISTS {table}_search_delete "
+        f"AFTER DELETE ON {table} BEGIN "
+        f"INSERT INTO {grams}({grams}, rowid, search_name) "
+        "VALUES ('delete', old.id, old.search_name); "
+        f"INSERT INTO {words}({words}, rowid, search_name) "
+        "VALUES ('delete', old.id, old.search_name); END",
+        f"CREATE TRIGGER IF NOT EXISTS {table}_search_update "
+        f"AFTER UPDATE OF search_name ON {table} BEGIN "
+        f"INSERT INTO {grams}({grams}, rowid, search_name) "
+        "VALUES ('delete', old.id, old.search_name); "
+        f"INSERT INTO {words}({words}, rowid, search_name) "
+        "VALUES ('delete', old.id, old.search_name); "
+        f"INSERT INTO {grams}(rowid, search_name) "
+        "VALUES (new.id, new.search_name); "
+        f"INSERT INTO {words}(rowid, search_name) "
+        "VALUES (new.id, new.search_name); END",
+    ]
+    for statement in statements:
+        connection.exec_driver_sql(statement)
+    if not created:
+        for fts_table in (grams, words):
+            connection.exec_driver_sql(
+                f"INSERT INTO {fts_table}(rowid, search_name) "
+                f"SELECT id, search_name FROM {table}"
+            )
+
+
+def add_value_counts(connection: Connection):
+    """
+    On SQLite, add the character_value_counts table, the number of
+    characters per value of each field the statistics are computed from,
+    filled in with one GROUP BY per field and kept up to date by triggers,
+    so statistics do not scan the characters. Other databases compute
+    them with GROUP BY queries instead.
+
+    Args:
+        connection (Connection): The connection to migrate with.
+    """
+    if connection.dialect.name != "sqlite":
+        return
+    table = cts.CHARACTER_TABLE_NAME
+    counts = cts.VALUE_COUNTS_TABLE_NAME
+    fields = stats_cts.COLOR_FIELDS + stats_cts.NUMERIC_FIELDS
+    created = inspect(connection).has_table(counts)
+
+    def count_in(field: str) -> str:
+        value = f"new.{field}" if field != stats_cts.TOTAL_FIELD else "0"
+        return (
+            f"INSERT INTO {counts}(field, value, count) "
+            f"SELECT '{field}', {value}, 1 WHERE {value} IS NOT NULL "
+            "ON CONFLICT(field, value) DO UPDATE SET count = count + 1; "
+        )
+
+    def count_out(field: str) -> str:
+        value = f"old.{field}" if field != stats_cts.TOTAL_FIELD else "0"
+        return (
+            f"UPDATE {counts} SET count = count - 1 "
+            f"WHERE field = '{field}' AND value = {value}; "
+            f"DELETE FROM {counts} "
+            f"WHERE field = '{field}' AND value = {value} AND count = 0; "
+        )
+
+    every_field = (stats_cts.TOTAL_FIELD,) + fields
+    statements = [
+        # The value column has no type, so values keep their own.
+        f"CREATE TABLE IF NOT EXISTS {counts} ("
+        "field VARCHAR NOT NULL, value, count INTEGER NOT NULL, "
+        "PRIMARY KEY (field, value))",
+        f"CREATE TRIGGER IF NOT EXISTS {table}_counts_insert "
+        f"AFTER INSERT ON {table} BEGIN "
+        + "".join(count_in(field) for field in every_field)
+        + "END",
+        f"CREATE TRIGGER IF NOT EXISTS {table}_counts_delete "
+        f"AFTER DELETE ON {table} BEGIN "
+        + "".join(count_out(field) for field in every_field)
+        + "END",
+        f"CREATE TRIGGER IF NOT EXISTS {table}_counts_update "
+        f"AFTER UPDATE OF {', '.join(fields)} ON {table} BEGIN "
+        + "".join(count_out(field) + count_in(field) for field in fields)
+        + "END",
+    ]
+    for statement in statements:
+        connection.exec_driver_sql(statement)
+    if not created:
+        connection.exec_driver_sql(
+            f"INSERT INTO {counts}(field, value, count) "
+            f"SELECT '{stats_cts.TOTAL_FIELD}', 0, COUNT(*) FROM {table}"
+        )
+        for field in fields:
+            connection.exec_driver_sql(
+                f"INSERT INTO {counts}(field, value, count) "
+                f"SELECT '{field}', {field}, COUNT(*) FROM {table} "
+                f"WHERE {field} IS NOT NULL GROUP BY {field}"
+            )
+
+
+REVISIONS: List[Revision] = [
+    Revision(1, "Create the characters table", create_characters_table),
+    Revision(
+        2,
+        "Index characters by name, birth_year and (eye_color, birth_year)",
+        add_lookup_indexes,
+    ),
+    Revision(
+        3,
+        "Make character names unique",
+        add_unique_name_index,
+        enabled=lambda: DatabaseSettings.UNIQUE_CHARACTER_NAMES,
+    ),
+    Revision(
+        4,
+        "Version characters and the character collection",
+        add_versions,
+    ),
+    Revision(5, "Index character names for search", add_search_indexes),
+    Revision(6, "Count the characters per value", add_value_counts),
+]
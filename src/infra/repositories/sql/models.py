@@ -1,18 +1,76 @@
-from sqlalchemy import Column, Float, Integer, String
+from datetime import datetime, timezone
+
+from sqlalchemy import Column, DateTime, Float, Index, Integer, String
+from sqlalchemy.engine.default import DefaultExecutionContext
 from sqlalchemy.ext.declarative import declarative_base
 
+from domain.entities.schemas import CharacterSchema
+from infra.repositories.search.matching import normalize
 from infra.repositories.sql import constants as cts
 from infra.repositories.sql.base import Base
 
 
+def utcnow() -> datetime:
+    """
+    Get the current time, in naive UTC as stored in the database.
+
+    Returns:
+        datetime: The current time.
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def hash_content(context: DefaultExecutionContext) -> str:
+    """
+    Hash the content of an inserted character.
+
+    Args:
+        context (DefaultExecutionContext): The context of the insert.
+
+    Returns:
+        str: The content hash of the character.
+    """
+    return CharacterSchema.model_validate(
+        context.get_current_parameters()
+    ).content_hash()
+
+
+def normalize_name(context: DefaultExecutionContext) -> str:
+    """
+    Normalize the name of an inserted character, as searches compare it.
+
+    Args:
+        context (DefaultExecutionContext): The context of the insert.
+
+    Returns:
+        str: The normalized name.
+    """
+    return normalize(context.get_current_parameters()["name"])
+
+
 class Character(Base):
     __tablename__: str = cts.CHARACTER_TABLE_NAME
+    __table_args__ = (
+        Index(cts.EYE_COLOR_BIRTH_YEAR_INDEX_NAME, "eye_color", "birth_year"),
+        Index(cts.SEARCH_NAME_INDEX_NAME, "search_name", "id"),
+    )
 
     id = Column(Integer, primary_key=True)
-    name = Column(String)
+    name = Column(String, index=True)
     height = Column(Float)
     mass = Column(Float)
     hair_color = Column(String)
     skin_color = Column(String)
     eye_color = Column(String)
-    birth_year = Column(Integer)
+    birth_year = Column(Integer, index=True)
+    content_hash = Column(String, default=hash_content)
+    updated_at = Column(DateTime, default=utcnow)
+    search_name = Column(String, default=normalize_name)
+
+
+class CollectionVersion(Base):
+    __tablename__: str = cts.COLLECTION_VERSION_TABLE_NAME
+
+    name = Column(String, primary_key=True)
+    version = Column(Integer, nullable=False)
+    updated_at = Column(DateTime, nullable=False)
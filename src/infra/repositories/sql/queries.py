@@ -0,0 +1,107 @@
+from typing import Any, Dict, Iterator, List, Tuple
+
+from sqlalchemy import Insert, Select, Update, insert, update
+
+from domain.entities.schemas import CharacterQuerySchema, CharacterSchema
+from infra.repositories.sql import constants as cts
+from infra.repositories.sql.models import Character, CollectionVersion, utcnow
+
+
+def projected_columns(fields: List[str]) -> list:
+    """
+    Get the columns to select for a projection. The ID is always selected
+    since it is the pagination cursor.
+
+    Args:
+        fields (List[str]): The requested fields.
+
+    Returns:
+        list: The columns to select.
+    """
+    names = ["id"] + [field for field in fields if field != "id"]
+    return [getattr(Character, name) for name in names]
+
+
+def apply_query(statement: Select, query: CharacterQuerySchema) -> Select:
+    """
+    Apply the filters, the keyset cursor, the ordering and the limit of a
+    query to a statement.
+
+    Args:
+        statement (Select): The statement to refine.
+        query (CharacterQuerySchema): The query options.
+
+    Returns:
+        Select: The refined statement.
+    """
+    if query.name is not None:
+        statement = statement.where(Character.name == query.name)
+    if query.eye_color is not None:
+        statement = statement.where(Character.eye_color == query.eye_color)
+    if query.birth_year_min is not None:
+        statement = statement.where(Character.birth_year >= query.birth_year_min)
+    if query.birth_year_max is not None:
+        statement = statement.where(Character.birth_year <= query.birth_year_max)
+    if query.after_id is not None:
+        statement = statement.where(Character.id > query.after_id)
+    statement = statement.order_by(Character.id)
+    if query.limit is not None:
+        statement = statement.limit(query.limit)
+    return statement
+
+
+def insert_statement() -> Insert:
+    """
+    Build a multi-row INSERT returning every column, in parameter order.
+
+    Returns:
+        Insert: The statement.
+    """
+    return insert(Character).returning(
+        *projected_columns(list(CharacterSchema.model_fields)),
+        sort_by_parameter_order=True,
+    )
+
+
+def insert_groups(
+    chunk: List[CharacterSchema],
+) -> Iterator[Tuple[List[int], List[Dict[str, Any]]]]:
+    """
+    Split characters between those with and without an ID, since they are
+    inserted by separate statements so the database assigns the missing
+    IDs.
+
+    Args:
+        chunk (List[CharacterSchema]): The characters to insert.
+
+    Yields:
+        Tuple[List[int], List[Dict[str, Any]]]: The positions of the
+            characters in the chunk and their insert parameters.
+    """
+    for with_id in (True, False):
+        positions = [
+            position
+            for position, character in enumerate(chunk)
+            if (character.id is not None) == with_id
+        ]
+        if positions:
+            exclude = None if with_id else {"id"}
+            yield positions, [
+                chunk[position].model_dump(exclude=exclude)
+                for position in positions
+            ]
+
+
+def bump_collection_version() -> Update:
+    """
+    Build the UPDATE bumping the version of the character collection, to
+    run in the transaction of every write.
+
+    Returns:
+        Update: The statement.
+    """
+    return (
+        update(CollectionVersion)
+        .where(CollectionVersion.name == cts.CHARACTER_TABLE_NAME)
+        .values(version=CollectionVersion.version + 1, updated_at=utcnow())
+    )
@@ -0,0 +1,109 @@
+import itertools
+import time
+from contextvars import ContextVar
+from typing import List
+
+from infra.repositories.sql.base import DatabaseInitializer
+from infra.repositories.sql.enums import ReplicaSelections
+from settings import DatabaseSettings
+
+# The wall-clock time until which the reads of the current client go to the
+# primary. Web adapters carry it between requests, e.g. in a cookie.
+PRIMARY_PINNED_UNTIL: ContextVar[float] = ContextVar(
+    "primary_pinned_until", default=0.0
+)
+
+
+class ReplicaRouter:
+    """
+    Routes reads to replicas of a primary database, and writes to the
+    primary.
+
+    Right after a write the reads of the same client (the same context)
+    are pinned to the primary for read_your_writes_seconds, so the client
+    sees its own writes whatever the replication lag.
+    """
+
+    def __init__(
+        self,
+        primary: DatabaseInitializer,
+        replicas: List[DatabaseInitializer] | None = None,
+        selection: str = DatabaseSettings.REPLICA_SELECTION,
+        read_your_writes_seconds: float = DatabaseSettings.READ_YOUR_WRITES_SECONDS,
+    ):
+        """
+        Constructor method.
+
+        Args:
+            primary (DatabaseInitializer): The primary database.
+            replicas (List[DatabaseInitializer] | None): The replicas of the
+                primary. Without replicas every read goes to the primary.
+            selection (str): The ReplicaSelections strategy picking the
+                replica of a read.
+            read_your_writes_seconds (float): How long the reads of a
+                client go to the primary after it writes.
+        """
+        self._primary = primary
+        self._replicas = replicas or []
+        self._selection = ReplicaSelections(selection)
+        self._read_your_writes_seconds = read_your_writes_seconds
+        self._turns = itertools.count()
+
+    @property
+    def primary(self) -> DatabaseInitializer:
+        """
+        The primary database, serving every write.
+
+        Returns:
+            DatabaseInitializer: The primary database.
+        """
+        return self._primary
+
+    def reader(self) -> DatabaseInitializer:
+        """
+        Pick the database serving a read.
+
+        Returns:
+            DatabaseInitializer: The primary while the client is pinned to
+                it or without replicas, a replica otherwise.
+        """
+        if not self._replicas or self.pinned_to_primary():
+            return self._primary
+        start = next(self._turns) % len(self._replicas)
+        replicas = self._replicas[start:] + self._replicas[:start]
+        if self._selection == ReplicaSelections.ROUND_ROBIN:
+            return replicas[0]
+        # Ties go to the next replica in turn, to spread the idle load.
+        return min(replicas, key=self._busy_connections)
+
+    def pinned_to_primary(self) -> bool:
+        """
+        Check whether the reads of the current client go to the primary
+        because it wrote recently.
+
+        Returns:
+            bool: True while the client is pinned to the primary.
+        """
+        return time.time() < PRIMARY_PINNED_UNTIL.get()
+
+    def record_write(self):
+        """
+        Pin the reads of the current client to the primary for
+        read_your_writes_seconds.
+        """
+        if self._replicas:
+            PRIMARY_PINNED_UNTIL.set(time.time() + self._read_your_writes_seconds)
+
+    @staticmethod
+    def _busy_connections(replica: DatabaseInitializer) -> int:
+        """
+        Count the connections of a replica currently in use.
+
+        Args:
+            replica (DatabaseInitializer): The replica.
+
+        Returns:
+            int: The number of checked out connections.
+        """
+        checkedout = getattr(replica.engine.pool, "checkedout", None)
+        return checkedout() if checkedout is not None else 0
@@ -0,0 +1,116 @@
+from typing import List
+
+from sqlalchemy import select, text
+from sqlalchemy.orm import Session
+
+from infra.repositories.search import constants as search_cts
+from infra.repositories.search.matching import NameSourceInterface
+from infra.repositories.sql import constants as cts
+from infra.repositories.sql.models import Character
+
+
+def _phrase(query: str) -> str:
+    """
+    Quote a query as an FTS5 phrase, matched as typed.
+
+    Args:
+        query (str): The normalized query.
+
+    Returns:
+        str: The phrase.
+    """
+    return '"{}"'.format(query.replace('"', '""'))
+
+
+class SQLNameSource(NameSourceInterface):
+    """
+    The search lookups of the normalized character names of a SQL database.
+
+    Prefixes use the index on search_name. On SQLite with the full-text
+    tables of the migrations, words and substrings are matched in the
+    trigram table and typos corrected with the vocabulary of the word
+    table. Elsewhere they fall back to a LIKE scan, without typo tolerance.
+    """
+
+    def __init__(self, session: Session):
+        """
+        Constructor method.
+
+        Args:
+            session (Session): The session to search with.
+        """
+        self._session = session
+        self._full_text = session.get_bind().dialect.name == "sqlite" and (
+            session.execute(
+                text(
+                    "SELECT 1 FROM sqlite_master "
+                    "WHERE type = 'table' AND name = :name"
+                ),
+                {"name": cts.NAME_GRAMS_TABLE_NAME},
+            ).first()
+            is not None
+        )
+
+    def prefixed(self, query: str, limit: int) -> List[int]:
+        return list(
+            self._session.scalars(
+                select(Character.id)
+                .where(
+                    Character.search_name >= query,
+                    Character.search_name < query + search_cts.MAX_CHAR,
+                )
+                .order_by(Character.search_name, Character.id)
+                .limit(limit)
+            )
+        )
+
+    def word_prefixed(self, query: str, limit: int) -> List[int]:
+        return self._containing(f" {query}", limit)
+
+    def containing(self, query: str, limit: int) -> List[int]:
+        return self._containing(query, limit)
+
+    def words(self, initial: str) -> List[str]:
+        if not self._full_text:
+            return []
+        return list(
+            self._session.scalars(
+                text(
+                    f"SELECT term FROM {cts.NAME_VOCABULARY_TABLE_NAME} "
+                    "WHERE term >= :initial AND term < :following"
+                ),
+                {"initial": initial, "following": chr(ord(initial) + 1)},
+            )
+        )
+
+    def _containing(self, query: str, limit: int) -> List[int]:
+        """
+        Get the characters whose name contains a text of at least GRAM_SIZE
+        characters, in ID order.
+
+        Args:
+            query (str): The text.
+            limit (int): The maximum number of characters.
+
+        Returns:
+            List[int]: The IDs of the characters.
+        """
+        if not self._full_text:
+            return list(
+                self._session.scalars(
+                    select(Character.id)
+                    .where(Character.search_name.contains(query, autoescape=True))
+                    .order_by(Character.id)
+                    .limit(limit)
+                )
+            )
+        return list(
+            self._session.scalars(
+                text(
+                    f"SELECT rowid FROM {cts.NAME_GRAMS_TABLE_NAME} "
+                    f"WHERE {cts.NAME_GRAMS_TABLE_NAME} MATCH :phrase "
+                    "ORDER BY rowid LIMIT :limit"
+                ),
+                {"phrase": _phrase(query), "limit": limit},
+            )
+        )
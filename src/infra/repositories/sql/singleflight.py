@@ -0,0 +1,94 @@
+import threading
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Callable, Dict, Hashable, TypeVar
+
+from infra.metrics.metrics import SINGLE_FLIGHT_CALLS
+from infra.repositories.sql.enums import FlightRoles
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent identical calls: the first caller of a key runs
+    the call, and the callers of the same key arriving while it runs wait
+    for it and share its result or its exception.
+
+    Results are never kept once the call returns, so a caller never gets
+    data older than the start of a call it overlapped. Shared results must
+    not be mutated.
+    """
+
+    def __init__(self, timeout: float):
+        """
+        Constructor method.
+
+        Args:
+            timeout (float): How long, in seconds, a caller waits for the
+                call in flight before running its own.
+        """
+        self._timeout = timeout
+        self._lock = threading.Lock()
+        self._flights: Dict[Hashable, Future] = {}
+
+    def do(self, key: Hashable, call: Callable[[], T], method: str) -> T:
+        """
+        Run a call, or wait for the identical call in flight.
+
+        Args:
+            key (Hashable): What identifies identical calls.
+            call (Callable[[], T]): The call.
+            method (str): The name of the repository method, for metrics.
+
+        Returns:
+            T: The result of the call.
+        """
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = Future()
+
+        if not leader:
+            try:
+                result = flight.result(timeout=self._timeout)
+            except FutureTimeoutError:
+                SINGLE_FLIGHT_CALLS.inc(method, FlightRoles.TIMED_OUT.value)
+                return call()
+            except Exception:
+                SINGLE_FLIGHT_CALLS.inc(method, FlightRoles.COALESCED.value)
+                raise
+            SINGLE_FLIGHT_CALLS.inc(method, FlightRoles.COALESCED.value)
+            return result
+
+        SINGLE_FLIGHT_CALLS.inc(method, FlightRoles.LEADER.value)
+        try:
+            result = call()
+        except BaseException as e:
+            self._land(key, flight)
+            flight.set_exception(e)
+            raise
+        self._land(key, flight)
+        flight.set_result(result)
+        return result
+
+    def forget(self):
+        """
+        Let the next callers start new calls instead of joining the ones in
+        flight, e.g. after a write they must observe.
+        """
+        with self._lock:
+            self._flights.clear()
+
+    def _land(self, key: Hashable, flight: Future):
+        """
+        Stop new callers from joining a finished call.
+
+        Args:
+            key (Hashable): The key of the call.
+            flight (Future): The call.
+        """
+        with self._lock:
+            if self._flights.get(key) is flight:
+                del self._flights[key]
@@ -0,0 +1,67 @@
+from typing import Any
+
+from sqlalchemy import Engine, event, make_url
+
+from settings import SQLiteSettings
+
+
+def read_only_url(database_url: str) -> str:
+    """
+    Get the URL opening a SQLite database file in read-only mode.
+
+    Args:
+        database_url (str): The URL of the database.
+
+    Returns:
+        str: The read-only URL.
+    """
+    url = make_url(database_url)
+    return url.set(
+        database=f"file:{url.database}", query={"mode": "ro", "uri": "true"}
+    ).render_as_string(hide_password=False)
+
+
+def apply_pragmas(
+    engine: Engine, read_only: bool = False, begin_immediate: bool = False
+):
+    """
+    Set the performance pragmas of SQLiteSettings on every new connection
+    of an engine.
+
+    Args:
+        engine (Engine): The engine.
+        read_only (bool): Whether the connections are read-only, which
+            cannot set the journal mode (WAL by default, persistent in the
+            file) nor the synchronous level.
+        begin_immediate (bool): Whether transactions take the write lock
+            when they begin (BEGIN IMMEDIATE), so that a writer waits for
+            busy_timeout instead of failing on a lock upgrade. Transactions
+            are then managed by SQLAlchemy instead of the pysqlite driver,
+            which also makes savepoints reliable.
+    """
+    pragmas = [
+        f"busy_timeout = {SQLiteSettings.BUSY_TIMEOUT_MS}",
+        f"cache_size = {SQLiteSettings.CACHE_SIZE}",
+        f"mmap_size = {SQLiteSettings.MMAP_SIZE}",
+    ]
+    if not read_only:
+        pragmas = [
+            f"journal_mode = {SQLiteSettings.JOURNAL_MODE}",
+            f"synchronous = {SQLiteSettings.SYNCHRONOUS}",
+        ] + pragmas
+
+    def on_connect(dbapi_connection: Any, connection_record: Any):
+        cursor = dbapi_connection.cursor()
+        for pragma in pragmas:
+            cursor.execute(f"PRAGMA {pragma}")
+        cursor.close()
+        if begin_immediate:
+            dbapi_connection.isolation_level = None
+
+    event.listen(engine, "connect", on_connect)
+    if begin_immediate:
+        event.listen(
+            engine,
+            "begin",
+            lambda connection: connection.exec_driver_sql("BEGIN IMMEDIATE"),
+        )
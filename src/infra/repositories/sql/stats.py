@@ -0,0 +1,56 @@
+from sqlalchemy import func, select, text
+from sqlalchemy.orm import Session
+
+from infra.repositories.sql import constants as cts
+from infra.repositories.sql.models import Character
+from infra.repositories.stats import constants as stats_cts
+from infra.repositories.stats.value_counter import ValueCounter
+
+
+def count_values(session: Session) -> ValueCounter:
+    """
+    Count the characters per value of each field the statistics are
+    computed from. On SQLite the counts are read from the table the
+    triggers of the migrations maintain, in one small query; elsewhere
+    they are computed with one GROUP BY per field.
+
+    Args:
+        session (Session): The session to read with.
+
+    Returns:
+        ValueCounter: The counts.
+    """
+    if session.get_bind().dialect.name == "sqlite" and (
+        session.execute(
+            text(
+                "SELECT 1 FROM sqlite_master "
+                "WHERE type = 'table' AND name = :name"
+            ),
+            {"name": cts.VALUE_COUNTS_TABLE_NAME},
+        ).first()
+        is not None
+    ):
+        return ValueCounter.from_rows(
+            session.execute(
+                text(
+                    "SELECT field, value, count "
+                    f"FROM {cts.VALUE_COUNTS_TABLE_NAME}"
+                )
+            )
+        )
+    rows = [
+        (
+            stats_cts.TOTAL_FIELD,
+            None,
+            session.scalar(select(func.count()).select_from(Character)),
+        )
+    ]
+    for field in stats_cts.COLOR_FIELDS + stats_cts.NUMERIC_FIELDS:
+        column = getattr(Character, field)
+        rows.extend(
+            (field, value, count)
+            for value, count in session.execute(
+                select(column, func.count()).group_by(column)
+            )
+        )
+    return ValueCounter.from_rows(rows)
@@ -0,0 +1,155 @@
+import contextvars
+import os
+import queue
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, List, Tuple, TypeVar
+
+from sqlalchemy.orm import Session, sessionmaker
+
+from infra.metrics.metrics import SQL_WRITE_BATCH_SIZE
+
+T = TypeVar("T")
+
+Job = Tuple[Callable[[Session], Any], contextvars.Context, Future]
+
+
+class WriteQueue:
+    """
+    Serialises the writes of a process through one writer thread owning
+    one connection, committing the writes queued at the same time in a
+    single transaction (group commit).
+
+    Each write runs in its own savepoint, so a failing write is rolled
+    back alone and its error is raised to its caller only, and under the
+    context variables of its caller, so metrics and logs are attributed
+    to the caller.
+    """
+
+    def __init__(self, session_factory: sessionmaker, max_batch_size: int):
+        """
+        Constructor method.
+
+        Args:
+            session_factory (sessionmaker): Builds the writer sessions.
+            max_batch_size (int): The maximum number of writes committed
+                together.
+        """
+        self._session_factory = session_factory
+        self._max_batch_size = max_batch_size
+        self._lock = threading.Lock()
+        self._queue: queue.Queue | None = None
+        self._thread: threading.Thread | None = None
+        self._pid: int | None = None
+
+    def submit(self, work: Callable[[Session], T]) -> T:
+        """
+        Run a write on the writer thread and wait for its commit.
+
+        Args:
+            work (Callable[[Session], T]): The write. It must not commit.
+
+        Returns:
+            T: The result of the write, once committed.
+        """
+        return self.enqueue(work).result()
+
+    def enqueue(self, work: Callable[[Session], T]) -> Future:
+        """
+        Queue a write on the writer thread without waiting for it.
+
+        Args:
+            work (Callable[[Session], T]): The write. It must not commit.
+
+        Returns:
+            Future: Resolves to the result of the write once committed.
+        """
+        future: Future = Future()
+        self._jobs().put((work, contextvars.copy_context(), future))
+        return future
+
+    def close(self):
+        """
+        Stop the writer thread once the queued writes are committed.
+        """
+        with self._lock:
+            if self._thread is not None and self._pid == os.getpid():
+                self._queue.put(None)
+                self._thread.join()
+            self._queue = None
+            self._thread = None
+
+    def _jobs(self) -> queue.Queue:
+        """
+        Get the job queue, starting the writer thread on first use and
+        again in a forked child, where the parent's thread does not run.
+
+        Returns:
+            queue.Queue: The job queue.
+        """
+        if self._pid == os.getpid():
+            return self._queue
+        with self._lock:
+            if self._pid != os.getpid():
+                self._queue = queue.Queue()
+                self._thread = threading.Thread(
+                    target=self._run, args=(self._queue,), daemon=True
+                )
+                self._thread.start()
+                self._pid = os.getpid()
+            return self._queue
+
+    def _run(self, jobs: queue.Queue):
+        """
+        The writer thread loop.
+
+        Args:
+            jobs (queue.Queue): The job queue, None stops the loop.
+        """
+        while True:
+            job = jobs.get()
+            if job is None:
+                return
+            batch = [job]
+            while len(batch) < self._max_batch_size:
+                try:
+                    job = jobs.get_nowait()
+                except queue.Empty:
+                    break
+                if job is None:
+                    self._commit(batch)
+                    return
+                batch.append(job)
+            self._commit(batch)
+
+    def _commit(self, batch: List[Job]):
+        """
+        Run a batch of writes in one transaction.
+
+        Args:
+            batch (List[Job]): The writes, their contexts and their futures.
+        """
+        SQL_WRITE_BATCH_SIZE.observe(len(batch))
+        outcomes = []
+        session = self._session_factory()
+        try:
+            for work, context, future in batch:
+                try:
+                    with session.begin_nested():
+                        result = context.run(work, session)
+                    outcomes.append((future, result, None))
+                except Exception as e:
+                    outcomes.append((future, None, e))
+            session.commit()
+        except Exception as e:
+            session.rollback()
+            for *_, future in batch:
+                future.set_exception(e)
+            return
+        finally:
+            session.close()
+        for future, result, error in outcomes:
+            if error is None:
+                future.set_result(result)
+            else:
+                future.set_exception(error)
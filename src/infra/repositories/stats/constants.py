@@ -0,0 +1,5 @@
+COLOR_FIELDS = ("eye_color", "hair_color", "skin_color")
+NUMERIC_FIELDS = ("height", "mass", "birth_year")
+# The pseudo field counting every character, nulls included.
+TOTAL_FIELD = "*"
+PERCENTILES = (25, 50, 75, 90, 95, 99)
@@ -0,0 +1,204 @@
+import bisect
+import math
+from itertools import accumulate
+from typing import Any, Dict, Iterable, List, Tuple
+
+from domain.entities.schemas import (
+    CharacterSchema,
+    CharacterStatsQuerySchema,
+    CharacterStatsSchema,
+    HistogramBucketSchema,
+    NumericStatsSchema,
+)
+from infra.repositories.stats import constants as cts
+
+
+def percentile(
+    values: List[float], cumulative: List[int], percent: float
+) -> float:
+    """
+    Get a percentile of a distribution, interpolating linearly between the
+    closest values, as NumPy does by default.
+
+    Args:
+        values (List[float]): The distinct values, in increasing order.
+        cumulative (List[int]): The number of values up to each of them.
+        percent (float): The percentile, between 0 and 100.
+
+    Returns:
+        float: The percentile.
+    """
+    rank = percent / 100 * (cumulative[-1] - 1)
+    lower = math.floor(rank)
+    low = values[bisect.bisect_right(cumulative, lower)]
+    high = values[
+        bisect.bisect_right(cumulative, min(lower + 1, cumulative[-1] - 1))
+    ]
+    return low + (high - low) * (rank - lower)
+
+
+def numeric_stats(counts: Dict[float, int]) -> NumericStatsSchema:
+    """
+    Get the statistics of a numeric field from the counts of its values,
+    in time proportional to the number of distinct values.
+
+    Args:
+        counts (Dict[float, int]): The number of characters per value.
+
+    Returns:
+        NumericStatsSchema: The statistics.
+    """
+    if not counts:
+        return NumericStatsSchema()
+    values = sorted(counts)
+    cumulative = list(accumulate(counts[value] for value in values))
+    return NumericStatsSchema(
+        count=cumulative[-1],
+        mean=math.fsum(value * counts[value] for value in values)
+        / cumulative[-1],
+        min=values[0],
+        max=values[-1],
+        percentiles={
+            f"p{percent}": percentile(values, cumulative, percent)
+            for percent in cts.PERCENTILES
+        },
+    )
+
+
+def histogram(
+    counts: Dict[int, int], bucket_size: int
+) -> List[HistogramBucketSchema]:
+    """
+    Get the non-empty buckets of an integer field from the counts of its
+    values.
+
+    Args:
+        counts (Dict[int, int]): The number of characters per value.
+        bucket_size (int): The width of the buckets.
+
+    Returns:
+        List[HistogramBucketSchema]: The buckets, in increasing order.
+    """
+    buckets: Dict[int, int] = {}
+    for value, count in counts.items():
+        start = int(value) // bucket_size * bucket_size
+        buckets[start] = buckets.get(start, 0) + count
+    return [
+        HistogramBucketSchema(
+            start=start, end=start + bucket_size, count=buckets[start]
+        )
+        for start in sorted(buckets)
+    ]
+
+
+class ValueCounter:
+    """
+    The number of characters per value of each field the statistics are
+    computed from. Characters are counted in and out one at a time, so the
+    counts can be kept up to date with the writes instead of recounted,
+    and the statistics only depend on the number of distinct values.
+    """
+
+    def __init__(self):
+        """
+        Constructor method.
+        """
+        self.total = 0
+        self.counts: Dict[str, Dict[Any, int]] = {
+            field: {} for field in cts.COLOR_FIELDS + cts.NUMERIC_FIELDS
+        }
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Tuple[str, Any, int]]) -> "ValueCounter":
+        """
+        Build the counter from counted values.
+
+        Args:
+            rows (Iterable[Tuple[str, Any, int]]): The fields, values and
+                numbers of characters, the total under TOTAL_FIELD.
+
+        Returns:
+            ValueCounter: The counter.
+        """
+        counter = cls()
+        for field, value, count in rows:
+            if field == cts.TOTAL_FIELD:
+                counter.total += count
+            elif field in counter.counts and value is not None and count:
+                counts = counter.counts[field]
+                counts[value] = counts.get(value, 0) + count
+        return counter
+
+    def add(self, character: CharacterSchema):
+        """
+        Count a character in.
+
+        Args:
+            character (CharacterSchema): The character.
+        """
+        self._count(character, 1)
+
+    def remove(self, character: CharacterSchema):
+        """
+        Count a character out.
+
+        Args:
+            character (CharacterSchema): The character, as counted in.
+        """
+        self._count(character, -1)
+
+    def stats(
+        self, query: CharacterStatsQuerySchema | None = None
+    ) -> CharacterStatsSchema:
+        """
+        Compute the statistics of the counted characters.
+
+        Args:
+            query (CharacterStatsQuerySchema | None): The statistics
+                options. Defaults to the default ones.
+
+        Returns:
+            CharacterStatsSchema: The statistics.
+        """
+        query = query or CharacterStatsQuerySchema()
+        stats = {
+            field: dict(
+                sorted(
+                    self.counts[field].items(),
+                    key=lambda item: (-item[1], item[0]),
+                )
+            )
+            for field in cts.COLOR_FIELDS
+        }
+        stats.update(
+            {
+                field: numeric_stats(self.counts[field])
+                for field in cts.NUMERIC_FIELDS
+            }
+        )
+        return CharacterStatsSchema(
+            count=self.total,
+            birth_year_histogram=histogram(
+                self.counts["birth_year"], query.bucket_size
+            ),
+            **stats,
+        )
+
+    def _count(self, character: CharacterSchema, sign: int):
+        """
+        Count a character in or out.
+
+        Args:
+            character (CharacterSchema): The character.
+            sign (int): 1 to count it in, -1 to count it out.
+        """
+        self.total += sign
+        for field, counts in self.counts.items():
+            value = getattr(character, field)
+            if value is None:
+                continue
+            count = counts.get(value, 0) + sign
+            if count:
+                counts[value] = count
+            else:
+                del counts[value]
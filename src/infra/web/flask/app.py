@@ -1,11 +1,45 @@
+import os
 from typing import Callable, Dict
 
 from flask import Flask
 from flask_swagger_ui import get_swaggerui_blueprint
 
 import settings
-from infra.web.flask.constants import API_NAME, Paths
+from domain.repositories.character_repository import (
+    CharacterRepositoryInterface,
+)
+from infra.repositories.cache.backends import (
+    InMemorySharedCacheBackend,
+    LRUCacheBackend,
+)
+from infra.metrics.sql import install_sql_instrumentation
+from infra.repositories.cache.character_repository import (
+    CachedCharacterRepository,
+)
+from infra.repositories.metrics.character_repository import (
+    InstrumentedCharacterRepository,
+)
+from infra.repositories.search.character_repository import (
+    IndexedCharacterRepository,
+)
+from infra.repositories.sql.base import EngineRegistry
+from infra.repositories.sql.character_repository import CharacterRepository
+from infra.web.flask.compression import load_static_assets
+from infra.web.flask.json_provider import PydanticJSONProvider
+from infra.web.flask.constants import (
+    API_NAME,
+    SWAGGER_UI_ENDPOINT,
+    Paths,
+    ViewNames,
+)
+from infra.web.flask.middleware import (
+    CompressionMiddleware,
+    MetricsMiddleware,
+    ReadYourWritesMiddleware,
+)
+from infra.web.flask.openapi_spec import OpenAPIDocument, build_openapi_spec
 from infra.web.flask.routes import ROUTES
+from infra.web.flask.views.doc_views import SwaggerUIAssetView
 
 
 class CharacterCRUDApp(Flask):
@@ -14,10 +48,21 @@ class CharacterCRUDApp(Flask):
     """
 
     _url_map: Dict[str, Callable] = ROUTES
+    json_provider_class = PydanticJSONProvider
 
-    def __init__(self, *args, **kwargs):
+    def __init__(
+        self,
+        *args,
+        character_repository: CharacterRepositoryInterface | None = None,
+        **kwargs,
+    ):
         """
         The constructor method
+
+        Args:
+            character_repository (CharacterRepositoryInterface | None): The
+                repository shared by every request. Defaults to a SQL
+                repository on the process-wide engine.
         """
         self._debug_mode = settings.DEBUG_MODE
         self._host_url= settings.WebServerSettings.WEB_SERVER_HOST
@@ -26,8 +71,21 @@ class CharacterCRUDApp(Flask):
             *args,
             **kwargs,
         )
+        if character_repository is None:
+            character_repository = self._build_character_repository()
+        self.character_repository = character_repository
+        self.openapi_document = OpenAPIDocument(build_openapi_spec())
         for url, view in self._url_map.items():
+            if url == Paths.METRICS and not settings.MetricsSettings.ENABLED:
+                continue
             self.add_url_rule(url, view_func=view)
+        if settings.CompressionSettings.ENABLED:
+            self.wsgi_app = CompressionMiddleware(self.wsgi_app)
+        if settings.DatabaseSettings.REPLICA_CONNECTION_STRINGS:
+            self.wsgi_app = ReadYourWritesMiddleware(self.wsgi_app)
+        if settings.MetricsSettings.ENABLED:
+            install_sql_instrumentation()
+            self.wsgi_app = MetricsMiddleware(self.wsgi_app)
 
         swaggerui_blueprint = get_swaggerui_blueprint(
             Paths.SWAGGER_UI,
@@ -37,6 +95,43 @@ class CharacterCRUDApp(Flask):
         self.register_blueprint(
             swaggerui_blueprint, url_prefix=Paths.SWAGGER_UI
         )
+        self.swagger_ui_assets = load_static_assets(
+            os.path.join(
+                swaggerui_blueprint.root_path, swaggerui_blueprint.static_folder
+            )
+        )
+        self.view_functions[SWAGGER_UI_ENDPOINT] = SwaggerUIAssetView.as_view(
+            ViewNames.SWAGGER_UI_ASSET, self.view_functions[SWAGGER_UI_ENDPOINT]
+        )
+
+    @staticmethod
+    def _build_character_repository() -> CharacterRepositoryInterface:
+        """
+        Build the SQL repository on the process-wide engine, searched in an
+        in-process name index when SearchSettings.INDEX is set, wrapped in
+        a read-through cache when CacheSettings.ENABLED is set and timed
+        when MetricsSettings.ENABLED is set.
+
+        Returns:
+            CharacterRepositoryInterface: The repository.
+        """
+        repository = CharacterRepository(
+            EngineRegistry.get(settings.DatabaseSettings.CONNECTION_STRING)
+        )
+        if settings.SearchSettings.INDEX:
+            repository = IndexedCharacterRepository(repository)
+        if settings.CacheSettings.ENABLED:
+            shared_cache = None
+            if settings.CacheSettings.SHARED_BACKEND == "memory":
+                shared_cache = InMemorySharedCacheBackend()
+            repository = CachedCharacterRepository(
+                repository,
+                local_cache=LRUCacheBackend(settings.CacheSettings.MAX_SIZE),
+                shared_cache=shared_cache,
+            )
+        if settings.MetricsSettings.ENABLED:
+            repository = InstrumentedCharacterRepository(repository)
+        return repository
 
     def run(self, *args, **kwargs):
         """
@@ -0,0 +1,208 @@
+import hashlib
+import os
+import zlib
+from functools import lru_cache
+from typing import Dict, Tuple
+
+from flask import Response, request
+from werkzeug.datastructures import Accept
+
+from infra.web.flask import constants as cts
+from infra.web.flask.enums import HttpStatusCodes
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# The supported content encodings, in order of preference.
+ENCODINGS: Tuple[str, ...] = (
+    ("br", "gzip", "deflate") if brotli is not None else ("gzip", "deflate")
+)
+# The encodings of the precompressed bodies: every client accepting deflate
+# also accepts gzip.
+PRECOMPRESSED_ENCODINGS: Tuple[str, ...] = tuple(
+    encoding for encoding in ENCODINGS if encoding != "deflate"
+)
+# The zlib window bits of the gzip and deflate (zlib) formats.
+WBITS = {"gzip": 16 + zlib.MAX_WBITS, "deflate": zlib.MAX_WBITS}
+
+
+class StreamCompressor:
+    """
+    Compresses a body incrementally in one content encoding.
+    """
+
+    def __init__(self, encoding: str, level: int = 9, brotli_quality: int = 11):
+        """
+        Constructor method.
+
+        Args:
+            encoding (str): The content encoding, one of ENCODINGS.
+            level (int): The gzip and deflate compression level, 1 to 9.
+            brotli_quality (int): The brotli quality, 0 to 11.
+        """
+        self._brotli = encoding == "br"
+        if self._brotli:
+            self._compressor = brotli.Compressor(quality=brotli_quality)
+        else:
+            self._compressor = zlib.compressobj(
+                level, zlib.DEFLATED, WBITS[encoding]
+            )
+
+    def compress(self, data: bytes) -> bytes:
+        """
+        Compress a part of the body. The output may lag behind the input.
+
+        Args:
+            data (bytes): The part of the body.
+
+        Returns:
+            bytes: The compressed bytes ready so far, possibly none.
+        """
+        if self._brotli:
+            return self._compressor.process(data)
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        """
+        Output everything compressed so far, so that the client can decode
+        it, while keeping the stream open.
+
+        Returns:
+            bytes: The compressed bytes.
+        """
+        if self._brotli:
+            return self._compressor.flush()
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        """
+        End the stream.
+
+        Returns:
+            bytes: The last compressed bytes.
+        """
+        if self._brotli:
+            return self._compressor.finish()
+        return self._compressor.flush()
+
+
+def compress(
+    data: bytes, encoding: str, level: int = 9, brotli_quality: int = 11
+) -> bytes:
+    """
+    Compress a whole body.
+
+    Args:
+        data (bytes): The body.
+        encoding (str): The content encoding, one of ENCODINGS.
+        level (int): The gzip and deflate compression level, 1 to 9.
+        brotli_quality (int): The brotli quality, 0 to 11.
+
+    Returns:
+        bytes: The compressed body.
+    """
+    compressor = StreamCompressor(encoding, level, brotli_quality)
+    return compressor.compress(data) + compressor.finish()
+
+
+class PrecompressedBody:
+    """
+    A static body with a strong ETag and its variants compressed once, at
+    the highest levels, in PRECOMPRESSED_ENCODINGS.
+    """
+
+    def __init__(self, body: bytes):
+        """
+        Constructor method.
+
+        Args:
+            body (bytes): The body.
+        """
+        self.body = body
+        self.etag = hashlib.sha256(body).hexdigest()
+        self.encodings: Dict[str, bytes] = {
+            encoding: compress(body, encoding)
+            for encoding in PRECOMPRESSED_ENCODINGS
+        }
+
+    def negotiate(self, accept_encodings: Accept) -> str | None:
+        """
+        Pick the encoding the client accepts best, as weighted by its
+        q-values, so that "gzip;q=0" refuses gzip.
+
+        Args:
+            accept_encodings (Accept): The parsed Accept-Encoding header.
+
+        Returns:
+            str | None: The content encoding, None for identity.
+        """
+        return accept_encodings.best_match(list(self.encodings))
+
+    def variant(self, encoding: str | None) -> Tuple[bytes, str]:
+        """
+        Get the body and the ETag of a representation.
+
+        Args:
+            encoding (str | None): The content encoding, None for identity.
+
+        Returns:
+            Tuple[bytes, str]: The body and its ETag.
+        """
+        if encoding is None:
+            return self.body, self.etag
+        return self.encodings[encoding], f"{self.etag}-{encoding}"
+
+    def response(self, mimetype: str, max_age: int) -> Response:
+        """
+        Serve the variant the client accepts best, answering If-None-Match
+        with 304.
+
+        Args:
+            mimetype (str): The media type of the body.
+            max_age (int): How long, in seconds, the response may be cached.
+
+        Returns:
+            Response: The response.
+        """
+        encoding = self.negotiate(request.accept_encodings)
+        body, etag = self.variant(encoding)
+        headers = {
+            "Cache-Control": f"public, max-age={max_age}",
+            "Vary": "Accept-Encoding",
+        }
+        if request.if_none_match.contains(etag):
+            response = Response(
+                status=HttpStatusCodes.NOT_MODIFIED.value, headers=headers
+            )
+        else:
+            response = Response(body, mimetype=mimetype, headers=headers)
+            if encoding is not None:
+                response.headers["Content-Encoding"] = encoding
+        response.set_etag(etag)
+        return response
+
+
+@lru_cache(maxsize=None)
+def load_static_assets(directory: str) -> Dict[str, PrecompressedBody]:
+    """
+    Load and precompress the text assets of a directory, once per process.
+
+    Args:
+        directory (str): The directory of the assets.
+
+    Returns:
+        Dict[str, PrecompressedBody]: The assets, by path relative to the
+            directory.
+    """
+    assets = {}
+    for root, _, files in os.walk(directory):
+        for name in files:
+            if not name.endswith(cts.COMPRESSIBLE_ASSET_SUFFIXES):
+                continue
+            path = os.path.join(root, name)
+            with open(path, "rb") as file:
+                body = PrecompressedBody(file.read())
+            assets[os.path.relpath(path, directory).replace(os.sep, "/")] = body
+    return assets
@@ -0,0 +1,100 @@
+import hashlib
+from datetime import datetime, timezone
+
+from flask import Response, request
+
+from infra.web.flask import constants as cts
+from infra.web.flask.enums import HttpStatusCodes
+
+
+def _as_utc(moment: datetime) -> datetime:
+    """
+    Make a database time, naive UTC, aware and drop its microseconds, which
+    HTTP dates do not carry.
+
+    Args:
+        moment (datetime): The time.
+
+    Returns:
+        datetime: The aware time, to the second.
+    """
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.replace(microsecond=0)
+
+
+def body_etag(body: bytes) -> str:
+    """
+    Hash a response body into a strong ETag, for representations whose
+    content is only known once served.
+
+    Args:
+        body (bytes): The body.
+
+    Returns:
+        str: The hexadecimal hash.
+    """
+    return hashlib.blake2b(body, digest_size=16).hexdigest()
+
+
+def is_fresh(etag: str, modified_at: datetime | None = None) -> bool:
+    """
+    Check whether the copy of the client is still current. If-None-Match
+    takes precedence over If-Modified-Since.
+
+    Args:
+        etag (str): The strong ETag of the current representation.
+        modified_at (datetime | None): When the resource last changed.
+            Defaults to unknown, to ignore If-Modified-Since.
+
+    Returns:
+        bool: True if the client copy is current, False otherwise.
+    """
+    if request.if_none_match:
+        # Weak comparison, since compression weakens the ETags it sends.
+        return request.if_none_match.contains_weak(etag)
+    if modified_at is not None and request.if_modified_since is not None:
+        return _as_utc(modified_at) <= request.if_modified_since
+    return False
+
+
+def with_validators(
+    response: Response, etag: str, modified_at: datetime | None = None
+) -> Response:
+    """
+    Set the ETag, Last-Modified and Cache-Control headers of a response,
+    so that clients and shared caches revalidate it on every use.
+
+    Args:
+        response (Response): The response.
+        etag (str): The strong ETag of the representation.
+        modified_at (datetime | None): When the resource last changed.
+            Defaults to unknown, to send no Last-Modified header.
+
+    Returns:
+        Response: The response.
+    """
+    response.set_etag(etag)
+    if modified_at is not None:
+        response.last_modified = _as_utc(modified_at)
+    response.headers["Cache-Control"] = cts.REVALIDATE_CACHE_CONTROL
+    return response
+
+
+def not_modified(
+    etag: str, modified_at: datetime | None = None
+) -> Response:
+    """
+    Build the 304 answer to a conditional request.
+
+    Args:
+        etag (str): The strong ETag of the current representation.
+        modified_at (datetime | None): When the resource last changed.
+            Defaults to unknown.
+
+    Returns:
+        Response: The response.
+    """
+    return with_validators(
+        Response(status=HttpStatusCodes.NOT_MODIFIED.value), etag, modified_at
+    )
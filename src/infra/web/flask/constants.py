@@ -1,15 +1,36 @@
 INDEX_TEXT: str = "Character API"
 API_NAME: str = "Character CRUD API"
 API_VERSION: str = "v1"
+OPENAPI_MAX_AGE: int = 3600
+STATIC_MAX_AGE: int = 86400
+SWAGGER_UI_ENDPOINT: str = "swagger_ui.show"
+# Source maps, only fetched by browser developer tools, are left out.
+COMPRESSIBLE_ASSET_SUFFIXES: tuple = (".js", ".css", ".html")
+COMPRESSIBLE_MIMETYPES: tuple = (
+    "application/json",
+    "application/x-ndjson",
+    "application/javascript",
+    "image/svg+xml",
+)
+# Input bytes after which a streamed response is flushed to the client.
+COMPRESSION_FLUSH_SIZE: int = 16 * 1024
+REVALIDATE_CACHE_CONTROL: str = "no-cache"
+READ_YOUR_WRITES_COOKIE: str = "primary_pinned_until"
 
 
 class Paths:
     INDEX: str = "/"
     CHAR_ALL: str = "/character/getAll"
     CHAR_ADD: str = "/character/add"
+    CHAR_BULK: str = "/character/bulk"
     CHAR_GET: str = "/character/get/<int:character_id>"
+    CHAR_GET_MANY: str = "/character/get"
+    CHAR_SEARCH: str = "/character/search"
+    CHAR_STATS: str = "/character/stats"
     CHAR_DEL: str = "/character/delete/<int:character_id>"
+    CHAR_DEL_MANY: str = "/character/delete"
     OPENAPI_JSON: str = "/swagger.json"
+    METRICS: str = "/metrics"
     SWAGGER_UI: str = "/docs"
     CHAR_GET_DOC: str = "/character/get/{character_id}"
     CHAR_DEL_DOC: str = "/character/delete/{character_id}"
@@ -18,6 +39,18 @@ class Paths:
 class ViewNames:
     CHAR_LIST: str = "character-list"
     CHAR_POST: str = "character-detail-post"
+    CHAR_BULK: str = "character-bulk-post"
     CHAR_GET: str = "character-detail-get"
+    CHAR_GET_MANY: str = "character-multi-get"
+    CHAR_SEARCH: str = "character-search"
+    CHAR_STATS: str = "character-stats"
     CHAR_DEL: str = "character-detail-delete"
+    CHAR_DEL_MANY: str = "character-bulk-delete"
     OPENAPI_JSON: str = "openapi-json"
+    METRICS: str = "metrics"
+    SWAGGER_UI_ASSET: str = "swagger-ui-asset"
+
+
+class MimeTypes:
+    JSON: str = "application/json"
+    NDJSON: str = "application/x-ndjson"
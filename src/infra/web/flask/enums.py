@@ -18,5 +18,16 @@ class HttpStatusCodes(int, Enum):
 
     OK = 200
     CREATED = 201
+    MULTI_STATUS = 207
+    NOT_MODIFIED = 304
     BAD_REQUEST = 400
     NOT_FOUND = 404
+
+
+class BulkModes(str, Enum):
+    """
+    Bulk operation modes
+    """
+
+    ATOMIC = "atomic"
+    PARTIAL = "partial"
@@ -0,0 +1,107 @@
+from functools import lru_cache
+from typing import Any, List, Type
+
+from flask import Response
+from flask.json.provider import DefaultJSONProvider
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import to_json, to_jsonable_python
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(model: Type[BaseModel]) -> TypeAdapter:
+    """
+    Get the adapter serialising a list of models in a single call.
+
+    Args:
+        model (Type[BaseModel]): The model class of the items.
+
+    Returns:
+        TypeAdapter: The adapter of List[model].
+    """
+    return TypeAdapter(List[model])
+
+
+class PydanticJSONProvider(DefaultJSONProvider):
+    """
+    A JSON provider that serialises pydantic models, and lists of them,
+    straight to bytes with their compiled serializer instead of dumping
+    them to dictionaries first. Other data is encoded with orjson when it
+    is installed, with pydantic otherwise.
+
+    Unlike the default provider keys are not sorted, the output is always
+    compact and datetimes are encoded in ISO 8601.
+    """
+
+    def dumpb(self, obj: Any, exclude_unset: bool = False) -> bytes:
+        """
+        Serialise data to JSON bytes.
+
+        Args:
+            obj (Any): The data.
+            exclude_unset (bool): Whether to leave out the fields of the
+                models that were not set, such as unprojected fields.
+
+        Returns:
+            bytes: The JSON document.
+        """
+        if isinstance(obj, BaseModel):
+            return obj.__pydantic_serializer__.to_json(
+                obj, exclude_unset=exclude_unset
+            )
+        if isinstance(obj, (list, tuple)) and obj:
+            model = type(obj[0])
+            if issubclass(model, BaseModel) and all(
+                type(item) is model for item in obj
+            ):
+                return _list_adapter(model).dump_json(
+                    obj, exclude_unset=exclude_unset
+                )
+        if orjson is not None:
+            return orjson.dumps(
+                obj,
+                default=to_jsonable_python,
+                option=orjson.OPT_NON_STR_KEYS,
+            )
+        return to_json(obj)
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """
+        Serialise data to a JSON string.
+
+        Args:
+            obj (Any): The data.
+
+        Returns:
+            str: The JSON document.
+        """
+        return self.dumpb(obj).decode()
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        """
+        Parse a JSON document, such as a request body.
+
+        Args:
+            s (str | bytes): The JSON document.
+
+        Returns:
+            Any: The data.
+        """
+        if orjson is not None:
+            return orjson.loads(s)
+        return super().loads(s, **kwargs)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        """
+        Build a JSON response, as flask.jsonify does, without encoding the
+        body to a string first.
+
+        Returns:
+            Response: The response.
+        """
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(self.dumpb(obj), mimetype=self.mimetype)
@@ -0,0 +1,269 @@
+import math
+import time
+from itertools import chain
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterable, Iterator
+
+from werkzeug.datastructures import Headers
+from werkzeug.http import dump_cookie, parse_accept_header, parse_cookie
+from werkzeug.wsgi import ClosingIterator
+
+from infra.metrics import constants as metrics_cts
+from infra.metrics.metrics import HTTP_REQUEST_DURATION, HTTP_REQUESTS
+from infra.repositories.sql.replicas import PRIMARY_PINNED_UNTIL
+from infra.web.flask import constants as cts
+from infra.web.flask.compression import ENCODINGS, StreamCompressor, compress
+from settings import CompressionSettings
+
+
+class MetricsMiddleware:
+    """
+    WSGI middleware counting the requests and timing them until their
+    response headers are sent, by URL rule, so that the labels stay bounded
+    whatever the path parameters.
+    """
+
+    def __init__(self, wsgi_app: Callable):
+        """
+        Constructor method.
+
+        Args:
+            wsgi_app (Callable): The wrapped WSGI application.
+        """
+        self._wsgi_app = wsgi_app
+
+    def __call__(
+        self, environ: Dict[str, Any], start_response: Callable
+    ) -> Iterable[bytes]:
+        """
+        Handle a request.
+
+        Args:
+            environ (Dict[str, Any]): The WSGI environment.
+            start_response (Callable): The WSGI start_response callable.
+
+        Returns:
+            Iterable[bytes]: The response body.
+        """
+        start = perf_counter()
+
+        def timed_start_response(status: str, headers: list, exc_info=None):
+            request = environ.get("werkzeug.request")
+            url_rule = getattr(request, "url_rule", None)
+            route = (
+                url_rule.rule
+                if url_rule is not None
+                else metrics_cts.UNMATCHED_ROUTE
+            )
+            method = environ.get("REQUEST_METHOD", "")
+            HTTP_REQUESTS.inc(route, method, status[:3])
+            HTTP_REQUEST_DURATION.observe(perf_counter() - start, route, method)
+            return start_response(status, headers, exc_info)
+
+        return self._wsgi_app(environ, timed_start_response)
+
+
+class ReadYourWritesMiddleware:
+    """
+    WSGI middleware carrying the read-your-writes window of a client
+    between its requests in a cookie, so that its reads go to the primary
+    database right after it writes, whichever worker serves them.
+    """
+
+    def __init__(self, wsgi_app: Callable):
+        """
+        Constructor method.
+
+        Args:
+            wsgi_app (Callable): The wrapped WSGI application.
+        """
+        self._wsgi_app = wsgi_app
+
+    def __call__(
+        self, environ: Dict[str, Any], start_response: Callable
+    ) -> Iterable[bytes]:
+        """
+        Handle a request.
+
+        Args:
+            environ (Dict[str, Any]): The WSGI environment.
+            start_response (Callable): The WSGI start_response callable.
+
+        Returns:
+            Iterable[bytes]: The response body.
+        """
+        try:
+            pinned_until = float(
+                parse_cookie(environ).get(cts.READ_YOUR_WRITES_COOKIE, 0)
+            )
+        except ValueError:
+            pinned_until = 0.0
+        # Worker threads are reused, so the window is set on every request.
+        PRIMARY_PINNED_UNTIL.set(pinned_until)
+
+        def pinning_start_response(status: str, headers: list, exc_info=None):
+            new_pinned_until = PRIMARY_PINNED_UNTIL.get()
+            if new_pinned_until > pinned_until:
+                cookie = dump_cookie(
+                    cts.READ_YOUR_WRITES_COOKIE,
+                    f"{new_pinned_until:.3f}",
+                    max_age=math.ceil(new_pinned_until - time.time()),
+                    httponly=True,
+                    samesite="Lax",
+                )
+                headers = headers + [("Set-Cookie", cookie)]
+            return start_response(status, headers, exc_info)
+
+        return self._wsgi_app(environ, pinning_start_response)
+
+
+class CompressionMiddleware:
+    """
+    WSGI middleware compressing text responses in the content encoding the
+    client accepts best.
+
+    Responses of known length are compressed whole, and only from
+    min_size bytes. Streamed responses are compressed incrementally and
+    flushed to the client every COMPRESSION_FLUSH_SIZE bytes of input.
+    Responses that already have a Content-Encoding are left untouched.
+
+    The wrapped app must call start_response before returning its body,
+    as Flask does.
+    """
+
+    def __init__(
+        self,
+        wsgi_app: Callable,
+        min_size: int = CompressionSettings.MIN_SIZE,
+        level: int = CompressionSettings.LEVEL,
+        brotli_quality: int = CompressionSettings.BROTLI_QUALITY,
+    ):
+        """
+        Constructor method.
+
+        Args:
+            wsgi_app (Callable): The wrapped WSGI application.
+            min_size (int): The size, in bytes, below which responses of
+                known length are not compressed.
+            level (int): The gzip and deflate compression level, 1 to 9.
+            brotli_quality (int): The brotli quality, 0 to 11.
+        """
+        self._wsgi_app = wsgi_app
+        self._min_size = min_size
+        self._level = level
+        self._brotli_quality = brotli_quality
+
+    def __call__(
+        self, environ: Dict[str, Any], start_response: Callable
+    ) -> Iterable[bytes]:
+        """
+        Handle a request.
+
+        Args:
+            environ (Dict[str, Any]): The WSGI environment.
+            start_response (Callable): The WSGI start_response callable.
+
+        Returns:
+            Iterable[bytes]: The response body.
+        """
+        encoding = parse_accept_header(
+            environ.get("HTTP_ACCEPT_ENCODING")
+        ).best_match(ENCODINGS)
+        if encoding is None or environ.get("REQUEST_METHOD") == "HEAD":
+            return self._wsgi_app(environ, start_response)
+
+        started: Dict[str, Any] = {}
+        written: list = []
+
+        def deferred_start_response(status: str, headers: list, exc_info=None):
+            started.update(status=status, headers=Headers(headers), exc_info=exc_info)
+            return written.append
+
+        app_iter = self._wsgi_app(environ, deferred_start_response)
+        status, headers = started["status"], started["headers"]
+        body = chain(written, app_iter)
+        if not self._compressible(status, headers):
+            start_response(status, headers.to_wsgi_list(), started["exc_info"])
+            return ClosingIterator(body, getattr(app_iter, "close", None))
+
+        headers["Content-Encoding"] = encoding
+        vary = headers.get("Vary")
+        if vary is None:
+            headers["Vary"] = "Accept-Encoding"
+        elif "accept-encoding" not in vary.lower():
+            headers["Vary"] = f"{vary}, Accept-Encoding"
+        etag = headers.get("ETag")
+        if etag is not None and not etag.startswith("W/"):
+            # The compressed body differs byte for byte from the original.
+            headers["ETag"] = f"W/{etag}"
+
+        if "Content-Length" in headers:
+            try:
+                compressed = compress(
+                    b"".join(body), encoding, self._level, self._brotli_quality
+                )
+            finally:
+                if hasattr(app_iter, "close"):
+                    app_iter.close()
+            headers["Content-Length"] = str(len(compressed))
+            start_response(status, headers.to_wsgi_list(), started["exc_info"])
+            return [compressed]
+
+        start_response(status, headers.to_wsgi_list(), started["exc_info"])
+        compressor = StreamCompressor(encoding, self._level, self._brotli_quality)
+        return ClosingIterator(
+            self._stream(body, compressor), getattr(app_iter, "close", None)
+        )
+
+    def _compressible(self, status: str, headers: Headers) -> bool:
+        """
+        Check whether a response is worth compressing.
+
+        Args:
+            status (str): The status line of the response.
+            headers (Headers): The headers of the response.
+
+        Returns:
+            bool: True if the response should be compressed.
+        """
+        code = int(status[:3])
+        if code < 200 or code in (204, 206, 304):
+            return False
+        if "Content-Encoding" in headers:
+            return False
+        if "no-transform" in headers.get("Cache-Control", ""):
+            return False
+        mimetype = headers.get("Content-Type", "").split(";")[0].strip()
+        if not (
+            mimetype.startswith("text/")
+            or mimetype.endswith("+json")
+            or mimetype in cts.COMPRESSIBLE_MIMETYPES
+        ):
+            return False
+        length = headers.get("Content-Length")
+        return length is None or int(length) >= self._min_size
+
+    @staticmethod
+    def _stream(
+        chunks: Iterable[bytes], compressor: StreamCompressor
+    ) -> Iterator[bytes]:
+        """
+        Compress a streamed body incrementally.
+
+        Args:
+            chunks (Iterable[bytes]): The body.
+            compressor (StreamCompressor): The compressor.
+
+        Yields:
+            bytes: The compressed body.
+        """
+        pending = 0
+        for chunk in chunks:
+            output = compressor.compress(chunk)
+            pending += len(chunk)
+            if pending >= cts.COMPRESSION_FLUSH_SIZE:
+                output += compressor.flush()
+                pending = 0
+            if output:
+                yield output
+        yield compressor.finish()
@@ -23,26 +23,31 @@ class OpenAPIBuilder:
     def add_endpoint(
         self,
         path: str,
-        input_model: Optional[Type[BaseModel]],
+        input_model: Optional[Type[BaseModel] | TypeAdapter[List[BaseModel]]],
         response_model_ok: Type[BaseModel] | TypeAdapter[List[BaseModel]],
         status_code_ok: int,
         response_model_bad: Type[BaseModel],
         status_code_bad: int,
         method: str,
         path_parameters: Optional[List[Dict[str, Any]]] = None,
+        query_parameters: Optional[List[Dict[str, Any]]] = None,
+        response_headers: Optional[Dict[str, str]] = None,
     ):
         """
         Add an endpoint to the OpenAPI JSON documentation.
 
         Args:
             path (str): The path of the endpoint.
-            input_model (Type[BaseModel] | None): The input model for the endpoint.
+            input_model (Type[BaseModel] | TypeAdapter[List[BaseModel]] | None): The input model for the endpoint.
             response_model_ok (Type[BaseModel] | TypeAdapter[List[BaseModel]]): The response model for success.
             status_code_ok (int): The status code for a successful response.
             response_model_bad (Type[BaseModel]): The response model for an error response.
             status_code_bad (int): The status code for an error response.
             method (str): The HTTP method of the endpoint.
             path_parameters (List[Dict[str, Any]], optional): Path parameters metadata.
+            query_parameters (List[Dict[str, Any]], optional): Query parameters metadata.
+            response_headers (Dict[str, str], optional): Headers of the
+                successful response, by name, with their description.
         """
         method = method.lower()
         if path not in self._openapi_doc["paths"]:
@@ -78,9 +83,18 @@ class OpenAPIBuilder:
                 }
             }
 
-        if path_parameters:
+        if response_headers:
+            endpoint_doc["responses"][str(status_code_ok)]["headers"] = {
+                name: {
+                    "description": description,
+                    "schema": {"type": "string"},
+                }
+                for name, description in response_headers.items()
+            }
+
+        if path_parameters or query_parameters:
             endpoint_doc["parameters"] = []
-            for param in path_parameters:
+            for param in path_parameters or []:
                 endpoint_doc["parameters"].append(
                     {
                         "name": param["name"],
@@ -90,6 +104,16 @@ class OpenAPIBuilder:
                         "schema": {"type": param.get("type", "string")},
                     }
                 )
+            for param in query_parameters or []:
+                endpoint_doc["parameters"].append(
+                    {
+                        "name": param["name"],
+                        "in": "query",
+                        "required": param.get("required", False),
+                        "description": param.get("description", ""),
+                        "schema": {"type": param.get("type", "string")},
+                    }
+                )
 
         self._openapi_doc["paths"][path][method] = endpoint_doc
 
@@ -0,0 +1,271 @@
+import json
+from typing import Any, Dict, List
+
+from pydantic import TypeAdapter
+
+from domain.entities.schemas import (
+    DEFAULT_PAGE_SIZE,
+    MAX_BULK_CHUNK_SIZE,
+    MAX_PAGE_SIZE,
+    MAX_SEARCH_LENGTH,
+    MAX_SEARCH_OFFSET,
+    MIN_SEARCH_LENGTH,
+    MAX_HISTOGRAM_BUCKET_SIZE,
+    BulkCreateResultSchema,
+    BulkDeleteResultSchema,
+    CharacterLookupResultSchema,
+    CharacterPartialSchema,
+    CharacterSchema,
+    CharacterStatsSchema,
+)
+from infra.web.flask import constants as cts
+from infra.web.flask.compression import PrecompressedBody
+from infra.web.flask.enums import HttpMethods, HttpStatusCodes
+from infra.web.flask.openapi_builder import OpenAPIBuilder
+from infra.web.flask.schemas import ResponseMessageSchema
+
+
+def build_openapi_spec() -> Dict[str, Any]:
+    """
+    Build the OpenAPI document of every route.
+
+    Returns:
+        Dict[str, Any]: The OpenAPI JSON documentation.
+    """
+    openapi_builder = OpenAPIBuilder(
+        title=cts.API_NAME, version=cts.API_VERSION
+    )
+    openapi_builder.add_endpoint(
+        path=cts.Paths.CHAR_ALL,
+        input_model=None,
+        response_model_ok=TypeAdapter(List[CharacterPartialSchema]),
+        status_code_ok=HttpStatusCodes.OK.value,
+        response_model_bad=ResponseMessageSchema,
+        status_code_bad=HttpStatusCodes.BAD_REQUEST.value,
+        method=HttpMethods.GET.value,
+        query_parameters=[
+            {
+                "name": "limit",
+                "type": "integer",
+                "description": "Maximum number of characters to return, "
+                f"{DEFAULT_PAGE_SIZE} by default and at most {MAX_PAGE_SIZE}. "
+                "Streams return every character unless it is set",
+            },
+            {
+                "name": "after_id",
+                "type": "integer",
+                "description": "Return characters with an ID greater than this cursor",
+            },
+            {
+                "name": "fields",
+                "type": "string",
+                "description": "Comma separated fields to return, the ID is always included",
+            },
+            {
+                "name": "name",
+                "type": "string",
+                "description": "Filter by exact name",
+            },
+            {
+                "name": "eye_color",
+                "type": "string",
+                "description": "Filter by exact eye color",
+            },
+            {
+                "name": "birth_year_min",
+                "type": "integer",
+                "description": "Filter by minimum year of birth",
+            },
+            {
+                "name": "birth_year_max",
+                "type": "integer",
+                "description": "Filter by maximum year of birth",
+            },
+            {
+                "name": "stream",
+                "type": "integer",
+                "description": "Set to 1 to stream a chunked JSON array, "
+                "send Accept: application/x-ndjson to stream NDJSON",
+            },
+        ],
+        response_headers={
+            "Link": 'URL of the next page with rel="next", when there is one',
+        },
+    )
+
+    openapi_builder.add_endpoint(
+        path=cts.Paths.CHAR_ADD,
+        input_model=CharacterSchema,
+        response_model_ok=CharacterSchema,
+        status_code_ok=HttpStatusCodes.CREATED.value,
+        response_model_bad=ResponseMessageSchema,
+        status_code_bad=HttpStatusCodes.BAD_REQUEST.value,
+        method=HttpMethods.POST.value,
+    )
+
+    openapi_builder.add_endpoint(
+        path=cts.Paths.CHAR_BULK,
+        input_model=TypeAdapter(List[CharacterSchema]),
+        response_model_ok=BulkCreateResultSchema,
+        status_code_ok=HttpStatusCodes.CREATED.value,
+        response_model_bad=ResponseMessageSchema,
+        status_code_bad=HttpStatusCodes.BAD_REQUEST.value,
+        method=HttpMethods.POST.value,
+        query_parameters=[
+            {
+                "name": "mode",
+                "type": "string",
+                "description": "atomic (default) creates all the characters or none, "
+                "partial reports failing characters by index with a 207 status",
+            },
+            {
+                "name": "chunk_size",
+                "type": "integer",
+                "description": "Number of characters inserted per statement, "
+                f"from 1 to {MAX_BULK_CHUNK_SIZE}",
+            },
+        ],
+    )
+
+    openapi_builder.add_endpoint(
+        path=cts.Paths.CHAR_GET_DOC,
+        input_model=None,
+        response_model_ok=CharacterSchema,
+        status_code_ok=HttpStatusCodes.OK.value,
+        response_model_bad=ResponseMessageSchema,
+        status_code_bad=HttpStatusCodes.BAD_REQUEST.value,
+        method=HttpMethods.GET.value,
+        path_parameters=[
+            {
+                "name": "character_id",
+                "type": "integer",
+                "description": "Character ID",
+            }
+        ],
+    )
+
+    openapi_builder.add_endpoint(
+        path=cts.Paths.CHAR_GET_MANY,
+        input_model=None,
+        response_model_ok=CharacterLookupResultSchema,
+        status_code_ok=HttpStatusCodes.OK.value,
+        response_model_bad=ResponseMessageSchema,
+        status_code_bad=HttpStatusCodes.BAD_REQUEST.value,
+        method=HttpMethods.GET.value,
+        query_parameters=[
+            {
+                "name": "ids",
+                "type": "string",
+                "required": True,
+                "description": "Comma separated IDs of the characters, "
+                "returned in that order with the IDs not found",
+            }
+        ],
+    )
+
+    openapi_builder.add_endpoint(
+        path=cts.Paths.CHAR_SEARCH,
+        input_model=None,
+        response_model_ok=TypeAdapter(List[CharacterSchema]),
+        status_code_ok=HttpStatusCodes.OK.value,
+        response_model_bad=ResponseMessageSchema,
+        status_code_bad=HttpStatusCodes.BAD_REQUEST.value,
+        method=HttpMethods.GET.value,
+        query_parameters=[
+            {
+                "name": "q",
+                "type": "string",
+                "required": True,
+                "description": "The name, or part of it, to search for, "
+                f"{MIN_SEARCH_LENGTH} to {MAX_SEARCH_LENGTH} characters",
+            },
+            {
+                "name": "limit",
+                "type": "integer",
+                "description": "Maximum number of characters to return",
+            },
+            {
+                "name": "offset",
+                "type": "integer",
+                "description": "Number of best matches to skip, "
+                f"at most {MAX_SEARCH_OFFSET}",
+            },
+            {
+                "name": "fuzzy",
+                "type": "boolean",
+                "description": "Whether to also match names with a few "
+                "typos, true by default",
+            },
+        ],
+    )
+
+    openapi_builder.add_endpoint(
+        path=cts.Paths.CHAR_STATS,
+        input_model=None,
+        response_model_ok=CharacterStatsSchema,
+        status_code_ok=HttpStatusCodes.OK.value,
+        response_model_bad=ResponseMessageSchema,
+        status_code_bad=HttpStatusCodes.BAD_REQUEST.value,
+        method=HttpMethods.GET.value,
+        query_parameters=[
+            {
+                "name": "bucket_size",
+                "type": "integer",
+                "description": "Width in years of the birth year histogram "
+                f"buckets, 10 by default, at most {MAX_HISTOGRAM_BUCKET_SIZE}",
+            },
+        ],
+    )
+
+    openapi_builder.add_endpoint(
+        path=cts.Paths.CHAR_DEL_DOC,
+        input_model=None,
+        response_model_ok=ResponseMessageSchema,
+        status_code_ok=HttpStatusCodes.OK.value,
+        response_model_bad=ResponseMessageSchema,
+        status_code_bad=HttpStatusCodes.BAD_REQUEST.value,
+        method=HttpMethods.DELETE.value,
+        path_parameters=[
+            {
+                "name": "character_id",
+                "type": "integer",
+                "description": "Character ID",
+            }
+        ],
+    )
+
+    openapi_builder.add_endpoint(
+        path=cts.Paths.CHAR_DEL_MANY,
+        input_model=None,
+        response_model_ok=BulkDeleteResultSchema,
+        status_code_ok=HttpStatusCodes.OK.value,
+        response_model_bad=ResponseMessageSchema,
+        status_code_bad=HttpStatusCodes.BAD_REQUEST.value,
+        method=HttpMethods.DELETE.value,
+        query_parameters=[
+            {
+                "name": "ids",
+                "type": "string",
+                "required": True,
+                "description": "Comma separated IDs of the characters",
+            }
+        ],
+    )
+
+    return openapi_builder.build()
+
+
+class OpenAPIDocument(PrecompressedBody):
+    """
+    An OpenAPI document serialised once, with a strong ETag and
+    precompressed variants.
+    """
+
+    def __init__(self, spec: Dict[str, Any]):
+        """
+        Constructor method.
+
+        Args:
+            spec (Dict[str, Any]): The OpenAPI JSON documentation.
+        """
+        super().__init__(json.dumps(spec, separators=(",", ":")).encode())
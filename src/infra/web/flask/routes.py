@@ -1,18 +1,30 @@
 from infra.web.flask.constants import INDEX_TEXT, Paths
 from infra.web.flask.constants import ViewNames as names
 from infra.web.flask.views.characters_views import (
+    CharacterBulkDELETEView,
+    CharacterBulkPOSTView,
     CharacterDetailDELETEView,
     CharacterDetailGETView,
     CharacterDetailPOSTView,
     CharacterListView,
+    CharacterMultiGETView,
+    CharacterSearchView,
+    CharacterStatsView,
 )
 from infra.web.flask.views.doc_views import OpenApiJsonView
+from infra.web.flask.views.metrics_views import MetricsView
 
 ROUTES = {
     Paths.INDEX: lambda: INDEX_TEXT,
     Paths.CHAR_ALL: CharacterListView.as_view(names.CHAR_LIST),
     Paths.CHAR_ADD: CharacterDetailPOSTView.as_view(names.CHAR_GET),
+    Paths.CHAR_BULK: CharacterBulkPOSTView.as_view(names.CHAR_BULK),
     Paths.CHAR_GET: CharacterDetailGETView.as_view(names.CHAR_POST),
+    Paths.CHAR_GET_MANY: CharacterMultiGETView.as_view(names.CHAR_GET_MANY),
+    Paths.CHAR_SEARCH: CharacterSearchView.as_view(names.CHAR_SEARCH),
+    Paths.CHAR_STATS: CharacterStatsView.as_view(names.CHAR_STATS),
     Paths.CHAR_DEL: CharacterDetailDELETEView.as_view(names.CHAR_DEL),
+    Paths.CHAR_DEL_MANY: CharacterBulkDELETEView.as_view(names.CHAR_DEL_MANY),
     Paths.OPENAPI_JSON: OpenApiJsonView.as_view(names.OPENAPI_JSON),
+    Paths.METRICS: MetricsView.as_view(names.METRICS),
 }
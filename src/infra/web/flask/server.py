@@ -0,0 +1,133 @@
+import gc
+from typing import Any, Dict
+
+from flask import Flask
+from gunicorn.app.base import BaseApplication
+
+import settings
+from infra.log.config import configure_logging
+from infra.repositories.sql.base import EngineRegistry
+from infra.web.flask.app import CharacterCRUDApp
+
+
+def when_ready(server: Any):
+    """
+    Freeze the objects of the preloaded app before the workers are forked,
+    so the garbage collector does not touch (and copy) their pages.
+
+    Warns when the character cache is enabled with several workers: every
+    worker keeps its own cache, so a write made through one worker is not
+    seen by the others until their entries expire.
+
+    Args:
+        server (Any): The gunicorn arbiter.
+    """
+    if settings.CacheSettings.ENABLED and server.cfg.workers > 1:
+        server.log.warning(
+            "CACHE_ENABLED with %s workers: the caches are per process and "
+            "may serve stale characters for up to %s seconds after a write.",
+            server.cfg.workers,
+            settings.CacheSettings.TTL_SECONDS,
+        )
+    gc.freeze()
+
+
+def post_fork(server: Any, worker: Any):
+    """
+    Give the worker its own database connection pool and log listener.
+
+    Args:
+        server (Any): The gunicorn arbiter.
+        worker (Any): The forked worker.
+    """
+    EngineRegistry.reset_after_fork()
+    configure_logging()
+
+
+def worker_exit(server: Any, worker: Any):
+    """
+    Close the database connections of a worker that shuts down.
+
+    Args:
+        server (Any): The gunicorn arbiter.
+        worker (Any): The exiting worker.
+    """
+    EngineRegistry.dispose_all()
+
+
+def on_exit(server: Any):
+    """
+    Close the database connections of the master process.
+
+    Args:
+        server (Any): The gunicorn arbiter.
+    """
+    EngineRegistry.dispose_all()
+
+
+def gunicorn_options() -> Dict[str, Any]:
+    """
+    Build the gunicorn options from WebServerSettings.
+
+    Returns:
+        Dict[str, Any]: The gunicorn settings, by name.
+    """
+    web_settings = settings.WebServerSettings
+    host = web_settings.WEB_SERVER_HOST or "127.0.0.1"
+    port = web_settings.WEB_SERVER_PORT or "5000"
+    return {
+        "bind": f"{host}:{port}",
+        "workers": web_settings.WORKERS,
+        "threads": web_settings.THREADS,
+        "worker_class": "gthread",
+        "preload_app": web_settings.PRELOAD_APP,
+        "timeout": web_settings.TIMEOUT,
+        "graceful_timeout": web_settings.GRACEFUL_TIMEOUT,
+        "keepalive": web_settings.KEEPALIVE,
+        "max_requests": web_settings.MAX_REQUESTS,
+        "max_requests_jitter": web_settings.MAX_REQUESTS_JITTER,
+        "when_ready": when_ready,
+        "post_fork": post_fork,
+        "worker_exit": worker_exit,
+        "on_exit": on_exit,
+    }
+
+
+class CharacterCRUDServer(BaseApplication):
+    """
+    Production WSGI server for CharacterCRUDApp: a gunicorn master process
+    forking WORKERS processes of THREADS threads each.
+
+    With PRELOAD_APP the app, its routes, schemas and OpenAPI document are
+    built once in the master and shared copy-on-write by the workers.
+    SIGHUP reloads the configuration and replaces the workers gracefully,
+    SIGTERM lets in-flight requests finish within GRACEFUL_TIMEOUT.
+    """
+
+    def __init__(self, options: Dict[str, Any] | None = None):
+        """
+        The constructor method
+
+        Args:
+            options (Dict[str, Any] | None): gunicorn settings overriding
+                the ones built from WebServerSettings.
+        """
+        self._options = gunicorn_options() | (options or {})
+        super().__init__()
+
+    def load_config(self):
+        """
+        Apply the options to the gunicorn configuration.
+        """
+        for name, value in self._options.items():
+            self.cfg.set(name, value)
+
+    def load(self) -> Flask:
+        """
+        Build the app, in the master when preloading and in each worker
+        otherwise.
+
+        Returns:
+            Flask: The app.
+        """
+        return CharacterCRUDApp("app")
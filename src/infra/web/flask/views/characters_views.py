@@ -1,15 +1,55 @@
-from flask import Response, jsonify, request
+from typing import Any, Dict, Iterator, List
+from urllib.parse import urlencode
+
+from flask import Response, current_app, jsonify, request
 from flask.views import MethodView
 
 from application.character_creator import CharacterCreator
 from application.character_inspector import CharacterInspector
 from application.character_remover import CharacterRemover
-from domain.entities.schemas import CharacterSchema
-from infra.repositories.sql.character_repository import CharacterRepository
-from infra.web.flask.enums import HttpStatusCodes
+from domain.entities.schemas import (
+    MAX_PAGE_SIZE,
+    BulkCreateQuerySchema,
+    CharacterPartialSchema,
+    CharacterQuerySchema,
+    CharacterSchema,
+    CharacterSearchSchema,
+    CharacterStatsQuerySchema,
+)
+from infra.web.flask.conditional import (
+    body_etag,
+    is_fresh,
+    not_modified,
+    with_validators,
+)
+from infra.web.flask.constants import MimeTypes
+from infra.web.flask.enums import BulkModes, HttpStatusCodes
 from infra.web.flask.schemas import ResponseMessageSchema
 
 
+def parse_ids(ids: str) -> List[int]:
+    """
+    Parse the comma separated IDs of an ids query parameter.
+
+    Args:
+        ids (str): The query parameter.
+
+    Returns:
+        List[int]: The IDs.
+
+    Raises:
+        ValueError: If an ID is not an integer or there is none.
+    """
+    character_ids = [
+        int(character_id)
+        for character_id in ids.split(",")
+        if character_id.strip()
+    ]
+    if not character_ids:
+        raise ValueError("The ids query parameter is required")
+    return character_ids
+
+
 class CharacterListView(MethodView):
     """
     The CharacterListView class.
@@ -17,20 +57,102 @@ class CharacterListView(MethodView):
 
     def get(self) -> Response:
         """
-        Get all characters.
+        Get characters, paginated with an after_id cursor, projected with
+        fields and filtered by name, eye_color and birth_year range. The
+        next page, if any, is linked in the Link header.
+
+        The response is tagged with the hash of the page sent, which may
+        come from a cache, so that conditional requests are answered with
+        304 without sending the page again.
+
+        With stream=1 or an Accept: application/x-ndjson header the
+        characters are streamed in a chunked response instead.
 
         Returns:
             Response: The response.
         """
-        character_inspector = CharacterInspector(CharacterRepository())
+        character_inspector = CharacterInspector(
+            current_app.character_repository
+        )
         try:
-            characters = character_inspector.list_characters()
+            query = CharacterQuerySchema.model_validate(request.args.to_dict())
+            ndjson = (
+                request.accept_mimetypes.best_match(
+                    [MimeTypes.JSON, MimeTypes.NDJSON]
+                )
+                == MimeTypes.NDJSON
+            )
+            if ndjson or request.args.get("stream") == "1":
+                return self._stream(character_inspector, query, ndjson)
+            characters = character_inspector.list_characters(query)
         except Exception as e:
             return (
-                jsonify(ResponseMessageSchema(message=str(e)).model_dump()),
+                jsonify(ResponseMessageSchema(message=str(e))),
                 HttpStatusCodes.BAD_REQUEST.value,
             )
-        return jsonify([c.model_dump() for c in characters])
+        body = current_app.json.dumpb(characters, exclude_unset=True)
+        etag = body_etag(body)
+        if is_fresh(etag):
+            response = not_modified(etag)
+            response.vary.add("Accept")
+            return response
+        response = current_app.response_class(body, mimetype=MimeTypes.JSON)
+        next_after_id = query.next_after_id(characters)
+        if next_after_id is not None:
+            args = request.args.to_dict()
+            args["after_id"] = next_after_id
+            response.headers["Link"] = (
+                f'<{request.base_url}?{urlencode(args)}>; rel="next"'
+            )
+        with_validators(response, etag)
+        response.vary.add("Accept")
+        return response
+
+    @staticmethod
+    def _stream(
+        character_inspector: CharacterInspector,
+        query: CharacterQuerySchema,
+        ndjson: bool,
+    ) -> Response:
+        """
+        Stream characters as NDJSON or as a chunked JSON array, serialising
+        each one straight to bytes. Unless a limit is given, every
+        character is streamed.
+
+        Args:
+            character_inspector (CharacterInspector): The inspector to read
+                characters from.
+            query (CharacterQuerySchema): The query options.
+            ndjson (bool): Whether to stream NDJSON instead of a JSON array.
+
+        Returns:
+            Response: The streamed response.
+        """
+        update: Dict[str, Any] = {}
+        if query.fields is None:
+            update["fields"] = list(CharacterPartialSchema.model_fields)
+        if "limit" not in query.model_fields_set:
+            update["limit"] = None
+        query = query.model_copy(update=update)
+        characters = character_inspector.iter_characters(query)
+        serializer = CharacterSchema.__pydantic_serializer__
+
+        def generate_ndjson() -> Iterator[bytes]:
+            for character in characters:
+                yield serializer.to_json(character, exclude_unset=True) + b"\n"
+
+        def generate_json_array() -> Iterator[bytes]:
+            separator = b"["
+            for character in characters:
+                yield separator + serializer.to_json(
+                    character, exclude_unset=True
+                )
+                separator = b","
+            yield b"[]" if separator == b"[" else b"]"
+
+        if ndjson:
+            return Response(generate_ndjson(), mimetype=MimeTypes.NDJSON)
+        return Response(generate_json_array(), mimetype=MimeTypes.JSON)
 
 
 class CharacterDetailGETView(MethodView):
@@ -42,21 +164,147 @@ class CharacterDetailGETView(MethodView):
         """
         Get a character by its ID.
 
+        The response carries a strong ETag, the content hash of the
+        character, and a Last-Modified header. Conditional requests are
+        answered with 304 from the stored hash, without loading the
+        character.
+
         Args:
             character_id (int): The ID of the character.
 
         Returns:
             Response: The response.
         """
-        character_inspector = CharacterInspector(CharacterRepository())
+        character_inspector = CharacterInspector(
+            current_app.character_repository
+        )
         try:
+            version = character_inspector.get_character_version(character_id)
+            if version is not None and is_fresh(version.tag, version.modified_at):
+                return not_modified(version.tag, version.modified_at)
             character = character_inspector.get_character(character_id)
         except Exception as e:
             return (
-                jsonify(ResponseMessageSchema(message=str(e)).model_dump()),
+                jsonify(ResponseMessageSchema(message=str(e))),
+                HttpStatusCodes.BAD_REQUEST.value,
+            )
+        response = jsonify(character)
+        if version is None:
+            return response
+        # Tagged from the body sent, which may come from a cache.
+        return with_validators(
+            response, character.content_hash(), version.modified_at
+        )
+
+
+class CharacterMultiGETView(MethodView):
+    """
+    The CharacterMultiGETView class GET method.
+    """
+
+    def get(self) -> Response:
+        """
+        Get many characters by the comma separated IDs of the ids query
+        parameter, with a single query. The characters are returned in the
+        order of their IDs and the IDs not found are reported.
+
+        Returns:
+            Response: The response.
+        """
+        character_inspector = CharacterInspector(
+            current_app.character_repository
+        )
+        try:
+            character_ids = parse_ids(request.args.get("ids", ""))
+            if len(character_ids) > MAX_PAGE_SIZE:
+                raise ValueError(
+                    f"At most {MAX_PAGE_SIZE} IDs can be requested at once"
+                )
+            result = character_inspector.get_characters_by_ids(character_ids)
+        except Exception as e:
+            return (
+                jsonify(ResponseMessageSchema(message=str(e))),
+                HttpStatusCodes.BAD_REQUEST.value,
+            )
+        return jsonify(result)
+
+
+class CharacterSearchView(MethodView):
+    """
+    The CharacterSearchView class GET method.
+    """
+
+    def get(self) -> Response:
+        """
+        Search characters by name with the q query parameter, paginated
+        with limit and offset. Names starting with the query come first,
+        then names with a word starting with it, then names containing it
+        and, unless fuzzy=false, names matching it with a few typos. The
+        next page, if any, is linked in the Link header.
+
+        Returns:
+            Response: The response.
+        """
+        character_inspector = CharacterInspector(
+            current_app.character_repository
+        )
+        try:
+            search = CharacterSearchSchema.model_validate(
+                request.args.to_dict()
+            )
+            characters = character_inspector.search_characters(search)
+        except Exception as e:
+            return (
+                jsonify(ResponseMessageSchema(message=str(e))),
+                HttpStatusCodes.BAD_REQUEST.value,
+            )
+        response = jsonify(characters)
+        next_offset = search.next_offset(characters)
+        if next_offset is not None:
+            args = request.args.to_dict()
+            args["offset"] = next_offset
+            response.headers["Link"] = (
+                f'<{request.base_url}?{urlencode(args)}>; rel="next"'
+            )
+        return response
+
+
+class CharacterStatsView(MethodView):
+    """
+    The CharacterStatsView class GET method.
+    """
+
+    def get(self) -> Response:
+        """
+        Get the statistics of the characters: the counts per color, the
+        mean and percentiles of height, mass and birth year, and a
+        histogram of the birth years in buckets of bucket_size years.
+
+        The response is tagged with the hash of the statistics sent, like
+        listings, so that conditional requests are answered with 304 until
+        they change.
+
+        Returns:
+            Response: The response.
+        """
+        character_inspector = CharacterInspector(
+            current_app.character_repository
+        )
+        try:
+            query = CharacterStatsQuerySchema.model_validate(
+                request.args.to_dict()
+            )
+            stats = character_inspector.get_character_stats(query)
+        except Exception as e:
+            return (
+                jsonify(ResponseMessageSchema(message=str(e))),
                 HttpStatusCodes.BAD_REQUEST.value,
             )
-        return jsonify(character.model_dump())
+        response = jsonify(stats)
+        etag = body_etag(response.get_data())
+        if is_fresh(etag):
+            return not_modified(etag)
+        return with_validators(response, etag)
 
 
 class CharacterDetailPOSTView(MethodView):
@@ -71,12 +319,14 @@ class CharacterDetailPOSTView(MethodView):
         Returns:
             Response: The response.
         """
-        character_creator = CharacterCreator(CharacterRepository())
+        character_creator = CharacterCreator(
+            current_app.character_repository
+        )
         try:
             input_data = CharacterSchema.model_validate(request.json)
         except Exception as e:
             return (
-                jsonify(ResponseMessageSchema(message=str(e)).model_dump()),
+                jsonify(ResponseMessageSchema(message=str(e))),
                 HttpStatusCodes.BAD_REQUEST.value,
             )
         try:
@@ -85,10 +335,54 @@ class CharacterDetailPOSTView(MethodView):
             return (
                 jsonify(ResponseMessageSchema(message=str(
                     f"Character ID: {input_data.id} already exists"
-                    )).model_dump()),
+                    ))),
+                HttpStatusCodes.BAD_REQUEST.value,
+            )
+        return jsonify(character), HttpStatusCodes.CREATED.value
+
+
+class CharacterBulkPOSTView(MethodView):
+    """
+    The CharacterBulkView class POST method.
+    """
+
+    def post(self) -> Response:
+        """
+        Create many characters from a JSON array.
+
+        The mode query parameter selects between atomic (all or nothing,
+        the default) and partial (per character errors) creation, and
+        chunk_size sets the number of characters inserted per statement.
+
+        Returns:
+            Response: The response.
+        """
+        character_creator = CharacterCreator(
+            current_app.character_repository
+        )
+        try:
+            mode = BulkModes(request.args.get("mode", BulkModes.ATOMIC.value))
+            options = BulkCreateQuerySchema.model_validate(
+                request.args.to_dict()
+            )
+            if not isinstance(request.json, list):
+                raise ValueError("A JSON array of characters is expected")
+            result = character_creator.create_characters(
+                request.json,
+                chunk_size=options.chunk_size,
+                atomic=mode == BulkModes.ATOMIC,
+            )
+        except Exception as e:
+            return (
+                jsonify(ResponseMessageSchema(message=str(e))),
                 HttpStatusCodes.BAD_REQUEST.value,
             )
-        return jsonify(character.model_dump()), HttpStatusCodes.CREATED.value
+        status_code = (
+            HttpStatusCodes.MULTI_STATUS
+            if result.errors
+            else HttpStatusCodes.CREATED
+        )
+        return jsonify(result), status_code.value
 
 
 class CharacterDetailDELETEView(MethodView):
@@ -106,17 +400,40 @@ class CharacterDetailDELETEView(MethodView):
         Returns:
             Response: The response.
         """
-        character_remover = CharacterRemover(CharacterRepository())
+        character_remover = CharacterRemover(
+            current_app.character_repository
+        )
         removed = character_remover.remove_character(character_id)
         if removed:
-            return jsonify(
-                ResponseMessageSchema(message="Character removed").model_dump()
-            )
+            return jsonify(ResponseMessageSchema(message="Character removed"))
         return (
-            jsonify(
-                ResponseMessageSchema(
-                    message="Character not found"
-                ).model_dump()
-            ),
+            jsonify(ResponseMessageSchema(message="Character not found")),
             HttpStatusCodes.BAD_REQUEST.value,
         )
+
+
+class CharacterBulkDELETEView(MethodView):
+    """
+    The CharacterBulkView class DELETE method.
+    """
+
+    def delete(self) -> Response:
+        """
+        Delete many characters by the comma separated IDs of the ids query
+        parameter.
+
+        Returns:
+            Response: The response.
+        """
+        character_remover = CharacterRemover(
+            current_app.character_repository
+        )
+        try:
+            character_ids = parse_ids(request.args.get("ids", ""))
+        except ValueError as e:
+            return (
+                jsonify(ResponseMessageSchema(message=str(e))),
+                HttpStatusCodes.BAD_REQUEST.value,
+            )
+        result = character_remover.remove_characters(character_ids)
+        return jsonify(result)
@@ -1,14 +1,10 @@
-from typing import List
+import mimetypes
+from typing import Callable
 
-from flask import Response, jsonify, request
+from flask import Response, current_app
 from flask.views import MethodView
-from pydantic import TypeAdapter
 
-from domain.entities.schemas import CharacterPartialSchema, CharacterSchema
 from infra.web.flask import constants as cts
-from infra.web.flask.enums import HttpMethods, HttpStatusCodes
-from infra.web.flask.openapi_builder import OpenAPIBuilder
-from infra.web.flask.schemas import ResponseMessageSchema
 
 
 class OpenApiJsonView(MethodView):
@@ -18,66 +14,48 @@ class OpenApiJsonView(MethodView):
 
     def get(self) -> Response:
         """
-        Get the OpenAPI JSON.
+        Get the OpenAPI JSON, precomputed at startup.
+
+        The response carries a strong ETag and Cache-Control headers,
+        answers If-None-Match with 304 and is served precompressed when the
+        client accepts it.
 
         Returns:
             Response: The response.
         """
-        openapi_builder = OpenAPIBuilder(
-            title=cts.API_NAME, version=cts.API_VERSION
-        )
-        openapi_builder.add_endpoint(
-            path=cts.Paths.CHAR_ALL,
-            input_model=None,
-            response_model_ok=TypeAdapter(List[CharacterPartialSchema]),
-            status_code_ok=HttpStatusCodes.OK.value,
-            response_model_bad=ResponseMessageSchema,
-            status_code_bad=HttpStatusCodes.BAD_REQUEST.value,
-            method=HttpMethods.GET.value,
+        return current_app.openapi_document.response(
+            cts.MimeTypes.JSON, cts.OPENAPI_MAX_AGE
         )
 
-        openapi_builder.add_endpoint(
-            path=cts.Paths.CHAR_ADD,
-            input_model=CharacterSchema,
-            response_model_ok=CharacterSchema,
-            status_code_ok=HttpStatusCodes.CREATED.value,
-            response_model_bad=ResponseMessageSchema,
-            status_code_bad=HttpStatusCodes.BAD_REQUEST.value,
-            method=HttpMethods.POST.value,
-        )
 
-        openapi_builder.add_endpoint(
-            path=cts.Paths.CHAR_GET_DOC,
-            input_model=None,
-            response_model_ok=CharacterSchema,
-            status_code_ok=HttpStatusCodes.OK.value,
-            response_model_bad=ResponseMessageSchema,
-            status_code_bad=HttpStatusCodes.BAD_REQUEST.value,
-            method=HttpMethods.GET.value,
-            path_parameters=[
-                {
-                    "name": "character_id",
-                    "type": "integer",
-                    "description": "Character ID",
-                }
-            ],
-        )
+class SwaggerUIAssetView(MethodView):
+    """
+    The SwaggerUIAssetView class, serving the Swagger UI assets
+    precompressed at startup.
+    """
 
-        openapi_builder.add_endpoint(
-            path=cts.Paths.CHAR_DEL_DOC,
-            input_model=None,
-            response_model_ok=ResponseMessageSchema,
-            status_code_ok=HttpStatusCodes.OK.value,
-            response_model_bad=ResponseMessageSchema,
-            status_code_bad=HttpStatusCodes.BAD_REQUEST.value,
-            method=HttpMethods.DELETE.value,
-            path_parameters=[
-                {
-                    "name": "character_id",
-                    "type": "integer",
-                    "description": "Character ID",
-                }
-            ],
-        )
+    def __init__(self, fallback: Callable):
+        """
+        Constructor method.
 
-        return jsonify(openapi_builder.build())
+        Args:
+            fallback (Callable): The Swagger UI view, serving the index and
+                the assets that are not precompressed.
+        """
+        self._fallback = fallback
+
+    def get(self, path: str | None = None) -> Response:
+        """
+        Get a Swagger UI asset.
+
+        Args:
+            path (str | None): The path of the asset, None for the index.
+
+        Returns:
+            Response: The response.
+        """
+        asset = current_app.swagger_ui_assets.get(path)
+        if asset is None:
+            return self._fallback(path)
+        mimetype = mimetypes.guess_type(path)[0] or cts.MimeTypes.JSON
+        return asset.response(mimetype, cts.STATIC_MAX_AGE)
@@ -0,0 +1,22 @@
+from flask import Response
+from flask.views import MethodView
+
+from infra.metrics import constants as metrics_cts
+from infra.metrics.registry import REGISTRY
+
+
+class MetricsView(MethodView):
+    """
+    The MetricsView class.
+    """
+
+    def get(self) -> Response:
+        """
+        Get the metrics of this process in the Prometheus text format.
+
+        Returns:
+            Response: The response.
+        """
+        return Response(
+            REGISTRY.render(), content_type=metrics_cts.CONTENT_TYPE
+        )
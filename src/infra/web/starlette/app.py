@@ -0,0 +1,81 @@
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+import uvicorn
+from starlette.applications import Starlette
+
+import settings
+from domain.repositories.character_repository import (
+    AsyncCharacterRepositoryInterface,
+)
+from infra.repositories.sql.async_character_repository import (
+    AsyncCharacterRepository,
+)
+from infra.repositories.sql.base import AsyncDatabaseInitializer
+from infra.web.flask.openapi_spec import OpenAPIDocument, build_openapi_spec
+from infra.web.starlette.routes import ROUTES
+
+
+class CharacterCRUDASGIApp(Starlette):
+    """
+    The asynchronous (ASGI) counterpart of CharacterCRUDApp, serving the
+    same routes and OpenAPI document.
+    """
+
+    def __init__(
+        self,
+        character_repository: AsyncCharacterRepositoryInterface | None = None,
+        **kwargs,
+    ):
+        """
+        The constructor method
+
+        Args:
+            character_repository (AsyncCharacterRepositoryInterface | None):
+                The repository shared by every request. Defaults to an
+                asynchronous SQL repository whose engine lives as long as
+                the app.
+        """
+        self._host_url = settings.WebServerSettings.WEB_SERVER_HOST
+        self._port = settings.WebServerSettings.WEB_SERVER_PORT
+        self._db_initializer = None
+        if character_repository is None:
+            self._db_initializer = AsyncDatabaseInitializer(
+                settings.DatabaseSettings.CONNECTION_STRING
+            )
+            character_repository = AsyncCharacterRepository(
+                self._db_initializer
+            )
+        self.character_repository = character_repository
+        self.openapi_document = OpenAPIDocument(build_openapi_spec())
+        super().__init__(
+            debug=settings.DEBUG_MODE,
+            routes=ROUTES,
+            lifespan=self._lifespan,
+            **kwargs,
+        )
+
+    @asynccontextmanager
+    async def _lifespan(self, app: Starlette) -> AsyncIterator[None]:
+        """
+        Create the schema on startup and dispose the engine on shutdown.
+
+        Args:
+            app (Starlette): The app.
+        """
+        if self._db_initializer is not None:
+            if settings.DatabaseSettings.CREATE_SCHEMA_ON_STARTUP:
+                await self._db_initializer.create_schema()
+        yield
+        if self._db_initializer is not None:
+            await self._db_initializer.dispose()
+
+    def run(self, **kwargs):
+        """
+        Start the app with uvicorn
+        """
+        if self._host_url:
+            kwargs.setdefault("host", self._host_url)
+        if self._port:
+            kwargs.setdefault("port", int(self._port))
+        uvicorn.run(self, **kwargs)
@@ -0,0 +1,26 @@
+class Paths:
+    INDEX: str = "/"
+    CHAR_ALL: str = "/character/getAll"
+    CHAR_ADD: str = "/character/add"
+    CHAR_BULK: str = "/character/bulk"
+    CHAR_GET: str = "/character/get/{character_id:int}"
+    CHAR_GET_MANY: str = "/character/get"
+    CHAR_SEARCH: str = "/character/search"
+    CHAR_STATS: str = "/character/stats"
+    CHAR_DEL: str = "/character/delete/{character_id:int}"
+    CHAR_DEL_MANY: str = "/character/delete"
+    OPENAPI_JSON: str = "/swagger.json"
+
+
+class ViewNames:
+    INDEX: str = "index"
+    CHAR_LIST: str = "character-list"
+    CHAR_POST: str = "character-detail-post"
+    CHAR_BULK: str = "character-bulk-post"
+    CHAR_GET: str = "character-detail-get"
+    CHAR_GET_MANY: str = "character-multi-get"
+    CHAR_SEARCH: str = "character-search"
+    CHAR_STATS: str = "character-stats"
+    CHAR_DEL: str = "character-detail-delete"
+    CHAR_DEL_MANY: str = "character-bulk-delete"
+    OPENAPI_JSON: str = "openapi-json"
@@ -0,0 +1,42 @@
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+
+from infra.web.flask.constants import INDEX_TEXT
+from infra.web.starlette.constants import Paths
+from infra.web.starlette.constants import ViewNames as names
+from infra.web.starlette.views.characters_views import (
+    CharacterBulkDELETEView,
+    CharacterBulkPOSTView,
+    CharacterDetailDELETEView,
+    CharacterDetailGETView,
+    CharacterDetailPOSTView,
+    CharacterListView,
+    CharacterMultiGETView,
+    CharacterSearchView,
+    CharacterStatsView,
+)
+from infra.web.starlette.views.doc_views import OpenApiJsonView
+
+
+async def index(request: Request) -> PlainTextResponse:
+    return PlainTextResponse(INDEX_TEXT)
+
+
+ROUTES = [
+    Route(Paths.INDEX, index, name=names.INDEX),
+    Route(Paths.CHAR_ALL, CharacterListView, name=names.CHAR_LIST),
+    Route(Paths.CHAR_ADD, CharacterDetailPOSTView, name=names.CHAR_POST),
+    Route(Paths.CHAR_BULK, CharacterBulkPOSTView, name=names.CHAR_BULK),
+    Route(Paths.CHAR_GET, CharacterDetailGETView, name=names.CHAR_GET),
+    Route(
+        Paths.CHAR_GET_MANY, CharacterMultiGETView, name=names.CHAR_GET_MANY
+    ),
+    Route(Paths.CHAR_SEARCH, CharacterSearchView, name=names.CHAR_SEARCH),
+    Route(Paths.CHAR_STATS, CharacterStatsView, name=names.CHAR_STATS),
+    Route(Paths.CHAR_DEL, CharacterDetailDELETEView, name=names.CHAR_DEL),
+    Route(
+        Paths.CHAR_DEL_MANY, CharacterBulkDELETEView, name=names.CHAR_DEL_MANY
+    ),
+    Route(Paths.OPENAPI_JSON, OpenApiJsonView, name=names.OPENAPI_JSON),
+]
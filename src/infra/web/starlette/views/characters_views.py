@@ -0,0 +1,394 @@
+from typing import Any, AsyncIterator, Dict
+
+from starlette.endpoints import HTTPEndpoint
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response, StreamingResponse
+
+from application.character_creator import CharacterCreator
+from application.character_inspector import CharacterInspector
+from application.character_remover import CharacterRemover
+from domain.entities.schemas import (
+    MAX_PAGE_SIZE,
+    BulkCreateQuerySchema,
+    CharacterPartialSchema,
+    CharacterQuerySchema,
+    CharacterSchema,
+    CharacterSearchSchema,
+    CharacterStatsQuerySchema,
+)
+from infra.web.flask.constants import MimeTypes
+from infra.web.flask.enums import BulkModes, HttpStatusCodes
+from infra.web.flask.schemas import ResponseMessageSchema
+
+
+def error_response(message: str) -> JSONResponse:
+    """
+    Build a 400 response with a message.
+
+    Args:
+        message (str): The error message.
+
+    Returns:
+        JSONResponse: The response.
+    """
+    return JSONResponse(
+        ResponseMessageSchema(message=message).model_dump(),
+        status_code=HttpStatusCodes.BAD_REQUEST.value,
+    )
+
+
+class CharacterListView(HTTPEndpoint):
+    """
+    The CharacterListView class.
+    """
+
+    async def get(self, request: Request) -> Response:
+        """
+        Get characters, paginated with an after_id cursor, projected with
+        fields and filtered by name, eye_color and birth_year range. The
+        next page, if any, is linked in the Link header.
+
+        With stream=1 or an Accept: application/x-ndjson header the
+        characters are streamed in a chunked response instead.
+
+        Args:
+            request (Request): The request.
+
+        Returns:
+            Response: The response.
+        """
+        character_inspector = CharacterInspector(
+            request.app.character_repository
+        )
+        try:
+            query = CharacterQuerySchema.model_validate(
+                dict(request.query_params)
+            )
+            ndjson = MimeTypes.NDJSON in request.headers.get("accept", "")
+            if ndjson or request.query_params.get("stream") == "1":
+                return self._stream(character_inspector, query, ndjson)
+            characters = await character_inspector.alist_characters(query)
+        except Exception as e:
+            return error_response(str(e))
+        response = JSONResponse(
+            [c.model_dump(exclude_unset=True) for c in characters]
+        )
+        next_after_id = query.next_after_id(characters)
+        if next_after_id is not None:
+            next_url = request.url.include_query_params(after_id=next_after_id)
+            response.headers["Link"] = f'<{next_url}>; rel="next"'
+        return response
+
+    @staticmethod
+    def _stream(
+        character_inspector: CharacterInspector,
+        query: CharacterQuerySchema,
+        ndjson: bool,
+    ) -> StreamingResponse:
+        """
+        Stream characters as NDJSON or as a chunked JSON array, serialising
+        each one straight to bytes. Unless a limit is given, every
+        character is streamed.
+
+        Args:
+            character_inspector (CharacterInspector): The inspector to read
+                characters from.
+            query (CharacterQuerySchema): The query options.
+            ndjson (bool): Whether to stream NDJSON instead of a JSON array.
+
+        Returns:
+            StreamingResponse: The streamed response.
+        """
+        update: Dict[str, Any] = {}
+        if query.fields is None:
+            update["fields"] = list(CharacterPartialSchema.model_fields)
+        if "limit" not in query.model_fields_set:
+            update["limit"] = None
+        query = query.model_copy(update=update)
+        characters = character_inspector.aiter_characters(query)
+        serializer = CharacterSchema.__pydantic_serializer__
+
+        async def generate_ndjson() -> AsyncIterator[bytes]:
+            async for character in characters:
+                yield serializer.to_json(character, exclude_unset=True) + b"\n"
+
+        async def generate_json_array() -> AsyncIterator[bytes]:
+            separator = b"["
+            async for character in characters:
+                yield separator + serializer.to_json(
+                    character, exclude_unset=True
+                )
+                separator = b","
+            yield b"[]" if separator == b"[" else b"]"
+
+        if ndjson:
+            return StreamingResponse(
+                generate_ndjson(), media_type=MimeTypes.NDJSON
+            )
+        return StreamingResponse(
+            generate_json_array(), media_type=MimeTypes.JSON
+        )
+
+
+class CharacterDetailGETView(HTTPEndpoint):
+    """
+    The CharacterDetailView class GET method.
+    """
+
+    async def get(self, request: Request) -> Response:
+        """
+        Get a character by its ID.
+
+        Args:
+            request (Request): The request.
+
+        Returns:
+            Response: The response.
+        """
+        character_inspector = CharacterInspector(
+            request.app.character_repository
+        )
+        try:
+            character = await character_inspector.aget_character(
+                request.path_params["character_id"]
+            )
+        except Exception as e:
+            return error_response(str(e))
+        return JSONResponse(character.model_dump())
+
+
+class CharacterMultiGETView(HTTPEndpoint):
+    """
+    The CharacterMultiGETView class GET method.
+    """
+
+    async def get(self, request: Request) -> Response:
+        """
+        Get many characters by the comma separated IDs of the ids query
+        parameter, with a single query. The characters are returned in the
+        order of their IDs and the IDs not found are reported.
+
+        Args:
+            request (Request): The request.
+
+        Returns:
+            Response: The response.
+        """
+        character_inspector = CharacterInspector(
+            request.app.character_repository
+        )
+        try:
+            character_ids = [
+                int(character_id)
+                for character_id in request.query_params.get("ids", "").split(",")
+                if character_id.strip()
+            ]
+            if not character_ids:
+                raise ValueError("The ids query parameter is required")
+            if len(character_ids) > MAX_PAGE_SIZE:
+                raise ValueError(
+                    f"At most {MAX_PAGE_SIZE} IDs can be requested at once"
+                )
+            result = await character_inspector.aget_characters_by_ids(
+                character_ids
+            )
+        except ValueError as e:
+            return error_response(str(e))
+        return JSONResponse(result.model_dump())
+
+
+class CharacterSearchView(HTTPEndpoint):
+    """
+    The CharacterSearchView class GET method.
+    """
+
+    async def get(self, request: Request) -> Response:
+        """
+        Search characters by name with the q query parameter, paginated
+        with limit and offset, best match first. The next page, if any, is
+        linked in the Link header.
+
+        Args:
+            request (Request): The request.
+
+        Returns:
+            Response: The response.
+        """
+        character_inspector = CharacterInspector(
+            request.app.character_repository
+        )
+        try:
+            search = CharacterSearchSchema.model_validate(
+                dict(request.query_params)
+            )
+            characters = await character_inspector.asearch_characters(search)
+        except Exception as e:
+            return error_response(str(e))
+        response = JSONResponse([c.model_dump() for c in characters])
+        next_offset = search.next_offset(characters)
+        if next_offset is not None:
+            next_url = request.url.include_query_params(offset=next_offset)
+            response.headers["Link"] = f'<{next_url}>; rel="next"'
+        return response
+
+
+class CharacterStatsView(HTTPEndpoint):
+    """
+    The CharacterStatsView class GET method.
+    """
+
+    async def get(self, request: Request) -> Response:
+        """
+        Get the statistics of the characters: the counts per color, the
+        mean and percentiles of height, mass and birth year, and a
+        histogram of the birth years in buckets of bucket_size years.
+
+        Args:
+            request (Request): The request.
+
+        Returns:
+            Response: The response.
+        """
+        character_inspector = CharacterInspector(
+            request.app.character_repository
+        )
+        try:
+            query = CharacterStatsQuerySchema.model_validate(
+                dict(request.query_params)
+            )
+            stats = await character_inspector.aget_character_stats(query)
+        except Exception as e:
+            return error_response(str(e))
+        return JSONResponse(stats.model_dump())
+
+
+class CharacterDetailPOSTView(HTTPEndpoint):
+    """
+    The CharacterDetailView class POST method.
+    """
+
+    async def post(self, request: Request) -> Response:
+        """
+        Create a new character.
+
+        Args:
+            request (Request): The request.
+
+        Returns:
+            Response: The response.
+        """
+        character_creator = CharacterCreator(request.app.character_repository)
+        try:
+            input_data = CharacterSchema.model_validate_json(
+                await request.body()
+            )
+        except Exception as e:
+            return error_response(str(e))
+        try:
+            character = await character_creator.acreate_character(input_data)
+        except Exception:
+            return error_response(
+                f"Character ID: {input_data.id} already exists"
+            )
+        return JSONResponse(
+            character.model_dump(), status_code=HttpStatusCodes.CREATED.value
+        )
+
+
+class CharacterBulkPOSTView(HTTPEndpoint):
+    """
+    The CharacterBulkView class POST method.
+    """
+
+    async def post(self, request: Request) -> Response:
+        """
+        Create many characters from a JSON array, in atomic (the default)
+        or partial mode.
+
+        Args:
+            request (Request): The request.
+
+        Returns:
+            Response: The response.
+        """
+        character_creator = CharacterCreator(request.app.character_repository)
+        try:
+            mode = BulkModes(
+                request.query_params.get("mode", BulkModes.ATOMIC.value)
+            )
+            options = BulkCreateQuerySchema.model_validate(
+                dict(request.query_params)
+            )
+            data = await request.json()
+            if not isinstance(data, list):
+                raise ValueError("A JSON array of characters is expected")
+            result = await character_creator.acreate_characters(
+                data,
+                chunk_size=options.chunk_size,
+                atomic=mode == BulkModes.ATOMIC,
+            )
+        except Exception as e:
+            return error_response(str(e))
+        status_code = (
+            HttpStatusCodes.MULTI_STATUS
+            if result.errors
+            else HttpStatusCodes.CREATED
+        )
+        return JSONResponse(result.model_dump(), status_code=status_code.value)
+
+
+class CharacterDetailDELETEView(HTTPEndpoint):
+    """
+    The CharacterDetailView class DELETE method.
+    """
+
+    async def delete(self, request: Request) -> Response:
+        """
+        Delete a character by its ID.
+
+        Args:
+            request (Request): The request.
+
+        Returns:
+            Response: The response.
+        """
+        character_remover = CharacterRemover(request.app.character_repository)
+        removed = await character_remover.aremove_character(
+            request.path_params["character_id"]
+        )
+        if removed:
+            return JSONResponse(
+                ResponseMessageSchema(message="Character removed").model_dump()
+            )
+        return error_response("Character not found")
+
+
+class CharacterBulkDELETEView(HTTPEndpoint):
+    """
+    The CharacterBulkView class DELETE method.
+    """
+
+    async def delete(self, request: Request) -> Response:
+        """
+        Delete many characters by the comma separated IDs of the ids query
+        parameter.
+
+        Args:
+            request (Request): The request.
+
+        Returns:
+            Response: The response.
+        """
+        character_remover = CharacterRemover(request.app.character_repository)
+        try:
+            character_ids = [
+                int(character_id)
+                for character_id in request.query_params.get("ids", "").split(",")
+                if character_id.strip()
+            ]
+            if not character_ids:
+                raise ValueError("The ids query parameter is required")
+        except ValueError as e:
+            return error_response(str(e))
+        result = await character_remover.aremove_characters(character_ids)
+        return JSONResponse(result.model_dump())
@@ -0,0 +1,43 @@
+from starlette.endpoints import HTTPEndpoint
+from starlette.requests import Request
+from starlette.responses import Response
+from werkzeug.http import parse_accept_header, parse_etags
+
+from infra.web.flask import constants as cts
+from infra.web.flask.enums import HttpStatusCodes
+
+
+class OpenApiJsonView(HTTPEndpoint):
+    """
+    The OpenApiJsonView class.
+    """
+
+    async def get(self, request: Request) -> Response:
+        """
+        Get the OpenAPI JSON, precomputed at startup, with a strong ETag,
+        Cache-Control headers, 304 answers to If-None-Match and
+        precompressed variants.
+
+        Args:
+            request (Request): The request.
+
+        Returns:
+            Response: The response.
+        """
+        document = request.app.openapi_document
+        encoding = document.negotiate(
+            parse_accept_header(request.headers.get("accept-encoding"))
+        )
+        body, etag = document.variant(encoding)
+        headers = {
+            "Cache-Control": f"public, max-age={cts.OPENAPI_MAX_AGE}",
+            "Vary": "Accept-Encoding",
+            "ETag": f'"{etag}"',
+        }
+        if parse_etags(request.headers.get("if-none-match")).contains(etag):
+            return Response(
+                status_code=HttpStatusCodes.NOT_MODIFIED.value, headers=headers
+            )
+        if encoding is not None:
+            headers["Content-Encoding"] = encoding
+        return Response(body, media_type=cts.MimeTypes.JSON, headers=headers)
@@ -7,8 +7,83 @@ ENV = os.getenv("ENV", "dev")
 class WebServerSettings:
     WEB_SERVER_HOST = os.getenv("WEB_SERVER_HOST")
     WEB_SERVER_PORT = os.getenv("WEB_SERVER_PORT")
+    WORKERS = int(os.getenv("WEB_SERVER_WORKERS", str(os.cpu_count() or 1)))
+    THREADS = int(os.getenv("WEB_SERVER_THREADS", "4"))
+    PRELOAD_APP = os.getenv("WEB_SERVER_PRELOAD_APP", "True") == "True"
+    TIMEOUT = int(os.getenv("WEB_SERVER_TIMEOUT", "30"))
+    GRACEFUL_TIMEOUT = int(os.getenv("WEB_SERVER_GRACEFUL_TIMEOUT", "30"))
+    KEEPALIVE = int(os.getenv("WEB_SERVER_KEEPALIVE", "5"))
+    MAX_REQUESTS = int(os.getenv("WEB_SERVER_MAX_REQUESTS", "0"))
+    MAX_REQUESTS_JITTER = int(os.getenv("WEB_SERVER_MAX_REQUESTS_JITTER", "0"))
 
 
 class DatabaseSettings:
     DRIVER = os.getenv("DB_DRIVER", "sqlite")
     CONNECTION_STRING = os.getenv("DB_CONNECTION_STRING")
+    POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+    MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+    POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+    POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "True") == "True"
+    STREAM_BATCH_SIZE = int(os.getenv("DB_STREAM_BATCH_SIZE", "1000"))
+    BULK_CHUNK_SIZE = int(os.getenv("DB_BULK_CHUNK_SIZE", "500"))
+    CREATE_SCHEMA_ON_STARTUP = (
+        os.getenv("DB_CREATE_SCHEMA_ON_STARTUP", "False") == "True"
+    )
+    UNIQUE_CHARACTER_NAMES = (
+        os.getenv("DB_UNIQUE_CHARACTER_NAMES", "False") == "True"
+    )
+    REPLICA_CONNECTION_STRINGS = [
+        url.strip()
+        for url in os.getenv("DB_REPLICA_CONNECTION_STRINGS", "").split(",")
+        if url.strip()
+    ]
+    REPLICA_SELECTION = os.getenv("DB_REPLICA_SELECTION", "round_robin")
+    READ_YOUR_WRITES_SECONDS = float(
+        os.getenv("DB_READ_YOUR_WRITES_SECONDS", "5")
+    )
+    SINGLE_FLIGHT = os.getenv("DB_SINGLE_FLIGHT", "True") == "True"
+    SINGLE_FLIGHT_TIMEOUT_SECONDS = float(
+        os.getenv("DB_SINGLE_FLIGHT_TIMEOUT_SECONDS", "5")
+    )
+
+
+class SQLiteSettings:
+    JOURNAL_MODE = os.getenv("SQLITE_JOURNAL_MODE", "WAL")
+    SYNCHRONOUS = os.getenv("SQLITE_SYNCHRONOUS", "NORMAL")
+    MMAP_SIZE = int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)))
+    CACHE_SIZE = int(os.getenv("SQLITE_CACHE_SIZE", "-64000"))
+    BUSY_TIMEOUT_MS = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+    WRITE_QUEUE = os.getenv("SQLITE_WRITE_QUEUE", "True") == "True"
+    WRITE_BATCH_SIZE = int(os.getenv("SQLITE_WRITE_BATCH_SIZE", "64"))
+
+
+class CacheSettings:
+    ENABLED = os.getenv("CACHE_ENABLED", "False") == "True"
+    MAX_SIZE = int(os.getenv("CACHE_MAX_SIZE", "1024"))
+    TTL_SECONDS = float(os.getenv("CACHE_TTL_SECONDS", "30"))
+    SHARED_BACKEND = os.getenv("CACHE_SHARED_BACKEND", "")
+
+
+class SearchSettings:
+    INDEX = os.getenv("SEARCH_INDEX", "False") == "True"
+
+
+class CompressionSettings:
+    ENABLED = os.getenv("COMPRESSION_ENABLED", "True") == "True"
+    MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", "1024"))
+    LEVEL = int(os.getenv("COMPRESSION_LEVEL", "6"))
+    BROTLI_QUALITY = int(os.getenv("COMPRESSION_BROTLI_QUALITY", "4"))
+
+
+class MetricsSettings:
+    ENABLED = os.getenv("METRICS_ENABLED", "True") == "True"
+
+
+class LoggingSettings:
+    LEVEL = os.getenv("LOG_LEVEL", "INFO")
+    FORMAT = os.getenv("LOG_FORMAT", "json")
+    ASYNC = os.getenv("LOG_ASYNC", "True") == "True"
+    QUEUE_SIZE = int(os.getenv("LOG_QUEUE_SIZE", "10000"))
+    SQL_ECHO = os.getenv("LOG_SQL_ECHO", "False") == "True"
+    SLOW_QUERY_MS = float(os.getenv("LOG_SLOW_QUERY_MS", "200"))
+    SLOW_QUERY_SAMPLE_RATE = float(os.getenv("LOG_SLOW_QUERY_SAMPLE_RATE", "1.0"))
@@ -0,0 +1,14 @@
+from infra.log.config import configure_logging
+from infra.web.flask.server import CharacterCRUDServer
+
+
+def main():
+    """
+    The main function
+    """
+    configure_logging()
+    CharacterCRUDServer().run()
+
+
+if __name__ == "__main__":
+    main()
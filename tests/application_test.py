@@ -5,9 +5,16 @@ from faker import Faker
 
 from application.character_creator import CharacterCreator
 from application.character_inspector import CharacterInspector
+from application.character_loader import CharacterLoader
 from application.character_remover import CharacterRemover
 from domain.entities.exceptions import CharacterNotFoundError
-from domain.entities.schemas import CharacterSchema
+from domain.entities.exceptions import UnknownFieldError
+from domain.entities.schemas import (
+    BulkCreateErrorSchema,
+    BulkCreateResultSchema,
+    CharacterQuerySchema,
+    CharacterSchema,
+)
 
 fake = Faker()
 
@@ -22,8 +29,8 @@ def character_data():
     return CharacterSchema(
         id=None,
         name=fake.first_name(),
-        height=fake.random_number(digits=3),
-        mass=fake.random_number(digits=2),
+        height=fake.random_number(digits=3) + 1,
+        mass=fake.random_number(digits=2) + 1,
         hair_color=fake.color_name(),
         skin_color=fake.color_name(),
         eye_color=fake.color_name(),
@@ -43,6 +50,41 @@ def test_create_character(mock_repository, character_data):
 
 
 
+def test_create_characters_atomic_rejects_invalid_payload(
+    mock_repository, character_data
+):
+    creator = CharacterCreator(mock_repository)
+    invalid = character_data.model_dump() | {"height": -1}
+
+    with pytest.raises(Exception):
+        creator.create_characters([character_data.model_dump(), invalid])
+
+    mock_repository.create_characters.assert_not_called()
+
+
+def test_create_characters_partial_reports_errors_by_index(
+    mock_repository, character_data
+):
+    creator = CharacterCreator(mock_repository)
+    invalid = character_data.model_dump() | {"height": -1}
+    mock_repository.create_characters.return_value = BulkCreateResultSchema(
+        created=[character_data],
+        errors=[BulkCreateErrorSchema(index=1, message="duplicated")],
+    )
+
+    result = creator.create_characters(
+        [invalid, character_data.model_dump(), character_data.model_dump()],
+        chunk_size=10,
+        atomic=False,
+    )
+
+    mock_repository.create_characters.assert_called_once_with(
+        [character_data, character_data], chunk_size=10, atomic=False
+    )
+    assert result.created == [character_data]
+    assert [error.index for error in result.errors] == [0, 2]
+
+
 def test_list_characters(mock_repository, character_data):
     inspector = CharacterInspector(mock_repository)
     mock_repository.get_characters.return_value = [character_data]
@@ -54,6 +96,33 @@ def test_list_characters(mock_repository, character_data):
     assert result[0] == character_data
 
 
+def test_list_characters_with_query(mock_repository, character_data):
+    inspector = CharacterInspector(mock_repository)
+    mock_repository.get_characters.return_value = [character_data]
+    query = CharacterQuerySchema(limit=1, fields="name,eye_color")
+
+    result = inspector.list_characters(query)
+
+    mock_repository.get_characters.assert_called_once_with(query)
+    assert query.fields == ["name", "eye_color"]
+    assert query.next_after_id(result) == character_data.id
+
+
+def test_iter_characters(mock_repository, character_data):
+    inspector = CharacterInspector(mock_repository)
+    mock_repository.iter_characters.return_value = iter([character_data])
+
+    result = list(inspector.iter_characters())
+
+    mock_repository.iter_characters.assert_called_once_with(None)
+    assert result == [character_data]
+
+
+def test_query_rejects_unknown_fields():
+    with pytest.raises(UnknownFieldError):
+        CharacterQuerySchema(fields="name,hair_color")
+
+
 def test_get_character_found(mock_repository, character_data):
     inspector = CharacterInspector(mock_repository)
     mock_repository.get_character.return_value = character_data
@@ -94,3 +163,47 @@ def test_remove_character_not_found(mock_repository):
 
     mock_repository.delete_character.assert_called_once_with(999)
     assert result is False
+
+
+def test_remove_characters(mock_repository):
+    remover = CharacterRemover(mock_repository)
+    mock_repository.delete_characters.return_value = [3, 1]
+
+    result = remover.remove_characters([1, 2, 3, 1])
+
+    mock_repository.delete_characters.assert_called_once_with([1, 2, 3])
+    assert result.deleted == [1, 3]
+    assert result.not_found == [2]
+
+
+def test_get_characters_by_ids_reports_not_found(
+    mock_repository, character_data
+):
+    inspector = CharacterInspector(mock_repository)
+    found = character_data.model_copy(update={"id": 2})
+    mock_repository.get_characters_by_ids.return_value = [found]
+
+    result = inspector.get_characters_by_ids([2, 5, 2])
+
+    mock_repository.get_characters_by_ids.assert_called_once_with([2, 5, 2])
+    assert result.characters == [found]
+    assert result.not_found == [5]
+
+
+def test_character_loader_coalesces_lookups(mock_repository, character_data):
+    loader = CharacterLoader(mock_repository)
+    first = character_data.model_copy(update={"id": 1})
+    third = character_data.model_copy(update={"id": 3})
+    mock_repository.get_characters_by_ids.return_value = [third, first]
+
+    pending = loader.load_many([1, 2, 3])
+
+    mock_repository.get_characters_by_ids.assert_not_called()
+    assert [p.get() for p in pending] == [first, None, third]
+    assert loader.get(1) == first
+    mock_repository.get_characters_by_ids.assert_called_once_with([1, 2, 3])
+
+    mock_repository.get_characters_by_ids.return_value = []
+    loader.clear(1)
+    assert loader.get(1) is None
+    mock_repository.get_characters_by_ids.assert_called_with([1])
@@ -0,0 +1,166 @@
+import asyncio
+
+import pytest
+from faker import Faker
+
+from application.character_creator import CharacterCreator
+from application.character_inspector import CharacterInspector
+from application.character_remover import CharacterRemover
+from domain.entities.exceptions import CharacterNotFoundError
+from domain.entities.schemas import (
+    CharacterQuerySchema,
+    CharacterSchema,
+    CharacterSearchSchema,
+    CharacterStatsQuerySchema,
+)
+from infra.repositories.sql.async_character_repository import (
+    AsyncCharacterRepository,
+)
+from infra.repositories.sql.base import AsyncDatabaseInitializer
+
+fake = Faker()
+
+
+@pytest.fixture
+def character_data():
+    return CharacterSchema(
+        id=None,
+        name=fake.first_name(),
+        height=fake.random_number(digits=3) + 1,
+        mass=fake.random_number(digits=2) + 1,
+        hair_color=fake.color_name(),
+        skin_color=fake.color_name(),
+        eye_color=fake.color_name(),
+        birth_year=fake.random_number(digits=2),
+    )
+
+
+def test_async_url():
+    assert (
+        AsyncDatabaseInitializer.async_url("sqlite:///data/characters.db")
+        == "sqlite+aiosqlite:///data/characters.db"
+    )
+    assert (
+        AsyncDatabaseInitializer.async_url("sqlite+aiosqlite://")
+        == "sqlite+aiosqlite://"
+    )
+
+
+def test_application_services_on_async_repository(tmp_path, character_data):
+    async def scenario():
+        db_initializer = AsyncDatabaseInitializer(
+            f"sqlite:///{tmp_path}/characters.db"
+        )
+        await db_initializer.create_schema()
+        repository = AsyncCharacterRepository(db_initializer)
+        creator = CharacterCreator(repository)
+        inspector = CharacterInspector(repository)
+        remover = CharacterRemover(repository)
+        try:
+            created = await creator.acreate_character(character_data)
+            bulk = await creator.acreate_characters(
+                [character_data.model_dump(), created.model_dump()],
+                atomic=False,
+            )
+            listed = await inspector.alist_characters(
+                CharacterQuerySchema(limit=1, fields="name")
+            )
+            streamed = [c async for c in inspector.aiter_characters()]
+            found = await inspector.aget_character(created.id)
+            removed = await remover.aremove_characters(
+                [created.id, bulk.created[0].id, 999]
+            )
+            with pytest.raises(CharacterNotFoundError):
+                await inspector.aget_character(created.id)
+        finally:
+            await db_initializer.dispose()
+        return created, bulk, listed, streamed, found, removed
+
+    created, bulk, listed, streamed, found, removed = asyncio.run(scenario())
+
+    assert found == created
+    assert [error.index for error in bulk.errors] == [1]
+    assert listed[0].model_dump(exclude_unset=True) == {
+        "id": created.id,
+        "name": created.name,
+    }
+    assert streamed == [created] + bulk.created
+    assert removed.not_found == [999]
+
+
+def test_get_characters_by_ids_on_async_repository(tmp_path, character_data):
+    async def scenario():
+        db_initializer = AsyncDatabaseInitializer(
+            f"sqlite:///{tmp_path}/characters.db"
+        )
+        await db_initializer.create_schema()
+        repository = AsyncCharacterRepository(db_initializer)
+        inspector = CharacterInspector(repository)
+        try:
+            first = await repository.create_character(character_data)
+            second = await repository.create_character(character_data)
+            result = await inspector.aget_characters_by_ids(
+                [second.id, 999, first.id]
+            )
+            return first, second, result
+        finally:
+            await db_initializer.dispose()
+
+    first, second, result = asyncio.run(scenario())
+
+    assert result.characters == [second, first]
+    assert result.not_found == [999]
+
+
+def test_search_characters_on_async_repository(tmp_path, character_data):
+    async def scenario():
+        db_initializer = AsyncDatabaseInitializer(
+            f"sqlite:///{tmp_path}/characters.db"
+        )
+        await db_initializer.create_schema()
+        repository = AsyncCharacterRepository(db_initializer)
+        inspector = CharacterInspector(repository)
+        try:
+            for name in ["Luke Skywalker", "Anakin Skywalker", "Leia"]:
+                await repository.create_character(
+                    character_data.model_copy(update={"name": name})
+                )
+            return await inspector.asearch_characters(
+                CharacterSearchSchema(q="skywalkr")
+            )
+        finally:
+            await db_initializer.dispose()
+
+    characters = asyncio.run(scenario())
+
+    assert [c.name for c in characters] == [
+        "Luke Skywalker",
+        "Anakin Skywalker",
+    ]
+
+
+def test_character_stats_on_async_repository(tmp_path, character_data):
+    async def scenario():
+        db_initializer = AsyncDatabaseInitializer(
+            f"sqlite:///{tmp_path}/characters.db"
+        )
+        await db_initializer.create_schema()
+        repository = AsyncCharacterRepository(db_initializer)
+        inspector = CharacterInspector(repository)
+        try:
+            for mass in [50, 60, 70]:
+                created = await repository.create_character(
+                    character_data.model_copy(update={"mass": mass})
+                )
+            await repository.delete_character(created.id)
+            return await inspector.aget_character_stats(
+                CharacterStatsQuerySchema()
+            )
+        finally:
+            await db_initializer.dispose()
+
+    stats = asyncio.run(scenario())
+
+    assert stats.count == 2
+    assert stats.mass.mean == 55
+    assert stats.mass.percentiles["p50"] == 55
@@ -0,0 +1,136 @@
+from unittest.mock import MagicMock
+
+import pytest
+from faker import Faker
+
+from domain.entities.schemas import CharacterQuerySchema, CharacterSchema
+from infra.repositories.cache.backends import (
+    InMemorySharedCacheBackend,
+    LRUCacheBackend,
+)
+from infra.repositories.cache.character_repository import (
+    CachedCharacterRepository,
+)
+
+fake = Faker()
+
+
+@pytest.fixture
+def mock_repository():
+    return MagicMock()
+
+
+@pytest.fixture
+def character_data():
+    return CharacterSchema(
+        id=1,
+        name=fake.first_name(),
+        height=fake.random_number(digits=3) + 1,
+        mass=fake.random_number(digits=2) + 1,
+        hair_color=fake.color_name(),
+        skin_color=fake.color_name(),
+        eye_color=fake.color_name(),
+        birth_year=fake.random_number(digits=2),
+    )
+
+
+def test_get_character_is_read_through(mock_repository, character_data):
+    repository = CachedCharacterRepository(mock_repository)
+    mock_repository.get_character.return_value = character_data
+
+    assert repository.get_character(1) == character_data
+    assert repository.get_character(1) == character_data
+
+    mock_repository.get_character.assert_called_once_with(1)
+    assert repository.stats == {"hits": 1, "misses": 1, "evictions": 0}
+
+
+def test_writes_invalidate_character_and_lists(mock_repository, character_data):
+    repository = CachedCharacterRepository(mock_repository)
+    mock_repository.get_character.return_value = character_data
+    mock_repository.get_characters.return_value = [character_data]
+    mock_repository.create_character.return_value = character_data
+
+    repository.get_character(1)
+    repository.get_characters(CharacterQuerySchema(limit=10))
+    repository.create_character(character_data)
+    repository.get_character(1)
+    repository.get_characters(CharacterQuerySchema(limit=10))
+    repository.delete_character(1)
+    repository.get_character(1)
+
+    assert mock_repository.get_character.call_count == 3
+    assert mock_repository.get_characters.call_count == 2
+
+
+def test_shared_cache_is_used_across_instances(mock_repository, character_data):
+    shared_cache = InMemorySharedCacheBackend()
+    mock_repository.get_character.return_value = character_data
+    mock_repository.get_characters.return_value = [character_data]
+
+    first = CachedCharacterRepository(mock_repository, shared_cache=shared_cache)
+    second = CachedCharacterRepository(mock_repository, shared_cache=shared_cache)
+    first.get_character(1)
+    first.get_characters()
+
+    assert second.get_character(1) == character_data
+    assert second.get_characters()[0].name == character_data.name
+    mock_repository.get_character.assert_called_once_with(1)
+    mock_repository.get_characters.assert_called_once()
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCacheBackend(max_size=2)
+
+    cache.set("a", 1, ttl=60)
+    cache.set("b", 2, ttl=60)
+    cache.get("a")
+    cache.set("c", 3, ttl=60)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.evictions == 1
+
+
+def test_lru_cache_expires_entries():
+    cache = LRUCacheBackend(max_size=2)
+
+    cache.set("a", 1, ttl=-1)
+
+    assert cache.get("a") is None
+    assert cache.evictions == 1
+
+
+def test_get_characters_by_ids_fetches_only_misses(
+    mock_repository, character_data
+):
+    repository = CachedCharacterRepository(mock_repository)
+    other = character_data.model_copy(update={"id": 2})
+    mock_repository.get_character.return_value = character_data
+    mock_repository.get_characters_by_ids.return_value = [other]
+    repository.get_character(1)
+
+    found = repository.get_characters_by_ids([2, 1, 3])
+
+    mock_repository.get_characters_by_ids.assert_called_once_with([2, 3])
+    assert found == [other, character_data]
+    assert repository.get_character(2) == other
+    assert repository.stats["hits"] == 2
+
+
+def test_get_characters_by_ids_shares_the_shared_cache(
+    mock_repository, character_data
+):
+    shared_cache = InMemorySharedCacheBackend()
+    other = character_data.model_copy(update={"id": 2})
+    mock_repository.get_character.return_value = character_data
+    mock_repository.get_characters_by_ids.return_value = [other]
+    first = CachedCharacterRepository(mock_repository, shared_cache=shared_cache)
+    second = CachedCharacterRepository(mock_repository, shared_cache=shared_cache)
+    first.get_character(1)
+
+    assert second.get_characters_by_ids([1, 2]) == [character_data, other]
+    assert first.get_character(2) == other
+    mock_repository.get_characters_by_ids.assert_called_once_with([2])
+    mock_repository.get_character.assert_called_once_with(1)
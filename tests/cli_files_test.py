@@ -0,0 +1,107 @@
+import io
+import json
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from domain.entities.schemas import CharacterSchema
+from infra.cli import cli
+from infra.cli.enums import FileFormats
+from infra.cli.files import (
+    chunked,
+    detect_format,
+    read_characters,
+    write_characters,
+)
+from infra.repositories.memory.character_repository import (
+    InMemoryCharacterRepository,
+)
+
+
+@pytest.fixture
+def characters():
+    return [
+        CharacterSchema(
+            id=i,
+            name=f"Character {i}",
+            height=170,
+            mass=70,
+            hair_color="blond",
+            skin_color="fair",
+            eye_color="blue",
+            birth_year=i,
+        )
+        for i in range(1, 4)
+    ]
+
+
+@pytest.mark.parametrize("file_format", list(FileFormats))
+def test_write_and_read_characters_round_trip(characters, file_format):
+    file = io.StringIO()
+
+    written = write_characters(file, file_format, iter(characters))
+    file.seek(0)
+    rows = list(read_characters(file, file_format))
+
+    assert written == len(characters)
+    assert [number for number, _ in rows] == [1, 2, 3]
+    assert [
+        CharacterSchema.model_validate(row) for _, row in rows
+    ] == characters
+
+
+def test_read_characters_reports_malformed_lines():
+    file = io.StringIO('{"name": "Luke"}\n\n{"name": \n{"name": "Leia"}\n')
+    errors = []
+
+    rows = list(
+        read_characters(
+            file,
+            FileFormats.JSONL,
+            on_error=lambda line, message: errors.append(line),
+        )
+    )
+
+    assert rows == [(1, {"name": "Luke"}), (4, {"name": "Leia"})]
+    assert errors == [3]
+
+
+def test_read_characters_raises_on_malformed_lines_without_callback():
+    with pytest.raises(json.JSONDecodeError):
+        list(read_characters(io.StringIO("{\n"), FileFormats.JSONL))
+
+
+def test_detect_format():
+    assert detect_format(Path("characters.CSV")) == FileFormats.CSV
+    assert detect_format(Path("characters.ndjson")) == FileFormats.JSONL
+    with pytest.raises(ValueError):
+        detect_format(Path("characters.txt"))
+
+
+def test_chunked():
+    assert list(chunked(range(5), 2)) == [[0, 1], [2, 3], [4]]
+
+
+def test_import_reports_errors_at_their_file_line(
+    characters, tmp_path, monkeypatch
+):
+    monkeypatch.setattr(
+        cli, "character_repository", lambda: InMemoryCharacterRepository()
+    )
+    path = tmp_path / "characters.jsonl"
+    path.write_text(
+        "{\n"
+        f"{characters[0].model_dump_json()}\n"
+        "\n"
+        '{"name": "Leia"}\n'
+    )
+
+    result = CliRunner().invoke(
+        cli.app, ["import-characters", str(path), "--chunk-size", "1"]
+    )
+
+    assert "Line 1: invalid JSON" in result.output
+    assert "Line 4:" in result.output
+    assert "Line 2:" not in result.output
+    assert "Imported 1 characters (2 failed)" in result.output
@@ -0,0 +1,70 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from sqlalchemy import create_engine, inspect
+
+from infra.cli.cli import character_repository
+from infra.repositories.sql.base import EngineRegistry
+from infra.repositories.sql.character_repository import CharacterRepository
+
+SRC_PATH = Path(__file__).resolve().parent.parent / "src"
+# Cumulative import time of the CLI module, well above typer's own.
+IMPORT_TIME_BUDGET_MS = 300
+DEFERRED_MODULES = ("sqlalchemy", "pydantic", "flask", "application")
+
+
+def import_cli(code: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        env=os.environ | {"PYTHONPATH": str(SRC_PATH)},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def test_cli_cold_start_stays_under_budget():
+    result = import_cli("import infra.cli.cli")
+    cumulative_us = next(
+        int(line.split("|")[1])
+        for line in result.stderr.splitlines()
+        if line.split("|")[-1].strip() == "infra.cli.cli"
+    )
+
+    assert cumulative_us / 1000 < IMPORT_TIME_BUDGET_MS
+
+
+def test_cli_defers_heavy_imports():
+    result = import_cli(
+        "import sys, infra.cli.cli; print(' '.join(sys.modules))"
+    )
+    modules = result.stdout.split()
+
+    assert not [
+        module
+        for module in modules
+        if module.split(".")[0] in DEFERRED_MODULES
+    ]
+
+
+def test_read_only_commands_skip_schema_creation(tmp_path, monkeypatch):
+    url = f"sqlite:///{tmp_path}/characters.db"
+    monkeypatch.setattr(CharacterRepository, "DATABASE_URL", url)
+    monkeypatch.setattr(CharacterRepository, "REPLICA_URLS", [])
+    monkeypatch.setattr(
+        "settings.DatabaseSettings.CREATE_SCHEMA_ON_STARTUP", True
+    )
+
+    try:
+        character_repository(read_only=True)
+        created_by_reader = inspect(create_engine(url)).get_table_names()
+        EngineRegistry.dispose_all()
+        character_repository()
+        created_by_writer = inspect(create_engine(url)).get_table_names()
+    finally:
+        EngineRegistry.dispose_all()
+
+    assert created_by_reader == []
+    assert "characters" in created_by_writer
@@ -0,0 +1,156 @@
+import gzip
+import json
+import zlib
+from unittest.mock import MagicMock
+
+import pytest
+from starlette.testclient import TestClient
+
+from domain.entities.schemas import CharacterSchema
+from infra.repositories.sql.base import EngineRegistry
+from infra.repositories.sql.character_repository import CharacterRepository
+from infra.web.flask.app import CharacterCRUDApp
+from infra.web.flask.middleware import CompressionMiddleware
+from infra.web.starlette.app import CharacterCRUDASGIApp
+
+
+@pytest.fixture
+def repository(tmp_path):
+    repository = CharacterRepository(
+        EngineRegistry.get(f"sqlite:///{tmp_path}/c.db", create_schema=True)
+    )
+    repository.create_characters(
+        [
+            CharacterSchema(
+                name=f"Character {i}",
+                height=170,
+                mass=70,
+                hair_color="blond",
+                skin_color="fair",
+                eye_color="blue",
+                birth_year=i,
+            )
+            for i in range(200)
+        ]
+    )
+    yield repository
+    EngineRegistry.dispose_all()
+
+
+@pytest.fixture
+def client(repository):
+    return CharacterCRUDApp(__name__, character_repository=repository).test_client()
+
+
+def test_large_responses_are_compressed_with_validators(client):
+    plain = client.get("/character/getAll")
+    compressed = client.get("/character/getAll", headers={"Accept-Encoding": "gzip"})
+    revalidated = client.get(
+        "/character/getAll",
+        headers={
+            "Accept-Encoding": "gzip",
+            "If-None-Match": compressed.headers["ETag"],
+        },
+    )
+
+    assert "Content-Encoding" not in plain.headers
+    assert compressed.headers["Content-Encoding"] == "gzip"
+    assert "Accept-Encoding" in compressed.headers["Vary"]
+    assert int(compressed.headers["Content-Length"]) == len(compressed.data)
+    assert len(compressed.data) < len(plain.data) / 5
+    assert gzip.decompress(compressed.data) == plain.data
+    assert compressed.headers["ETag"] == f"W/{plain.headers['ETag']}"
+    assert revalidated.status_code == 304
+
+
+def test_deflate_is_negotiated(client):
+    response = client.get(
+        "/character/getAll?limit=200", headers={"Accept-Encoding": "deflate"}
+    )
+
+    assert response.headers["Content-Encoding"] == "deflate"
+    assert len(json.loads(zlib.decompress(response.data))) == 200
+
+
+def test_small_responses_are_not_compressed(client):
+    response = client.get("/character/get/1", headers={"Accept-Encoding": "gzip"})
+
+    assert "Content-Encoding" not in response.headers
+    assert response.json["name"] == "Character 0"
+
+
+def test_streamed_responses_are_compressed(client):
+    response = client.get(
+        "/character/getAll?stream=1", headers={"Accept-Encoding": "gzip"}
+    )
+
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert "Content-Length" not in response.headers
+    assert len(json.loads(gzip.decompress(response.data))) == 200
+
+
+def test_streamed_responses_are_flushed_incrementally():
+    def app(environ, start_response):
+        start_response("200 OK", [("Content-Type", "application/x-ndjson")])
+        return (b'{"row": %d}\n' % i * 2000 for i in range(5))
+
+    chunks = list(
+        CompressionMiddleware(app)(
+            {"HTTP_ACCEPT_ENCODING": "gzip", "REQUEST_METHOD": "GET"},
+            lambda status, headers, exc_info=None: None,
+        )
+    )
+    decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    # Everything but the final chunk decodes: the stream was flushed as it went.
+    flushed = decompressor.decompress(b"".join(chunks[:-1]))
+    rest = decompressor.decompress(chunks[-1])
+
+    assert len(chunks) > 2
+    assert flushed.count(b"\n") >= 8000
+    assert (flushed + rest).count(b"\n") == 10000
+
+
+def test_swagger_ui_assets_are_precompressed(client):
+    app = client.application
+    asset = app.swagger_ui_assets["swagger-ui-bundle.js"]
+
+    response = client.get(
+        "/docs/swagger-ui-bundle.js", headers={"Accept-Encoding": "gzip, br"}
+    )
+    revalidated = client.get(
+        "/docs/swagger-ui-bundle.js",
+        headers={
+            "Accept-Encoding": "gzip, br",
+            "If-None-Match": response.headers["ETag"],
+        },
+    )
+
+    encoding = response.headers["Content-Encoding"]
+    assert response.data == asset.encodings[encoding]
+    assert response.mimetype == "text/javascript"
+    assert "max-age" in response.headers["Cache-Control"]
+    assert revalidated.status_code == 304
+
+
+@pytest.mark.parametrize(
+    "accept_encoding, encoding",
+    [("gzip;q=0, identity", None), ("deflate;q=0.5, gzip", "gzip"), ("", None)],
+)
+def test_openapi_encoding_honours_q_values(client, accept_encoding, encoding):
+    asgi_client = TestClient(CharacterCRUDASGIApp(MagicMock()))
+    headers = {"Accept-Encoding": accept_encoding}
+
+    responses = [
+        client.get("/swagger.json", headers=headers),
+        asgi_client.get("/swagger.json", headers=headers),
+    ]
+    revalidated = asgi_client.get(
+        "/swagger.json",
+        headers={**headers, "If-None-Match": responses[1].headers["ETag"]},
+    )
+
+    for response in responses:
+        assert response.status_code == 200
+        assert response.headers.get("Content-Encoding") == encoding
+    assert responses[0].headers["ETag"] == responses[1].headers["ETag"]
+    assert revalidated.status_code == 304
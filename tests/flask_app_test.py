@@ -0,0 +1,306 @@
+import gzip
+import json
+
+import pytest
+
+from domain.entities.schemas import DEFAULT_PAGE_SIZE, CharacterSchema
+from infra.repositories.cache.character_repository import (
+    CachedCharacterRepository,
+)
+from infra.repositories.sql.base import EngineRegistry
+from infra.repositories.sql.character_repository import CharacterRepository
+from infra.web.flask.app import CharacterCRUDApp
+
+
+def character(i: int) -> CharacterSchema:
+    return CharacterSchema(
+        name=f"Character {i}",
+        height=170,
+        mass=70,
+        hair_color="blond",
+        skin_color="fair",
+        eye_color="blue",
+        birth_year=i,
+    )
+
+
+@pytest.fixture
+def repository(tmp_path):
+    yield CharacterRepository(
+        EngineRegistry.get(f"sqlite:///{tmp_path}/c.db", create_schema=True)
+    )
+    EngineRegistry.dispose_all()
+
+
+@pytest.fixture
+def client(repository):
+    app = CharacterCRUDApp(__name__, character_repository=repository)
+    return app.test_client()
+
+
+def test_list_links_the_next_page(repository, client):
+    for i in range(3):
+        repository.create_character(character(i))
+
+    first = client.get("/character/getAll?limit=2&fields=id,name")
+    last = client.get("/character/getAll?limit=2&fields=id,name&after_id=2")
+
+    assert [c["id"] for c in first.json] == [1, 2]
+    assert first.json[0] == {"id": 1, "name": "Character 0"}
+    assert 'after_id=2>; rel="next"' in first.headers["Link"]
+    assert "limit=2" in first.headers["Link"]
+    assert [c["id"] for c in last.json] == [3]
+    assert "Link" not in last.headers
+
+
+def test_list_defaults_to_a_page_and_streams_every_character(
+    repository, client
+):
+    count = DEFAULT_PAGE_SIZE + 5
+    repository.create_characters([character(i) for i in range(count)])
+
+    page = client.get("/character/getAll")
+    stream = client.get("/character/getAll?stream=1")
+    limited = client.get("/character/getAll?stream=1&limit=3")
+
+    assert len(page.json) == DEFAULT_PAGE_SIZE
+    assert f'after_id={DEFAULT_PAGE_SIZE}>; rel="next"' in page.headers["Link"]
+    assert len(json.loads(stream.data)) == count
+    assert len(json.loads(limited.data)) == 3
+
+
+@pytest.mark.parametrize(
+    "url, headers, mimetype",
+    [
+        ("/character/getAll?stream=1", {}, "application/json"),
+        (
+            "/character/getAll",
+            {"Accept": "application/x-ndjson"},
+            "application/x-ndjson",
+        ),
+    ],
+)
+def test_list_streams_characters(repository, client, url, headers, mimetype):
+    for i in range(3):
+        repository.create_character(character(i))
+
+    response = client.get(url, headers=headers)
+
+    if mimetype == "application/x-ndjson":
+        rows = [json.loads(line) for line in response.data.splitlines()]
+    else:
+        rows = json.loads(response.data)
+    assert response.mimetype == mimetype
+    assert "Content-Length" not in response.headers
+    assert [row["name"] for row in rows] == [f"Character {i}" for i in range(3)]
+
+
+def test_list_streams_an_empty_json_array(client):
+    response = client.get("/character/getAll?stream=1")
+    ndjson = client.get(
+        "/character/getAll", headers={"Accept": "application/x-ndjson"}
+    )
+
+    assert response.data == b"[]"
+    assert response.mimetype == "application/json"
+    assert ndjson.data == b""
+    assert ndjson.mimetype == "application/x-ndjson"
+
+
+def test_bulk_create_reports_partial_failures_with_207(client):
+    payload = [character(0).model_dump(), {"name": "Invalid"}]
+
+    response = client.post("/character/bulk?mode=partial", json=payload)
+
+    assert response.status_code == 207
+    assert [c["name"] for c in response.json["created"]] == ["Character 0"]
+    assert [e["index"] for e in response.json["errors"]] == [1]
+
+
+def test_bulk_create_rejects_invalid_payloads_in_atomic_mode(repository, client):
+    payload = [character(0).model_dump(), {"name": "Invalid"}]
+
+    response = client.post("/character/bulk", json=payload)
+
+    assert response.status_code == 400
+    assert repository.get_characters() == []
+
+
+def test_bulk_create_returns_201(client):
+    payload = [character(i).model_dump() for i in range(2)]
+
+    response = client.post("/character/bulk", json=payload)
+
+    assert response.status_code == 201
+    assert len(response.json["created"]) == 2
+
+
+@pytest.mark.parametrize("chunk_size", ["-1", "0", "abc", "1001"])
+def test_bulk_create_rejects_invalid_chunk_sizes(repository, client, chunk_size):
+    payload = [character(0).model_dump()]
+
+    response = client.post(f"/character/bulk?chunk_size={chunk_size}", json=payload)
+
+    assert response.status_code == 400
+    assert repository.get_characters() == []
+
+
+def test_openapi_document_is_cached_and_compressed(client):
+    response = client.get("/swagger.json")
+    compressed = client.get("/swagger.json", headers={"Accept-Encoding": "gzip"})
+    revalidated = client.get(
+        "/swagger.json", headers={"If-None-Match": response.headers["ETag"]}
+    )
+
+    assert response.status_code == 200
+    assert "Content-Encoding" not in response.headers
+    assert "max-age" in response.headers["Cache-Control"]
+    assert compressed.headers["Content-Encoding"] == "gzip"
+    assert compressed.headers["Vary"] == "Accept-Encoding"
+    assert compressed.headers["ETag"] != response.headers["ETag"]
+    assert gzip.decompress(compressed.data) == response.data
+    assert revalidated.status_code == 304
+    assert revalidated.data == b""
+
+
+def test_bulk_delete_reports_deleted_and_not_found(repository, client):
+    for i in range(2):
+        repository.create_character(character(i))
+
+    response = client.delete("/character/delete?ids=1,2,3")
+
+    assert response.status_code == 200
+    assert response.json == {"deleted": [1, 2], "not_found": [3]}
+    assert repository.get_characters() == []
+
+
+@pytest.mark.parametrize("ids", ["x", ""])
+def test_bulk_delete_rejects_invalid_ids(client, ids):
+    response = client.delete(f"/character/delete?ids={ids}")
+
+    assert response.status_code == 400
+
+
+def test_character_is_revalidated_with_etag_and_last_modified(
+    repository, client
+):
+    created = repository.create_character(character(0))
+    url = f"/character/get/{created.id}"
+
+    response = client.get(url)
+    by_etag = client.get(url, headers={"If-None-Match": response.headers["ETag"]})
+    by_date = client.get(
+        url, headers={"If-Modified-Since": response.headers["Last-Modified"]}
+    )
+    stale = client.get(url, headers={"If-None-Match": '"other"'})
+
+    assert response.headers["ETag"] == f'"{created.content_hash()}"'
+    assert response.headers["Cache-Control"] == "no-cache"
+    assert by_etag.status_code == 304
+    assert by_etag.data == b""
+    assert by_date.status_code == 304
+    assert stale.status_code == 200
+    assert stale.json == response.json
+
+
+def test_listing_is_revalidated_until_a_write(repository, client):
+    repository.create_character(character(0))
+
+    response = client.get("/character/getAll")
+    etag = response.headers["ETag"]
+    unchanged = client.get("/character/getAll", headers={"If-None-Match": etag})
+    repository.create_character(character(1))
+    changed = client.get("/character/getAll", headers={"If-None-Match": etag})
+
+    assert "Accept" in response.headers["Vary"]
+    assert unchanged.status_code == 304
+    assert changed.status_code == 200
+    assert len(changed.json) == 2
+    assert changed.headers["ETag"] != etag
+
+
+def test_listing_is_tagged_from_the_page_served_by_the_cache(repository):
+    cached = CachedCharacterRepository(repository)
+    client = CharacterCRUDApp(
+        __name__, character_repository=cached
+    ).test_client()
+    cached.create_character(character(0))
+
+    response = client.get("/character/getAll")
+    # Written by another process: the cache still serves the old page.
+    repository.create_character(character(1))
+    stale = client.get("/character/getAll")
+    cached.create_character(character(2))
+    changed = client.get(
+        "/character/getAll", headers={"If-None-Match": response.headers["ETag"]}
+    )
+
+    assert stale.json == response.json
+    assert stale.headers["ETag"] == response.headers["ETag"]
+    assert changed.status_code == 200
+    assert len(changed.json) == 3
+
+
+def test_multi_get_returns_characters_in_order(repository, client):
+    ids = [repository.create_character(character(i)).id for i in range(3)]
+
+    response = client.get(f"/character/get?ids={ids[2]},999,{ids[0]}")
+    missing_ids = client.get("/character/get")
+    invalid_ids = client.get("/character/get?ids=1,x")
+
+    assert response.status_code == 200
+    assert [c["id"] for c in response.json["characters"]] == [ids[2], ids[0]]
+    assert response.json["not_found"] == [999]
+    assert missing_ids.status_code == 400
+    assert invalid_ids.status_code == 400
+
+
+def test_search_links_the_next_page_of_best_matches(repository, client):
+    for i in range(3):
+        repository.create_character(character(i))
+
+    first = client.get("/character/search?q=charactr&limit=2")
+    last = client.get("/character/search?q=charactr&limit=2&offset=2")
+    exact = client.get("/character/search?q=charactr&fuzzy=false")
+    too_short = client.get("/character/search?q=c")
+
+    assert [c["name"] for c in first.json] == ["Character 0", "Character 1"]
+    assert 'offset=2>; rel="next"' in first.headers["Link"]
+    assert [c["name"] for c in last.json] == ["Character 2"]
+    assert "Link" not in last.headers
+    assert exact.json == []
+    assert too_short.status_code == 400
+
+
+def test_stats_revalidate_until_the_next_write(repository, client):
+    for i in range(3):
+        repository.create_character(character(i))
+
+    response = client.get("/character/stats?bucket_size=2")
+    etag = response.headers["ETag"]
+    unchanged = client.get(
+        "/character/stats?bucket_size=2", headers={"If-None-Match": etag}
+    )
+    repository.create_character(character(3))
+    changed = client.get(
+        "/character/stats?bucket_size=2", headers={"If-None-Match": etag}
+    )
+    invalid = client.get("/character/stats?bucket_size=0")
+
+    assert response.json["count"] == 3
+    assert response.json["eye_color"] == {"blue": 3}
+    assert response.json["birth_year"]["percentiles"]["p50"] == 1
+    assert response.json["birth_year_histogram"] == [
+        {"start": 0, "end": 2, "count": 2},
+        {"start": 2, "end": 4, "count": 1},
+    ]
+    assert unchanged.status_code == 304
+    assert changed.json["count"] == 4
+    assert invalid.status_code == 400
+
+
+def test_detail_view_reports_missing_character(client):
+    response = client.get("/character/get/999")
+
+    assert response.status_code == 400
+    assert "999" in response.json["message"]
@@ -0,0 +1,64 @@
+import json
+from datetime import datetime
+
+import pytest
+from flask import Flask, jsonify
+
+from domain.entities.schemas import CharacterPartialSchema, CharacterSchema
+from infra.web.flask.json_provider import PydanticJSONProvider
+
+
+@pytest.fixture
+def app():
+    app = Flask(__name__)
+    app.json = PydanticJSONProvider(app)
+    return app
+
+
+def character(i):
+    return CharacterSchema(
+        id=i,
+        name=f"Character {i}",
+        height=170,
+        mass=70,
+        hair_color="blond",
+        skin_color="fair",
+        eye_color="blue",
+        birth_year=i,
+    )
+
+
+def test_models_are_serialised_straight_to_bytes(app):
+    projected = [
+        CharacterPartialSchema.model_construct(
+            _fields_set={"id", "name"}, id=i, name=f"Character {i}"
+        )
+        for i in range(3)
+    ]
+
+    assert json.loads(app.json.dumpb(character(1))) == character(1).model_dump()
+    assert json.loads(app.json.dumpb([character(1), character(2)])) == [
+        character(1).model_dump(),
+        character(2).model_dump(),
+    ]
+    assert json.loads(app.json.dumpb(projected, exclude_unset=True)) == [
+        {"id": i, "name": f"Character {i}"} for i in range(3)
+    ]
+
+
+def test_plain_and_mixed_data_are_serialised(app):
+    data = {"when": datetime(2024, 1, 2, 3, 4, 5), 1: [character(1)]}
+
+    assert json.loads(app.json.dumps(data)) == {
+        "when": "2024-01-02T03:04:05",
+        "1": [character(1).model_dump()],
+    }
+    assert app.json.loads(b'{"a": [1, 2]}') == {"a": [1, 2]}
+
+
+def test_jsonify_uses_the_provider(app):
+    with app.app_context():
+        response = jsonify(character(1))
+
+    assert response.mimetype == "application/json"
+    assert response.get_json() == character(1).model_dump()
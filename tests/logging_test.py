@@ -0,0 +1,56 @@
+import io
+import json
+import logging
+
+from sqlalchemy import create_engine, text
+
+from infra.log import constants as cts
+from infra.log.config import _reset, configure_logging
+
+
+def test_configure_logging_writes_json_from_listener():
+    stream = io.StringIO()
+    configure_logging(level="INFO", log_format="json", stream=stream)
+
+    logging.getLogger("test").info("created %s", "luke", extra={"id": 1})
+    _reset()
+
+    record = json.loads(stream.getvalue())
+    assert record["message"] == "created luke"
+    assert record["level"] == "INFO"
+    assert record["id"] == 1
+
+
+def test_sql_echo_is_off_by_default():
+    configure_logging(stream=io.StringIO())
+    _reset()
+
+    assert not logging.getLogger(cts.SQL_LOGGER_NAME).isEnabledFor(logging.INFO)
+
+
+def test_slow_queries_are_logged(caplog):
+    configure_logging(slow_query_ms=0.000001, stream=io.StringIO())
+    engine = create_engine("sqlite://")
+
+    with caplog.at_level(logging.WARNING, logger=cts.SLOW_QUERY_LOGGER_NAME):
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+    configure_logging(stream=io.StringIO())
+    _reset()
+
+    assert any(r.statement == "SELECT 1" for r in caplog.records)
+
+
+def test_slow_query_logging_can_be_turned_off(caplog):
+    configure_logging(slow_query_ms=0.000001, stream=io.StringIO())
+    configure_logging(slow_query_ms=0, stream=io.StringIO())
+    engine = create_engine("sqlite://")
+
+    with caplog.at_level(logging.WARNING, logger=cts.SLOW_QUERY_LOGGER_NAME):
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+    _reset()
+
+    assert not any(
+        r.name == cts.SLOW_QUERY_LOGGER_NAME for r in caplog.records
+    )
@@ -0,0 +1,222 @@
+import sys
+
+import pytest
+from faker import Faker
+
+from domain.entities.exceptions import (
+    BulkCreateError,
+    CharacterAlreadyExistsError,
+)
+from domain.entities.schemas import (
+    CharacterQuerySchema,
+    CharacterSchema,
+    CharacterSearchSchema,
+    CharacterStatsQuerySchema,
+)
+from infra.repositories.memory.character_repository import (
+    InMemoryCharacterRepository,
+)
+from infra.repositories.sql.base import EngineRegistry
+from infra.repositories.sql.character_repository import CharacterRepository
+
+fake = Faker()
+
+
+@pytest.fixture
+def sql_repository(tmp_path):
+    repository = CharacterRepository(
+        EngineRegistry.get(
+            f"sqlite:///{tmp_path}/characters.db", create_schema=True
+        )
+    )
+    yield repository
+    EngineRegistry.dispose_all()
+
+
+@pytest.fixture
+def repositories(sql_repository):
+    characters = [random_character(id_) for id_ in range(1, 61)]
+    memory_repository = InMemoryCharacterRepository()
+    for repository in (sql_repository, memory_repository):
+        repository.create_characters(characters)
+        repository.delete_characters([3, 10, 11, 40])
+    return sql_repository, memory_repository
+
+
+def random_character(character_id=None):
+    return CharacterSchema(
+        id=character_id,
+        name=fake.random_element(["Luke", "Leia", "Han"]) + " " + fake.name(),
+        height=fake.random_int(150, 200),
+        mass=fake.random_int(40, 120) + fake.random_int(0, 1) / 2,
+        hair_color=fake.random_element(["blond", "brown", "black"]),
+        skin_color=fake.random_element(["fair", "light", "dark"]),
+        eye_color=fake.random_element(["blue", "brown", "green"]),
+        birth_year=fake.random_int(0, 100),
+    )
+
+
+def test_reads_match_the_sql_repository(repositories):
+    sql_repository, memory_repository = repositories
+    named = sql_repository.get_character(20).name
+    queries = [
+        CharacterQuerySchema(),
+        CharacterQuerySchema(limit=7, after_id=9),
+        CharacterQuerySchema(fields=["name", "mass"], eye_color="blue"),
+        CharacterQuerySchema(birth_year_min=20, birth_year_max=60, limit=5),
+        CharacterQuerySchema(name=named),
+        CharacterQuerySchema(eye_color="purple"),
+    ]
+
+    for query in queries:
+        assert memory_repository.get_characters(query) == (
+            sql_repository.get_characters(query)
+        )
+        assert list(memory_repository.iter_characters(query)) == list(
+            sql_repository.iter_characters(query)
+        )
+    for repository in repositories:
+        repository.STREAM_BATCH_SIZE = 4
+    assert list(memory_repository.iter_characters()) == list(
+        sql_repository.iter_characters()
+    )
+    for ids in ([5, 3, 5, 60, 99], [40]):
+        assert memory_repository.get_characters_by_ids(ids) == (
+            sql_repository.get_characters_by_ids(ids)
+        )
+    search = CharacterSearchSchema(q="luke", limit=50)
+    assert memory_repository.search_characters(search) == (
+        sql_repository.search_characters(search)
+    )
+    stats = CharacterStatsQuerySchema(bucket_size=7)
+    assert memory_repository.get_character_stats(stats) == (
+        sql_repository.get_character_stats(stats)
+    )
+    assert memory_repository.get_character_version(5).tag == (
+        sql_repository.get_character_version(5).tag
+    )
+    assert memory_repository.get_character_version(3) is None
+
+
+def test_writes_match_the_sql_repository(repositories):
+    sql_repository, memory_repository = repositories
+    memory_repository.search_characters(CharacterSearchSchema(q="luke"))
+    created = random_character()
+    batch = [random_character(), random_character(3), random_character(100)]
+
+    for repository in repositories:
+        repository.create_character(created)
+        repository.create_characters(batch)
+        repository.delete_character(4)
+
+    assert memory_repository.get_characters() == (
+        sql_repository.get_characters()
+    )
+    assert [c.id for c in memory_repository.iter_characters()][-3:] == [
+        61,
+        100,
+        101,
+    ]
+    search = CharacterSearchSchema(q="luke", limit=50)
+    assert memory_repository.search_characters(search) == (
+        sql_repository.search_characters(search)
+    )
+    assert memory_repository.get_character_stats() == (
+        sql_repository.get_character_stats()
+    )
+
+
+def test_taken_ids_are_rejected():
+    repository = InMemoryCharacterRepository()
+    repository.create_characters([random_character(1), random_character(2)])
+    version = repository.get_characters_version().tag
+
+    with pytest.raises(CharacterAlreadyExistsError):
+        repository.create_character(random_character(1))
+    with pytest.raises(BulkCreateError):
+        repository.create_characters([random_character(3), random_character(3)])
+    assert repository.get_characters_version().tag == version
+    assert len(repository) == 2
+
+    result = repository.create_characters(
+        [random_character(2), random_character(4)], atomic=False
+    )
+
+    assert [c.id for c in result.created] == [4]
+    assert [error.index for error in result.errors] == [0]
+
+
+def test_dead_rows_are_compacted_away():
+    repository = InMemoryCharacterRepository()
+    characters = repository.create_characters(
+        [random_character() for _ in range(100)]
+    ).created
+
+    repository.delete_characters(list(range(1, 101, 5)))
+
+    assert repository._dead == 20
+    assert repository.get_character(6) is None
+
+    repository.delete_characters(list(range(2, 101, 5)))
+
+    assert repository._dead == 0
+    assert len(repository._columns["id"]) == len(repository) == 60
+    assert list(repository.iter_characters()) == [
+        c for c in characters if c.id % 5 not in (1, 2)
+    ]
+    assert repository.get_characters_by_ids([99]) == [characters[98]]
+
+
+def test_snapshots_restore_every_column(tmp_path, repositories):
+    _, repository = repositories
+    path = str(tmp_path / "characters.snapshot")
+
+    assert repository.snapshot(path) == 56
+
+    restored = InMemoryCharacterRepository.from_snapshot(path)
+
+    assert restored.get_characters() == repository.get_characters()
+    assert restored.get_character_stats() == repository.get_character_stats()
+    assert restored.get_characters_version() == (
+        repository.get_characters_version()
+    )
+    assert restored.get_character_version(7) == (
+        repository.get_character_version(7)
+    )
+    restored.create_character(random_character(3))
+    assert restored.get_character(3) is not None
+
+
+def test_snapshots_are_byte_order_independent(tmp_path, monkeypatch):
+    repository = InMemoryCharacterRepository()
+    repository.create_characters([random_character() for _ in range(5)])
+    path = str(tmp_path / "characters.snapshot")
+    other_order = "big" if sys.byteorder == "little" else "little"
+    monkeypatch.setattr(sys, "byteorder", other_order)
+    for column in repository._columns.values():
+        column.byteswap()
+    repository.snapshot(path)
+    for column in repository._columns.values():
+        column.byteswap()
+    monkeypatch.undo()
+
+    restored = InMemoryCharacterRepository.from_snapshot(path)
+
+    assert restored.get_characters() == repository.get_characters()
+
+
+def test_warm_start_loads_once_then_restores(tmp_path, sql_repository):
+    sql_repository.create_characters([random_character() for _ in range(10)])
+    path = str(tmp_path / "characters.snapshot")
+
+    loaded = InMemoryCharacterRepository.warm_start(sql_repository, path)
+    sql_repository.delete_character(1)
+    restored = InMemoryCharacterRepository.warm_start(sql_repository, path)
+
+    assert loaded.get_characters() == restored.get_characters()
+    assert len(restored) == 10
+
+    with open(path, "r+b") as file:
+        file.write(b"NOTASNAP")
+    with pytest.raises(ValueError):
+        InMemoryCharacterRepository.from_snapshot(path)
@@ -0,0 +1,98 @@
+import threading
+
+import pytest
+
+from infra.metrics.metrics import (
+    DB_POOL_CHECKOUT_WAIT,
+    HTTP_REQUESTS,
+    REPOSITORY_CALL_DURATION,
+    SQL_STATEMENTS,
+)
+from infra.metrics.registry import MetricsRegistry
+from infra.metrics.sql import install_sql_instrumentation
+from infra.repositories.metrics.character_repository import (
+    InstrumentedCharacterRepository,
+)
+from infra.repositories.sql.base import EngineRegistry
+from infra.repositories.sql.character_repository import CharacterRepository
+from infra.web.flask.app import CharacterCRUDApp
+
+
+@pytest.fixture
+def repository(tmp_path):
+    install_sql_instrumentation()
+    yield InstrumentedCharacterRepository(
+        CharacterRepository(
+            EngineRegistry.get(f"sqlite:///{tmp_path}/c.db", create_schema=True)
+        )
+    )
+    EngineRegistry.dispose_all()
+
+
+def test_counter_sums_every_thread():
+    counter = MetricsRegistry().counter("jobs_total", "Jobs.", ("kind",))
+
+    threads = [
+        threading.Thread(target=lambda: [counter.inc("a") for _ in range(1000)])
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert counter.value("a") == 4000
+
+
+def test_stores_of_ended_threads_are_folded():
+    counter = MetricsRegistry().counter("jobs_total", "Jobs.", ("kind",))
+
+    for _ in range(20):
+        thread = threading.Thread(target=counter.inc, args=("a",))
+        thread.start()
+        thread.join()
+
+    assert counter.value("a") == 20
+    assert len(counter._shards) == 0
+
+
+def test_histogram_renders_cumulative_buckets():
+    registry = MetricsRegistry()
+    histogram = registry.histogram("latency_seconds", "Latency.", buckets=(0.1, 1))
+
+    histogram.observe(0.05)
+    histogram.observe(0.5)
+    histogram.observe(5)
+
+    lines = registry.render().splitlines()
+    assert "# TYPE latency_seconds histogram" in lines
+    assert 'latency_seconds_bucket{le="0.1"} 1' in lines
+    assert 'latency_seconds_bucket{le="1"} 2' in lines
+    assert 'latency_seconds_bucket{le="+Inf"} 3' in lines
+    assert "latency_seconds_count 3" in lines
+
+
+def test_instrumented_repository_attributes_statements(repository):
+    calls = REPOSITORY_CALL_DURATION.count("get_character")
+    checkouts = DB_POOL_CHECKOUT_WAIT.count("get_character")
+    statements = SQL_STATEMENTS.value("get_character")
+
+    repository.get_character(1)
+
+    assert REPOSITORY_CALL_DURATION.count("get_character") == calls + 1
+    assert DB_POOL_CHECKOUT_WAIT.count("get_character") == checkouts + 1
+    assert SQL_STATEMENTS.value("get_character") == statements + 1
+
+
+def test_metrics_endpoint_counts_requests_by_rule(repository):
+    app = CharacterCRUDApp(__name__, character_repository=repository)
+    client = app.test_client()
+    route = "/character/get/<int:character_id>"
+    requests = HTTP_REQUESTS.value(route, "GET", "400")
+
+    client.get("/character/get/404")
+    response = client.get("/metrics")
+
+    assert HTTP_REQUESTS.value(route, "GET", "400") == requests + 1
+    assert response.content_type.startswith("text/plain")
+    assert b"sql_statements_total" in response.data
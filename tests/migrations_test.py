@@ -0,0 +1,154 @@
+import pytest
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.exc import IntegrityError
+
+from domain.entities.schemas import CharacterSchema, CharacterSearchSchema
+from infra.repositories.sql import constants as cts
+from infra.repositories.sql.base import Base, EngineRegistry
+from infra.repositories.sql.character_repository import CharacterRepository
+from infra.repositories.sql.migrations.migrator import Migrator
+from infra.repositories.sql.migrations.revisions import REVISIONS
+
+
+@pytest.fixture
+def database_url(tmp_path):
+    url = f"sqlite:///{tmp_path}/characters.db"
+    yield url
+    EngineRegistry.dispose_all()
+
+
+def index_names(database_url):
+    return {
+        index["name"]
+        for index in inspect(create_engine(database_url)).get_indexes(
+            cts.CHARACTER_TABLE_NAME
+        )
+    }
+
+
+def test_upgrade_applies_revisions_once(database_url):
+    initializer = EngineRegistry.get(database_url, create_schema=False)
+
+    applied = initializer.create_schema()
+
+    assert [revision.version for revision in applied] == [1, 2, 4, 5, 6]
+    assert initializer.create_schema() == []
+    assert cts.EYE_COLOR_BIRTH_YEAR_INDEX_NAME in index_names(database_url)
+
+
+def test_upgrade_adopts_database_created_without_migrations(database_url):
+    engine = create_engine(database_url)
+    Base.metadata.create_all(engine)
+
+    with engine.begin() as connection:
+        applied = Migrator(connection).upgrade()
+
+    assert [revision.version for revision in applied] == [1, 2, 4, 5, 6]
+
+
+def test_unique_names_revision_waits_until_enabled(database_url, monkeypatch):
+    initializer = EngineRegistry.get(database_url, create_schema=True)
+    repository = CharacterRepository(initializer)
+    character = CharacterSchema(
+        name="Luke",
+        height=172,
+        mass=77,
+        hair_color="blond",
+        skin_color="fair",
+        eye_color="blue",
+        birth_year=19,
+    )
+    repository.create_character(character)
+
+    monkeypatch.setattr(
+        "settings.DatabaseSettings.UNIQUE_CHARACTER_NAMES", True
+    )
+    applied = initializer.create_schema()
+
+    assert [revision.version for revision in applied] == [3]
+    with pytest.raises(IntegrityError):
+        repository.create_character(character)
+
+
+def test_versions_revision_backfills_existing_characters(database_url):
+    character = CharacterSchema(
+        name="Luke",
+        height=172,
+        mass=77,
+        hair_color="blond",
+        skin_color="fair",
+        eye_color="blue",
+        birth_year=19,
+    )
+    engine = create_engine(database_url)
+    with engine.begin() as connection:
+        Migrator(connection, REVISIONS[:2]).upgrade()
+        connection.execute(
+            text(
+                "INSERT INTO characters (name, height, mass, hair_color, "
+                "skin_color, eye_color, birth_year) VALUES (:name, :height, "
+                ":mass, :hair_color, :skin_color, :eye_color, :birth_year)"
+            ),
+            character.model_dump(exclude={"id"}),
+        )
+    with engine.begin() as connection:
+        applied = Migrator(connection).upgrade()
+    repository = CharacterRepository(EngineRegistry.get(database_url))
+
+    assert [revision.version for revision in applied] == [4, 5, 6]
+    assert repository.get_character_version(1).tag == character.content_hash()
+    assert repository.get_characters_version().tag == "1"
+
+
+def test_search_revision_indexes_existing_characters(database_url):
+    engine = create_engine(database_url)
+    with engine.begin() as connection:
+        Migrator(connection, REVISIONS[:4]).upgrade()
+        connection.execute(
+            text(
+                "INSERT INTO characters (name, height, mass, hair_color, "
+                "skin_color, eye_color, birth_year) VALUES ('Luke  Skywalker', "
+                "172, 77, 'blond', 'fair', 'blue', 19)"
+            )
+        )
+    with engine.begin() as connection:
+        applied = Migrator(connection, REVISIONS[:5]).upgrade()
+        search_name = connection.execute(
+            text("SELECT search_name FROM characters")
+        ).scalar()
+    repository = CharacterRepository(EngineRegistry.get(database_url))
+
+    assert [revision.version for revision in applied] == [5]
+    assert search_name == "luke skywalker"
+    assert cts.SEARCH_NAME_INDEX_NAME in index_names(database_url)
+    assert [
+        character.id
+        for character in repository.search_characters(
+            CharacterSearchSchema(q="walker")
+        )
+    ] == [1]
+
+
+def test_value_counts_revision_counts_existing_characters(database_url):
+    engine = create_engine(database_url)
+    with engine.begin() as connection:
+        Migrator(connection, REVISIONS[:5]).upgrade()
+        for height in (172, 172, 180):
+            connection.execute(
+                text(
+                    "INSERT INTO characters (name, height, mass, hair_color, "
+                    "skin_color, eye_color, birth_year) VALUES ('Luke', "
+                    ":height, 77, 'blond', 'fair', 'blue', 19)"
+                ),
+                {"height": height},
+            )
+    with engine.begin() as connection:
+        applied = Migrator(connection).upgrade()
+    repository = CharacterRepository(EngineRegistry.get(database_url))
+    repository.delete_character(3)
+    stats = repository.get_character_stats()
+
+    assert [revision.version for revision in applied] == [6]
+    assert stats.count == 2
+    assert stats.eye_color == {"blue": 2}
+    assert stats.height.max == 172
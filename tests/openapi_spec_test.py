@@ -0,0 +1,23 @@
+import gzip
+import json
+
+from infra.web.flask.constants import Paths
+from infra.web.flask.openapi_spec import OpenAPIDocument, build_openapi_spec
+
+
+def test_build_openapi_spec_documents_routes():
+    spec = build_openapi_spec()
+
+    assert Paths.CHAR_ALL in spec["paths"]
+    assert "CharacterSchema" in spec["components"]["schemas"]
+
+
+def test_openapi_document_variants_share_content():
+    document = OpenAPIDocument(build_openapi_spec())
+
+    body, etag = document.variant(None)
+    gzip_body, gzip_etag = document.variant("gzip")
+
+    assert json.loads(body) == build_openapi_spec()
+    assert gzip.decompress(gzip_body) == body
+    assert gzip_etag != etag
@@ -0,0 +1,93 @@
+import pytest
+
+from domain.entities.schemas import CharacterSchema
+from infra.repositories.sql.base import EngineRegistry
+from infra.repositories.sql.character_repository import CharacterRepository
+from infra.repositories.sql.enums import ReplicaSelections
+from infra.repositories.sql.replicas import PRIMARY_PINNED_UNTIL
+from infra.web.flask.app import CharacterCRUDApp
+
+
+def character(name: str) -> CharacterSchema:
+    return CharacterSchema(
+        name=name,
+        height=170,
+        mass=70,
+        hair_color="blond",
+        skin_color="fair",
+        eye_color="blue",
+        birth_year=19,
+    )
+
+
+@pytest.fixture
+def databases(tmp_path):
+    PRIMARY_PINNED_UNTIL.set(0.0)
+    initializers = []
+    for name in ("primary", "replica-1", "replica-2"):
+        initializer = EngineRegistry.get(
+            f"sqlite:///{tmp_path}/{name}.db", create_schema=True
+        )
+        # Each database gets a distinct first character to tell them apart.
+        CharacterRepository(initializer).create_character(character(name))
+        initializers.append(initializer)
+    primary, *replicas = initializers
+    PRIMARY_PINNED_UNTIL.set(0.0)
+    yield primary, replicas
+    PRIMARY_PINNED_UNTIL.set(0.0)
+    EngineRegistry.dispose_all()
+
+
+def test_reads_are_spread_round_robin_over_replicas(databases):
+    primary, replicas = databases
+    repository = CharacterRepository(primary, replicas)
+
+    names = [repository.get_character(1).name for _ in range(4)]
+
+    assert names == ["replica-1", "replica-2", "replica-1", "replica-2"]
+    assert [c.name for c in repository.get_characters()] in (
+        ["replica-1"],
+        ["replica-2"],
+    )
+
+
+def test_least_busy_selection_skips_busy_replicas(databases):
+    primary, replicas = databases
+    repository = CharacterRepository(
+        primary, replicas, replica_selection=ReplicaSelections.LEAST_BUSY
+    )
+
+    with replicas[0].engine.connect():
+        names = {repository.get_character(1).name for _ in range(4)}
+
+    assert names == {"replica-2"}
+
+
+def test_writes_go_to_the_primary_and_pin_reads_to_it(databases):
+    primary, replicas = databases
+    repository = CharacterRepository(primary, replicas)
+
+    created = repository.create_character(character("Luke"))
+
+    assert repository.get_character(created.id).name == "Luke"
+    assert CharacterRepository(replicas[0]).get_character(created.id) is None
+    PRIMARY_PINNED_UNTIL.set(0.0)
+    assert repository.get_character(created.id) is None
+
+
+def test_read_your_writes_window_is_carried_in_a_cookie(databases, monkeypatch):
+    primary, replicas = databases
+    monkeypatch.setattr(
+        "settings.DatabaseSettings.REPLICA_CONNECTION_STRINGS", ["replica"]
+    )
+    app = CharacterCRUDApp(
+        __name__, character_repository=CharacterRepository(primary, replicas)
+    )
+    writer, reader = app.test_client(), app.test_client()
+
+    created = writer.post("/character/add", json=character("Luke").model_dump())
+    PRIMARY_PINNED_UNTIL.set(0.0)
+
+    assert "primary_pinned_until" in created.headers["Set-Cookie"]
+    assert writer.get(f"/character/get/{created.json['id']}").status_code == 200
+    assert reader.get(f"/character/get/{created.json['id']}").status_code == 400
@@ -0,0 +1,171 @@
+import pytest
+from sqlalchemy import text
+
+from domain.entities.schemas import CharacterSchema, CharacterSearchSchema
+from infra.repositories.search.character_repository import (
+    IndexedCharacterRepository,
+)
+from infra.repositories.search.matching import corrections, edit_distance
+from infra.repositories.search.name_index import NameIndex
+from infra.repositories.sql import constants as cts
+from infra.repositories.sql.base import EngineRegistry
+from infra.repositories.sql.character_repository import CharacterRepository
+
+NAMES = {
+    1: "Anakin Skywalker",
+    2: "Luke Skywalker",
+    3: "Leia Organa",
+    4: "Owen Lars",
+    5: "Lukas Lukeman",
+    6: "Paluke",
+    7: "Luke",
+}
+
+
+@pytest.fixture
+def database_url(tmp_path):
+    url = f"sqlite:///{tmp_path}/characters.db"
+    yield url
+    EngineRegistry.dispose_all()
+
+
+@pytest.fixture
+def repository(database_url):
+    repository = CharacterRepository(
+        EngineRegistry.get(database_url, create_schema=True)
+    )
+    repository.create_characters(
+        [character(id_, name) for id_, name in NAMES.items()]
+    )
+    return repository
+
+
+@pytest.fixture
+def index():
+    index = NameIndex()
+    index.add_many(NAMES.items())
+    return index
+
+
+def character(character_id, name):
+    return CharacterSchema(
+        id=character_id,
+        name=name,
+        height=172,
+        mass=77,
+        hair_color="blond",
+        skin_color="fair",
+        eye_color="blue",
+        birth_year=19,
+    )
+
+
+def search(q, **options):
+    return CharacterSearchSchema(q=q, **options)
+
+
+def test_edit_distance_counts_swaps_and_gives_up_past_limit():
+    assert edit_distance("jonh", "john", 1) == 1
+    assert edit_distance("skywalkr", "skywalker", 2) == 1
+    assert edit_distance("kitten", "sitting", 2) is None
+
+
+def test_corrections_fix_each_word_against_the_vocabulary(index):
+    assert corrections(index, "lukr skywalker") == ["luke skywalker"]
+    # Words shorter than four characters are never corrected.
+    assert corrections(index, "lek") == []
+
+
+def test_index_ranks_prefixes_then_words_then_substrings(index):
+    assert index.search(search("luke")) == [7, 2, 5, 6]
+    assert index.search(search("LUKE  sky")) == [2]
+
+
+def test_index_paginates_best_matches(index):
+    assert index.search(search("luke", limit=2)) == [7, 2]
+    assert index.search(search("luke", limit=2, offset=2)) == [5, 6]
+
+
+def test_index_tolerates_typos_unless_exact(index):
+    assert index.search(search("skywalkr")) == [1, 2]
+    assert index.search(search("skywalkr", fuzzy=False)) == []
+
+
+def test_index_forgets_removed_and_renamed_characters(index):
+    index.remove(7)
+    index.add(2, "Ben Kenobi")
+
+    assert index.search(search("luke")) == [5, 6]
+    assert index.search(search("kenobi")) == [2]
+    assert len(index) == 6
+
+
+def test_index_compacts_stale_entries():
+    index = NameIndex()
+    for round_ in range(5):
+        index.add_many((id_, f"{name} {round_}") for id_, name in NAMES.items())
+
+    assert index.search(search("luke", limit=10)) == [7, 2, 5, 6]
+    assert index._stale <= len(index)
+
+
+def test_sql_repository_ranks_like_the_index(repository, index):
+    for q in ["luke", "sky", "skywalkr", "lars", "organ", "lu"]:
+        expected = index.search(search(q))
+
+        assert [
+            found.id for found in repository.search_characters(search(q))
+        ] == expected
+
+
+def test_sql_repository_follows_writes(repository):
+    repository.delete_character(7)
+    repository.create_character(character(8, "Luke Lars"))
+
+    assert [
+        found.id for found in repository.search_characters(search("luke"))
+    ] == [8, 2, 5, 6]
+    assert [
+        found.id for found in repository.search_characters(search("lrs"))
+    ] == []
+    assert [
+        found.id for found in repository.search_characters(search("larz"))
+    ] == [4, 8]
+
+
+def test_sql_repository_without_full_text_matches_as_typed(
+    repository, database_url
+):
+    with EngineRegistry.get(database_url).write_engine.begin() as connection:
+        for suffix in ("insert", "delete", "update"):
+            connection.execute(
+                text(
+                    f"DROP TRIGGER {cts.CHARACTER_TABLE_NAME}_search_{suffix}"
+                )
+            )
+        for table in (
+            cts.NAME_VOCABULARY_TABLE_NAME,
+            cts.NAME_GRAMS_TABLE_NAME,
+            cts.NAME_WORDS_TABLE_NAME,
+        ):
+            connection.execute(text(f"DROP TABLE {table}"))
+
+    assert [
+        found.id for found in repository.search_characters(search("luke"))
+    ] == [7, 2, 5, 6]
+    assert repository.search_characters(search("skywalkr")) == []
+
+
+def test_indexed_repository_loads_once_and_follows_writes(repository):
+    indexed = IndexedCharacterRepository(repository)
+
+    assert indexed.search_characters(search("luke")) == (
+        repository.search_characters(search("luke"))
+    )
+
+    indexed.delete_character(7)
+    indexed.create_characters([character(8, "Luke Lars")])
+
+    assert [
+        found.id for found in indexed.search_characters(search("luke"))
+    ] == [8, 2, 5, 6]
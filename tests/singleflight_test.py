@@ -0,0 +1,126 @@
+import threading
+import time
+
+from infra.metrics.metrics import SINGLE_FLIGHT_CALLS
+from infra.repositories.sql.singleflight import SingleFlight
+
+
+def blocked_call(results):
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def call():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        if isinstance(results, Exception):
+            raise results
+        return results
+
+    return call, calls, started, release
+
+
+def run_concurrently(flight, call, started, release, followers=5):
+    outcomes = []
+
+    def caller():
+        try:
+            outcomes.append(flight.do("key", call, "method"))
+        except Exception as e:
+            outcomes.append(e)
+
+    leader = threading.Thread(target=caller)
+    leader.start()
+    started.wait(5)
+    threads = [threading.Thread(target=caller) for _ in range(followers)]
+    for thread in threads:
+        thread.start()
+    # Let the followers join the call in flight.
+    time.sleep(0.2)
+    release.set()
+    for thread in [leader] + threads:
+        thread.join(5)
+    return outcomes
+
+
+def test_concurrent_calls_share_one_call():
+    coalesced = SINGLE_FLIGHT_CALLS.value("method", "coalesced")
+    result = object()
+    call, calls, started, release = blocked_call(result)
+
+    outcomes = run_concurrently(SingleFlight(timeout=5), call, started, release)
+
+    assert len(calls) == 1
+    assert outcomes == [result] * 6
+    assert SINGLE_FLIGHT_CALLS.value("method", "coalesced") == coalesced + 5
+
+
+def test_errors_reach_every_caller():
+    error = ValueError("boom")
+    call, calls, started, release = blocked_call(error)
+
+    outcomes = run_concurrently(SingleFlight(timeout=5), call, started, release)
+
+    assert len(calls) == 1
+    assert outcomes == [error] * 6
+
+
+def test_waits_are_bounded():
+    timed_out = SINGLE_FLIGHT_CALLS.value("method", "timed_out")
+    flight = SingleFlight(timeout=0.01)
+    call, calls, started, release = blocked_call("result")
+    leader = threading.Thread(target=flight.do, args=("key", call, "method"))
+    leader.start()
+    started.wait(5)
+
+    result = flight.do("key", lambda: "own result", "method")
+    release.set()
+    leader.join(5)
+
+    assert result == "own result"
+    assert SINGLE_FLIGHT_CALLS.value("method", "timed_out") == timed_out + 1
+
+
+def test_finished_and_forgotten_calls_are_not_shared():
+    flight = SingleFlight(timeout=5)
+    call, calls, started, release = blocked_call("stale")
+    leader = threading.Thread(target=flight.do, args=("key", call, "method"))
+    leader.start()
+    started.wait(5)
+
+    flight.forget()
+    fresh = flight.do("key", lambda: "fresh", "method")
+    release.set()
+    leader.join(5)
+
+    assert fresh == "fresh"
+    assert flight.do("key", lambda: "again", "method") == "again"
+
+
+def test_repository_reads_see_writes(tmp_path):
+    from domain.entities.schemas import CharacterSchema
+    from infra.repositories.sql.base import EngineRegistry
+    from infra.repositories.sql.character_repository import (
+        CharacterRepository,
+    )
+
+    repository = CharacterRepository(
+        EngineRegistry.get(f"sqlite:///{tmp_path}/c.db", create_schema=True)
+    )
+    try:
+        created = repository.create_character(
+            CharacterSchema(
+                name="Luke",
+                height=172,
+                mass=77,
+                hair_color="blond",
+                skin_color="fair",
+                eye_color="blue",
+                birth_year=19,
+            )
+        )
+        assert repository.get_character(created.id) == created
+        repository.delete_character(created.id)
+        assert repository.get_character(created.id) is None
+    finally:
+        EngineRegistry.dispose_all()
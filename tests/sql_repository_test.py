@@ -0,0 +1,201 @@
+import pytest
+from faker import Faker
+
+from domain.entities.exceptions import BulkCreateError
+from domain.entities.schemas import CharacterQuerySchema, CharacterSchema
+from infra.metrics.metrics import SQL_STATEMENTS
+from infra.metrics.sql import install_sql_instrumentation
+from infra.repositories.metrics.character_repository import (
+    InstrumentedCharacterRepository,
+)
+from infra.repositories.sql.base import EngineRegistry
+from infra.repositories.sql.character_repository import CharacterRepository
+
+fake = Faker()
+
+
+@pytest.fixture
+def database_url(tmp_path):
+    url = f"sqlite:///{tmp_path}/characters.db"
+    yield url
+    EngineRegistry.dispose_all()
+
+
+@pytest.fixture
+def repository(database_url):
+    return CharacterRepository(
+        EngineRegistry.get(database_url, create_schema=True)
+    )
+
+
+@pytest.fixture
+def character_data():
+    return CharacterSchema(
+        id=None,
+        name=fake.first_name(),
+        height=fake.random_number(digits=3) + 1,
+        mass=fake.random_number(digits=2) + 1,
+        hair_color=fake.color_name(),
+        skin_color=fake.color_name(),
+        eye_color=fake.color_name(),
+        birth_year=fake.random_number(digits=2),
+    )
+
+
+def test_engine_registry_shares_initializer(database_url):
+    first = EngineRegistry.get(database_url)
+    second = EngineRegistry.get(database_url)
+
+    assert first is second
+    assert first.engine is second.engine
+
+
+def test_create_get_and_delete_character(repository, character_data):
+    created = repository.create_character(character_data)
+
+    assert created.id is not None
+    assert repository.get_character(created.id) == created
+    assert [c.id for c in repository.get_characters()] == [created.id]
+    assert repository.delete_character(created.id) is True
+    assert repository.get_character(created.id) is None
+    assert repository.delete_character(created.id) is False
+
+
+def test_get_characters_paginates_projects_and_filters(
+    repository, character_data
+):
+    created = [
+        repository.create_character(
+            character_data.model_copy(
+                update={"eye_color": "blue" if i % 2 else "red", "birth_year": i}
+            )
+        )
+        for i in range(5)
+    ]
+
+    query = CharacterQuerySchema(limit=2, fields="name")
+    first_page = repository.get_characters(query)
+    second_page = repository.get_characters(
+        query.model_copy(update={"after_id": query.next_after_id(first_page)})
+    )
+    filtered = repository.get_characters(
+        CharacterQuerySchema(eye_color="blue", birth_year_min=2)
+    )
+
+    assert [c.id for c in first_page + second_page] == [
+        c.id for c in created[:4]
+    ]
+    assert first_page[0].model_dump(exclude_unset=True) == {
+        "id": created[0].id,
+        "name": created[0].name,
+    }
+    assert [c.id for c in filtered] == [created[3].id]
+
+
+def test_iter_characters_streams_full_and_projected_rows(
+    repository, character_data
+):
+    created = [repository.create_character(character_data) for _ in range(3)]
+
+    streamed = list(repository.iter_characters())
+    projected = list(
+        repository.iter_characters(CharacterQuerySchema(fields="eye_color"))
+    )
+
+    assert streamed == created
+    assert [c.model_dump(exclude_unset=True) for c in projected] == [
+        {"id": c.id, "eye_color": c.eye_color} for c in created
+    ]
+
+
+def test_create_characters_atomic_rolls_back_on_error(
+    repository, character_data
+):
+    existing = repository.create_character(character_data)
+
+    with pytest.raises(BulkCreateError):
+        repository.create_characters(
+            [character_data, existing, character_data], chunk_size=2
+        )
+
+    assert [c.id for c in repository.get_characters()] == [existing.id]
+
+
+def test_create_characters_rejects_chunk_sizes_below_one(
+    repository, character_data
+):
+    with pytest.raises(ValueError):
+        repository.create_characters([character_data], chunk_size=-1)
+    assert repository.get_characters() == []
+
+
+def test_create_characters_partial_reports_failing_rows(
+    repository, character_data
+):
+    existing = repository.create_character(character_data)
+
+    result = repository.create_characters(
+        [character_data, existing, character_data],
+        chunk_size=2,
+        atomic=False,
+    )
+
+    assert [error.index for error in result.errors] == [1]
+    assert len(result.created) == 2
+    assert len(repository.get_characters()) == 3
+
+
+def test_delete_characters(repository, character_data):
+    created = [repository.create_character(character_data) for _ in range(3)]
+
+    deleted = repository.delete_characters([created[0].id, created[2].id, 999])
+
+    assert sorted(deleted) == [created[0].id, created[2].id]
+    assert [c.id for c in repository.get_characters()] == [created[1].id]
+
+
+def test_versions_follow_content_and_writes(repository, character_data):
+    collection = repository.get_characters_version()
+    created = repository.create_character(character_data)
+    bulk = repository.create_characters(
+        [character_data.model_copy(update={"name": "Leia"})]
+    ).created[0]
+
+    version = repository.get_character_version(created.id)
+
+    assert version.tag == created.content_hash()
+    assert repository.get_character_version(bulk.id).tag == bulk.content_hash()
+    assert version.tag != bulk.content_hash()
+    assert repository.get_characters_version().tag == str(int(collection.tag) + 2)
+    repository.delete_character(created.id)
+    assert repository.get_character_version(created.id) is None
+    assert repository.get_characters_version().tag == str(int(collection.tag) + 3)
+
+
+def test_writes_changing_no_row_keep_the_version(repository, character_data):
+    created = repository.create_character(character_data)
+    version = repository.get_characters_version()
+
+    repository.delete_character(999)
+    repository.delete_characters([998, 999])
+    repository.create_characters([created], atomic=False)
+
+    assert repository.get_characters_version() == version
+
+
+def test_get_characters_by_ids_uses_one_query_in_request_order(
+    repository, character_data
+):
+    install_sql_instrumentation()
+    instrumented = InstrumentedCharacterRepository(repository)
+    ids = [
+        repository.create_character(character_data).id for _ in range(3)
+    ]
+    statements = SQL_STATEMENTS.value("get_characters_by_ids")
+
+    found = instrumented.get_characters_by_ids([ids[2], 999, ids[0], ids[2]])
+
+    assert [c.id for c in found] == [ids[2], ids[0]]
+    assert found[0] == repository.get_character(ids[2])
+    assert SQL_STATEMENTS.value("get_characters_by_ids") == statements + 1
+    assert repository.get_characters_by_ids([]) == []
@@ -0,0 +1,129 @@
+import threading
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import IntegrityError, OperationalError
+from sqlalchemy.orm import Session, sessionmaker
+
+from domain.entities.schemas import CharacterSchema
+from infra.metrics.metrics import SQL_STATEMENTS, SQL_WRITE_BATCH_SIZE
+from infra.metrics.sql import install_sql_instrumentation
+from infra.repositories.metrics.character_repository import (
+    InstrumentedCharacterRepository,
+)
+from infra.repositories.sql.base import EngineRegistry
+from infra.repositories.sql.character_repository import CharacterRepository
+from infra.repositories.sql.models import Character
+from infra.repositories.sql.writer import WriteQueue
+
+
+@pytest.fixture
+def initializer(tmp_path):
+    yield EngineRegistry.get(f"sqlite:///{tmp_path}/c.db", create_schema=True)
+    EngineRegistry.dispose_all()
+
+
+def character(i: int) -> CharacterSchema:
+    return CharacterSchema(
+        name=f"Character {i}",
+        height=170,
+        mass=70,
+        hair_color="blond",
+        skin_color="fair",
+        eye_color="blue",
+        birth_year=i,
+    )
+
+
+def test_sqlite_profile_sets_wal_and_read_only_readers(initializer):
+    with initializer.write_engine.connect() as connection:
+        journal_mode = connection.exec_driver_sql("PRAGMA journal_mode").scalar()
+    session = initializer.get_session()
+
+    assert journal_mode == "wal"
+    with pytest.raises(OperationalError):
+        session.execute(text("DELETE FROM characters"))
+    session.close()
+
+
+def test_concurrent_writes_are_group_committed(initializer):
+    write_queue = WriteQueue(
+        sessionmaker(bind=initializer.write_engine), max_batch_size=64
+    )
+    started, release = threading.Event(), threading.Event()
+    sessions = []
+    batches = SQL_WRITE_BATCH_SIZE.count()
+    blocker = write_queue.enqueue(lambda session: started.set() or release.wait())
+    started.wait()
+    futures = [
+        write_queue.enqueue(lambda session: sessions.append(id(session)))
+        for _ in range(5)
+    ]
+    release.set()
+    for future in [blocker] + futures:
+        future.result()
+    write_queue.close()
+
+    assert SQL_WRITE_BATCH_SIZE.count() == batches + 2
+    assert len(sessions) == 5
+    assert len(set(sessions)) == 1
+
+
+def test_concurrent_repository_writes_do_not_lock(initializer):
+    repository = CharacterRepository(initializer)
+    errors = []
+
+    def create(i: int):
+        try:
+            repository.create_character(character(i))
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=create, args=(i,)) for i in range(50)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert len(repository.get_characters()) == 50
+
+
+def test_failing_write_does_not_affect_its_batch(initializer):
+    existing = CharacterRepository(initializer).create_character(character(0))
+    write_queue = WriteQueue(
+        sessionmaker(bind=initializer.write_engine), max_batch_size=64
+    )
+    started, release = threading.Event(), threading.Event()
+    batches = SQL_WRITE_BATCH_SIZE.count()
+
+    def insert(character: CharacterSchema):
+        def work(session: Session):
+            session.add(Character(**character.model_dump()))
+            session.flush()
+
+        return work
+
+    blocker = write_queue.enqueue(lambda session: started.set() or release.wait())
+    started.wait()
+    failing = write_queue.enqueue(insert(existing))
+    succeeding = write_queue.enqueue(insert(character(1)))
+    release.set()
+    blocker.result()
+    succeeding.result()
+    write_queue.close()
+
+    with pytest.raises(IntegrityError):
+        failing.result()
+    assert SQL_WRITE_BATCH_SIZE.count() == batches + 2
+    assert len(CharacterRepository(initializer).get_characters()) == 2
+
+
+def test_queued_writes_keep_the_caller_metrics_context(initializer):
+    install_sql_instrumentation()
+    repository = InstrumentedCharacterRepository(CharacterRepository(initializer))
+    statements = SQL_STATEMENTS.value("create_character")
+
+    repository.create_character(character(0))
+
+    assert SQL_STATEMENTS.value("create_character") > statements
@@ -0,0 +1,119 @@
+import statistics
+
+import pytest
+from faker import Faker
+from sqlalchemy import text
+
+from domain.entities.schemas import CharacterSchema, CharacterStatsQuerySchema
+from infra.repositories.sql import constants as cts
+from infra.repositories.sql.base import EngineRegistry
+from infra.repositories.sql.character_repository import CharacterRepository
+from infra.repositories.stats.value_counter import ValueCounter
+
+fake = Faker()
+
+
+@pytest.fixture
+def database_url(tmp_path):
+    url = f"sqlite:///{tmp_path}/characters.db"
+    yield url
+    EngineRegistry.dispose_all()
+
+
+@pytest.fixture
+def repository(database_url):
+    return CharacterRepository(
+        EngineRegistry.get(database_url, create_schema=True)
+    )
+
+
+def random_character():
+    return CharacterSchema(
+        name=fake.name(),
+        height=fake.random_int(150, 200),
+        mass=fake.random_int(40, 120) + fake.random_int(0, 1) / 2,
+        hair_color=fake.random_element(["blond", "brown", "black"]),
+        skin_color=fake.random_element(["fair", "light", "dark"]),
+        eye_color=fake.random_element(["blue", "brown", "green"]),
+        birth_year=fake.random_int(0, 100),
+    )
+
+
+def counted(characters):
+    counter = ValueCounter()
+    for character in characters:
+        counter.add(character)
+    return counter
+
+
+def test_stats_match_the_raw_values():
+    characters = [random_character() for _ in range(200)]
+    heights = [character.height for character in characters]
+
+    stats = counted(characters).stats()
+
+    assert stats.count == 200
+    assert stats.height.mean == pytest.approx(statistics.fmean(heights))
+    assert stats.height.min == min(heights)
+    assert stats.height.max == max(heights)
+    cut_points = statistics.quantiles(heights, n=100, method="inclusive")
+    for percent in (25, 50, 75, 90, 95, 99):
+        assert stats.height.percentiles[f"p{percent}"] == pytest.approx(
+            cut_points[percent - 1]
+        )
+    assert sum(stats.eye_color.values()) == 200
+    assert list(stats.eye_color.values()) == sorted(
+        stats.eye_color.values(), reverse=True
+    )
+
+
+def test_stats_bucket_the_birth_years():
+    characters = [random_character() for _ in range(3)]
+    for character, birth_year in zip(characters, [3, 9, 25]):
+        character.birth_year = birth_year
+
+    stats = counted(characters).stats(CharacterStatsQuerySchema(bucket_size=5))
+
+    assert [
+        (bucket.start, bucket.end, bucket.count)
+        for bucket in stats.birth_year_histogram
+    ] == [(0, 5, 1), (5, 10, 1), (25, 30, 1)]
+
+
+def test_removed_characters_are_counted_out():
+    kept, removed = random_character(), random_character()
+    counter = counted([kept, removed])
+
+    counter.remove(removed)
+
+    assert counter.stats() == counted([kept]).stats()
+    assert ValueCounter().stats().height.mean is None
+
+
+def test_sql_stats_follow_the_writes(repository):
+    created = repository.create_characters(
+        [random_character() for _ in range(50)]
+    ).created
+    created += repository.create_characters(
+        [random_character() for _ in range(10)], atomic=False
+    ).created
+    deleted = set(repository.delete_characters([c.id for c in created[:20]]))
+    repository.delete_character(created[20].id)
+    deleted.add(created[20].id)
+    remaining = [c for c in created if c.id not in deleted]
+
+    assert repository.get_character_stats() == counted(remaining).stats()
+
+
+def test_sql_stats_without_counts_table_group_by(repository, database_url):
+    characters = repository.create_characters(
+        [random_character() for _ in range(30)]
+    ).created
+    with EngineRegistry.get(database_url).write_engine.begin() as connection:
+        for suffix in ("insert", "delete", "update"):
+            connection.execute(
+                text(f"DROP TRIGGER {cts.CHARACTER_TABLE_NAME}_counts_{suffix}")
+            )
+        connection.execute(text(f"DROP TABLE {cts.VALUE_COUNTS_TABLE_NAME}"))
+
+    assert repository.get_character_stats() == counted(characters).stats()
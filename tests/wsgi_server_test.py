@@ -0,0 +1,53 @@
+import gc
+from types import SimpleNamespace
+
+from infra.repositories.sql.base import EngineRegistry
+from infra.web.flask.server import (
+    CharacterCRUDServer,
+    gunicorn_options,
+    when_ready,
+)
+
+
+def test_gunicorn_options_use_web_server_settings(monkeypatch):
+    monkeypatch.setattr("settings.WebServerSettings.WEB_SERVER_HOST", "0.0.0.0")
+    monkeypatch.setattr("settings.WebServerSettings.WEB_SERVER_PORT", "8000")
+    monkeypatch.setattr("settings.WebServerSettings.WORKERS", 3)
+
+    options = gunicorn_options()
+
+    assert options["bind"] == "0.0.0.0:8000"
+    assert options["workers"] == 3
+
+
+def test_server_configures_gunicorn():
+    server = CharacterCRUDServer({"workers": 2, "threads": 8})
+
+    assert server.cfg.workers == 2
+    assert server.cfg.threads == 8
+    assert server.cfg.post_fork.__name__ == "post_fork"
+
+
+def test_reset_after_fork_keeps_engine_with_new_pool(tmp_path):
+    initializer = EngineRegistry.get(f"sqlite:///{tmp_path}/characters.db")
+    engine, pool = initializer.engine, initializer.engine.pool
+
+    EngineRegistry.reset_after_fork()
+
+    assert initializer.engine is engine
+    assert initializer.engine.pool is not pool
+    EngineRegistry.dispose_all()
+
+
+def test_when_ready_warns_about_per_worker_caches(monkeypatch):
+    monkeypatch.setattr("settings.CacheSettings.ENABLED", True)
+    warnings = []
+    server = SimpleNamespace(
+        cfg=SimpleNamespace(workers=2),
+        log=SimpleNamespace(warning=lambda *args: warnings.append(args)),
+    )
+
+    when_ready(server)
+    gc.unfreeze()
+
+    assert len(warnings) == 1